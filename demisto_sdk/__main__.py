@@ -16,7 +16,7 @@ from demisto_sdk.commands.common.constants import (
     ALL_PACKS_DEPENDENCIES_DEFAULT_PATH, ENV_DEMISTO_SDK_MARKETPLACE,
     MODELING_RULES_DIR, PARSING_RULES_DIR, FileType, MarketplaceVersions)
 from demisto_sdk.commands.common.handlers import JSON_Handler
-from demisto_sdk.commands.common.tools import (find_type,
+from demisto_sdk.commands.common.tools import (arg_to_list, find_type,
                                                get_last_remote_release_version,
                                                get_release_note_entries,
                                                is_external_repository,
@@ -477,6 +477,21 @@ def zip_packs(**kwargs) -> int:
     '-sv', '--run-specific-validations',
     help="Run specific validations by stating the error codes.",
     is_flag=False)
+@click.option(
+    '-w', '--workers',
+    help="The number of worker processes used to validate all files. Defaults to the number of CPUs.",
+    type=click.IntRange(min=1))
+@click.option(
+    '--cache-path',
+    help="The directory of the validation results cache. The files which were validated with the same content and "
+         "configuration in a previous run are not validated again, and their errors and warnings are reported "
+         "from the cache. The docker images lookups are also cached in the directory, for an hour.",
+    type=click.Path(file_okay=False, resolve_path=True))
+@click.option(
+    '--time-measurements-dir',
+    help="The directory to write the time measurements report of the validations, validated file types and "
+         "validated packs to, as JSON and csv files. The validations which took the longest are also printed.",
+    type=click.Path(file_okay=False, resolve_path=True))
 @pass_config
 def validate(config, **kwargs):
     """Validate your content files. If no additional flags are given, will validated only committed files."""
@@ -521,6 +536,9 @@ def validate(config, **kwargs):
             multiprocessing=run_with_mp,
             check_is_unskipped=not kwargs.get('allow_skipped', False),
             specific_validations=kwargs.get('run_specific_validations'),
+            validation_cache_path=kwargs.get('cache_path'),
+            workers=kwargs.get('workers'),
+            time_measurements_dir=kwargs.get('time_measurements_dir'),
         )
         return validator.run_validation()
     except (git.InvalidGitRepositoryError, git.NoSuchPathError, FileNotFoundError) as e:
@@ -1487,8 +1505,18 @@ def generate_docs(**kwargs):
 )
 @click.option('-mp', '--marketplace', help='The marketplace the id set are created for, that determines which packs are'
                                            ' inserted to the id set, and which items are present in the id set for '
-                                           'each pack. Default is all packs exists in the content repository.',
+                                           'each pack. Default is all packs exists in the content repository. '
+                                           'Pass a comma separated list of marketplaces (e.g. xsoar,marketplacev2) to '
+                                           'create the id sets of all of them in a single pass over the content, '
+                                           'the output should then be a comma separated list of the same length.',
               default='')
+@click.option('-m', '--manifest-path', help='The id set manifest file path. When given, only content items that were '
+                                            'changed since the manifest was saved are parsed, the rest are taken '
+                                            'from the manifest, which is updated at the end of the run.',
+              default=None)
+@click.option('-db', '--write-db', help='Write an indexed id set database (SQLite) next to the output file, '
+                                        'e.g. Tests/id_set.db for Tests/id_set.json.',
+              is_flag=True)
 def create_id_set(**kwargs):
     """Create the content dependency tree by ids."""
     from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
@@ -1496,13 +1524,23 @@ def create_id_set(**kwargs):
         remove_dependencies_from_id_set
 
     check_configuration_file('create-id-set', kwargs)
-    id_set_creator = IDSetCreator(**kwargs)
-    id_set, excluded_items_by_pack, excluded_items_by_type = id_set_creator.create_id_set()
+    marketplace = kwargs.get('marketplace', '')
+    if ',' in marketplace:
+        marketplaces = arg_to_list(marketplace)
+        outputs = arg_to_list(kwargs.pop('output')) or None
+        kwargs.pop('marketplace')
+        id_set_creators = IDSetCreator.create_marketplaces_id_sets(marketplaces, outputs, **kwargs)
+    else:
+        id_set_creator = IDSetCreator(**kwargs)
+        _, excluded_items_by_pack, excluded_items_by_type = id_set_creator.create_id_set()
+        id_set_creators = {marketplace: (id_set_creator, excluded_items_by_pack, excluded_items_by_type)}
 
-    if excluded_items_by_pack:
-        remove_dependencies_from_id_set(id_set, excluded_items_by_pack, excluded_items_by_type,
-                                        kwargs.get('marketplace', ''))
-        id_set_creator.save_id_set()
+    for marketplace, (id_set_creator, excluded_items_by_pack, excluded_items_by_type) in id_set_creators.items():
+        if excluded_items_by_pack:
+            remove_dependencies_from_id_set(id_set_creator.id_set, excluded_items_by_pack, excluded_items_by_type,
+                                            marketplace)
+            # the id set is no longer needed, each section is released once it is written
+            id_set_creator.save_id_set(release=True)
 
 
 # ====================== merge-id-sets ====================== #
@@ -1531,6 +1569,13 @@ def create_id_set(**kwargs):
     help="Fails the process if any duplicates are found.",
     is_flag=True
 )
+@click.option(
+    '-s',
+    '--streaming',
+    help="Merge the id sets section by section, without loading both of them at once. Reduces the memory usage "
+         "when merging large id sets.",
+    is_flag=True
+)
 def merge_id_sets(**kwargs):
     """Merge two id_sets"""
     from demisto_sdk.commands.common.update_id_set import \
@@ -1544,7 +1589,8 @@ def merge_id_sets(**kwargs):
     _, duplicates = merge_id_sets_from_files(
         first_id_set_path=first,
         second_id_set_path=second,
-        output_id_set_path=output
+        output_id_set_path=output,
+        streaming=kwargs.get('streaming', False),
     )
     if duplicates:
         print_error(f'Failed to merge ID sets: {first} with {second}, '
@@ -1645,6 +1691,22 @@ def update_release_notes(**kwargs):
                                          " used for the packs ApiModules and Base", required=False, is_flag=True)
 @click.option("-d", "--dependency", help="Find which items in a specific content pack appears as a mandatory "
                                          "dependency of the searched pack ", required=False)
+@click.option("--cache-path", help="The dependencies cache file path, used with the '--all-packs-dependencies' flag. "
+                                   "When given, only the dependencies of packs which were changed, or depend on items "
+                                   "which were changed, since the cache was saved are calculated, and the cache is "
+                                   "updated at the end of the run.", required=False)
+@click.option("-w", "--workers", help="The number of worker processes used with the '--all-packs-dependencies' and "
+                                      "'--get-dependent-on' flags. Defaults to the number of CPUs.",
+              required=False, type=click.IntRange(min=1))
+@click.option("--dependent-on-index", help="The path of the index of the packs dependent on each pack, saved by the "
+                                           "'--all-packs-dependencies' flag alongside its output file. Used with the "
+                                           "'--get-dependent-on' flag to look up the dependent packs instead of "
+                                           "calculating them, when the index was created from the same id set file. "
+                                           "Defaults to the index of the default '--output-path'.", required=False)
+@click.option("--dependency-graph-path", help="The path of the all packs dependency graph file, used with the "
+                                              "'--all-packs-dependencies' and '--get-dependent-on' flags. The graph "
+                                              "is loaded from the file when it was built from the same id set file, "
+                                              "and is saved to it otherwise.", required=False)
 def find_dependencies(**kwargs):
     """Find pack dependencies and update pack metadata."""
     from demisto_sdk.commands.find_dependencies.find_dependencies import \
@@ -1659,6 +1721,10 @@ def find_dependencies(**kwargs):
     get_dependent_on = kwargs.get('get_dependent_on', False)
     output_path = kwargs.get('output_path', ALL_PACKS_DEPENDENCIES_DEFAULT_PATH)
     dependency = kwargs.get('dependency', '')
+    cache_path = kwargs.get('cache_path')
+    workers = kwargs.get('workers')
+    dependent_on_index_path = kwargs.get('dependent_on_index')
+    graph_path = kwargs.get('dependency_graph_path')
     try:
 
         PackDependencies.find_dependencies_manager(
@@ -1671,6 +1737,10 @@ def find_dependencies(**kwargs):
             get_dependent_on=get_dependent_on,
             output_path=output_path,
             dependency=dependency,
+            cache_path=cache_path,
+            workers=workers,
+            dependent_on_index_path=dependent_on_index_path,
+            graph_path=graph_path,
         )
 
     except ValueError as exp:
@@ -4,3 +4,5 @@ This is for source of truth of handlers
 
 from .json.ujson_handler import UJSON_Handler as JSON_Handler  # noqa: F401
 from .yaml.ruamel_handler import RUAMEL_Handler as YAML_Handler  # noqa: F401
+from .yaml.ruamel_handler import \
+    RUAMEL_Safe_Handler as YAML_Safe_Handler  # noqa: F401
@@ -0,0 +1,43 @@
+from io import StringIO
+
+import pytest
+from ruamel.yaml.comments import CommentedMap
+from ruamel.yaml.constructor import DuplicateKeyError
+
+from demisto_sdk.commands.common.handlers import (YAML_Handler,
+                                                  YAML_Safe_Handler)
+
+YML_CONTENT = '''commonfields:
+  id: "Test"
+  version: -1
+name: 'Test'
+fromversion: 6.0.0
+tests:
+- No tests
+script:
+  isfetch: true
+  subtype: python3
+'''
+
+
+class TestYAMLSafeHandler:
+    def test_load_plain_data(self):
+        """Check that the safe handler loads plain types, with the same data as the round-trip handler"""
+        data = YAML_Safe_Handler().load(StringIO(YML_CONTENT))
+        round_trip_data = YAML_Handler().load(StringIO(YML_CONTENT))
+
+        assert type(data) is dict
+        assert type(data['commonfields']['id']) is str
+        assert isinstance(round_trip_data, CommentedMap)
+        assert data == round_trip_data
+        assert list(data) == list(round_trip_data)
+
+    def test_load_custom_tags(self):
+        """Check that a file with custom tags, e.g. a gitlab ci file, is loaded by the round-trip handler"""
+        data = YAML_Safe_Handler().load('job:\n  script:\n  - !reference [.setup, script]\n')
+        assert data['job']['script'][0].tag.value == '!reference'
+
+    def test_load_duplicate_keys(self):
+        """Check that duplicate keys fail the safe handler, as they fail the round-trip handler"""
+        with pytest.raises(DuplicateKeyError):
+            YAML_Safe_Handler().load('id: test\nid: test2\n')
@@ -1,6 +1,8 @@
 from io import StringIO
+from pathlib import Path
 
 from ruamel.yaml import YAML
+from ruamel.yaml.constructor import ConstructorError
 
 from demisto_sdk.commands.common.handlers.handlers_utils import order_dict
 from demisto_sdk.commands.common.handlers.xsoar_handler import XSOAR_Handler
@@ -51,3 +53,33 @@ class RUAMEL_Handler(XSOAR_Handler):
         output_str = string_stream.getvalue()
         string_stream.close()
         return output_str
+
+
+class RUAMEL_Safe_Handler(RUAMEL_Handler):
+    """
+    Read-only XSOAR wrapper to the ruamel.yaml safe loader.
+    Loads plain dicts, lists and scalars, without the quotes, comments and formatting kept by RUAMEL_Handler,
+    several times faster. The C loader of ruamel.yaml.clib is used when it is installed.
+    Use only for files which are not written back, files which are written back must be loaded with RUAMEL_Handler.
+    """
+
+    def __init__(self, allow_duplicate_keys=False, width=5000):
+        super().__init__(preserve_quotes=False, allow_duplicate_keys=allow_duplicate_keys, width=width)
+
+    @property
+    def yaml(self) -> YAML:
+        yaml = YAML(typ='safe')
+        yaml.allow_duplicate_keys = self._allow_duplicate_keys
+        yaml.width = self._width
+        return yaml
+
+    def load(self, stream):
+        if isinstance(stream, Path):
+            stream = stream.read_text(encoding='utf8')
+        elif not isinstance(stream, str):
+            stream = stream.read()
+        try:
+            return self.yaml.load(stream)
+        except ConstructorError:
+            # the safe loader does not load custom tags, e.g. the !reference tag of gitlab ci files
+            return RUAMEL_Handler(allow_duplicate_keys=self._allow_duplicate_keys, width=self._width).load(stream)
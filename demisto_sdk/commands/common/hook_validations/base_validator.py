@@ -1,6 +1,8 @@
+import inspect
 import io
 import os
-from typing import Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
 import click
 
@@ -16,12 +18,104 @@ from demisto_sdk.commands.common.errors import (ALLOWED_IGNORE_ERRORS,
                                                 get_all_error_codes,
                                                 get_error_object)
 from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.timers import MeasureType, measure_method_time
 from demisto_sdk.commands.common.tools import (
-    find_type, get_file_displayed_name, get_json, get_pack_name,
+    find_type, get_file_displayed_name, get_pack_name,
     get_relative_path_from_packs_dir, get_yaml)
 
 json = JSON_Handler()
 
+# the outputs of the errors reported in the current `record_reported_errors` block
+_reported_errors: Optional[List[dict]] = None
+
+# the JSON report entries which were not written yet, by the paths of their report files
+_json_report_entries: Dict[str, List[dict]] = {}
+
+
+@contextmanager
+def record_reported_errors() -> Iterator[List[dict]]:
+    """
+    Records the outputs of the errors reported by `BaseValidator.handle_error` inside the block - the printed
+    messages, the JSON report entries and the entries of the files and errors report lists, in the order they were
+    made. The recorded outputs can be made again by `replay_reported_errors`.
+    """
+    global _reported_errors
+    outer_reported_errors = _reported_errors
+    _reported_errors = []
+    try:
+        yield _reported_errors
+    finally:
+        if outer_reported_errors is not None:
+            outer_reported_errors.extend(_reported_errors)
+        _reported_errors = outer_reported_errors
+
+
+def replay_reported_errors(reported_errors: List[dict], json_file_path: Optional[str] = None):
+    """
+    Makes the outputs recorded by `record_reported_errors` again.
+
+    Args:
+        reported_errors: The recorded outputs.
+        json_file_path: The JSON file to output the recorded JSON report entries to.
+    """
+    json_validator = BaseValidator(json_file_path=json_file_path)
+    for reported_error in reported_errors:
+        if 'print' in reported_error:
+            print_reported_error(reported_error['print'], reported_error['fg'])
+        elif 'json' in reported_error:
+            json_validator.json_output(*reported_error['json'])
+        else:
+            error_code, file_path = reported_error['report']
+            BaseValidator.report_error(error_code, file_path, ignored=reported_error['ignored'])
+
+
+def pop_json_report_entries() -> Dict[str, List[dict]]:
+    """
+    Takes the JSON report entries which were not written yet, e.g. to pass the entries found by a worker process
+    to the main process. The taken entries are not written by `flush_json_report`.
+
+    Returns:
+        The entries, by the paths of their report files.
+    """
+    json_report_entries = dict(_json_report_entries)
+    _json_report_entries.clear()
+    return json_report_entries
+
+
+def add_json_report_entries(json_report_entries: Dict[str, List[dict]]):
+    """
+    Adds JSON report entries taken by `pop_json_report_entries`, to be written by the next `flush_json_report`.
+    """
+    for json_file_path, entries in json_report_entries.items():
+        _json_report_entries.setdefault(json_file_path, []).extend(entries)
+
+
+def flush_json_report():
+    """
+    Writes the JSON report entries added by `BaseValidator.json_output` to their report files, after the entries
+    already in the files. Every report file is read and written once, no matter how many entries were added to it.
+    """
+    for json_file_path, entries in pop_json_report_entries().items():
+        json_contents = []
+        if os.path.exists(json_file_path):
+            try:
+                with open(json_file_path, 'r') as json_file:
+                    existing_json = json.load(json_file)
+            except ValueError:
+                existing_json = ''
+            if isinstance(existing_json, list):
+                json_contents = existing_json
+
+        json_contents.extend(entries)
+        with open(json_file_path, 'w') as json_file:
+            json.dump(json_contents, json_file, indent=4)
+
+
+def print_reported_error(message: str, fg: str):
+    if _reported_errors is not None:
+        _reported_errors.append({'print': message, 'fg': fg})
+    click.secho(message, fg=fg)
+
 
 def error_codes(error_codes_str: str):
 
@@ -45,6 +139,21 @@ def error_codes(error_codes_str: str):
 
 class BaseValidator:
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Measures the time of the public methods of the validators, as `<validator class>.<method>` validations,
+        see `timers.enable_time_measurements`. The time of a method does not include the methods it calls.
+        """
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if name.startswith('_'):
+                continue
+            measure_decorator = measure_method_time(MeasureType.VALIDATIONS, f'{cls.__name__}.{name}')
+            if inspect.isfunction(attribute):
+                setattr(cls, name, measure_decorator(attribute))
+            elif isinstance(attribute, (staticmethod, classmethod)) and inspect.isfunction(attribute.__func__):
+                setattr(cls, name, type(attribute)(measure_decorator(attribute.__func__)))
+
     def __init__(self, ignored_errors=None, print_as_warnings=False, suppress_print: bool = False,
                  json_file_path: Optional[str] = None, specific_validations: Optional[list] = None):
         # these are the ignored errors from the .pack-ignore including un-allowed error codes
@@ -187,30 +296,30 @@ class BaseValidator:
             predefined_by_support_ignored_errors
         ) or warning:
             if self.print_as_warnings or warning:
-                click.secho(formatted_error_str('WARNING'), fg="yellow")
+                print_reported_error(formatted_error_str('WARNING'), fg="yellow")
                 self.json_output(file_path, error_code, error_message, warning)
-                self.add_to_report_error_list(error_code, file_path, FOUND_FILES_AND_IGNORED_ERRORS)
+                self.report_error(error_code, file_path, ignored=True)
             return None
 
         formatted_error = formatted_error_str('ERROR')
         if should_print and not self.suppress_print:
             if suggested_fix and not is_error_not_allowed_in_pack_ignore:
-                click.secho(formatted_error[:-1], fg="bright_red")
+                print_reported_error(formatted_error[:-1], fg="bright_red")
                 if error_code == 'ST109':
-                    click.secho("Please add to the root of the yml.\n", fg="bright_red")
+                    print_reported_error("Please add to the root of the yml.\n", fg="bright_red")
                 elif error_code == 'ST107':
                     missing_field = error_message.split(" ")[3]
                     path_to_add = error_message.split(":")[1]
-                    click.secho(f"Please add the field {missing_field} to the path: {path_to_add} in the yml.\n",
-                                fg="bright_red")
+                    print_reported_error(f"Please add the field {missing_field} to the path: {path_to_add} in the yml.\n",
+                                         fg="bright_red")
                 else:
-                    click.secho(suggested_fix + "\n", fg="bright_red")
+                    print_reported_error(suggested_fix + "\n", fg="bright_red")
 
             else:
-                click.secho(formatted_error, fg="bright_red")
+                print_reported_error(formatted_error, fg="bright_red")
 
         self.json_output(file_path, error_code, error_message, warning)
-        self.add_to_report_error_list(error_code, file_path, FOUND_FILES_AND_ERRORS)
+        self.report_error(error_code, file_path, ignored=False)
         return formatted_error
 
     def check_file_flags(self, file_name, file_path):
@@ -270,6 +379,16 @@ class BaseValidator:
                     self.predefined_deprecated_ignored_errors[file_path] = []
                 self.predefined_deprecated_ignored_errors[file_path].append(ignored_error)
 
+    @staticmethod
+    def report_error(error_code, file_path, ignored: bool):
+        """
+        Adds an error to the found files and errors report list, or to the ignored errors one.
+        """
+        if _reported_errors is not None:
+            _reported_errors.append({'report': [error_code, file_path], 'ignored': ignored})
+        BaseValidator.add_to_report_error_list(error_code, file_path,
+                                               FOUND_FILES_AND_IGNORED_ERRORS if ignored else FOUND_FILES_AND_ERRORS)
+
     @staticmethod
     def add_to_report_error_list(error_code, file_path, error_list) -> bool:
         formatted_file_and_error = f'{file_path} - [{error_code}]'
@@ -279,7 +398,7 @@ class BaseValidator:
         return False
 
     def json_output(self, file_path: str, error_code: str, error_message: str, warning: bool) -> None:
-        """Adds an error's info to the output JSON file
+        """Adds an error's info to the output JSON file, the file is written by `flush_json_report`
 
         Args:
             file_path (str): The file path where the error ocurred.
@@ -290,6 +409,9 @@ class BaseValidator:
         if not self.json_file_path:
             return
 
+        if _reported_errors is not None:
+            _reported_errors.append({'json': [file_path, error_code, error_message, warning]})
+
         error_data = get_error_object(error_code)
 
         output = {
@@ -301,16 +423,6 @@ class BaseValidator:
             'linter': 'validate'
         }
 
-        json_contents = []
-        existing_json = ''
-        if os.path.exists(self.json_file_path):
-            try:
-                existing_json = get_json(self.json_file_path)
-            except ValueError:
-                pass
-            if isinstance(existing_json, list):
-                json_contents = existing_json
-
         file_type = find_type(file_path)
         entity_type = file_type.value if file_type else 'pack'
 
@@ -327,6 +439,4 @@ class BaseValidator:
             'linter': 'validate',
             **output
         }
-        json_contents.append(formatted_error_output)
-        with open(self.json_file_path, 'w') as f:
-            json.dump(json_contents, f, indent=4)
+        _json_report_entries.setdefault(self.json_file_path, []).append(formatted_error_output)
@@ -1,16 +1,24 @@
+import hashlib
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import lru_cache
-from typing import Optional, Tuple, Union
+from threading import get_ident, local
+from typing import Any, Callable, Iterable, Optional, Set, Tuple, Union
 
 import requests
 from pkg_resources import parse_version
 
 from demisto_sdk.commands.common.constants import IronBankDockers
 from demisto_sdk.commands.common.errors import Errors
+from demisto_sdk.commands.common.handlers import JSON_Handler
 from demisto_sdk.commands.common.hook_validations.base_validator import (
     BaseValidator, error_codes)
-from demisto_sdk.commands.common.tools import get_yaml
+from demisto_sdk.commands.common.tools import get_yaml, is_iron_bank_pack
+
+json = JSON_Handler()
 
 # disable insecure warnings
 requests.packages.urllib3.disable_warnings()
@@ -25,9 +33,73 @@ ACCEPT_HEADER = {
 TIMEOUT = 60
 DEFAULT_REGISTRY = 'registry-1.docker.io'
 DEPRECATED_DOCKER_IMAGE_LIST_URL = 'https://raw.githubusercontent.com/demisto/dockerfiles/master/docker/deprecated_images.json'
+# the time the docker images lookups are kept in the docker images cache
+DOCKER_IMAGES_CACHE_TTL = timedelta(hours=1)
+# the number of docker images looked up concurrently by DockerImageValidator.prefetch_docker_images
+DOCKER_PREFETCH_WORKERS = 8
+
+# the sessions of the requests to the docker registries, by thread
+_docker_sessions = local()
+
+
+def get_docker_session() -> requests.Session:
+    """
+    A session of the requests to the docker registries, reusing the connections to the registries.
+    Every thread of every process has a session of its own, as the connections can not be shared between them.
+    """
+    if getattr(_docker_sessions, 'pid', None) != os.getpid():
+        _docker_sessions.pid = os.getpid()
+        _docker_sessions.session = requests.Session()
+    return _docker_sessions.session
+
+
+class DockerImagesCache:
+    """
+    An on-disk cache of the docker images lookups - the latest tags of the images and the deprecated images list,
+    shared by the processes and the runs using the same cache directory. A lookup expires after the cache TTL.
+
+    Every lookup is kept in a file of its own in the cache directory, named by the hash of the lookup key, so
+    processes caching lookups concurrently do not overwrite the lookups of each other.
+    """
+
+    def __init__(self, cache_dir: str, ttl: timedelta = DOCKER_IMAGES_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def get_lookup_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{hashlib.sha256(key.encode()).hexdigest()}.json')
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns:
+            The cached result of a lookup, or None if the lookup is not cached or expired.
+        """
+        try:
+            with open(self.get_lookup_path(key), 'r') as lookup_file:
+                cached_lookup = json.load(lookup_file)
+        except (OSError, ValueError):
+            return None
+        if isinstance(cached_lookup, dict) and cached_lookup.get('key') == key and \
+                time.time() - cached_lookup.get('time', 0) < self.ttl.total_seconds():
+            return cached_lookup.get('value')
+        return None
+
+    def set(self, key: str, value: Any):
+        """
+        Caches the result of a lookup.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        lookup_path = self.get_lookup_path(key)
+        # write to a temporary file and rename it, so a concurrent get never reads a partial lookup
+        temp_lookup_path = f'{lookup_path}.{os.getpid()}.{get_ident()}.tmp'
+        with open(temp_lookup_path, 'w') as lookup_file:
+            json.dump({'key': key, 'time': time.time(), 'value': value}, lookup_file)
+        os.replace(temp_lookup_path, lookup_path)
 
 
 class DockerImageValidator(BaseValidator):
+    # Static var to hold the docker images cache, the lookups are cached only in memory when it is not set
+    images_cache: Optional[DockerImagesCache] = None
 
     def __init__(self, yml_file_path, is_modified_file, is_integration, ignored_errors=None, print_as_warnings=False,
                  suppress_print: bool = False, json_file_path: Optional[str] = None, is_iron_bank: bool = False,
@@ -160,7 +232,7 @@ class DockerImageValidator(BaseValidator):
         """
         Authenticate to the docker service. Return an authentication token if authentication is required.
         """
-        res = requests.get(
+        res = get_docker_session().get(
             'https://{}/v2/'.format(registry),
             headers=ACCEPT_HEADER,
             timeout=TIMEOUT,
@@ -180,7 +252,7 @@ class DockerImageValidator(BaseValidator):
                 'scope': 'repository:{}:pull'.format(image_name),
                 'service': service
             }
-            res = requests.get(
+            res = get_docker_session().get(
                 url=realm,
                 params=params,
                 headers=ACCEPT_HEADER,
@@ -247,6 +319,24 @@ class DockerImageValidator(BaseValidator):
                 latest_tag_name = tag.get('name')
         return latest_tag_name
 
+    @staticmethod
+    def cached_lookup(key: str, lookup: Callable[[], Any]) -> Any:
+        """
+        Returns the result of a lookup from the docker images cache, or makes the lookup and caches its result.
+        A failed lookup raises, and is not cached. An empty result (e.g. no tag was found) is not cached either,
+        so it is looked up again by the next run.
+        """
+        images_cache = DockerImageValidator.images_cache
+        if images_cache:
+            cached_value = images_cache.get(key)
+            if cached_value is not None:
+                return cached_value
+
+        value = lookup()
+        if images_cache and value:
+            images_cache.set(key, value)
+        return value
+
     @staticmethod
     @lru_cache(256)
     def get_docker_image_latest_tag_request(docker_image_name: str) -> str:
@@ -258,13 +348,18 @@ class DockerImageValidator(BaseValidator):
         Returns:
             The latest tag for the docker image.
         """
+        return DockerImageValidator.cached_lookup(
+            f'latest_tag:{docker_image_name}',
+            lambda: DockerImageValidator.fetch_docker_image_latest_tag(docker_image_name))
+
+    @staticmethod
+    def fetch_docker_image_latest_tag(docker_image_name: str) -> str:
+        """
+        Get the latest tag for a docker image by request to docker hub, without the caches.
+        """
         tag = ''
-        auth_token = DockerImageValidator.docker_auth(docker_image_name, False, DEFAULT_REGISTRY)
-        headers = ACCEPT_HEADER.copy()
-        if auth_token:
-            headers['Authorization'] = 'Bearer {}'.format(auth_token)
         # first try to get the docker image tags using normal http request
-        res = requests.get(
+        res = get_docker_session().get(
             url='https://hub.docker.com/v2/repositories/{}/tags'.format(docker_image_name),
             verify=False,
             timeout=TIMEOUT,
@@ -278,7 +373,11 @@ class DockerImageValidator(BaseValidator):
         else:
             # if http request did not succeed than get tags using the API.
             # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
-            res = requests.get(
+            auth_token = DockerImageValidator.docker_auth(docker_image_name, False, DEFAULT_REGISTRY)
+            headers = ACCEPT_HEADER.copy()
+            if auth_token:
+                headers['Authorization'] = 'Bearer {}'.format(auth_token)
+            res = get_docker_session().get(
                 'https://{}/v2/{}/tags/list'.format(DEFAULT_REGISTRY, docker_image_name),
                 headers=headers,
                 timeout=TIMEOUT,
@@ -357,6 +456,7 @@ class DockerImageValidator(BaseValidator):
                 return 'demisto/python3', self.get_docker_image_latest_tag('demisto/python3', None)
 
     @staticmethod
+    @lru_cache(256)
     def get_docker_image_latest_tag_from_iron_bank_request(docker_image_name):
         """
         Get the latest tag for a docker image by request to Iron Bank Repo.
@@ -366,6 +466,15 @@ class DockerImageValidator(BaseValidator):
         Returns:
             The latest tag for the docker image.
         """
+        return DockerImageValidator.cached_lookup(
+            f'iron_bank_latest_tag:{docker_image_name}',
+            lambda: DockerImageValidator.fetch_docker_image_latest_tag_from_iron_bank(docker_image_name))
+
+    @staticmethod
+    def fetch_docker_image_latest_tag_from_iron_bank(docker_image_name):
+        """
+        Get the latest tag for a docker image by request to Iron Bank Repo, without the caches.
+        """
         project_name = docker_image_name.replace('demisto/', '')
         commits_url = f'{IronBankDockers.API_LINK}{project_name}/pipelines'
         manifest_url = f'{IronBankDockers.API_LINK}{project_name}/repository/files/hardening_manifest.yaml/raw'
@@ -392,7 +501,7 @@ class DockerImageValidator(BaseValidator):
     @staticmethod
     def _get_manifest_from_commit(manifest_url, commit_id):
         # gets the manifest file from the specified commit in Iron Bank:
-        res = requests.get(url=manifest_url, params={'ref': commit_id}, verify=False, timeout=TIMEOUT)
+        res = get_docker_session().get(url=manifest_url, params={'ref': commit_id}, verify=False, timeout=TIMEOUT)
 
         # If file does not exists in the last commit:
         if res.status_code != 200:
@@ -403,9 +512,9 @@ class DockerImageValidator(BaseValidator):
     @staticmethod
     def _get_latest_commit(commits_url, docker_image_name):
         # Get latest commit in master which passed the pipeline of the project in Iron Bank:
-        res = requests.get(url=commits_url, params={'ref': 'master', 'status': 'success',
-                                                    'order_by': 'updated_at', 'per_page': '1'},
-                           verify=False, timeout=TIMEOUT)
+        res = get_docker_session().get(url=commits_url, params={'ref': 'master', 'status': 'success',
+                                                                'order_by': 'updated_at', 'per_page': '1'},
+                                       verify=False, timeout=TIMEOUT)
 
         # Project may not be existing and needs to be created.
         if res.status_code != 200:
@@ -422,13 +531,22 @@ class DockerImageValidator(BaseValidator):
         return last_successful_pipelines[0]['sha']
 
     @staticmethod
+    @lru_cache(None)
     def get_deprecated_dockers_list() -> dict:
         """
         Get the deprecated docker images from dockerfiles repo
         returns: Dict contains the following keys: image_name, reason and created_time_utc.
         """
+        return DockerImageValidator.cached_lookup('deprecated_images',
+                                                  DockerImageValidator.fetch_deprecated_dockers_list)
+
+    @staticmethod
+    def fetch_deprecated_dockers_list() -> dict:
+        """
+        Get the deprecated docker images from dockerfiles repo, without the caches.
+        """
         try:
-            dockers_request = requests.get(DEPRECATED_DOCKER_IMAGE_LIST_URL, verify=False)
+            dockers_request = get_docker_session().get(DEPRECATED_DOCKER_IMAGE_LIST_URL, verify=False)
             dockers_request.raise_for_status()
             deprecated_dockers_json = dockers_request.json()
             return deprecated_dockers_json
@@ -452,3 +570,53 @@ class DockerImageValidator(BaseValidator):
                 deprecated_reason = docker_image.get('reason')
                 return docker_image_name, deprecated_reason
         return ''
+
+    @staticmethod
+    def prefetch_docker_images(file_paths: Iterable[str]):
+        """
+        Looks up the latest tags of the docker images of the given integrations and scripts, and the deprecated
+        docker images, concurrently, so validating the files does not wait for the lookups of every image in turn.
+        A failed lookup is not cached, it is made again and reported when the file is validated.
+
+        Args:
+            file_paths: The paths of the validated files, files which are not integrations or scripts are skipped.
+        """
+        lookups: Set[Tuple[str, bool]] = set()
+        for file_path in file_paths:
+            if not file_path.endswith('.yml') or not os.path.isfile(file_path):
+                continue
+            yml_file = get_yaml(file_path)
+            if not isinstance(yml_file, dict) or 'script' not in yml_file:
+                continue
+            # the docker image of an integration is under its script section, and only integrations use Iron Bank
+            is_integration = isinstance(yml_file['script'], dict)
+            script_section = yml_file['script'] if is_integration else yml_file
+            docker_image = script_section.get('dockerimage', '')
+            if docker_image:
+                image_regex = re.findall(r'(demisto\/.+)', docker_image, re.IGNORECASE)
+                docker_image_name = image_regex[0].split(':')[0] if image_regex else ''
+            else:
+                # the default docker image, see parse_docker_image
+                docker_image_name = 'demisto/python3' if script_section.get('subtype') == 'python3' else \
+                    'demisto/python'
+            if docker_image_name:
+                lookups.add((docker_image_name, is_integration and is_iron_bank_pack(file_path)))
+
+        if not lookups:
+            return
+
+        def lookup_latest_tag(docker_image_name: str, is_iron_bank: bool):
+            if is_iron_bank:
+                DockerImageValidator.get_docker_image_latest_tag_from_iron_bank_request(docker_image_name)
+            else:
+                DockerImageValidator.get_docker_image_latest_tag_request(docker_image_name)
+
+        with ThreadPoolExecutor(max_workers=DOCKER_PREFETCH_WORKERS) as executor:
+            futures = [executor.submit(DockerImageValidator.get_deprecated_dockers_list)]
+            futures.extend(executor.submit(lookup_latest_tag, *image_lookup) for image_lookup in sorted(lookups))
+            for future in futures:
+                try:
+                    future.result()
+                except Exception:
+                    # the lookup is made again, and its error is reported, when the file is validated
+                    continue
@@ -1,20 +1,22 @@
+import hashlib
 import os
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from threading import Lock
-from typing import Callable, List, Optional, Set
+from threading import Lock, local
+from typing import Callable, Dict, Iterable, List, Optional, Set
 from urllib.parse import urlparse
 
 import click
 import requests
 from git import InvalidGitRepositoryError
 from requests.adapters import HTTPAdapter
-from requests.exceptions import HTTPError
+from requests.exceptions import HTTPError, RequestException
 from urllib3.util import Retry
 
 from demisto_sdk.commands.common.constants import (RELATIVE_HREF_URL_REGEX,
@@ -50,11 +52,37 @@ USER_FILL_SECTIONS = [
 
 REQUIRED_MDX_PACKS = ['@mdx-js/mdx', 'fs-extra', 'commander']
 
+MDX_SERVER_LISTENING_REGEX = re.compile(r'MDX server is listening on port: (\d+)')
+
+# the number of readme files parsed by a single request to an mdx server
+MDX_BATCH_SIZE = 50
+
 PACKS_TO_IGNORE = ['HelloWorld', 'HelloWorldPremium']
 
 DEFAULT_SENTENCES = ['getting started and learn how to build an integration']
 
 
+# the sessions of the requests to the mdx servers, by thread
+_mdx_sessions = local()
+
+
+def get_mdx_session() -> requests.Session:
+    """
+    A session of the requests to the mdx servers, reusing the connections to the servers.
+    Every thread of every process has a session of its own, as the connections can not be shared between them.
+    """
+    if getattr(_mdx_sessions, 'pid', None) != os.getpid():
+        session = requests.Session()
+        session.mount('http://', HTTPAdapter(max_retries=Retry(total=2)))
+        _mdx_sessions.pid = os.getpid()
+        _mdx_sessions.session = session
+    return _mdx_sessions.session
+
+
+def get_mdx_content_hash(readme_content: str) -> str:
+    return hashlib.sha256(readme_content.encode('utf-8')).hexdigest()
+
+
 @dataclass(frozen=True)
 class ReadmeUrl:
     """Url links found in README files.
@@ -117,9 +145,15 @@ class ReadMeValidator(BaseValidator):
             export DEMISTO_README_VALIDATION=True
     """
 
-    # Static var to hold the mdx server process
+    # Static vars to hold the mdx server processes, the first of them, and the ports they listen on
     _MDX_SERVER_PROCESS: Optional[subprocess.Popen] = None
+    _MDX_SERVER_PROCESSES: List[subprocess.Popen] = []
+    _MDX_SERVER_PORTS: List[int] = []
     _MDX_SERVER_LOCK = Lock()
+    # The index of the mdx server this process parses readme files with, see get_mdx_server_url
+    _MDX_SERVER_INDEX = 0
+    # The mdx parse errors of readme contents, by the hashes of the contents ('' for a valid content)
+    _MDX_RESULTS: Dict[str, str] = {}
     MINIMUM_README_LENGTH = 30
 
     def __init__(self, file_path: str, ignored_errors=None, print_as_warnings=False, suppress_print=False,
@@ -169,28 +203,133 @@ class ReadMeValidator(BaseValidator):
         return True
 
     def mdx_verify_server(self) -> bool:
-        if not ReadMeValidator._MDX_SERVER_PROCESS:
-            server_started = ReadMeValidator.start_mdx_server(handle_error=self.handle_error,
-                                                              file_path=str(self.file_path))
-            if not server_started:
-                return False
+        if not ReadMeValidator._MDX_SERVER_PORTS:
+            # no mdx server was started for this process, start one for the file
+            with ReadMeValidator.start_mdx_server(handle_error=self.handle_error,
+                                                  file_path=str(self.file_path)) as server_started:
+                if not ReadMeValidator._MDX_SERVER_PORTS:
+                    # the server could not be started, and its error was reported (or ignored)
+                    return server_started
+                return self.mdx_verify_server()
         readme_content = self.fix_mdx()
-        retry = Retry(total=2)
-        adapter = HTTPAdapter(max_retries=retry)
-        session = requests.Session()
-        session.mount('http://', adapter)
-        response = session.request(
-            'POST',
-            'http://localhost:6161',
-            data=readme_content.encode('utf-8'),
-            timeout=20
-        )
-        if response.status_code != 200:
-            error_message, error_code = Errors.readme_error(response.text)
+        content_hash = get_mdx_content_hash(readme_content)
+        mdx_error = ReadMeValidator._MDX_RESULTS.get(content_hash)
+        if mdx_error is None:
+            response = get_mdx_session().request(
+                'POST',
+                ReadMeValidator.get_mdx_server_url(),
+                data=readme_content.encode('utf-8'),
+                timeout=20
+            )
+            mdx_error = response.text if response.status_code != 200 else ''
+            if response.status_code in (200, 500):  # the content was parsed
+                ReadMeValidator._MDX_RESULTS[content_hash] = mdx_error
+        if mdx_error:
+            error_message, error_code = Errors.readme_error(mdx_error)
             if self.handle_error(error_message, error_code, file_path=self.file_path):
                 return False
         return True
 
+    @staticmethod
+    def get_mdx_server_ports() -> List[int]:
+        return list(ReadMeValidator._MDX_SERVER_PORTS)
+
+    @staticmethod
+    def set_mdx_server_ports(ports: List[int], server_index: int = 0):
+        """
+        Sets the ports of the mdx servers started by another process, e.g. to use the servers of the main validate
+        process in its worker processes, which do not inherit them when they are spawned.
+
+        Args:
+            ports: The ports of the mdx servers.
+            server_index: The index of the server to parse the readme files of this process with, e.g. the index of
+             the validate worker process, so the workers are spread evenly between the servers.
+        """
+        ReadMeValidator._MDX_SERVER_PORTS[:] = ports
+        ReadMeValidator._MDX_SERVER_INDEX = server_index
+
+    @staticmethod
+    def get_mdx_results() -> Dict[str, str]:
+        return dict(ReadMeValidator._MDX_RESULTS)
+
+    @staticmethod
+    def add_mdx_results(mdx_results: Dict[str, str]):
+        """
+        Adds mdx parse results of another process, e.g. the results prefetched by the main validate process
+        (see prefetch_mdx_results) to its worker processes, which do not inherit them when they are spawned.
+        """
+        ReadMeValidator._MDX_RESULTS.update(mdx_results)
+
+    @staticmethod
+    def get_mdx_server_url(server_index: Optional[int] = None) -> str:
+        """
+        The url of one of the running mdx servers, the server of this process (see set_mdx_server_ports) unless
+        a specific server is requested.
+        """
+        ports = ReadMeValidator._MDX_SERVER_PORTS
+        if server_index is None:
+            server_index = ReadMeValidator._MDX_SERVER_INDEX
+        return f'http://localhost:{ports[server_index % len(ports)]}'
+
+    @staticmethod
+    def parse_mdx_batch(readme_contents: List[str], server_index: Optional[int] = None) -> List[str]:
+        """
+        Parses several readme contents with a single request to an mdx server.
+
+        Args:
+            readme_contents: The contents, after `fix_mdx_content`.
+            server_index: The index of the server to parse the contents with, see `get_mdx_server_url`.
+
+        Returns:
+            The parse errors of the contents, in the order of the contents ('' for a valid content).
+        """
+        response = get_mdx_session().request(
+            'POST',
+            f'{ReadMeValidator.get_mdx_server_url(server_index)}/batch',
+            data=json.dumps(readme_contents).encode('utf-8'),
+            timeout=20 * len(readme_contents)
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def prefetch_mdx_results(file_paths: Iterable[str]):
+        """
+        Parses the mdx of readme files in batches, concurrently with all the running mdx servers, so validating
+        the files does not wait for the server to parse each of them. Contents which were parsed before, and html
+        readme files, are not parsed again.
+
+        Args:
+            file_paths: The paths of the readme files.
+        """
+        if not ReadMeValidator._MDX_SERVER_PORTS or os.getenv('DEMISTO_MDX_CMD_VERIFY'):
+            return
+
+        readme_contents: Dict[str, str] = {}
+        for file_path in file_paths:
+            with open(file_path) as readme_file:
+                readme_content = readme_file.read()
+            if ReadMeValidator.is_html_content(readme_content):
+                continue
+            readme_content = ReadMeValidator.fix_mdx_content(readme_content)
+            content_hash = get_mdx_content_hash(readme_content)
+            if content_hash not in ReadMeValidator._MDX_RESULTS:
+                readme_contents[content_hash] = readme_content
+
+        content_hashes = list(readme_contents)
+        batches = [content_hashes[start:start + MDX_BATCH_SIZE]
+                   for start in range(0, len(content_hashes), MDX_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=len(ReadMeValidator._MDX_SERVER_PORTS)) as executor:
+            futures = [executor.submit(ReadMeValidator.parse_mdx_batch,
+                                       [readme_contents[content_hash] for content_hash in batch], batch_index)
+                       for batch_index, batch in enumerate(batches)]
+            for batch, future in zip(batches, futures):
+                try:
+                    ReadMeValidator._MDX_RESULTS.update(zip(batch, future.result()))
+                except (RequestException, ValueError) as error:
+                    # the files of the batch are parsed one by one when they are validated
+                    print_warning(f'Could not parse a batch of readme files with the mdx server: {error}')
+
     def is_mdx_file(self) -> bool:
         html = self.is_html_doc()
         valid = os.environ.get('DEMISTO_README_VALIDATION') or os.environ.get(
@@ -205,7 +344,10 @@ class ReadMeValidator(BaseValidator):
         return True
 
     def fix_mdx(self) -> str:
-        txt = self.readme_content
+        return self.fix_mdx_content(self.readme_content)
+
+    @staticmethod
+    def fix_mdx_content(txt: str) -> str:
         # copied from: https://github.com/demisto/content-docs/blob/2402bd1ab1a71f5bf1a23e1028df6ce3b2729cbb/content-repo/mdx_utils.py#L11
         # to use the same logic as we have in the content-docs build
         replace_tuples = [
@@ -254,13 +396,17 @@ class ReadMeValidator(BaseValidator):
         return valid
 
     def is_html_doc(self) -> bool:
-        if self.readme_content.startswith(NO_HTML):
+        return self.is_html_content(self.readme_content)
+
+    @staticmethod
+    def is_html_content(readme_content: str) -> bool:
+        if readme_content.startswith(NO_HTML):
             return False
-        if self.readme_content.startswith(YES_HTML):
+        if readme_content.startswith(YES_HTML):
             return True
         # use some heuristics to try to figure out if this is html
-        return self.readme_content.startswith('<p>') or self.readme_content.startswith('<!DOCTYPE html>') or \
-            ('<thead>' in self.readme_content and '<tbody>' in self.readme_content)
+        return readme_content.startswith('<p>') or readme_content.startswith('<!DOCTYPE html>') or \
+            ('<thead>' in readme_content and '<tbody>' in readme_content)
 
     @error_codes('RM101')
     def is_image_path_valid(self) -> bool:
@@ -633,24 +779,40 @@ class ReadMeValidator(BaseValidator):
 
     @staticmethod
     @contextmanager
-    def start_mdx_server(handle_error: Optional[Callable] = None, file_path: Optional[str] = None):
+    def start_mdx_server(handle_error: Optional[Callable] = None, file_path: Optional[str] = None, servers: int = 1):
+        """
+        Starts a pool of mdx servers, each listening on a free port of its own, and stops them when the block ends.
+
+        Args:
+            handle_error: The function to report a failure to start a server with.
+            file_path: The file to report a failure to start a server on.
+            servers: The number of servers to start, the validate worker processes are spread between them.
+        """
+        server_started = True
         with ReadMeValidator._MDX_SERVER_LOCK:
             if not ReadMeValidator._MDX_SERVER_PROCESS:
                 mdx_parse_server = Path(__file__).parent.parent / 'mdx-parse-server.js'
-                ReadMeValidator._MDX_SERVER_PROCESS = subprocess.Popen(['node', str(mdx_parse_server)],
-                                                                       stdout=subprocess.PIPE, text=True)
-                line = ReadMeValidator._MDX_SERVER_PROCESS.stdout.readline()  # type: ignore
-                if 'MDX server is listening on port' not in line:
-                    ReadMeValidator.stop_mdx_server()
-                    error_message, error_code = Errors.error_starting_mdx_server(line=line)
-                    if handle_error and file_path:
-                        if handle_error(error_message, error_code, file_path=file_path):
-                            return False
-
-                    else:
-                        raise Exception(error_message)
+                for _ in range(servers):
+                    server_process = subprocess.Popen(['node', str(mdx_parse_server), '0'],
+                                                      stdout=subprocess.PIPE, text=True)
+                    ReadMeValidator._MDX_SERVER_PROCESSES.append(server_process)
+                    line = server_process.stdout.readline()  # type: ignore
+                    port_match = MDX_SERVER_LISTENING_REGEX.search(line)
+                    if not port_match:
+                        ReadMeValidator.stop_mdx_server()
+                        error_message, error_code = Errors.error_starting_mdx_server(line=line)
+                        if handle_error and file_path:
+                            if handle_error(error_message, error_code, file_path=file_path):
+                                server_started = False
+
+                        else:
+                            raise Exception(error_message)
+                        break
+                    ReadMeValidator._MDX_SERVER_PORTS.append(int(port_match.group(1)))
+                if ReadMeValidator._MDX_SERVER_PROCESSES:
+                    ReadMeValidator._MDX_SERVER_PROCESS = ReadMeValidator._MDX_SERVER_PROCESSES[0]
         try:
-            yield True
+            yield server_started
         finally:
             ReadMeValidator.stop_mdx_server()
 
@@ -662,9 +824,11 @@ class ReadMeValidator(BaseValidator):
 
     @staticmethod
     def stop_mdx_server():
-        if ReadMeValidator._MDX_SERVER_PROCESS:
-            ReadMeValidator._MDX_SERVER_PROCESS.terminate()
-            ReadMeValidator._MDX_SERVER_PROCESS = None
+        for server_process in ReadMeValidator._MDX_SERVER_PROCESSES:
+            server_process.terminate()
+        ReadMeValidator._MDX_SERVER_PROCESSES.clear()
+        ReadMeValidator._MDX_SERVER_PORTS.clear()
+        ReadMeValidator._MDX_SERVER_PROCESS = None
 
     @staticmethod
     def _get_error_lists():
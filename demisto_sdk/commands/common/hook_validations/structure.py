@@ -6,10 +6,15 @@ import logging
 import os
 import re
 import string
-from typing import List, Optional, Tuple
+from copy import deepcopy
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import click
+import pykwalify
+from pykwalify.compat import yml
 from pykwalify.core import Core
+from pykwalify.rule import Rule
 
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (
@@ -19,7 +24,7 @@ from demisto_sdk.commands.common.errors import Errors
 from demisto_sdk.commands.common.handlers import JSON_Handler, YAML_Handler
 from demisto_sdk.commands.common.hook_validations.base_validator import (
     BaseValidator, error_codes)
-from demisto_sdk.commands.common.tools import (get_remote_file,
+from demisto_sdk.commands.common.tools import (get_file, get_remote_file,
                                                is_file_path_in_pack)
 from demisto_sdk.commands.format.format_constants import \
     OLD_FILE_DEFAULT_1_FROMVERSION
@@ -28,6 +33,44 @@ json = JSON_Handler()
 yaml = YAML_Handler()
 
 
+@lru_cache(maxsize=None)
+def get_compiled_schema(schema_path: str) -> Tuple[Dict, Dict[str, Rule], Rule]:
+    """
+    Loads and compiles a pykwalify schema file once per process.
+
+    Args:
+        schema_path: The path of the schema file.
+
+    Returns:
+        The schema data, the rules of the partial schemas (`schema;<name>` keys) by their names, and the root rule.
+    """
+    with open(schema_path, 'r') as schema_file:
+        schema_data = yml.load(schema_file)
+
+    partial_rules = {key.split(';', 1)[1]: Rule(schema=value) for key, value in schema_data.items()
+                     if key.startswith('schema;')}
+    root_rule = Rule(schema={key: value for key, value in schema_data.items() if not key.startswith('schema;')})
+    return schema_data, partial_rules, root_rule
+
+
+class CompiledSchemaCore(Core):
+    """
+    A pykwalify Core validating an already loaded document against a schema compiled by `get_compiled_schema`,
+    instead of loading the document and the schema file and compiling the schema rules on every validation.
+    """
+
+    def __init__(self, source_data, schema_path: str):
+        schema_data, self.partial_rules, self.compiled_root_rule = get_compiled_schema(schema_path)
+        super().__init__(source_data=source_data, schema_data=schema_data)
+
+    def _start_validate(self, value=None):
+        self.errors = []
+        # the partial schemas are looked up globally by their names, which are shared between the schema files
+        pykwalify.partial_schemas.update(self.partial_rules)
+        self.root_rule = self.compiled_root_rule
+        self._validate(value, self.root_rule, '', [])
+
+
 class StructureValidator(BaseValidator):
     """Structure validator is designed to validate the correctness of the file structure we enter to content repo.
 
@@ -68,7 +111,7 @@ class StructureValidator(BaseValidator):
         self.prev_ver = tag
         self.branch_name = branch_name
         self.file_type = self.get_file_type()
-        self.current_file = self.load_data_from_file()
+        self.current_file = self.load_data_from_file(shared=True)
         self.fromversion = fromversion
         # If it is a newly added file or if it is a file outside the pack then we will not search for an old file
         if is_new_file or not is_file_path_in_pack(self.file_path):
@@ -147,8 +190,11 @@ class StructureValidator(BaseValidator):
             scheme_file_name = 'integration' if self.scheme_name.value == 'betaintegration' else self.scheme_name.value  # type: ignore
             path = os.path.normpath(
                 os.path.join(__file__, "..", "..", self.SCHEMAS_PATH, '{}.yml'.format(scheme_file_name)))
-            core = Core(source_file=self.file_path,
-                        schema_files=[path])
+            if os.path.splitext(self.file_path)[1] in self.FILE_SUFFIX_TO_LOAD_FUNCTION:
+                # validate the document loaded by the validator, instead of loading the file again
+                core = CompiledSchemaCore(source_data=self.current_file, schema_path=path)
+            else:
+                core = Core(source_file=self.file_path, schema_files=[path])
             core.validate(raise_exception=True)
         except Exception as err:
             try:
@@ -261,19 +307,21 @@ class StructureValidator(BaseValidator):
 
         return True
 
-    def load_data_from_file(self):
-        # type: () -> dict
-        """Loads data according to function defined in FILE_SUFFIX_TO_LOAD_FUNCTION
+    def load_data_from_file(self, shared=False):
+        # type: (bool) -> dict
+        """Loads the files with a suffix in FILE_SUFFIX_TO_LOAD_FUNCTION, from the parsed documents store, so the
+        other validators of the file reuse the loaded data instead of loading the file again.
+        Args:
+            shared (bool): whether to return the loaded data shared with the other readers of the file, which must
+                not be changed, instead of a copy of it.
         Returns:
              (dict)
         """
         file_extension = os.path.splitext(self.file_path)[1]
         if file_extension in ACCEPTED_FILE_EXTENSIONS:
             if file_extension in self.FILE_SUFFIX_TO_LOAD_FUNCTION:
-                load_function = self.FILE_SUFFIX_TO_LOAD_FUNCTION[file_extension]
-                with open(self.file_path, 'r') as file_obj:
-                    loaded_file_data = load_function(file_obj)  # type: ignore
-                    return loaded_file_data
+                data = get_file(self.file_path, file_extension)
+                return data if shared else deepcopy(data)
 
             # Ignore loading image and markdown
             elif file_extension in ['.png', '.md']:
@@ -0,0 +1,227 @@
+import os
+import sqlite3
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from demisto_sdk.commands.common.handlers import JSON_Handler
+
+json = JSON_Handler()
+
+ID_SET_DB_VERSION = 1
+ID_SET_DB_SUFFIX = '.db'
+
+LIST_SECTION = 'list'
+DICT_SECTION = 'dict'
+
+CREATE_TABLES_QUERY = '''
+CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE sections (name TEXT PRIMARY KEY, kind TEXT NOT NULL, position INTEGER NOT NULL);
+CREATE TABLE items (
+    section TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    pack TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (section, position)
+);
+CREATE INDEX items_id ON items (id, section);
+CREATE INDEX items_name ON items (name, section);
+CREATE INDEX items_pack ON items (pack, section);
+'''
+
+
+def get_id_set_db_path(id_set_path: str) -> str:
+    """
+    Gets the path of the id_set database which is written next to the given id_set JSON file,
+    e.g. Tests/id_set.json -> Tests/id_set.db
+    """
+    return os.path.splitext(id_set_path)[0] + ID_SET_DB_SUFFIX
+
+
+def iter_section_items(section: Union[list, dict]) -> Iterator[Tuple[str, Dict]]:
+    """
+    Iterates over the (id, data) pairs of an id_set section.
+    List sections hold single key dicts of {id: data}, dict sections (e.g. Packs) map the id to the data.
+    """
+    if isinstance(section, dict):
+        yield from section.items()
+        return
+    for item in section:
+        yield from item.items()
+
+
+def write_id_set_db(id_set: Dict[str, Any], db_path: str):
+    """
+    Writes the id_set to an SQLite database, one row per item, indexed by the item id, name and pack.
+    An existing database in the given path is replaced.
+
+    Args:
+        id_set: The id_set to write.
+        db_path: The path of the database file.
+    """
+    db_dir = os.path.dirname(os.path.abspath(db_path))
+    os.makedirs(db_dir, exist_ok=True)
+    tmp_db_path = db_path + '.tmp'
+    if os.path.exists(tmp_db_path):
+        os.remove(tmp_db_path)
+
+    connection = sqlite3.connect(tmp_db_path)
+    try:
+        connection.executescript(CREATE_TABLES_QUERY)
+        connection.execute('INSERT INTO metadata VALUES (?, ?)', ('version', str(ID_SET_DB_VERSION)))
+        for section_position, (section_name, section) in enumerate(id_set.items()):
+            kind = DICT_SECTION if isinstance(section, dict) else LIST_SECTION
+            connection.execute('INSERT INTO sections VALUES (?, ?, ?)', (section_name, kind, section_position))
+            connection.executemany(
+                'INSERT INTO items VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    (section_name, position, item_id, item_data.get('name'), item_data.get('pack'),
+                     json.dumps(item_data))
+                    for position, (item_id, item_data) in enumerate(iter_section_items(section))
+                )
+            )
+        connection.commit()
+    finally:
+        connection.close()
+
+    os.replace(tmp_db_path, db_path)
+
+
+class IDSetDB(Mapping):
+    """
+    Read access to an id_set database written by `write_id_set_db`.
+
+    Sections are loaded lazily - only when they are accessed, and single items can be looked up by their id,
+    name or pack without loading any section.
+    The items are returned in the id_set JSON format - {id: data} for list sections, so the database can be used
+    wherever the id_set dict is read. A pickled database is opened again, without its loaded sections.
+    A connection must not be used across fork, so a forked process opens a connection of its own.
+    """
+
+    def __init__(self, db_path: str):
+        if not os.path.isfile(db_path):
+            raise FileNotFoundError(f'The id_set database {db_path} does not exist.')
+
+        self.db_path = db_path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid = 0
+        # the connections inherited from the parent processes, which must not be used or closed by this process
+        self._inherited_connections: List[sqlite3.Connection] = []
+        version = self._execute("SELECT value FROM metadata WHERE key = 'version'").fetchone()
+        if not version or int(version[0]) != ID_SET_DB_VERSION:
+            self.close()
+            raise ValueError(f'The id_set database {db_path} was created by an incompatible demisto-sdk version.')
+
+        self._section_kinds: Dict[str, str] = dict(
+            self._execute('SELECT name, kind FROM sections ORDER BY position')
+        )
+        self._sections: Dict[str, Union[list, dict]] = {}
+
+    def __reduce__(self):
+        return IDSetDB, (self.db_path,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getitem__(self, section_name: str) -> Union[list, dict]:
+        if section_name not in self._section_kinds:
+            raise KeyError(section_name)
+        return self.get_section(section_name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._section_kinds)
+
+    def __len__(self) -> int:
+        return len(self._section_kinds)
+
+    def _execute(self, query: str, params: Tuple = ()) -> sqlite3.Cursor:
+        """
+        Runs a query on the connection of the current process, which is opened on the first query of the process.
+        """
+        if self._connection is not None and self._connection_pid != os.getpid():
+            self._inherited_connections.append(self._connection)
+            self._connection = None
+        if self._connection is None:
+            # the database is read only, so it can be shared by the threads of the process
+            self._connection = sqlite3.connect(f'file:{self.db_path}?mode=ro', uri=True, check_same_thread=False)
+            self._connection_pid = os.getpid()
+        return self._connection.execute(query, params)
+
+    def close(self):
+        """
+        Closes the connection of the current process. The database can still be read, a connection is opened again
+        when it is needed.
+        """
+        if self._connection is not None:
+            if self._connection_pid == os.getpid():
+                self._connection.close()
+            else:
+                self._inherited_connections.append(self._connection)
+        self._connection = None
+
+    @property
+    def sections(self) -> List[str]:
+        return list(self._section_kinds)
+
+    def get_section(self, section_name: str) -> Union[list, dict]:
+        """
+        Loads a whole id_set section, the section is cached for later calls.
+        """
+        if section_name not in self._sections:
+            rows = self._execute(
+                'SELECT id, data FROM items WHERE section = ? ORDER BY position', (section_name,)
+            )
+            if self._section_kinds.get(section_name) == DICT_SECTION:
+                self._sections[section_name] = {item_id: json.loads(data) for item_id, data in rows}
+            else:
+                self._sections[section_name] = [{item_id: json.loads(data)} for item_id, data in rows]
+        return self._sections[section_name]
+
+    def _find(self, column: str, value: str, section_name: Optional[str] = None) -> List[Dict]:
+        query = f'SELECT id, data FROM items WHERE {column} = ?'
+        params: Tuple[str, ...] = (value,)
+        if section_name:
+            query += ' AND section = ?'
+            params += (section_name,)
+        rows = self._execute(query + ' ORDER BY section, position', params)
+        return [{item_id: json.loads(data)} for item_id, data in rows]
+
+    def get_items_by_id(self, item_id: str, section_name: Optional[str] = None) -> List[Dict]:
+        """
+        Gets the items with the given id, of the given section or of all the sections.
+        """
+        return self._find('id', item_id, section_name)
+
+    def get_items_by_name(self, name: str, section_name: Optional[str] = None) -> List[Dict]:
+        """
+        Gets the items with the given name, of the given section or of all the sections.
+        """
+        return self._find('name', name, section_name)
+
+    def get_items_by_pack(self, pack: str, section_name: Optional[str] = None) -> List[Dict]:
+        """
+        Gets the items of the given pack, of the given section or of all the sections.
+        """
+        return self._find('pack', pack, section_name)
+
+    def to_dict(self) -> Dict[str, Union[list, dict]]:
+        """
+        Loads all the sections, the result equals the id_set the database was written from.
+        """
+        return {section_name: self.get_section(section_name) for section_name in self._section_kinds}
+
+    def export_json(self, json_path: str):
+        with open(json_path, 'w') as id_set_file:
+            json.dump(self.to_dict(), id_set_file, indent=4)
+
+
+def close_id_set(id_set: Any):
+    """
+    Closes an id_set opened lazily from an id_set database (see `open_id_set_file`), other id_sets are left as is.
+    """
+    if isinstance(id_set, IDSetDB):
+        id_set.close()
@@ -0,0 +1,207 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from demisto_sdk.commands.common.constants import (PACKS_DIR,
+                                                   PACKS_PACK_META_FILE_NAME)
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.tools import (LOG_COLORS,
+                                               get_demisto_sdk_version,
+                                               get_file_or_dir_hash,
+                                               print_color, print_warning)
+
+json = JSON_Handler()
+
+MANIFEST_VERSION = 1
+
+
+def get_context_hash(context: Any) -> str:
+    """
+    Calculate a hash of the extra data an id_set item depends on, apart from its own files.
+    For example, incident fields depend on the incident types section.
+
+    Args:
+        context: a JSON serializable object.
+
+    Returns:
+        str: the sha256 hex digest of the serialized object.
+    """
+    return hashlib.sha256(json.dumps(context, sort_keys=True).encode()).hexdigest()
+
+
+def get_section_name(func: Callable) -> str:
+    """
+    Get the manifest section of a processing function.
+    The same paths may be processed by several functions (e.g. layouts and layoutscontainers),
+    or by the same function with different expected file types (e.g. classifiers and mappers).
+    """
+    section = getattr(func, 'func', func).__name__
+    expected_file_types = getattr(func, 'keywords', {}).get('expected_file_types')
+    if expected_file_types:
+        section += ':' + ','.join(file_type.value for file_type in expected_file_types)
+    return section
+
+
+def encode_result(obj: Any) -> Any:
+    """
+    Converts a processing result into a JSON serializable object, keeping tuples and sets.
+    """
+    if isinstance(obj, tuple):
+        return {'__tuple__': [encode_result(item) for item in obj]}
+    if isinstance(obj, set):
+        return {'__set__': [encode_result(item) for item in sorted(obj)]}
+    if isinstance(obj, list):
+        return [encode_result(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: encode_result(value) for key, value in obj.items()}
+    return obj
+
+
+def decode_result(obj: Any) -> Any:
+    """
+    Reverts `encode_result`.
+    """
+    if isinstance(obj, list):
+        return [decode_result(item) for item in obj]
+    if isinstance(obj, dict):
+        if '__tuple__' in obj and len(obj) == 1:
+            return tuple(decode_result(item) for item in obj['__tuple__'])
+        if '__set__' in obj and len(obj) == 1:
+            return {decode_result(item) for item in obj['__set__']}
+        return {key: decode_result(value) for key, value in obj.items()}
+    return obj
+
+
+class IDSetManifest:
+    """
+    A persisted mapping of: processing function -> item path -> (content hash, extracted id_set data).
+
+    Used to create the id_set incrementally - only items whose content (or the content of their pack metadata)
+    changed since the manifest was saved are parsed again, the rest are taken from the manifest.
+    """
+
+    def __init__(self, manifest_path: Optional[str] = None, marketplace: str = ''):
+        """
+        Args:
+            manifest_path: The path of the manifest file. Pass None to disable the manifest.
+            marketplace: The marketplace the id_set is created for.
+        """
+        self.manifest_path = manifest_path
+        self.marketplace = marketplace
+        self._items: Dict[str, Dict[str, Dict]] = {}
+        self._new_items: Dict[str, Dict[str, Dict]] = {}
+        self._pack_metadata_hashes: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.manifest_path)
+
+    def load(self):
+        if not self.enabled or not os.path.isfile(self.manifest_path):  # type: ignore[arg-type]
+            return
+
+        try:
+            with open(self.manifest_path, 'r') as manifest_file:  # type: ignore[arg-type]
+                manifest = json.load(manifest_file)
+        except ValueError:
+            print_warning(f'Could not parse the id_set manifest {self.manifest_path}, ignoring it.')
+            return
+
+        if manifest.get('version') != MANIFEST_VERSION or \
+                manifest.get('sdk_version') != get_demisto_sdk_version() or \
+                manifest.get('marketplace') != self.marketplace:
+            print_color(f'The id_set manifest {self.manifest_path} was created by a different demisto-sdk version or '
+                        f'for a different marketplace, ignoring it.', LOG_COLORS.YELLOW)
+            return
+
+        self._items = manifest.get('items', {})
+
+    def save(self):
+        """
+        Saves the items processed in the current run. Items which were not processed (e.g. deleted files)
+        are dropped from the manifest.
+        """
+        manifest_path = self.manifest_path
+        if not manifest_path:
+            return
+
+        os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+        with open(manifest_path, 'w') as manifest_file:
+            json.dump({
+                'version': MANIFEST_VERSION,
+                'sdk_version': get_demisto_sdk_version(),
+                'marketplace': self.marketplace,
+                'items': self._new_items,
+            }, manifest_file)
+
+        print_color(f'Saved the id_set manifest to {self.manifest_path}. '
+                    f'{self.hits} items were taken from the manifest, {self.misses} items were parsed.',
+                    LOG_COLORS.GREEN)
+
+    def get_pack_metadata_hash(self, path: str) -> str:
+        """
+        Items take their marketplaces from their pack metadata, so it is a part of each item hash.
+        """
+        parts = Path(path).parts
+        if PACKS_DIR not in parts or len(parts) <= parts.index(PACKS_DIR) + 1:
+            return ''
+
+        pack_metadata_path = os.path.join(*parts[:parts.index(PACKS_DIR) + 2], PACKS_PACK_META_FILE_NAME)
+        if pack_metadata_path not in self._pack_metadata_hashes:
+            self._pack_metadata_hashes[pack_metadata_path] = get_file_or_dir_hash(pack_metadata_path)
+        return self._pack_metadata_hashes[pack_metadata_path]
+
+    def get_item_hash(self, path: str, context_hash: str = '') -> str:
+        return get_context_hash([get_file_or_dir_hash(path), self.get_pack_metadata_hash(path), context_hash])
+
+    def get_cached_results(self, func: Callable, paths: List[str],
+                           context: Any = None) -> Tuple[Dict[int, Any], Dict[int, str]]:
+        """
+        Gets the results of the items which were not changed since the manifest was saved.
+
+        Args:
+            func: The item processing function.
+            paths: The paths of the items to process.
+            context: Any additional data the processing result depends on, apart from the item content.
+
+        Returns:
+            The cached results by the item index in `paths`,
+            and the hashes of the items that should be processed, by the item index in `paths`.
+        """
+        if not self.enabled:
+            return {}, {index: '' for index in range(len(paths))}
+
+        section = get_section_name(func)
+        context_hash = get_context_hash(context) if context is not None else ''
+        section_items = self._items.get(section, {})
+        new_section_items = self._new_items.setdefault(section, {})
+
+        cached_results = {}
+        item_hashes = {}
+        for index, path in enumerate(paths):
+            item_hash = self.get_item_hash(path, context_hash)
+            cached_item = section_items.get(path)
+            if cached_item and cached_item['hash'] == item_hash:
+                cached_results[index] = decode_result(cached_item['result'])
+                new_section_items[path] = cached_item
+                self.hits += 1
+            else:
+                item_hashes[index] = item_hash
+
+        return cached_results, item_hashes
+
+    def add_result(self, func: Callable, path: str, item_hash: str, result: Any):
+        """
+        Adds the result of a processed item to the manifest.
+        """
+        if not self.enabled:
+            return
+
+        # encoding copies the result, later changes to the id_set don't affect the manifest
+        section_items = self._new_items.setdefault(get_section_name(func), {})
+        section_items[path] = {'hash': item_hash, 'result': encode_result(result)}
+        self.misses += 1
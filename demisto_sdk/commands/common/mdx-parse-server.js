@@ -1,11 +1,24 @@
 const mdx = require('@mdx-js/mdx');
 const http = require('http')
 
+// the port to listen on, 0 for a free port chosen by the system
+const port = process.argv.length > 2 ? parseInt(process.argv[2]) : 6161
+
+async function parseMDX(contents) {
+    try {
+        await mdx(contents)
+        return ''
+    } catch (error) {
+        return "MDX parse failure: " + error
+    }
+}
+
 function requestHandler(req, res) {
     // console.log(req)
     if (req.method != 'POST') {
         res.statusCode = 405
         res.end('Only POST is supported')
+        return
     }
     let body = ''
     req.setEncoding('utf8');
@@ -14,21 +27,39 @@ function requestHandler(req, res) {
     })
     req.on('end', async function () {
         //   console.log('Body length: ' + body.length)
-        try {
-            parsed = await mdx(body)
-            res.end('Successfully parsed mdx')
-        } catch (error) {
+        if (req.url == '/batch') {
+            // a JSON list of documents, responded with a JSON list of their parse errors ('' for a valid document)
+            let documents
+            try {
+                documents = JSON.parse(body)
+            } catch (error) {
+                res.statusCode = 400
+                res.end("Invalid batch: " + error)
+                return
+            }
+            const errors = []
+            for (const contents of documents) {
+                errors.push(await parseMDX(contents))
+            }
+            res.setHeader('Content-Type', 'application/json')
+            res.end(JSON.stringify(errors))
+            return
+        }
+        const error = await parseMDX(body)
+        if (error) {
             res.statusCode = 500
-            res.end("MDX parse failure: " + error)
+            res.end(error)
+        } else {
+            res.end('Successfully parsed mdx')
         }
     })
 }
 
 const server = http.createServer(requestHandler);
 
-server.listen(6161, (err) => {
+server.listen(port, (err) => {
     if (err) {
         return console.log('MDX server failed starting.', err)
     }
-    console.log(`MDX server is listening on port: 6161`)
+    console.log(`MDX server is listening on port: ${server.address().port}`)
 });
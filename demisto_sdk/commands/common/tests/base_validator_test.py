@@ -9,8 +9,9 @@ from demisto_sdk.commands.common.errors import (FOUND_FILES_AND_ERRORS,
                                                 PRESET_ERROR_TO_CHECK,
                                                 PRESET_ERROR_TO_IGNORE, Errors)
 from demisto_sdk.commands.common.handlers import JSON_Handler
-from demisto_sdk.commands.common.hook_validations.base_validator import \
-    BaseValidator
+from demisto_sdk.commands.common.hook_validations.base_validator import (
+    BaseValidator, add_json_report_entries, flush_json_report,
+    pop_json_report_entries, record_reported_errors, replay_reported_errors)
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.tools import get_yaml
 from TestSuite.test_tools import ChangeCWD
@@ -116,6 +117,50 @@ def test_handle_error(mocker):
     assert 'path/to/file_name - [ST109]' in FOUND_FILES_AND_ERRORS
 
 
+def test_record_and_replay_reported_errors(mocker, tmpdir):
+    """
+    Given
+    - Errors and an ignored error reported inside a record_reported_errors block.
+
+    When
+    - Replaying the recorded errors.
+
+    Then
+    - Ensure the same messages are printed again, in the same order.
+    - Ensure the errors are added to the JSON output file and the files and errors report lists again.
+    """
+    import click
+    json_file_path = str(tmpdir / 'validate_outputs.json')
+    base_validator = BaseValidator(ignored_errors={"file_name": ["BA101"]}, print_as_warnings=True,
+                                   json_file_path=json_file_path)
+    base_validator.checked_files.update({'file_name'})
+    mocker.patch('demisto_sdk.commands.common.hook_validations.base_validator.find_type', return_value=None)
+    click_mock = mocker.patch.object(click, 'secho')
+
+    with record_reported_errors() as reported_errors:
+        base_validator.handle_error("Error-message", "SC102", "path/to/file_name")
+        base_validator.handle_error("ignore-file-specific", "BA101", "path/to/file_name")
+    flush_json_report()
+    printed = [call[0][0] for call in click_mock.call_args_list]
+    with open(json_file_path) as json_file:
+        json_outputs = json.load(json_file)
+
+    os.remove(json_file_path)
+    click_mock.reset_mock()
+    FOUND_FILES_AND_ERRORS.remove('path/to/file_name - [SC102]')
+    FOUND_FILES_AND_IGNORED_ERRORS.remove('path/to/file_name - [BA101]')
+
+    replay_reported_errors(reported_errors, json_file_path)
+    flush_json_report()
+
+    assert len(reported_errors) == 6
+    assert [call[0][0] for call in click_mock.call_args_list] == printed
+    with open(json_file_path) as json_file:
+        assert json.load(json_file) == json_outputs
+    assert 'path/to/file_name - [SC102]' in FOUND_FILES_AND_ERRORS
+    assert 'path/to/file_name - [BA101]' in FOUND_FILES_AND_IGNORED_ERRORS
+
+
 def test_handle_error_file_with_path(pack):
     """
     Given
@@ -446,6 +491,7 @@ class TestJsonOutput:
         with ChangeCWD(repo.path):
             # create new file
             base.json_output(integration.yml.path, ui_applicable_error_code, ui_applicable_error_message, False)
+            flush_json_report()
             with open(base.json_file_path) as f:
                 json_output = json.load(f)
 
@@ -453,6 +499,7 @@ class TestJsonOutput:
 
             # update existing file
             base.json_output(integration.yml.path, non_ui_applicable_error_code, non_ui_applicable_error_message, True)
+            flush_json_report()
             with open(base.json_file_path) as f:
                 json_output = json.load(f)
 
@@ -497,6 +544,7 @@ class TestJsonOutput:
         with ChangeCWD(repo.path):
             # create new file
             base.json_output(integration.yml.path, ui_applicable_error_code, ui_applicable_error_message, False)
+            flush_json_report()
             with open(base.json_file_path, 'r') as f:
                 json_output = json.load(f)
 
@@ -541,7 +589,41 @@ class TestJsonOutput:
         with ChangeCWD(repo.path):
             # create new file
             base.json_output(integration.yml.path, ui_applicable_error_code, ui_applicable_error_message, False)
+            flush_json_report()
             with open(base.json_file_path, 'r') as f:
                 json_output = json.load(f)
 
             assert json_output.sort() == expected_json_1.sort()
+
+    def test_json_output_entries_merge(self, tmpdir, mocker):
+        """
+        Given
+        - A JSON report file with an entry of a previous run.
+        - Errors reported by a worker process, and errors reported by the main process.
+
+        When
+        - Adding the entries taken from the worker to the main process entries, and writing the report twice.
+
+        Then
+        - Ensure the report file is not written before the report is flushed.
+        - Ensure all the entries are in the report, after the entry of the previous run, in the order they were added.
+        """
+        mocker.patch('demisto_sdk.commands.common.hook_validations.base_validator.find_type', return_value=None)
+        json_path = str(tmpdir / 'validate_outputs.json')
+        with open(json_path, 'w') as json_file:
+            json.dump([{'errorCode': 'BA100'}], json_file)
+        base = BaseValidator(json_file_path=json_path)
+
+        base.json_output('Packs/PackName/worker_file.yml', 'BA101', 'worker error', False)
+        worker_entries = pop_json_report_entries()
+        base.json_output('Packs/PackName/main_file.yml', 'BA102', 'main error', False)
+        add_json_report_entries(worker_entries)
+        with open(json_path) as json_file:
+            assert len(json.load(json_file)) == 1
+
+        flush_json_report()
+        base.json_output('Packs/PackName/main_file.yml', 'BA103', 'main warning', True)
+        flush_json_report()
+
+        with open(json_path) as json_file:
+            assert [entry['errorCode'] for entry in json.load(json_file)] == ['BA100', 'BA102', 'BA101', 'BA103']
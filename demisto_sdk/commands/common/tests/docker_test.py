@@ -1,11 +1,13 @@
 import os
+import time
+from datetime import timedelta
 
 import mock
 import pytest
 
 from demisto_sdk.commands.common.errors import Errors
-from demisto_sdk.commands.common.hook_validations.docker import \
-    DockerImageValidator
+from demisto_sdk.commands.common.hook_validations.docker import (
+    DockerImagesCache, DockerImageValidator)
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.tools import get_yaml
 from TestSuite.test_tools import ChangeCWD
@@ -61,6 +63,15 @@ TEST_INTEGRATION_FILE = os.path.join(FILES_PATH, 'fake_integration.yml')
 TEST_SCRIPT_FILE = os.path.join(FILES_PATH, 'fake-script.yml')
 
 
+@pytest.fixture(autouse=True)
+def clear_docker_lookups_caches():
+    yield
+    DockerImageValidator.get_docker_image_latest_tag_request.cache_clear()
+    DockerImageValidator.get_docker_image_latest_tag_from_iron_bank_request.cache_clear()
+    DockerImageValidator.get_deprecated_dockers_list.cache_clear()
+    DockerImageValidator.images_cache = None
+
+
 def mock_docker_image_validator():
     with mock.patch.object(DockerImageValidator, '__init__', lambda x, y, z, w: None):
         docker_image_validator = DockerImageValidator(None, None, None)
@@ -582,3 +593,138 @@ class TestDockerImage:
             print(docker_image_validator.is_docker_image_deprecated('demisto/aiohttp'))
             assert ('demisto/aiohttp', 'Use the demisto/py3-tools docker image instead.') == \
                 docker_image_validator.is_docker_image_deprecated('demisto/aiohttp')
+
+
+DEPRECATED_DOCKER_IMAGES = [{
+    "image_name": "demisto/aiohttp",
+    "reason": "Use the demisto/py3-tools docker image instead.",
+    "created_time_utc": "2022-05-31T17:51:17.226278Z"
+}]
+
+
+def mock_docker_hub(requests_mock):
+    requests_mock.get('https://raw.githubusercontent.com/demisto/dockerfiles/master/docker/deprecated_images.json',
+                      json=DEPRECATED_DOCKER_IMAGES)
+    return requests_mock.get('https://hub.docker.com/v2/repositories/demisto/python3/tags',
+                             json={'results': MOCK_TAG_LIST})
+
+
+class TestDockerImagesCache:
+    def test_cached_lookup_expires(self, tmpdir, mocker):
+        """
+        Given
+        - A docker images cache with a lookup cached in it.
+
+        When
+        - Getting the lookup before and after the cache TTL passed.
+
+        Then
+        - Ensure the cached value is returned before the TTL passed, and None is returned after it.
+        """
+        cache_time = time.time()
+        mocker.patch('demisto_sdk.commands.common.hook_validations.docker.time.time', return_value=cache_time)
+        images_cache = DockerImagesCache(str(tmpdir / 'docker_images'), ttl=timedelta(hours=1))
+        images_cache.set('latest_tag:demisto/python3', '1.0.0.2876')
+
+        mocker.patch('demisto_sdk.commands.common.hook_validations.docker.time.time', return_value=cache_time + 60)
+        assert images_cache.get('latest_tag:demisto/python3') == '1.0.0.2876'
+        assert images_cache.get('latest_tag:demisto/python') is None
+
+        mocker.patch('demisto_sdk.commands.common.hook_validations.docker.time.time',
+                     return_value=cache_time + 2 * 60 * 60)
+        assert images_cache.get('latest_tag:demisto/python3') is None
+
+    def test_lookups_shared_by_cache_dir(self, tmpdir, requests_mock):
+        """
+        Given
+        - A docker images cache directory, filled by a validate run.
+
+        When
+        - Looking up the same docker image in another run (the in-memory caches are cleared), using the same
+          directory.
+
+        Then
+        - Ensure the docker registry is requested only by the first run.
+        """
+        tags_request = mock_docker_hub(requests_mock)
+        cache_path = str(tmpdir / 'docker_images')
+
+        DockerImageValidator.images_cache = DockerImagesCache(cache_path)
+        assert DockerImageValidator.get_docker_image_latest_tag_request('demisto/python3') == '1.0.0.2876'
+        assert tags_request.call_count == 1
+
+        DockerImageValidator.get_docker_image_latest_tag_request.cache_clear()
+        DockerImageValidator.images_cache = DockerImagesCache(cache_path)
+        assert DockerImageValidator.get_docker_image_latest_tag_request('demisto/python3') == '1.0.0.2876'
+        assert tags_request.call_count == 1
+
+    def test_lookups_of_concurrent_processes_kept(self, tmpdir):
+        """
+        Given
+        - Two docker images caches of processes sharing the same cache directory.
+
+        When
+        - Both processes cache lookups, interleaved.
+
+        Then
+        - Ensure the lookups of both processes are kept.
+        """
+        cache_dir = str(tmpdir / 'docker_images')
+        first_cache, second_cache = DockerImagesCache(cache_dir), DockerImagesCache(cache_dir)
+
+        first_cache.set('latest_tag:demisto/python3', '1.0.0.2876')
+        second_cache.set('latest_tag:demisto/python', '1.0.0.2876')
+
+        assert second_cache.get('latest_tag:demisto/python3') == '1.0.0.2876'
+        assert first_cache.get('latest_tag:demisto/python') == '1.0.0.2876'
+
+    def test_empty_lookup_not_cached(self, tmpdir):
+        """
+        Given
+        - A docker images cache.
+
+        When
+        - A lookup finds no latest tag of a docker image.
+
+        Then
+        - Ensure the empty result is not cached, so the next run looks the image up again.
+        """
+        DockerImageValidator.images_cache = DockerImagesCache(str(tmpdir / 'docker_images'))
+        try:
+            assert DockerImageValidator.cached_lookup('latest_tag:demisto/missing', lambda: '') == ''
+            assert DockerImageValidator.images_cache.get('latest_tag:demisto/missing') is None
+        finally:
+            DockerImageValidator.images_cache = None
+
+
+def test_prefetch_docker_images(repo, requests_mock):
+    """
+    Given
+    - Two scripts using the demisto/python3 docker image, and an integration without a docker image.
+
+    When
+    - Prefetching the docker images of the files, then getting the latest tag and the deprecated images.
+
+    Then
+    - Ensure every docker image is looked up once by the prefetch, and not looked up again after it.
+    """
+    tags_request = mock_docker_hub(requests_mock)
+    python_tags_request = requests_mock.get('https://hub.docker.com/v2/repositories/demisto/python/tags',
+                                            json={'results': MOCK_TAG_LIST})
+    pack = repo.create_pack('DockerPack')
+    scripts = [pack.create_script(f'Script{index}') for index in range(2)]
+    for script in scripts:
+        script.yml.update({'dockerimage': 'demisto/python3:1.0.0.2689', 'subtype': 'python3'})
+    integration = pack.create_integration('Integration')
+    integration.yml.update({'script': {'script': '', 'type': 'python', 'subtype': 'python2'}})
+
+    with ChangeCWD(repo.path):
+        DockerImageValidator.prefetch_docker_images([script.yml.path for script in scripts] +
+                                                    [integration.yml.path, pack.pack_metadata.path])
+
+        assert tags_request.call_count == 1
+        assert python_tags_request.call_count == 1
+        assert DockerImageValidator.get_docker_image_latest_tag_request('demisto/python3') == '1.0.0.2876'
+        assert DockerImageValidator.get_deprecated_dockers_list() == DEPRECATED_DOCKER_IMAGES
+    assert tags_request.call_count == 1
+    assert requests_mock.call_count == 3
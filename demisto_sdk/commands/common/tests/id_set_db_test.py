@@ -0,0 +1,151 @@
+import os
+import pickle
+
+import pytest
+
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.id_set_db import (IDSetDB, get_id_set_db_path,
+                                                   write_id_set_db)
+from demisto_sdk.commands.common.tools import open_id_set_file
+
+json = JSON_Handler()
+
+ID_SET = {
+    'scripts': [
+        {'script1': {'name': 'Script One', 'pack': 'Pack1', 'file_path': 'Packs/Pack1/Scripts/script1.yml'}},
+        {'script2': {'name': 'Script Two', 'pack': 'Pack2', 'file_path': 'Packs/Pack2/Scripts/script2.yml'}},
+        {'script1': {'name': 'Script One', 'pack': 'Pack2', 'fromversion': '6.0.0'}},
+    ],
+    'integrations': [
+        {'integration1': {'name': 'Integration One', 'pack': 'Pack1', 'commands': ['command1']}},
+    ],
+    'Layouts': [],
+    'Packs': {
+        'Pack1': {'name': 'Pack One', 'current_version': '1.0.0'},
+        'Pack2': {'name': 'Pack Two', 'current_version': '2.0.0'},
+    },
+}
+
+
+@pytest.fixture
+def id_set_db(tmp_path):
+    db_path = str(tmp_path / 'id_set.db')
+    write_id_set_db(ID_SET, db_path)
+    with IDSetDB(db_path) as db:
+        yield db
+
+
+def test_get_id_set_db_path():
+    assert get_id_set_db_path('Tests/id_set.json') == 'Tests/id_set.db'
+
+
+def test_id_set_db_sections(id_set_db):
+    """
+    Given
+    - an id_set database
+
+    When
+    - loading its sections
+
+    Then
+    - ensure the sections are loaded only when accessed
+    - ensure the sections equal the id_set sections, including the empty and the dict sections
+    """
+    assert id_set_db.sections == list(ID_SET)
+    assert not id_set_db._sections
+
+    assert id_set_db['scripts'] == ID_SET['scripts']
+    assert list(id_set_db._sections) == ['scripts']
+
+    assert id_set_db['Packs'] == ID_SET['Packs']
+    assert id_set_db.get('Layouts') == []
+    assert id_set_db.get('Mappers', []) == []
+    assert 'Mappers' not in id_set_db
+    assert id_set_db.to_dict() == ID_SET
+
+
+def test_id_set_db_lookup(id_set_db):
+    """
+    Given
+    - an id_set database
+
+    When
+    - looking items up by id, name and pack
+
+    Then
+    - ensure the matching items are returned, without loading any section
+    """
+    assert id_set_db.get_items_by_id('script1') == [ID_SET['scripts'][0], ID_SET['scripts'][2]]
+    assert id_set_db.get_items_by_id('script1', 'integrations') == []
+    assert id_set_db.get_items_by_name('Script Two') == [ID_SET['scripts'][1]]
+    assert id_set_db.get_items_by_pack('Pack1', 'scripts') == [ID_SET['scripts'][0]]
+    assert id_set_db.get_items_by_pack('Pack1') == [ID_SET['integrations'][0], ID_SET['scripts'][0]]
+    assert id_set_db.get_items_by_id('Pack2', 'Packs') == [{'Pack2': ID_SET['Packs']['Pack2']}]
+    assert not id_set_db._sections
+
+
+def test_id_set_db_export_json(id_set_db, tmp_path):
+    """
+    Given
+    - an id_set database
+
+    When
+    - exporting it to JSON, and opening the database with open_id_set_file
+
+    Then
+    - ensure both equal the original id_set
+    """
+    json_path = tmp_path / 'exported_id_set.json'
+    id_set_db.export_json(str(json_path))
+
+    assert json.loads(json_path.read_text()) == ID_SET
+    assert open_id_set_file(id_set_db.db_path) == ID_SET
+
+
+def test_open_id_set_file_lazy(id_set_db):
+    """
+    Given
+    - an id_set database
+
+    When
+    - opening it lazily with open_id_set_file, and pickling the opened database
+
+    Then
+    - ensure the database is returned without loading any section, and can be read as the id_set dict
+    - ensure the unpickled database reads the same id_set
+    """
+    lazy_id_set = open_id_set_file(id_set_db.db_path, lazy=True)
+    try:
+        assert isinstance(lazy_id_set, IDSetDB)
+        assert not lazy_id_set._sections
+        assert len(lazy_id_set) == len(ID_SET)
+        assert dict(lazy_id_set) == ID_SET
+        assert pickle.loads(pickle.dumps(lazy_id_set)) == ID_SET
+    finally:
+        lazy_id_set.close()
+
+
+def test_id_set_db_connection_per_process(id_set_db, mocker):
+    """
+    Given
+    - an id_set database opened by a process
+
+    When
+    - reading the database in a forked process, and closing it there
+    - reading the database again after it was closed
+
+    Then
+    - ensure the forked process opens a connection of its own, and does not use or close the inherited connection
+    - ensure a connection is opened again after the database was closed
+    """
+    inherited_connection = id_set_db._connection
+    mocker.patch('demisto_sdk.commands.common.id_set_db.os.getpid', return_value=os.getpid() + 1)
+
+    assert id_set_db['scripts'] == ID_SET['scripts']
+    assert id_set_db._connection is not inherited_connection
+    id_set_db.close()
+    assert id_set_db._inherited_connections == [inherited_connection]
+    assert inherited_connection.execute('SELECT COUNT(*) FROM sections').fetchone() == (len(ID_SET),)
+
+    assert id_set_db.get_items_by_name('Script Two') == [ID_SET['scripts'][1]]
+    assert id_set_db._connection is not None
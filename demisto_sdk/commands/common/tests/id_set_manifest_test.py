@@ -0,0 +1,112 @@
+from functools import partial
+
+from demisto_sdk.commands.common.constants import FileType
+from demisto_sdk.commands.common.id_set_manifest import (IDSetManifest,
+                                                         decode_result,
+                                                         encode_result,
+                                                         get_section_name)
+
+
+def process_with_manifest(manifest, func, paths, context=None):
+    """
+    Processes the items like the id_set creation does, returns the results and the paths that were processed.
+    """
+    results, item_hashes = manifest.get_cached_results(func, paths, context)
+    for index, item_hash in item_hashes.items():
+        results[index] = func(paths[index])
+        manifest.add_result(func, paths[index], item_hash, results[index])
+    return [results[index] for index in range(len(paths))], [paths[index] for index in item_hashes]
+
+
+def process_dummy_item(path, marketplace=''):
+    return [{path: {'name': path, 'marketplace': marketplace}}], {'pack': {('integration', path)}}
+
+
+def test_encode_decode_result():
+    """
+    Given
+    - a processing result containing tuples, sets and dicts
+
+    When
+    - encoding and decoding the result
+
+    Then
+    - ensure the decoded result equals the original one
+    """
+    result = ([{'id': {'name': 'name', 'tags': ['a']}}], {'pack': {('script', 'id1'), ('script', 'id2')}})
+    assert decode_result(encode_result(result)) == result
+    assert decode_result(encode_result((None, {'id': {}}))) == (None, {'id': {}})
+
+
+def test_get_section_name():
+    """
+    Given
+    - the same processing function with different expected file types
+
+    When
+    - getting their manifest section names
+
+    Then
+    - ensure the section names are different
+    """
+    classifiers = partial(process_dummy_item, expected_file_types=(FileType.CLASSIFIER, FileType.OLD_CLASSIFIER))
+    mappers = partial(process_dummy_item, expected_file_types=(FileType.MAPPER,))
+    assert get_section_name(classifiers) != get_section_name(mappers)
+    assert get_section_name(partial(process_dummy_item, marketplace='xsoar')) == 'process_dummy_item'
+
+
+def test_manifest_get_cached_results(tmp_path):
+    """
+    Given
+    - a manifest of two items, one of them was changed after the manifest was saved
+
+    When
+    - processing the items with the manifest
+
+    Then
+    - ensure only the changed item is processed
+    - ensure the results are in the order of the given paths
+    """
+    manifest_path = str(tmp_path / 'manifest.json')
+    first_item = tmp_path / 'first.json'
+    second_item = tmp_path / 'second.json'
+    first_item.write_text('{"id": "first"}')
+    second_item.write_text('{"id": "second"}')
+    paths = [str(first_item), str(second_item)]
+    func = partial(process_dummy_item, marketplace='xsoar')
+
+    manifest = IDSetManifest(manifest_path)
+    first_results, processed = process_with_manifest(manifest, func, paths)
+    manifest.save()
+    assert processed == paths
+
+    second_item.write_text('{"id": "second", "name": "changed"}')
+    manifest = IDSetManifest(manifest_path)
+    second_results, processed = process_with_manifest(manifest, func, paths)
+    assert processed == [str(second_item)]
+    assert (manifest.hits, manifest.misses) == (1, 1)
+    assert second_results == first_results
+
+
+def test_manifest_context_changed(tmp_path):
+    """
+    Given
+    - a manifest of an item which depends on additional context (e.g. incident fields depend on incident types)
+
+    When
+    - processing the item again with a different context
+
+    Then
+    - ensure the item is processed again
+    """
+    manifest_path = str(tmp_path / 'manifest.json')
+    item = tmp_path / 'item.json'
+    item.write_text('{"id": "item"}')
+
+    manifest = IDSetManifest(manifest_path)
+    process_with_manifest(manifest, process_dummy_item, [str(item)], context=[{'type': {}}])
+    manifest.save()
+
+    manifest = IDSetManifest(manifest_path)
+    _, processed = process_with_manifest(manifest, process_dummy_item, [str(item)], context=[{'other_type': {}}])
+    assert processed == [str(item)]
@@ -4,6 +4,8 @@ import pytest
 
 from demisto_sdk.commands.common.handlers import JSON_Handler
 from demisto_sdk.commands.common.hook_validations import image
+from demisto_sdk.commands.common.hook_validations.base_validator import \
+    flush_json_report
 from demisto_sdk.commands.common.hook_validations.integration import \
     IntegrationValidator
 from demisto_sdk.commands.common.legacy_git_tools import git_path
@@ -143,6 +145,7 @@ def test_json_outputs_where_no_image_in_integration(repo):
         # Run the image validator with a json file path
         json_file_path = os.path.join(integration.path, 'json_outputs.json')
         image_validator = image.ImageValidator(integration.yml.path, json_file_path=json_file_path)
+        flush_json_report()
 
         # Check the outputs in the json file
         with open(image_validator.json_file_path, "r") as r:
@@ -514,3 +514,110 @@ def test_verify_readme_image_paths(mocker):
     assert 'please repair it:\n' \
            '![Identity with High Risk Score](https://github.com/demisto/test3.png)' \
            not in captured_output
+
+
+def test_mdx_verify_server_cached_results(mocker):
+    """
+    Given
+        - Two readme validators of the same readme content, and mdx servers which failed parsing it.
+
+    When
+        - Verifying the mdx of the readme files with the servers.
+
+    Then
+        - Ensure the content is sent to a server only once.
+        - Ensure the parse error is reported for both files.
+    """
+    mocker.patch.object(ReadMeValidator, '_MDX_SERVER_PROCESS', mocker.MagicMock())
+    mocker.patch.object(ReadMeValidator, '_MDX_SERVER_PORTS', [6161, 6162])
+    mocker.patch.object(ReadMeValidator, '_MDX_RESULTS', {})
+    handle_error = mocker.patch.object(ReadMeValidator, 'handle_error', return_value='error')
+
+    with requests_mock.Mocker() as m:
+        m.post(requests_mock.ANY, status_code=500, text='MDX parse failure: Expected a closing tag')
+        assert not ReadMeValidator(INVALID_MD).mdx_verify_server()
+        assert not ReadMeValidator(INVALID_MD).mdx_verify_server()
+
+    assert m.call_count == 1
+    assert handle_error.call_count == 2
+    assert 'Expected a closing tag' in handle_error.call_args[0][0]
+
+
+def test_prefetch_mdx_results(mocker, tmp_path):
+    """
+    Given
+        - Readme files, one of them an html readme, and two mdx servers.
+
+    When
+        - Prefetching the mdx results of the files in batches of a single file, and verifying the mdx of a file.
+
+    Then
+        - Ensure the markdown files are parsed in batches spread between the servers, and the html file is not parsed.
+        - Ensure verifying the mdx of a prefetched file does not send it to a server again.
+    """
+    mocker.patch.object(ReadMeValidator, '_MDX_SERVER_PROCESS', mocker.MagicMock())
+    mocker.patch.object(ReadMeValidator, '_MDX_SERVER_PORTS', [6161, 6162])
+    mocker.patch.object(ReadMeValidator, '_MDX_RESULTS', {})
+    mocker.patch('demisto_sdk.commands.common.hook_validations.readme.MDX_BATCH_SIZE', 1)
+    html_readme = tmp_path / 'README.md'
+    html_readme.write_text('<!-- HTML_DOC -->\n<p>html</p>')
+
+    with requests_mock.Mocker() as m:
+        m.post('http://localhost:6161/batch', json=[''])
+        m.post('http://localhost:6162/batch', json=['MDX parse failure: Expected a closing tag'])
+        ReadMeValidator.prefetch_mdx_results([VALID_MD, str(html_readme), INVALID_MD])
+        assert sorted(request.url for request in m.request_history) == ['http://localhost:6161/batch',
+                                                                        'http://localhost:6162/batch']
+        m.reset_mock()
+        assert ReadMeValidator(VALID_MD).mdx_verify_server()
+        assert not m.called
+
+
+def test_mdx_verify_server_without_servers(mocker):
+    """
+    Given
+        - A readme validator in a process which no mdx server was started for, e.g. a spawned validate worker.
+
+    When
+        - Verifying the mdx of the readme with the server.
+
+    Then
+        - Ensure an mdx server is started for the file, the readme is parsed with it, and the server is stopped.
+    """
+    mocker.patch.object(ReadMeValidator, '_MDX_SERVER_PORTS', [])
+    mocker.patch.object(ReadMeValidator, '_MDX_RESULTS', {})
+    server_process = mocker.MagicMock()
+    server_process.stdout.readline.return_value = 'MDX server is listening on port: 6163'
+    mocker.patch('demisto_sdk.commands.common.hook_validations.readme.subprocess.Popen', return_value=server_process)
+
+    with requests_mock.Mocker() as m:
+        m.post('http://localhost:6163', status_code=200)
+        assert ReadMeValidator(VALID_MD).mdx_verify_server()
+
+    assert m.call_count == 1
+    assert server_process.terminate.called
+    assert not ReadMeValidator.get_mdx_server_ports()
+
+
+def test_mdx_verify_server_failed_to_start(mocker):
+    """
+    Given
+        - A readme validator in a process which no mdx server was started for, and an mdx server which fails to start.
+
+    When
+        - Verifying the mdx of the readme with the server.
+
+    Then
+        - Ensure the failure to start the server is reported, and the readme is not sent to a server.
+    """
+    mocker.patch.object(ReadMeValidator, '_MDX_SERVER_PORTS', [])
+    server_process = mocker.MagicMock()
+    server_process.stdout.readline.return_value = 'Error: Cannot find module'
+    mocker.patch('demisto_sdk.commands.common.hook_validations.readme.subprocess.Popen', return_value=server_process)
+    handle_error = mocker.patch.object(ReadMeValidator, 'handle_error', return_value='error')
+
+    with requests_mock.Mocker() as m:
+        assert not ReadMeValidator(VALID_MD).mdx_verify_server()
+
+    assert not m.called
+    assert handle_error.call_count == 1
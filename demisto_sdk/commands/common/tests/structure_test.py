@@ -4,6 +4,8 @@ from shutil import copyfile
 from typing import List, Tuple
 
 import pytest
+from pykwalify.core import Core
+from pykwalify.errors import SchemaError
 
 from demisto_sdk.commands.common.constants import (
     CODE_FILES_REGEX, PACKAGE_YML_FILE_REGEX,
@@ -21,7 +23,8 @@ from demisto_sdk.commands.common.handlers import JSON_Handler, YAML_Handler
 from demisto_sdk.commands.common.hook_validations.base_validator import \
     BaseValidator
 from demisto_sdk.commands.common.hook_validations.structure import (
-    StructureValidator, checked_type_by_reg)
+    CompiledSchemaCore, StructureValidator, checked_type_by_reg,
+    get_compiled_schema)
 from demisto_sdk.tests.constants_test import (
     DASHBOARD_TARGET, DIR_LIST, INCIDENT_FIELD_TARGET,
     INDICATORFIELD_EXACT_SCHEME, INDICATORFIELD_EXTRA_FIELDS,
@@ -190,6 +193,37 @@ class TestStructureValidator:
         finally:
             os.remove(target)
 
+    @pytest.mark.parametrize('path', [VALID_INTEGRATION_TEST_PATH, INVALID_INTEGRATION_YML_1,
+                                      INVALID_INTEGRATION_YML_3, INVALID_INTEGRATION_YML_4])
+    def test_compiled_schema_validation(self, path):
+        """
+        Given
+        - An integration yml, and the integration schema.
+
+        When
+        - Validating the loaded integration with the compiled schema, twice.
+
+        Then
+        - Ensure the result is the same as validating the file with a pykwalify Core loading the schema file.
+        - Ensure the schema is compiled only once.
+        """
+        schema_path = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'schemas', 'integration.yml'))
+        get_compiled_schema.cache_clear()
+
+        def get_validation_errors(core: Core) -> List[str]:
+            try:
+                core.validate(raise_exception=True)
+            except SchemaError:
+                pass
+            return core.validation_errors
+
+        expected_errors = get_validation_errors(Core(source_file=path, schema_files=[schema_path]))
+        for _ in range(2):
+            source_data = StructureValidator(path, predefined_scheme='integration').current_file
+            assert get_validation_errors(CompiledSchemaCore(source_data, schema_path)) == expected_errors
+
+        assert get_compiled_schema.cache_info().misses == 1
+
     pykwalify_error_1 = " - Cannot find required key \'category\'. Path: \'\'.: Path: \'/\'>'"
     expected_error_1 = 'Missing the field "category" in root'
     pykwalify_error_2 = " - Cannot find required key \'id\'. Path: \'/commonfields\'.: Path: \'/\'>'"
@@ -394,6 +428,24 @@ class TestStructureValidator:
         structure = StructureValidator(incident_field.path)
         assert not structure.is_valid_scheme()
 
+    def test_load_data_from_file_returns_copy(self):
+        """
+        Given
+        - a structure validator of a playbook, whose loaded data is shared with the other readers of the file
+
+        When
+        - loading the playbook data with load_data_from_file, and changing the loaded data
+
+        Then
+        - ensure the change is not seen by the validator or by another validator of the same file
+        """
+        structure = StructureValidator(file_path=VALID_TEST_PLAYBOOK_PATH)
+        loaded_data = structure.load_data_from_file()
+        loaded_data['id'] = 'changed_id'
+
+        assert structure.current_file['id'] != 'changed_id'
+        assert StructureValidator(file_path=VALID_TEST_PLAYBOOK_PATH).current_file['id'] != 'changed_id'
+
 
 class TestGetMatchingRegex:
     INPUTS = [
@@ -2,11 +2,21 @@ import logging
 import tempfile
 from pathlib import Path
 
+from demisto_sdk.commands.common.handlers import JSON_Handler
 from demisto_sdk.commands.common.timers import (MEASURE_TYPE_TO_HEADERS,
                                                 MeasureType,
+                                                add_time_measurement,
+                                                add_time_measurements,
+                                                enable_time_measurements,
+                                                measure_method_time,
+                                                measure_time,
+                                                pop_time_measurements,
+                                                report_measured_time,
                                                 report_time_measurements,
                                                 timer)
 
+json = JSON_Handler()
+
 logger = logging.getLogger('demisto-sdk')
 
 
@@ -60,3 +70,83 @@ def test_timers__no_group_exist(mocker):
 
     assert some_func.stat_info().call_count == 1
     assert f'There is no timers registered for the group {not_exist_group}' in logger.debug.call_args[0][0]
+
+
+def test_measure_time__report(tmp_path):
+    """
+    Given -
+        time measurements of two names, one of them merged from the measurements popped in another process
+    When -
+        reporting the measurements with a summary of the longest one
+    Then -
+        verify the call counts and total time of the names are summed
+        verify the JSON and csv reports include all the names, and the summary only the longest one
+    """
+    enable_time_measurements()
+    try:
+        with measure_time(MeasureType.VALIDATIONS, 'SomeValidator.is_valid'):
+            pass
+        add_time_measurement(MeasureType.VALIDATIONS, 'SlowValidator.is_valid', 2.0)
+        worker_measurements = pop_time_measurements()
+        add_time_measurement(MeasureType.VALIDATIONS, 'SlowValidator.is_valid', 1.0)
+        add_time_measurements(worker_measurements)
+
+        summary = report_measured_time('test_group', str(tmp_path), measure_types=[MeasureType.VALIDATIONS], top=1)
+    finally:
+        enable_time_measurements(False)
+        pop_time_measurements()
+
+    with open(tmp_path / 'test_group_time_measurements.json') as report_file:
+        report = json.load(report_file)
+    slow_validation, validation = report[MeasureType.VALIDATIONS.value]
+    assert slow_validation == {'name': 'SlowValidator.is_valid', 'avg_time': 1.5, 'total_time': 3.0, 'call_count': 2}
+    assert validation['name'] == 'SomeValidator.is_valid' and validation['call_count'] == 1
+    assert (tmp_path / 'test_group_validations_time_measurements.csv').read_text().count('\n') == 2
+    assert 'SlowValidator.is_valid' in summary and 'SomeValidator.is_valid' not in summary
+
+
+def test_measure_time__disabled():
+    """
+    Given -
+        disabled time measurements
+    When -
+        measuring a block
+    Then -
+        verify nothing is recorded
+    """
+    with measure_time(MeasureType.VALIDATIONS, 'SomeValidator.is_valid'):
+        pass
+
+    assert pop_time_measurements() == {}
+
+
+def test_measure_method_time__nested_calls(mocker):
+    """
+    Given -
+        a measured method calling another measured method
+    When -
+        calling the outer method, with measurements enabled
+    Then -
+        verify every method is measured with its own time only, not including the time of the method it calls
+    """
+    mocker.patch('demisto_sdk.commands.common.timers.time.perf_counter', side_effect=[0.0, 1.0, 3.0, 6.0])
+
+    @measure_method_time(MeasureType.VALIDATIONS, 'SomeValidator.is_valid_inner')
+    def is_valid_inner():
+        return True
+
+    @measure_method_time(MeasureType.VALIDATIONS, 'SomeValidator.is_valid')
+    def is_valid():
+        return is_valid_inner()
+
+    enable_time_measurements()
+    try:
+        assert is_valid()
+    finally:
+        enable_time_measurements(False)
+        measurements = pop_time_measurements()
+
+    assert measurements[MeasureType.VALIDATIONS.value] == {
+        'SomeValidator.is_valid_inner': [2.0, 1],
+        'SomeValidator.is_valid': [4.0, 1],
+    }
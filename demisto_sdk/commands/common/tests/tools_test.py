@@ -8,6 +8,7 @@ from typing import List, Union
 import git
 import pytest
 import requests
+from ruamel.yaml.scalarstring import DoubleQuotedScalarString
 
 from demisto_sdk.commands.common import tools
 from demisto_sdk.commands.common.constants import (
@@ -25,17 +26,17 @@ from demisto_sdk.commands.common.tools import (
     compare_context_path_in_yml_and_readme, filter_files_by_type,
     filter_files_on_pack, filter_packagify_changes, find_type, get_code_lang,
     get_current_repo, get_dict_from_file, get_display_name,
-    get_entity_id_by_entity_type, get_entity_name_by_entity_type,
+    get_entity_id_by_entity_type, get_entity_name_by_entity_type, get_file,
     get_file_displayed_name, get_file_version_suffix_if_exists,
     get_files_in_dir, get_ignore_pack_skipped_tests, get_item_marketplaces,
-    get_last_release_version, get_last_remote_release_version,
+    get_json, get_last_release_version, get_last_remote_release_version,
     get_latest_release_notes_text, get_pack_metadata,
     get_relative_path_from_packs_dir, get_release_note_entries,
     get_release_notes_file_path, get_scripts_and_commands_from_yml_data,
     get_test_playbook_id, get_to_version, get_yaml, has_remote_configured,
     is_object_in_id_set, is_origin_content_repo, is_pack_path, is_uuid,
-    retrieve_file_ending, run_command_os, server_version_compare,
-    to_kebab_case)
+    parsed_documents_store, retrieve_file_ending, run_command_os,
+    server_version_compare, to_kebab_case)
 from demisto_sdk.tests.constants_test import (DUMMY_SCRIPT_PATH, IGNORED_PNG,
                                               INDICATORFIELD_EXTRA_FIELDS,
                                               SOURCE_FORMAT_INTEGRATION_COPY,
@@ -1918,3 +1919,91 @@ def test_get_display_name(data, answer, tmpdir):
         """
     file = File(tmpdir / 'test_file.json', '', json.dumps(data))
     assert get_display_name(file.path) == answer
+
+
+class TestParsedDocumentsStore:
+    def test_file_parsed_once(self, tmpdir):
+        """
+        Given
+            - A yml file.
+        When
+            - Getting the file several times, by its relative and absolute paths, as 'yml' and '.yml'.
+        Then
+            - Ensure the file is parsed once, and the same parsed document is returned every time.
+        """
+        parsed_documents_store.clear()
+        file = File(tmpdir / 'test_file.yml', '', 'id: test\nname: test')
+
+        with ChangeCWD(tmpdir):
+            documents = [get_yaml(file.path), get_yaml('test_file.yml'), get_dict_from_file(file.path)[0],
+                         get_file(file.path, '.yml')]
+
+        assert all(document is documents[0] for document in documents)
+        assert documents[0] == {'id': 'test', 'name': 'test'}
+        assert parsed_documents_store.parse_counts[str(Path(file.path).resolve())] == 1
+        assert parsed_documents_store.hits == 3
+
+    def test_changed_file_parsed_again(self, tmpdir):
+        """
+        Given
+            - A parsed json file.
+        When
+            - Changing the file, and getting it again.
+        Then
+            - Ensure the file is parsed again, and the changed content is returned.
+        """
+        parsed_documents_store.clear()
+        file = File(tmpdir / 'test_file.json', '', json.dumps({'id': 'test'}))
+        assert get_json(file.path) == {'id': 'test'}
+
+        file.write(json.dumps({'id': 'changed test'}))
+
+        assert get_json(file.path) == {'id': 'changed test'}
+        assert parsed_documents_store.parse_counts[str(Path(file.path).resolve())] == 2
+
+    def test_least_recently_used_documents_dropped(self, tmpdir, mocker):
+        """
+        Given
+            - A parsed documents store keeping up to two documents.
+        When
+            - Getting three files.
+        Then
+            - Ensure only the least recently used file is parsed again when it is read next.
+        """
+        mocker.patch.object(parsed_documents_store, 'max_documents', 2)
+        parsed_documents_store.clear()
+        files = [File(tmpdir / f'test_file{index}.json', '', json.dumps({'id': index})) for index in range(3)]
+        get_json(files[0].path)
+        get_json(files[1].path)
+        get_json(files[0].path)
+        get_json(files[2].path)
+
+        get_json(files[0].path)
+        get_json(files[1].path)
+
+        assert parsed_documents_store.parse_counts == {str(Path(files[0].path).resolve()): 1,
+                                                       str(Path(files[1].path).resolve()): 2,
+                                                       str(Path(files[2].path).resolve()): 1}
+
+    def test_keep_format_document(self, tmpdir):
+        """
+        Given
+            - A yml file with quoted values.
+        When
+            - Getting the file with and without keeping its format.
+        Then
+            - Ensure the file is loaded as plain data by default, and with its quotes when keeping its format.
+            - Ensure both are loaded with the same data, and kept as separate documents.
+        """
+        parsed_documents_store.clear()
+        file = File(tmpdir / 'test_file.yml', '', 'id: "test"\nname: \'test\'')
+
+        data = get_yaml(file.path)
+        formatted_data = get_yaml(file.path, keep_format=True)
+
+        assert type(data) is dict and type(data['id']) is str
+        assert type(formatted_data['id']) is DoubleQuotedScalarString
+        assert data == formatted_data
+        assert get_yaml(file.path) is data
+        assert get_dict_from_file(file.path, keep_format=True)[0] is formatted_data
+        assert parsed_documents_store.parse_counts[str(Path(file.path).resolve())] == 2
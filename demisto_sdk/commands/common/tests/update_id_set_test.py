@@ -1,5 +1,6 @@
 import logging
 import os
+import subprocess
 import sys
 import tempfile
 import unittest
@@ -15,9 +16,10 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.handlers import JSON_Handler
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.update_id_set import (
-    add_item_to_exclusion_dict, does_dict_have_alternative_key,
-    find_duplicates, get_classifier_data, get_correlation_rule_data,
-    get_dashboard_data, get_fields_by_script_argument,
+    ID_SET_ENTITIES, add_item_to_exclusion_dict, build_tasks_graph,
+    does_dict_have_alternative_key, find_duplicates, get_classifier_data,
+    get_correlation_rule_data, get_dashboard_data,
+    get_fields_by_script_argument,
     get_filters_and_transformers_from_complex_value,
     get_filters_and_transformers_from_playbook, get_general_data,
     get_generic_field_data, get_generic_module_data, get_generic_type_data,
@@ -26,10 +28,10 @@ from demisto_sdk.commands.common.update_id_set import (
     get_modeling_rule_data, get_pack_metadata_data, get_parsing_rule_data,
     get_playbook_data, get_report_data, get_script_data, get_trigger_data,
     get_values_for_keys_recursively, get_widget_data, get_xsiam_dashboard_data,
-    get_xsiam_report_data, has_duplicate, merge_id_sets, process_general_items,
-    process_incident_fields, process_integration, process_jobs,
-    process_layoutscontainers, process_script, process_wizards,
-    re_create_id_set, should_skip_item_by_mp)
+    get_xsiam_report_data, has_duplicate, merge_id_sets,
+    merge_id_sets_from_files, process_general_items, process_incident_fields,
+    process_integration, process_jobs, process_layoutscontainers,
+    process_script, process_wizards, re_create_id_set, should_skip_item_by_mp)
 from TestSuite.utils import IsEqualFunctions
 
 json = JSON_Handler()
@@ -389,6 +391,37 @@ class TestDuplicates:
         has_duplicates = has_duplicate(integrations, 'Integ', 'integrations', print_logs=False)
         assert not has_duplicates
 
+    @staticmethod
+    def test_find_duplicates_by_section_and_fields():
+        """
+        Given
+            - id_set with duplicate scripts, non overlapping scripts with the same id,
+              and an incident field and an indicator field with the same id.
+
+        When
+            - finding the id_set duplicates
+
+        Then
+            - Ensure only the overlapping scripts are found as duplicates of the scripts section.
+            - Ensure the incident and indicator fields are found as duplicates of the combined fields check.
+        """
+        id_set = {section: [] for section in ID_SET_ENTITIES}
+        id_set['scripts'] = [
+            {'dup': {'name': 'dup', 'marketplaces': ['xsoar']}},
+            {'dup': {'name': 'dup', 'marketplaces': ['xsoar']}},
+            {'versioned': {'name': 'versioned', 'marketplaces': ['xsoar'], 'toversion': '5.9.9'}},
+            {'versioned': {'name': 'versioned', 'marketplaces': ['xsoar'], 'fromversion': '6.0.0'}},
+            {'single': {'name': 'single', 'marketplaces': ['xsoar']}},
+        ]
+        id_set['IncidentFields'] = [{'incident_field': {'name': 'field', 'marketplaces': ['xsoar']}}]
+        id_set['IndicatorFields'] = [{'incident_field': {'name': 'field', 'marketplaces': ['xsoar']}}]
+
+        duplicates = find_duplicates(id_set, print_logs=False, marketplace='xsoar')
+
+        assert duplicates[ID_SET_ENTITIES.index('scripts')] == ['dup']
+        assert duplicates[-1] == ['incident_field']
+        assert sum(len(section_duplicates) for section_duplicates in duplicates) == 2
+
 
 class TestIntegrations:
     INTEGRATION_DATA = {
@@ -1027,6 +1060,40 @@ class TestPlaybooks:
         assert 'domain' in playbook_data.get('skippable_tasks', [])
         assert len(playbook_data.get('skippable_tasks', [])) == 1
 
+    @staticmethod
+    def test_build_tasks_graph_mandatory_path_found_late():
+        """
+        Given
+            - A playbook where task 3 is reached first through a skippable task (1),
+              and later through a longer path of tasks which can't be skipped (2 -> 4).
+
+        When
+            - building the tasks graph
+
+        Then
+            - task 3 and the tasks after it are mandatory, since one of the paths to them is mandatory
+            - task 1 is skippable, and task 6 is unreachable
+        """
+        playbook = {
+            'id': 'playbook',
+            'starttaskid': '0',
+            'tasks': {
+                '0': {'nexttasks': {'#none#': ['1', '2']}},
+                '1': {'nexttasks': {'#none#': ['3']}, 'skipunavailable': True},
+                '2': {'nexttasks': {'#none#': ['4']}},
+                '4': {'nexttasks': {'#none#': ['3']}},
+                '3': {'nexttasks': {'#none#': ['5']}},
+                '5': {},
+                '6': {'nexttasks': {'#none#': ['5']}},
+            }
+        }
+        graph = build_tasks_graph(playbook)
+
+        assert graph.is_skippable('1')
+        assert not any(graph.is_skippable(task_id) for task_id in ('0', '2', '3', '4', '5'))
+        assert not graph.is_reachable('6')
+        assert not graph.is_reachable('no such task')
+
     @staticmethod
     def test_get_filters_from_playbook_tasks():
         """
@@ -3296,6 +3363,64 @@ def test_merged_id_sets_with_legal_duplicates(caplog):
     assert duplicates == ['playbook_foo1']
 
 
+MERGE_FIRST_ID_SET = {
+    'scripts': [
+        {'ScriptFoo': {'name': 'ScriptFoo', 'pack': 'Foo', 'marketplaces': ['xsoar'], 'toversion': '5.9.9'}},
+        {'ScriptBar': {'name': 'ScriptBar', 'pack': 'Bar', 'marketplaces': ['xsoar'], 'file_path': 'a/b.yml'}},
+    ],
+    'playbooks': [],
+    'Packs': {'Foo': {'name': 'Foo'}, 'Bar': {'name': 'Bar'}},
+}
+
+MERGE_SECOND_ID_SET = {
+    'scripts': [
+        {'ScriptFoo': {'name': 'ScriptFoo', 'pack': 'Foo2', 'marketplaces': ['xsoar'], 'fromversion': '6.0.0'}},
+        {'ScriptBar': {'name': 'ScriptBar', 'pack': 'Bar', 'marketplaces': ['xsoar'], 'file_path': 'a/b.yml'}},
+        {'ScriptBaz': {'name': 'ScriptBaz', 'pack': 'Baz', 'marketplaces': ['xsoar']}},
+    ],
+    'Packs': {'Baz': {'name': 'Baz'}, 'Bar': {'name': 'Bar', 'current_version': '1.0.1'}},
+    'integrations': [{'IntegrationBaz': {'name': 'IntegrationBaz', 'pack': 'Baz'}}],
+    'Mappers': [],
+}
+
+
+@pytest.mark.parametrize('second_id_set, expected_duplicates', [
+    (MERGE_SECOND_ID_SET, []),
+    ({'scripts': [{'ScriptBar': {'name': 'ScriptBar', 'pack': 'Bar2', 'marketplaces': ['xsoar']}}]}, ['ScriptBar']),
+])
+def test_merge_id_sets_from_files_streaming(tmp_path, second_id_set, expected_duplicates):
+    """
+    Given
+    - two id_set files, with or without duplicate items
+
+    When
+    - merging them with and without the streaming mode
+
+    Then
+    - ensure the same duplicates are found
+    - ensure both modes write the same output file, or don't write it when there are duplicates
+    """
+    first_path, second_path = tmp_path / 'first.json', tmp_path / 'second.json'
+    first_path.write_text(json.dumps(MERGE_FIRST_ID_SET, indent=4))
+    second_path.write_text(json.dumps(second_id_set, indent=4))
+    output_path, streaming_output_path = tmp_path / 'output.json', tmp_path / 'streaming_output.json'
+
+    unified_id_set, duplicates = merge_id_sets_from_files(first_path, second_path, output_path)
+    _, streaming_duplicates = merge_id_sets_from_files(first_path, second_path, streaming_output_path,
+                                                       streaming=True)
+
+    assert duplicates == streaming_duplicates == expected_duplicates
+    if expected_duplicates:
+        assert not output_path.exists()
+        assert not streaming_output_path.exists()
+    else:
+        assert streaming_output_path.read_text() == output_path.read_text()
+        assert list(json.loads(output_path.read_text())) == ['scripts', 'playbooks', 'Packs', 'integrations']
+        assert unified_id_set.get_list('scripts') == MERGE_FIRST_ID_SET['scripts'] + [
+            MERGE_SECOND_ID_SET['scripts'][0], MERGE_SECOND_ID_SET['scripts'][2]]
+    assert not (tmp_path / 'streaming_output.json.tmp').exists()
+
+
 def test_get_filters_and_transformers_from_complex_value():
     """
     Given
@@ -3450,3 +3575,34 @@ def test_add_item_to_exclusion_dict():
     add_item_to_exclusion_dict(excluded_items_from_id_set, file_path, "Cortex XDR")
 
     assert IsEqualFunctions.is_dicts_equal(expected_result, excluded_items_from_id_set)
+
+
+LISTS_NAMES_SCRIPT = '''
+from demisto_sdk.commands.common.update_id_set import build_tasks_graph, get_lists_names_from_playbook
+tasks = {'0': {'id': '0', 'type': 'start', 'nexttasks': {'#none#': ['1', '2', '3', '4', '5']}}}
+for index, list_name in enumerate(['list_c', 'list_a', 'list_e', 'list_b', 'list_d'], start=1):
+    tasks[str(index)] = {'id': str(index), 'skipunavailable': True,
+                         'task': {'script': 'Builtin|||setList'},
+                         'scriptarguments': {'listName': {'simple': list_name}}}
+playbook = {'id': 'playbook', 'starttaskid': '0', 'tasks': tasks}
+print(get_lists_names_from_playbook(playbook, build_tasks_graph(playbook)))
+'''
+
+
+def test_get_lists_names_from_playbook_order():
+    """
+    Given
+        - A playbook which uses several lists.
+    When
+        - Getting the lists of the playbook in processes with different hash seeds.
+    Then
+        - Ensure the lists and the skippable lists are in the same sorted order in both processes.
+    """
+    outputs = [
+        subprocess.run([sys.executable, '-c', LISTS_NAMES_SCRIPT], env={**os.environ, 'PYTHONHASHSEED': hash_seed},
+                       capture_output=True, text=True, check=True).stdout
+        for hash_seed in ('1', '2')
+    ]
+
+    sorted_lists = ['list_a', 'list_b', 'list_c', 'list_d', 'list_e']
+    assert outputs[0] == outputs[1] == f'{(sorted_lists, sorted_lists)}\n'
@@ -1,20 +1,25 @@
 # STD python packages
 import logging
+import threading
 import time
 from collections import defaultdict, namedtuple
+from contextlib import contextmanager
 from dataclasses import astuple, dataclass
 from datetime import datetime
 from enum import Enum
 from functools import wraps
 from pathlib import Path
-from typing import Dict, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence
 
 # Third party packages
 from tabulate import tabulate
 
 # Local packages
+from demisto_sdk.commands.common.handlers import JSON_Handler
 from demisto_sdk.commands.common.logger import Colors
 
+json = JSON_Handler()
+
 logger = logging.getLogger('demisto-sdk')
 
 StatInfo = namedtuple("StatInfo", ["total_time", "call_count", "avg_time"])
@@ -23,15 +28,30 @@ registered_timers: dict = defaultdict(set)
 
 packs: dict = {}
 
+# whether `measure_time` and `add_time_measurement` record time measurements, see `enable_time_measurements`
+time_measurements_enabled = False
+
+# the time measurements of `add_time_measurement`, by measure type value and measured name: [total time, call count]
+time_measurements: Dict[str, Dict[str, List[float]]] = defaultdict(dict)
+
+# the time of the nested measured calls of every running `measure_method_time` call of the current thread
+_nested_calls_times = threading.local()
+
 
 class MeasureType(Enum):
     FUNCTIONS = 'functions'
     PACKS = 'packs'
+    VALIDATIONS = 'validations'
+    FILE_TYPES = 'file_types'
+    VALIDATED_PACKS = 'validated_packs'
 
 
 MEASURE_TYPE_TO_HEADERS: Dict[MeasureType, Sequence[str]] = {
     MeasureType.FUNCTIONS: ['Function', 'Avg', 'Total', 'Call count'],
-    MeasureType.PACKS: ['Pack', 'Start Time', 'End Time', 'Total Time']
+    MeasureType.PACKS: ['Pack', 'Start Time', 'End Time', 'Total Time'],
+    MeasureType.VALIDATIONS: ['Validation', 'Avg', 'Total', 'Call count'],
+    MeasureType.FILE_TYPES: ['File type', 'Avg', 'Total', 'Call count'],
+    MeasureType.VALIDATED_PACKS: ['Pack', 'Avg', 'Total', 'Call count'],
 }
 
 
@@ -164,6 +184,153 @@ def report_time_measurements(group_name='Common', time_measurements_dir='time_me
         logger.debug(f'There is no timers registered for the group {group_name}')
 
 
+def enable_time_measurements(enabled: bool = True):
+    """
+    Starts (or stops) recording the time measurements of `measure_time` and `add_time_measurement`.
+    The measurements are not recorded by default, so the measured code runs almost as fast as without them.
+    """
+    global time_measurements_enabled
+    time_measurements_enabled = enabled
+
+
+def add_time_measurement(measure_type: MeasureType, name: str, elapsed_time: float):
+    """
+    Adds a call of `elapsed_time` seconds to the time measurements of a measured name, if measurements are enabled.
+    """
+    if not time_measurements_enabled:
+        return
+    measurement = time_measurements[measure_type.value].setdefault(name, [0.0, 0])
+    measurement[0] += elapsed_time
+    measurement[1] += 1
+
+
+@contextmanager
+def measure_time(measure_type: MeasureType, name: str) -> Iterator[None]:
+    """
+    Measures the time of the block as a call of a measured name, see `add_time_measurement`.
+    """
+    if not time_measurements_enabled:
+        yield
+        return
+    tic = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_time_measurement(measure_type, name, time.perf_counter() - tic)
+
+
+def measure_method_time(measure_type: MeasureType, name: str):
+    """
+    Decorates a function to measure the time of its calls as calls of a measured name, see `add_time_measurement`.
+    The time of the measured functions of the same measure type called by the function is not counted in its own
+    time, so a measured function called by another one is not counted twice.
+    """
+
+    def measure_decorator(func):
+        @wraps(func)
+        def wrapper_measure(*args, **kwargs):
+            if not time_measurements_enabled:
+                return func(*args, **kwargs)
+            nested_calls_times: List[float] = _nested_calls_times.__dict__.setdefault(measure_type.value, [])
+            nested_calls_times.append(0.0)
+            tic = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed_time = time.perf_counter() - tic
+                add_time_measurement(measure_type, name, elapsed_time - nested_calls_times.pop())
+                if nested_calls_times:
+                    nested_calls_times[-1] += elapsed_time
+
+        return wrapper_measure
+
+    return measure_decorator
+
+
+def pop_time_measurements() -> Dict[str, Dict[str, List[float]]]:
+    """
+    Takes the time measurements recorded so far, e.g. to pass the measurements of a worker process to the main
+    process. The taken measurements are not reported by `report_measured_time`.
+
+    Returns:
+        The measurements, by measure type value and measured name.
+    """
+    measurements = {measure_type: dict(names) for measure_type, names in time_measurements.items()}
+    time_measurements.clear()
+    return measurements
+
+
+def add_time_measurements(measurements: Dict[str, Dict[str, List[float]]]):
+    """
+    Adds time measurements taken by `pop_time_measurements`, to be reported by the next `report_measured_time`.
+    """
+    for measure_type, names in measurements.items():
+        for name, (total_time, call_count) in names.items():
+            measurement = time_measurements[measure_type].setdefault(name, [0.0, 0])
+            measurement[0] += total_time
+            measurement[1] += call_count
+
+
+def get_time_measurements_stats(measure_type: MeasureType) -> List[List[str]]:
+    """
+    The time measurements of a measure type, as [name, avg, total, call count] rows sorted by the total time.
+    """
+    measurements = sorted(time_measurements.get(measure_type.value, {}).items(),
+                          key=lambda measurement: measurement[1][0], reverse=True)
+    return [
+        [name, f'{total_time / call_count if call_count else 0:0.4f}', f'{total_time:0.4f}', f'{int(call_count)}']
+        for name, (total_time, call_count) in measurements
+    ]
+
+
+def report_measured_time(group_name: str, time_measurements_dir: str, measure_types: Sequence[MeasureType],
+                         top: int = 20) -> str:
+    """
+    Reports the time measurements of `add_time_measurement`: writes a JSON report of all the measure types and a
+    csv file of every measure type to the time measurements directory.
+
+    Args:
+        group_name: the name of the reported group, the report files are named after it.
+        time_measurements_dir: directory for the time measurements report files.
+        measure_types: the measure types to report.
+        top: the number of names with the longest total time to include in the summary of every measure type.
+
+    Returns:
+        The summary tables of the measure types.
+    """
+    summary = ''
+    json_report = {}
+    for measure_type in measure_types:
+        stats = get_time_measurements_stats(measure_type)
+        json_report[measure_type.value] = [
+            {'name': name, 'avg_time': float(avg_time), 'total_time': float(total_time),
+             'call_count': int(call_count)}
+            for name, avg_time, total_time, call_count in stats
+        ]
+        write_measure_to_file(time_measurements_dir, f'{group_name}_{measure_type.value}', stats,
+                              measure_type=measure_type)
+        if stats:
+            summary += get_measure_table(f'{group_name} {measure_type.value.replace("_", " ")} (top {top})',
+                                         stats[:top], measure_type) + '\n'
+
+    try:
+        time_measurements_path = Path(time_measurements_dir)
+        time_measurements_path.mkdir(parents=True, exist_ok=True)
+        with open(time_measurements_path / f'{group_name}_time_measurements.json', 'w') as file:
+            json.dump(json_report, file, indent=4)
+    except Exception as e:
+        logger.error(f"can't write time measure to file {e}")
+    return summary
+
+
+def get_measure_table(name: str, csv_data, measure_type: MeasureType = MeasureType.FUNCTIONS) -> str:
+    sentence = f'Time measurements stat for {name}'
+    output_msg = f"\n{Colors.Fg.cyan}{'#' * len(sentence)}\n" \
+                 f"{sentence}\n" \
+                 f"{'#' * len(sentence)}\n{Colors.reset}"
+    return output_msg + tabulate(csv_data, headers=MEASURE_TYPE_TO_HEADERS[measure_type])
+
+
 def write_measure_to_logger(name: str, csv_data, measure_type: MeasureType = MeasureType.FUNCTIONS,
                             debug: bool = False):
     """
@@ -177,12 +344,7 @@ def write_measure_to_logger(name: str, csv_data, measure_type: MeasureType = Mea
     Returns:
 
     """
-    sentence = f'Time measurements stat for {name}'
-    output_msg = f"\n{Colors.Fg.cyan}{'#' * len(sentence)}\n" \
-                 f"{sentence}\n" \
-                 f"{'#' * len(sentence)}\n{Colors.reset}"
-    stat_info_table = tabulate(csv_data, headers=MEASURE_TYPE_TO_HEADERS[measure_type])
-    output_msg += stat_info_table
+    output_msg = get_measure_table(name, csv_data, measure_type)
     if debug:
         logger.debug(output_msg)
     else:
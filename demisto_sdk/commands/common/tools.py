@@ -1,5 +1,6 @@
 import argparse
 import glob
+import hashlib
 import io
 import logging
 import os
@@ -7,7 +8,7 @@ import re
 import shlex
 import sys
 import urllib.parse
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 from concurrent.futures import as_completed
 from configparser import ConfigParser, MissingSectionHeaderError
 from contextlib import contextmanager
@@ -16,8 +17,10 @@ from enum import Enum
 from functools import lru_cache
 from pathlib import Path, PosixPath
 from subprocess import DEVNULL, PIPE, Popen, check_output
+from threading import Lock
 from time import sleep
-from typing import Callable, Dict, List, Match, Optional, Set, Tuple, Union
+from typing import (Any, Callable, Dict, Iterator, List, Match, Optional, Set,
+                    Tuple, Union)
 
 import click
 import colorama
@@ -28,6 +31,7 @@ import requests
 import urllib3
 from packaging.version import parse
 from pebble import ProcessFuture, ProcessPool
+from pkg_resources import DistributionNotFound, get_distribution
 from requests.exceptions import HTTPError
 
 from demisto_sdk.commands.common.constants import (
@@ -50,12 +54,14 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.git_content_config import (GitContentConfig,
                                                             GitProvider)
 from demisto_sdk.commands.common.git_util import GitUtil
-from demisto_sdk.commands.common.handlers import JSON_Handler, YAML_Handler
+from demisto_sdk.commands.common.handlers import (JSON_Handler, YAML_Handler,
+                                                  YAML_Safe_Handler)
 
 json = JSON_Handler()
 
 logger = logging.getLogger("demisto-sdk")
 yaml = YAML_Handler()
+yaml_safe = YAML_Safe_Handler()
 
 urllib3.disable_warnings()
 
@@ -586,10 +592,110 @@ def get_last_remote_release_version():
     return ''
 
 
-@lru_cache()
-def get_file(file_path, type_of_file, clear_cache=False):
+# the number of parsed files kept by the parsed documents store
+MAX_PARSED_DOCUMENTS = 512
+
+
+class ParsedDocumentsStore:
+    """
+    The files parsed by `get_file`, by their resolved paths and the type they were parsed as.
+
+    A file is parsed again only when its modification time or size changed since it was parsed, so all the readers
+    of a file, e.g. the validators of a validated file, get the same parsed document of it. The documents are shared,
+    and must not be changed by the readers. The least recently used documents are dropped when more than
+    `max_documents` documents are kept.
+    """
+
+    def __init__(self, max_documents: int = MAX_PARSED_DOCUMENTS):
+        self.max_documents = max_documents
+        self.documents: 'OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], Any]]' = OrderedDict()
+        # the number of times every file was parsed, by its resolved path
+        self.parse_counts: Counter = Counter()
+        # the number of times a parsed document was reused instead of parsing its file
+        self.hits = 0
+        self.lock = Lock()
+
+    def get(self, file_path: Union[Path, str], type_of_file: str, parse: Callable[[], Any]) -> Any:
+        """
+        Gets the parsed document of a file, parsing the file only if it was not parsed since it was last changed.
+
+        Args:
+            file_path: The path of the file.
+            type_of_file: The type the file is parsed as, part of the document key.
+            parse: Parses the file, called without the store lock held.
+
+        Returns:
+            The parsed document.
+        """
+        resolved_path = str(Path(file_path).expanduser().resolve())
+        file_stat = os.stat(resolved_path)
+        key = (resolved_path, type_of_file)
+        file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+        with self.lock:
+            document = self.documents.get(key)
+            if document and document[0] == file_version:
+                self.documents.move_to_end(key)
+                self.hits += 1
+                return document[1]
+
+        data = parse()
+        with self.lock:
+            self.parse_counts[resolved_path] += 1
+            self.documents[key] = (file_version, data)
+            self.documents.move_to_end(key)
+            if len(self.documents) > self.max_documents:
+                self.documents.popitem(last=False)
+        return data
+
+    def invalidate(self, file_path: Union[Path, str]):
+        """
+        Drops the parsed documents of a file, so it is parsed again when it is read next.
+        """
+        resolved_path = str(Path(file_path).expanduser().resolve())
+        with self.lock:
+            for key in [key for key in self.documents if key[0] == resolved_path]:
+                del self.documents[key]
+
+    def clear(self):
+        """
+        Drops all the parsed documents and resets the counters, e.g. when a validate run starts.
+        """
+        with self.lock:
+            self.documents.clear()
+            self.parse_counts.clear()
+            self.hits = 0
+
+
+parsed_documents_store = ParsedDocumentsStore()
+
+
+def get_file(file_path, type_of_file, clear_cache=False, keep_format=False):
+    """
+    Gets the parsed content of a yml or json file from the parsed documents store (see `ParsedDocumentsStore`),
+    parsing the file only if it was changed since it was last parsed. The returned data is shared with the other
+    readers of the file, and must not be changed.
+
+    Args:
+        file_path: The path of the file.
+        type_of_file: The type of the file, yml or json. Files with a different suffix are not parsed.
+        clear_cache: Whether to parse the file again even if it was not changed.
+        keep_format: Whether to load a yml file with the round-trip loader, keeping its quotes and formatting, for
+         files which are written back. Otherwise the yml file is loaded with the faster read-only safe loader.
+
+    Returns:
+        The parsed file, or an empty dict if the file is not a dict or a list.
+    """
     if clear_cache:
-        get_file.cache_clear()
+        parsed_documents_store.invalidate(file_path)
+    # the file is parsed the same as 'yml' and '.yml', so both are kept as the same document
+    document_type = type_of_file.lstrip('.')
+    if keep_format and document_type == 'yml':
+        document_type = 'yml:keep_format'
+    return parsed_documents_store.get(file_path, document_type,
+                                      lambda: parse_file(file_path, type_of_file, keep_format=keep_format))
+
+
+def parse_file(file_path, type_of_file, keep_format=False):
     file_path = Path(file_path)
     data_dictionary = None
     with open(file_path.expanduser(), mode="r", encoding="utf8") as f:
@@ -600,7 +706,7 @@ def get_file(file_path, type_of_file, clear_cache=False):
             stream = io.StringIO(replaced)
             try:
                 if type_of_file in ('yml', '.yml'):
-                    data_dictionary = yaml.load(stream)
+                    data_dictionary = (yaml if keep_format else yaml_safe).load(stream)
 
                 else:
                     data_dictionary = json.load(stream)
@@ -613,13 +719,11 @@ def get_file(file_path, type_of_file, clear_cache=False):
     return {}
 
 
-def get_yaml(file_path, cache_clear=False):
-    return get_file(file_path, 'yml', clear_cache=cache_clear)
+def get_yaml(file_path, cache_clear=False, keep_format=False):
+    return get_file(file_path, 'yml', clear_cache=cache_clear, keep_format=keep_format)
 
 
 def get_json(file_path, cache_clear=False):
-    if cache_clear:
-        get_file.cache_clear()
     return get_file(file_path, 'json', clear_cache=cache_clear)
 
 
@@ -1262,14 +1366,15 @@ def get_dev_requirements(py_version, envs_dirs_base):
     return requirements
 
 
-def get_dict_from_file(path: str,
-                       raises_error: bool = True, clear_cache: bool = False) -> Tuple[Dict, Union[str, None]]:
+def get_dict_from_file(path: str, raises_error: bool = True, clear_cache: bool = False,
+                       keep_format: bool = False) -> Tuple[Dict, Union[str, None]]:
     """
     Get a dict representing the file
 
     Arguments:
         path - a path to the file
         raises_error - Whether to raise a FileNotFound error if `path` is not a valid file.
+        keep_format - Whether to keep the quotes and formatting of a yml file, for files which are written back.
 
     Returns:
         dict representation of the file, and the file_type, either .yml or .json
@@ -1277,7 +1382,7 @@ def get_dict_from_file(path: str,
     try:
         if path:
             if path.endswith('.yml'):
-                return get_yaml(path, cache_clear=clear_cache), 'yml'
+                return get_yaml(path, cache_clear=clear_cache, keep_format=keep_format), 'yml'
             elif path.endswith('.json'):
                 return get_json(path, cache_clear=clear_cache), 'json'
             elif path.endswith('.py'):
@@ -1936,11 +2041,31 @@ def camel_to_snake(camel: str) -> str:
     return snake
 
 
-def open_id_set_file(id_set_path):
-    id_set = {}
+def open_id_set_file(id_set_path, lazy: bool = False):
+    """
+    Opens an id_set JSON file or an id_set database.
+
+    Args:
+        id_set_path: The path of the id_set file.
+        lazy: Whether to return the opened IDSetDB of an id_set database, which loads every section only when
+            it is accessed, instead of loading all the sections.
+
+    Returns:
+        The id_set, or an empty dict when it could not be opened.
+    """
+    from demisto_sdk.commands.common.id_set_db import ID_SET_DB_SUFFIX, IDSetDB
+
+    id_set: Any = {}
     try:
-        with open(id_set_path, 'r') as id_set_file:
-            id_set = json.load(id_set_file)
+        if str(id_set_path).endswith(ID_SET_DB_SUFFIX):
+            if lazy:
+                id_set = IDSetDB(id_set_path)
+            else:
+                with IDSetDB(id_set_path) as id_set_db:
+                    id_set = id_set_db.to_dict()
+        else:
+            with open(id_set_path, 'r') as id_set_file:
+                id_set = json.load(id_set_file)
     except IOError:
         print_warning("Could not open id_set file")
         raise
@@ -2563,13 +2688,20 @@ def get_pack_dir(path):
 
 
 @contextmanager
-def ProcessPoolHandler() -> ProcessPool:
+def ProcessPoolHandler(max_workers: int = 3, initializer: Optional[Callable] = None,
+                       initargs: tuple = ()) -> Iterator[ProcessPool]:
     """ Process pool Handler which terminate all processes in case of Exception.
 
+    Args:
+        max_workers: The number of worker processes.
+        initializer: A function each worker process runs once when it starts, e.g. to keep data shared by all
+         the tasks, instead of passing it to every task.
+        initargs: The arguments of the initializer.
+
     Yields:
         ProcessPool: Pebble process pool.
     """
-    with ProcessPool(max_workers=3) as pool:
+    with ProcessPool(max_workers=max_workers, initializer=initializer, initargs=initargs) as pool:
         try:
             yield pool
         except Exception:
@@ -2910,3 +3042,66 @@ def normalize_field_name(field: str) -> str:
         field (str): the incident/indicator field.
     """
     return field.replace('incident_', '').replace('indicator_', '')
+
+
+@lru_cache()
+def get_demisto_sdk_version() -> str:
+    """
+    Get the installed demisto-sdk version.
+
+    Returns:
+        str: The demisto-sdk version, or 'dev' when running from a source checkout.
+    """
+    try:
+        return get_distribution('demisto-sdk').version
+    except DistributionNotFound:
+        return 'dev'
+
+
+def get_file_or_dir_hash(path: Union[Path, str]) -> str:
+    """
+    Calculate a content hash of a file, or of all the files under a directory (e.g. an integration package).
+
+    Args:
+        path (Path|str): the file or directory path.
+
+    Returns:
+        str: the sha256 hex digest of the content, or an empty string if the path does not exist.
+    """
+    path = Path(path)
+    if path.is_file():
+        files = [path]
+    elif path.is_dir():
+        files = sorted(file_path for file_path in path.rglob('*') if file_path.is_file())
+    else:
+        return ''
+
+    content_hash = hashlib.sha256()
+    for file_path in files:
+        content_hash.update(str(file_path.relative_to(path)).encode())
+        content_hash.update(file_path.read_bytes())
+    return content_hash.hexdigest()
+
+
+def get_peak_memory_usage() -> Tuple[float, float]:
+    """
+    Get the peak resident memory of the current process and of its (terminated) child processes.
+
+    Returns:
+        tuple: The peak memory in MB of the current process and of the largest child process,
+         (0, 0) on platforms without the `resource` module (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0.0, 0.0
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    unit = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / unit,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / unit)
+
+
+def get_peak_memory_usage_message() -> str:
+    self_peak, children_peak = get_peak_memory_usage()
+    return f'Peak memory usage: {self_peak:.1f} MB (main process), {children_peak:.1f} MB (largest worker process)'
@@ -1,7 +1,9 @@
 import copy
+import dataclasses
 import glob
 import itertools
 import os
+import queue
 import re
 import time
 from collections import OrderedDict
@@ -9,12 +11,12 @@ from datetime import datetime
 from distutils.version import LooseVersion
 from enum import Enum
 from functools import partial
+from json import JSONDecoder
 from multiprocessing import Pool, cpu_count
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import click
-import networkx
 
 from demisto_sdk.commands.common.constants import (
     CLASSIFIERS_DIR, COMMON_TYPES_PACK, CORRELATION_RULES_DIR, DASHBOARDS_DIR,
@@ -27,18 +29,22 @@ from demisto_sdk.commands.common.constants import (
     TRIGGER_DIR, WIDGETS_DIR, WIZARDS_DIR, XSIAM_DASHBOARDS_DIR,
     XSIAM_REPORTS_DIR, FileType, MarketplaceVersions)
 from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.id_set_manifest import IDSetManifest
 from demisto_sdk.commands.common.tools import (LOG_COLORS, find_type,
                                                get_current_repo,
                                                get_display_name, get_file,
                                                get_item_marketplaces, get_json,
-                                               get_pack_name, get_yaml,
-                                               print_color, print_error,
-                                               print_warning)
+                                               get_pack_name,
+                                               get_peak_memory_usage_message,
+                                               get_yaml, print_color,
+                                               print_error, print_warning)
 from demisto_sdk.commands.unify.integration_script_unifier import \
     IntegrationScriptUnifier
 
 json = JSON_Handler()
 
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
 
 CONTENT_ENTITIES = ['Packs', 'Integrations', 'Scripts', 'Playbooks', 'TestPlaybooks', 'Classifiers',
                     'Dashboards', 'IncidentFields', 'IncidentTypes', 'IndicatorFields', 'IndicatorTypes',
@@ -189,60 +195,84 @@ def should_skip_item_by_mp(file_path: str, marketplace: str, excluded_items_from
     return False
 
 
-def build_tasks_graph(playbook_data):
+class PlaybookTasksGraph:
     """
-    Builds tasks flow graph.
-
-    Args:
-        playbook_data (dict): playbook yml data.
+    The flow graph of the playbook tasks, held as adjacency lists of task indexes.
 
-    Returns:
-        DiGraph: all tasks of given playbook.
+    A task is reachable if there is a path to it from the start task, and mandatory if one of these paths
+    goes only through tasks which can't be skipped (i.e. without `skipunavailable`).
+    Both are computed once, when the graph is built.
     """
-    initial_task = playbook_data.get('starttaskid', '')
-    tasks = playbook_data.get('tasks', {})
-
-    graph = networkx.DiGraph()
-    graph.add_node(initial_task, mandatory=True)  # add starting task as root of the direct graph
 
-    found_new_tasks = True
-    while found_new_tasks:
-        current_number_of_nodes = graph.number_of_nodes()
-        leaf_nodes = {node for node in graph.nodes() if graph.out_degree(node) == 0}
+    def __init__(self, playbook_data: dict):
+        tasks = playbook_data.get('tasks') or {}
+        self.playbook_id = playbook_data.get('id')
+        self.task_indexes: Dict[str, int] = {task_id: index for index, task_id in enumerate(tasks)}
+        self.next_tasks: List[List[int]] = []
+        self.skippable_tasks: List[bool] = []
+        missing_next_tasks: Dict[int, List[str]] = {}
+        for index, task in enumerate(tasks.values()):
+            task = task or {}
+            next_tasks = []
+            for next_task_ids in (task.get('nexttasks') or {}).values():
+                for next_task_id in next_task_ids or []:
+                    if next_task_id in self.task_indexes:
+                        next_tasks.append(self.task_indexes[next_task_id])
+                    else:
+                        missing_next_tasks.setdefault(index, []).append(next_task_id)
+            self.next_tasks.append(next_tasks)
+            self.skippable_tasks.append(bool(task.get('skipunavailable', False)))
 
-        for leaf in leaf_nodes:
-            leaf_task = tasks.get(leaf)
-            leaf_mandatory = graph.nodes[leaf]['mandatory']
+        self.reachable: Set[int] = set()
+        self.mandatory: Set[int] = set()
 
+        start_task_id = playbook_data.get('starttaskid', '')
+        start_task = self.task_indexes.get(start_task_id)
+        if start_task is None:
             # In this case the playbook is invalid, starttaskid contains invalid task id.
-            if not leaf_task:
-                print_warning(f'{playbook_data.get("id")}: No such task {leaf} in playbook')
-                continue
-
-            leaf_next_tasks = sum(leaf_task.get('nexttasks', {}).values(), [])  # type: ignore
-
-            for task_id in leaf_next_tasks:
-                task = tasks.get(task_id)
-                if not task:
-                    print_warning(f'{playbook_data.get("id")}: No such task {leaf} in playbook')
-                    continue
+            print_warning(f'{self.playbook_id}: No such task {start_task_id} in playbook')
+            return
 
-                # If task can't be skipped and predecessor task is mandatory - set as mandatory.
-                mandatory = leaf_mandatory and not task.get('skipunavailable', False)
-                if task_id not in graph.nodes():
-                    graph.add_node(task_id, mandatory=mandatory)
-                else:
-                    # If task already in graph, update mandatory field.
-                    # If one of the paths to the task is mandatory - set as mandatory.
-                    graph.nodes[task_id]['mandatory'] = graph.nodes[task_id]['mandatory'] or mandatory
-                graph.add_edge(leaf, task_id)
+        self.reachable = self._traverse(start_task)
+        self.mandatory = self._traverse(start_task, mandatory_only=True)
+        for index in sorted(self.reachable.intersection(missing_next_tasks)):
+            for next_task_id in missing_next_tasks[index]:
+                print_warning(f'{self.playbook_id}: No such task {next_task_id} in playbook')
+
+    def _traverse(self, start_task: int, mandatory_only: bool = False) -> Set[int]:
+        visited = {start_task}
+        to_visit = [start_task]
+        while to_visit:
+            for next_task in self.next_tasks[to_visit.pop()]:
+                if next_task not in visited and not (mandatory_only and self.skippable_tasks[next_task]):
+                    visited.add(next_task)
+                    to_visit.append(next_task)
+        return visited
+
+    def is_reachable(self, task_id: str) -> bool:
+        return self.task_indexes.get(task_id) in self.reachable
+
+    def is_skippable(self, task_id: str) -> bool:
+        """
+        Whether a reachable task can be skipped, i.e. all the paths to it go through a task with `skipunavailable`.
+        """
+        return self.task_indexes[task_id] not in self.mandatory
+
+
+def build_tasks_graph(playbook_data: dict) -> PlaybookTasksGraph:
+    """
+    Builds tasks flow graph.
 
-        found_new_tasks = graph.number_of_nodes() > current_number_of_nodes
+    Args:
+        playbook_data (dict): playbook yml data.
 
-    return graph
+    Returns:
+        PlaybookTasksGraph: all tasks of given playbook.
+    """
+    return PlaybookTasksGraph(playbook_data)
 
 
-def get_lists_names_from_playbook(data_dictionary: dict, graph: networkx.DiGraph) -> tuple:
+def get_lists_names_from_playbook(data_dictionary: dict, graph: PlaybookTasksGraph) -> tuple:
     lists_names = set()
     lists_names_skippable = set()
     tasks = data_dictionary.get('tasks', {})
@@ -252,21 +282,19 @@ def get_lists_names_from_playbook(data_dictionary: dict, graph: networkx.DiGraph
         if script in lists_tasks_scripts:
             list_name = task.get('scriptarguments', {}).get('listName', {}).get('simple')
 
-            try:
-                skippable = not graph.nodes[task_id]['mandatory']
-            except KeyError:
-                # if task id not in the graph - the task is unreachable.
+            if not graph.is_reachable(task_id):
                 print_error(f'{data_dictionary["id"]}: task {task_id} is not connected')
                 continue
+            skippable = graph.is_skippable(task_id)
             if list_name:
                 lists_names.add(list_name)
                 if skippable:
                     lists_names_skippable.add(list_name)
 
-    return list(lists_names), list(lists_names_skippable)
+    return to_sorted_list(lists_names), to_sorted_list(lists_names_skippable)
 
 
-def get_task_ids_from_playbook(param_to_enrich_by: str, data_dict: dict, graph: networkx.DiGraph) -> tuple:
+def get_task_ids_from_playbook(param_to_enrich_by: str, data_dict: dict, graph: PlaybookTasksGraph) -> tuple:
     implementing_ids = set()
     implementing_ids_skippable = set()
     tasks = data_dict.get('tasks', {})
@@ -275,18 +303,16 @@ def get_task_ids_from_playbook(param_to_enrich_by: str, data_dict: dict, graph:
         task_details = task.get('task', {})
 
         enriched_id = task_details.get(param_to_enrich_by)
-        try:
-            skippable = not graph.nodes[task_id]['mandatory']
-        except KeyError:
-            # if task id not in the graph - the task is unreachable.
+        if not graph.is_reachable(task_id):
             print_error(f'{data_dict["id"]}: task {task_id} is not connected')
             continue
+        skippable = graph.is_skippable(task_id)
         if enriched_id:
             implementing_ids.add(enriched_id)
             if skippable:
                 implementing_ids_skippable.add(enriched_id)
 
-    return list(implementing_ids), list(implementing_ids_skippable)
+    return to_sorted_list(implementing_ids), to_sorted_list(implementing_ids_skippable)
 
 
 def get_commands_from_playbook(data_dict: dict) -> tuple:
@@ -307,7 +333,7 @@ def get_commands_from_playbook(data_dict: dict) -> tuple:
                 if skippable:
                     command_to_integration_skippable.add(splitted_cmd[-1])
 
-    return command_to_integration, list(command_to_integration_skippable)
+    return command_to_integration, to_sorted_list(command_to_integration_skippable)
 
 
 def get_filters_and_transformers_from_complex_value(complex_value: dict) -> Tuple[list, list]:
@@ -328,7 +354,7 @@ def get_filters_and_transformers_from_complex_value(complex_value: dict) -> Tupl
             operator = tmp_transformer.get('operator')
             all_transformers.add(operator)
 
-    return list(all_transformers), list(all_filters)
+    return to_sorted_list(all_transformers), to_sorted_list(all_filters)
 
 
 def get_filters_and_transformers_from_playbook(data_dict: dict) -> Tuple[list, list]:
@@ -362,7 +388,7 @@ def get_filters_and_transformers_from_playbook(data_dict: dict) -> Tuple[list, l
             all_transformers.update(transformers)
             all_filters.update(filters)
 
-    return list(all_transformers), list(all_filters)
+    return to_sorted_list(all_transformers), to_sorted_list(all_filters)
 
 
 def get_integration_api_modules(file_path, data_dictionary, is_unified_integration):
@@ -437,7 +463,7 @@ def get_integration_data(file_path, packs: Dict[str, Dict] = None):
     if default_classifier and default_classifier != '':
         integration_data['classifiers'] = default_classifier
     if mappers:
-        integration_data['mappers'] = list(mappers)
+        integration_data['mappers'] = to_sorted_list(mappers)
     if default_incident_type and default_incident_type != '':
         integration_data['incident_types'] = default_incident_type
     if is_fetch:
@@ -610,9 +636,9 @@ def get_playbook_data(file_path: str, packs: Dict[str, Dict] = None) -> dict:
     if skippable_tasks:
         playbook_data['skippable_tasks'] = skippable_tasks
     if dependent_incident_fields:
-        playbook_data['incident_fields'] = list(dependent_incident_fields)
+        playbook_data['incident_fields'] = to_sorted_list(dependent_incident_fields)
     if dependent_indicator_fields:
-        playbook_data['indicator_fields'] = list(dependent_indicator_fields)
+        playbook_data['indicator_fields'] = to_sorted_list(dependent_indicator_fields)
     if filters:
         playbook_data['filters'] = filters
     if transformers:
@@ -759,7 +785,7 @@ def get_layout_data(path: str, packs: Dict[str, Dict] = None):
         incident_indicator_types_dependency.add(type_name)
     if kind:
         data['kind'] = kind
-    data['incident_and_indicator_types'] = list(incident_indicator_types_dependency)
+    data['incident_and_indicator_types'] = to_sorted_list(incident_indicator_types_dependency)
     if incident_indicator_fields_dependency['fieldId']:
         data['incident_and_indicator_fields'] = incident_indicator_fields_dependency['fieldId']
     if definition_id:
@@ -826,7 +852,7 @@ def get_layoutscontainer_data(path: str, packs: Dict[str, Dict] = None):
     definition_id = json_data.get('definitionId')
     if data.get('name'):
         incident_indicator_types_dependency.add(data['name'])
-    data['incident_and_indicator_types'] = list(incident_indicator_types_dependency)
+    data['incident_and_indicator_types'] = to_sorted_list(incident_indicator_types_dependency)
     if incident_indicator_fields_dependency['fieldId']:
         data['incident_and_indicator_fields'] = incident_indicator_fields_dependency['fieldId']
     if definition_id:
@@ -875,9 +901,9 @@ def get_incident_field_data(path: str, incident_types: List, packs: Dict[str, Di
                                      from_version=fromversion, pack=pack, marketplaces=marketplaces)
 
     if all_associated_types:
-        data['incident_types'] = list(all_associated_types)
+        data['incident_types'] = to_sorted_list(all_associated_types)
     if all_scripts:
-        data['scripts'] = list(all_scripts)
+        data['scripts'] = to_sorted_list(all_scripts)
     if aliases:
         data['aliases'] = aliases
     if cli_name:
@@ -920,9 +946,9 @@ def get_indicator_type_data(path: str, all_integrations: List, packs: Dict[str,
     data = create_common_entity_data(path=path, name=name, display_name=display_name, to_version=toversion,
                                      from_version=fromversion, pack=pack, marketplaces=marketplaces)
     if associated_integrations:
-        data['integrations'] = list(associated_integrations)
+        data['integrations'] = to_sorted_list(associated_integrations)
     if all_scripts:
-        data['scripts'] = list(all_scripts)
+        data['scripts'] = to_sorted_list(all_scripts)
 
     return {id_: data}
 
@@ -981,7 +1007,7 @@ def get_classifier_data(path: str, packs: Dict[str, Dict] = None):
     data = create_common_entity_data(path=path, name=name, display_name=display_name, to_version=toversion,
                                      from_version=fromversion, pack=pack, marketplaces=marketplaces)
     if incidents_types:
-        data['incident_types'] = list(incidents_types)
+        data['incident_types'] = to_sorted_list(incidents_types)
     if filters:
         data['filters'] = filters
     if transformers:
@@ -1094,13 +1120,13 @@ def get_mapper_data(path: str, packs: Dict[str, Dict] = None):
     data = create_common_entity_data(path=path, name=name, display_name=display_name, to_version=toversion,
                                      from_version=fromversion, pack=pack, marketplaces=marketplaces)
     if incidents_types:
-        data['incident_types'] = list(incidents_types)
+        data['incident_types'] = to_sorted_list(incidents_types)
     if incidents_fields:
-        data['incident_fields'] = list(incidents_fields)
+        data['incident_fields'] = to_sorted_list(incidents_fields)
     if all_filters:
-        data['filters'] = list(all_filters)
+        data['filters'] = to_sorted_list(all_filters)
     if all_transformers:
-        data['transformers'] = list(all_transformers)
+        data['transformers'] = to_sorted_list(all_transformers)
     if definition_id:
         data['definitionId'] = definition_id
     if does_dict_have_alternative_key(json_data):
@@ -1164,7 +1190,7 @@ def parse_dashboard_or_report_data(path: str, data_file_json: Dict, all_layouts:
     data = create_common_entity_data(path=path, name=name, display_name=display_name, to_version=toversion,
                                      from_version=fromversion, pack=pack, marketplaces=marketplaces)
     if scripts:
-        data['scripts'] = list(scripts)
+        data['scripts'] = to_sorted_list(scripts)
 
     return {id_: data}
 
@@ -1299,7 +1325,7 @@ def get_correlation_rule_data(path: str, packs: Dict[str, Dict] = None):
 
 def get_depends_on(data_dict):
     depends_on = data_dict.get('dependson', {}).get('must', [])
-    depends_on_list = list({cmd.split('|')[-1] for cmd in depends_on})
+    depends_on_list = to_sorted_list({cmd.split('|')[-1] for cmd in depends_on})
     command_to_integration = {}
     for cmd in depends_on:
         splitted_cmd = cmd.split('|')
@@ -1831,9 +1857,9 @@ def get_generic_field_data(path, generic_types_list, packs: Dict[str, Dict] = No
                                      from_version=fromversion, pack=pack, marketplaces=marketplaces)
 
     if all_associated_types:
-        data['generic_types'] = list(all_associated_types)
+        data['generic_types'] = to_sorted_list(all_associated_types)
     if all_scripts:
-        data['scripts'] = list(all_scripts)
+        data['scripts'] = to_sorted_list(all_scripts)
     if definitionId:
         data['definitionId'] = definitionId
 
@@ -1949,6 +1975,8 @@ class IDSetType(Enum):
 class IDSet:
     def __init__(self, id_set_dict=None):
         self._id_set_dict = id_set_dict if id_set_dict else {}
+        # object type -> item key -> the items with this key, so adding an item doesn't scan the whole list
+        self._items_by_key: Dict[str, Dict[Optional[str], List[Dict]]] = {}
 
     def get_dict(self):
         return self._id_set_dict
@@ -1956,21 +1984,42 @@ class IDSet:
     def get_list(self, item_type):
         return self._id_set_dict.get(item_type, [])
 
+    def _get_items_by_key(self, object_type: str) -> Dict[Optional[str], List[Dict]]:
+        if object_type not in self._items_by_key:
+            items_by_key: Dict[Optional[str], List[Dict]] = {}
+            for item in self._id_set_dict.get(object_type, []):
+                for key in list(item) or [None]:
+                    items_by_key.setdefault(key, []).append(item)
+            self._items_by_key[object_type] = items_by_key
+        return self._items_by_key[object_type]
+
     def add_to_list(self, object_type: IDSetType, obj):
         if not IDSetType.has_value(object_type):
             raise ValueError(f'Invalid IDSetType {object_type}')
 
-        if obj not in self._id_set_dict.get(object_type, {}):
+        items_by_key = self._get_items_by_key(object_type)  # type: ignore[arg-type]
+        obj_keys = list(obj) or [None]
+        if obj not in items_by_key.get(obj_keys[0], []):
             self._id_set_dict.setdefault(object_type, []).append(obj)
+            for key in obj_keys:
+                items_by_key.setdefault(key, []).append(obj)
 
     def add_pack_to_id_set_packs(self, object_type: IDSetType, obj_name, obj_value):
         self._id_set_dict.setdefault(object_type, {}).update({obj_name: obj_value})
 
 
-def merge_id_sets_from_files(first_id_set_path, second_id_set_path, output_id_set_path, print_logs: bool = True):
+def merge_id_sets_from_files(first_id_set_path, second_id_set_path, output_id_set_path, print_logs: bool = True,
+                             streaming: bool = False):
     """
     Merges two id-sets. Loads them from files and saves the merged unified id_set into output_id_set_path.
+
+    In streaming mode the id-sets are merged section by section, so only a single section of each id-set is loaded
+    at a time. The unified id_set is then written to output_id_set_path only, and is not returned.
     """
+    if streaming:
+        return None, merge_id_set_files_by_sections(first_id_set_path, second_id_set_path, output_id_set_path,
+                                                    print_logs)
+
     with open(first_id_set_path, mode='r') as f1:
         first_id_set = json.load(f1)
 
@@ -1997,21 +2046,8 @@ def merge_id_sets(first_id_set_dict: dict, second_id_set_dict: dict, print_logs:
     second_id_set = IDSet(second_id_set_dict)
 
     for object_type, object_list in second_id_set.get_dict().items():
-        subset = first_id_set.get_list(object_type)
-
-        if object_type != "Packs":
-            for obj in object_list:
-                obj_id = list(obj.keys())[0]
-                is_duplicate = has_duplicate(subset, obj_id, object_type, print_logs,
-                                             external_object=obj, is_create_new=False)
-                if is_duplicate:
-                    duplicates.append(obj_id)
-                else:
-                    united_id_set.add_to_list(object_type, obj)
-
-        else:
-            for obj_name, obj_value in object_list.items():
-                united_id_set.add_pack_to_id_set_packs(object_type, obj_name, obj_value)
+        duplicates.extend(merge_id_set_section(united_id_set, object_type, first_id_set.get_list(object_type),
+                                               object_list, print_logs))
 
     if duplicates:
         return None, duplicates
@@ -2019,9 +2055,480 @@ def merge_id_sets(first_id_set_dict: dict, second_id_set_dict: dict, print_logs:
     return united_id_set, []
 
 
+def merge_id_set_section(united_id_set: IDSet, object_type: str, first_section, second_section,
+                         print_logs: bool = True) -> List[str]:
+    """
+    Adds the items of a section of the second id_set to the united id_set.
+    The section of the first id_set is indexed by id once, so each item is only compared to the items with its id.
+
+    Args:
+        united_id_set: The united id_set, contains the first id_set items.
+        object_type: The section name.
+        first_section: The section of the first id_set.
+        second_section: The section of the second id_set.
+        print_logs: Whether to print logs.
+
+    Returns:
+        The ids of the second id_set items which are duplicates of items of the first id_set.
+    """
+    duplicates: List[str] = []
+    if object_type == 'Packs':
+        for obj_name, obj_value in second_section.items():
+            united_id_set.add_pack_to_id_set_packs(object_type, obj_name, obj_value)  # type: ignore[arg-type]
+        return duplicates
+
+    first_items_by_id = group_by_id(first_section)
+    for obj in second_section:
+        obj_id = list(obj.keys())[0]
+        first_items = first_items_by_id.get(obj_id)
+        if first_items and has_overlapping_duplicates(first_items + [obj], obj_id, object_type, print_logs,
+                                                      is_create_new=False):
+            duplicates.append(obj_id)
+        else:
+            united_id_set.add_to_list(object_type, obj)  # type: ignore[arg-type]
+    return duplicates
+
+
+def skip_json_whitespace(text: str, index: int) -> int:
+    """
+    Returns the index of the first non whitespace character of a JSON text from the given index.
+    """
+    match = JSON_WHITESPACE.match(text, index)
+    return match.end() if match else index
+
+
+def index_id_set_sections(id_set_text: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Finds the sections of an id_set JSON document, without keeping them loaded.
+
+    Returns:
+        The section name -> the start and end offsets of the section value in the text, in the document order.
+    """
+    decoder = JSONDecoder()
+    sections = {}
+    index = skip_json_whitespace(id_set_text, 0)
+    if id_set_text[index:index + 1] != '{':
+        raise ValueError('The id_set must be a JSON object.')
+    index = skip_json_whitespace(id_set_text, index + 1)
+    while id_set_text[index:index + 1] != '}':
+        section_name, index = decoder.raw_decode(id_set_text, index)
+        index = skip_json_whitespace(id_set_text, index)
+        if id_set_text[index:index + 1] != ':':
+            raise ValueError(f'Expected ":" at position {index} of the id_set.')
+        start = skip_json_whitespace(id_set_text, index + 1)
+        # the section is decoded only to find its end, and is released right away
+        _, index = decoder.raw_decode(id_set_text, start)
+        sections[section_name] = (start, index)
+        index = skip_json_whitespace(id_set_text, index)
+        if id_set_text[index:index + 1] == ',':
+            index = skip_json_whitespace(id_set_text, index + 1)
+        elif id_set_text[index:index + 1] != '}':
+            raise ValueError(f'Expected "," or "}}" at position {index} of the id_set.')
+    return sections
+
+
+def write_id_set_sections(id_set_file, sections: Iterable[Tuple[str, Any]]):
+    """
+    Writes the id_set sections one after the other, the output is the same as dumping the whole id_set at once
+    with `indent=4`.
+    """
+    id_set_file.write('{')
+    separator = '\n'
+    for section_name, section in sections:
+        section_text = json.dumps(section, indent=4).replace('\n', '\n    ')
+        id_set_file.write(f'{separator}    {json.dumps(section_name)}: {section_text}')
+        separator = ',\n'
+    id_set_file.write('}' if separator == '\n' else '\n}')
+
+
+def merge_id_set_files_by_sections(first_id_set_path, second_id_set_path, output_id_set_path,
+                                   print_logs: bool = True) -> List[str]:
+    """
+    Merges two id_set files section by section, holding only the raw text of the id_sets and a single
+    section of each one as python objects at a time.
+    The output file is written only if no duplicates were found.
+
+    Returns:
+        The ids of the duplicate items.
+    """
+    with open(first_id_set_path, mode='r') as f1:
+        first_id_set_text = f1.read()
+    with open(second_id_set_path, mode='r') as f2:
+        second_id_set_text = f2.read()
+
+    decoder = JSONDecoder()
+    first_sections = index_id_set_sections(first_id_set_text)
+    second_sections = index_id_set_sections(second_id_set_text)
+    duplicates: List[str] = []
+
+    def load_section(id_set_text, offsets):
+        return decoder.raw_decode(id_set_text, offsets[0])[0]
+
+    def merged_sections():
+        for object_type in list(first_sections) + [name for name in second_sections if name not in first_sections]:
+            first_section = load_section(first_id_set_text, first_sections[object_type]) \
+                if object_type in first_sections else None
+            united_id_set = IDSet({object_type: first_section} if first_section is not None else {})
+            if object_type in second_sections:
+                duplicates.extend(merge_id_set_section(
+                    united_id_set, object_type, first_section or [],
+                    load_section(second_id_set_text, second_sections[object_type]), print_logs))
+            if object_type in united_id_set.get_dict():
+                yield object_type, united_id_set.get_dict()[object_type]
+
+    tmp_output_path = f'{output_id_set_path}.tmp'
+    with open(tmp_output_path, mode='w', encoding='utf-8') as f:
+        write_id_set_sections(f, merged_sections())
+
+    if duplicates:
+        os.remove(tmp_output_path)
+    else:
+        os.replace(tmp_output_path, output_id_set_path)
+    return duplicates
+
+
+@dataclasses.dataclass(frozen=True)
+class IDSetStage:
+    """
+    Describes how to create the id_set items of a single object type.
+
+    Args:
+        name: The stage name, unique across the stages.
+        object_type: The object type (as in `objects_to_create`) this stage belongs to.
+        get_paths: A function that given the `pack_to_create` returns the paths of the items to process.
+        process_func: The item processing function.
+        section: The id_set section the items are added to.
+        content_items_key: The pack `ContentItems` key the items are added to, if any.
+        func_kwargs: Additional keyword arguments for `process_func`.
+        dependencies: A mapping of `process_func` keyword argument to the name of the stage whose items it gets.
+            The stage will only be scheduled after these stages are finished.
+    """
+    name: str
+    object_type: str
+    get_paths: Callable
+    process_func: Callable
+    section: str = ''
+    content_items_key: str = ''
+    func_kwargs: Dict = dataclasses.field(default_factory=dict)
+    dependencies: Dict[str, str] = dataclasses.field(default_factory=dict)
+
+
+# The order of the stages determines the order of the items in the id_set, so it must not depend on the order the
+# stages are finished in.
+ID_SET_STAGES = [
+    IDSetStage('Packs', 'Packs', get_pack_metadata_paths, get_pack_metadata_data),
+    IDSetStage('Integrations', 'Integrations', get_integrations_paths, process_integration,
+               section='integrations', content_items_key='integrations'),
+    IDSetStage('Playbooks', 'Playbooks', get_playbooks_paths, process_general_items,
+               section='playbooks', content_items_key='playbooks',
+               func_kwargs={'expected_file_types': (FileType.PLAYBOOK,), 'data_extraction_func': get_playbook_data}),
+    IDSetStage('Scripts', 'Scripts', partial(get_general_paths, SCRIPTS_DIR), process_script,
+               section='scripts', content_items_key='scripts'),
+    IDSetStage('TestPlaybooks', 'TestPlaybooks', partial(get_general_paths, TEST_PLAYBOOKS_DIR),
+               process_test_playbook_path),
+    IDSetStage('Classifiers', 'Classifiers', partial(get_general_paths, CLASSIFIERS_DIR), process_general_items,
+               section='Classifiers', content_items_key='classifiers',
+               func_kwargs={'expected_file_types': (FileType.CLASSIFIER, FileType.OLD_CLASSIFIER),
+                            'data_extraction_func': get_classifier_data}),
+    IDSetStage('Dashboards', 'Dashboards', partial(get_general_paths, DASHBOARDS_DIR), process_general_items,
+               section='Dashboards', content_items_key='dashboards',
+               func_kwargs={'expected_file_types': (FileType.DASHBOARD,), 'data_extraction_func': get_dashboard_data}),
+    IDSetStage('IncidentTypes', 'IncidentTypes', partial(get_general_paths, INCIDENT_TYPES_DIR),
+               process_general_items, section='IncidentTypes', content_items_key='incidentTypes',
+               func_kwargs={'expected_file_types': (FileType.INCIDENT_TYPE,),
+                            'data_extraction_func': get_incident_type_data}),
+    IDSetStage('IncidentFields', 'IncidentFields', partial(get_general_paths, INCIDENT_FIELDS_DIR),
+               process_incident_fields, section='IncidentFields', content_items_key='incidentFields',
+               dependencies={'incident_types': 'IncidentTypes'}),
+    IDSetStage('IndicatorFields', 'IndicatorFields', partial(get_general_paths, INDICATOR_FIELDS_DIR),
+               process_general_items, section='IndicatorFields', content_items_key='indicatorFields',
+               func_kwargs={'expected_file_types': (FileType.INDICATOR_FIELD,),
+                            'data_extraction_func': get_general_data}),
+    IDSetStage('IndicatorTypes', 'IndicatorTypes', partial(get_general_paths, INDICATOR_TYPES_DIR),
+               process_indicator_types, section='IndicatorTypes', content_items_key='indicatorTypes',
+               dependencies={'all_integrations': 'Integrations'}),
+    IDSetStage('Layouts', 'Layouts', partial(get_general_paths, LAYOUTS_DIR), process_general_items,
+               section='Layouts',
+               func_kwargs={'expected_file_types': (FileType.LAYOUT,), 'data_extraction_func': get_layout_data}),
+    IDSetStage('LayoutsContainers', 'Layouts', partial(get_general_paths, LAYOUTS_DIR), process_layoutscontainers,
+               section='Layouts', content_items_key='layouts'),
+    IDSetStage('Reports', 'Reports', partial(get_general_paths, REPORTS_DIR), process_general_items,
+               section='Reports', content_items_key='reports',
+               func_kwargs={'expected_file_types': (FileType.REPORT,), 'data_extraction_func': get_report_data}),
+    IDSetStage('Widgets', 'Widgets', partial(get_general_paths, WIDGETS_DIR), process_general_items,
+               section='Widgets', content_items_key='widgets',
+               func_kwargs={'expected_file_types': (FileType.WIDGET,), 'data_extraction_func': get_widget_data}),
+    IDSetStage('Mappers', 'Mappers', partial(get_general_paths, MAPPERS_DIR), process_general_items,
+               section='Mappers', content_items_key='mappers',
+               func_kwargs={'expected_file_types': (FileType.MAPPER,), 'data_extraction_func': get_mapper_data}),
+    IDSetStage('Lists', 'Lists', partial(get_general_paths, LISTS_DIR), process_general_items,
+               section='Lists', content_items_key='lists',
+               func_kwargs={'expected_file_types': (FileType.LISTS,), 'data_extraction_func': get_list_data}),
+    IDSetStage('GenericDefinitions', 'GenericDefinitions', partial(get_general_paths, GENERIC_DEFINITIONS_DIR),
+               process_general_items, section='GenericDefinitions', content_items_key='genericDefinitions',
+               func_kwargs={'expected_file_types': (FileType.GENERIC_DEFINITION,),
+                            'data_extraction_func': get_general_data}),
+    IDSetStage('GenericModules', 'GenericModules', partial(get_general_paths, GENERIC_MODULES_DIR),
+               process_general_items, section='GenericModules', content_items_key='genericModules',
+               func_kwargs={'expected_file_types': (FileType.GENERIC_MODULE,),
+                            'data_extraction_func': get_generic_module_data}),
+    IDSetStage('GenericTypes', 'GenericTypes', partial(get_generic_entities_paths, GENERIC_TYPES_DIR),
+               process_generic_items, section='GenericTypes', content_items_key='genericTypes'),
+    IDSetStage('GenericFields', 'GenericFields', partial(get_generic_entities_paths, GENERIC_FIELDS_DIR),
+               process_generic_items, section='GenericFields', content_items_key='genericFields',
+               dependencies={'generic_types_list': 'GenericTypes'}),
+    IDSetStage('Jobs', 'Jobs', partial(get_general_paths, JOBS_DIR), process_jobs,
+               section='Jobs', content_items_key='jobs'),
+    IDSetStage('ParsingRules', 'ParsingRules', partial(get_general_paths, PARSING_RULES_DIR), process_general_items,
+               section='ParsingRules', content_items_key='parsingRules',
+               func_kwargs={'expected_file_types': (FileType.PARSING_RULE,),
+                            'data_extraction_func': get_parsing_rule_data}),
+    IDSetStage('ModelingRules', 'ModelingRules', partial(get_general_paths, MODELING_RULES_DIR),
+               process_general_items, section='ModelingRules', content_items_key='modelingRules',
+               func_kwargs={'expected_file_types': (FileType.MODELING_RULE,),
+                            'data_extraction_func': get_modeling_rule_data}),
+    IDSetStage('CorrelationRules', 'CorrelationRules', partial(get_general_paths, CORRELATION_RULES_DIR),
+               process_general_items, section='CorrelationRules', content_items_key='correlationRules',
+               func_kwargs={'expected_file_types': (FileType.CORRELATION_RULE,),
+                            'data_extraction_func': get_correlation_rule_data}),
+    IDSetStage('XSIAMDashboards', 'XSIAMDashboards', partial(get_general_paths, XSIAM_DASHBOARDS_DIR),
+               process_general_items, section='XSIAMDashboards', content_items_key='xsiamdashboards',
+               func_kwargs={'expected_file_types': (FileType.XSIAM_DASHBOARD,),
+                            'data_extraction_func': get_xsiam_dashboard_data}),
+    IDSetStage('XSIAMReports', 'XSIAMReports', partial(get_general_paths, XSIAM_REPORTS_DIR),
+               process_general_items, section='XSIAMReports', content_items_key='xsiamreports',
+               func_kwargs={'expected_file_types': (FileType.XSIAM_REPORT,),
+                            'data_extraction_func': get_xsiam_report_data}),
+    IDSetStage('Triggers', 'Triggers', partial(get_general_paths, TRIGGER_DIR), process_general_items,
+               section='Triggers', content_items_key='triggers',
+               func_kwargs={'expected_file_types': (FileType.TRIGGER,), 'data_extraction_func': get_trigger_data}),
+    IDSetStage('Wizards', 'Wizards', partial(get_general_paths, WIZARDS_DIR), process_wizards,
+               section='Wizards', content_items_key='wizards'),
+]
+
+
+def get_path_size(path: str) -> int:
+    """
+    Returns the size of a file, or the total size of the files in a directory (e.g. an integration package).
+    """
+    try:
+        if os.path.isdir(path):
+            return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def process_id_set_chunk(funcs: Dict[str, Callable],
+                         chunk: List[Tuple[int, str, List[str]]]) -> List[Tuple[int, str, Any]]:
+    """
+    Processes a chunk of items in a worker process.
+    An item is processed for all of its marketplaces one after the other, so its files are loaded only once
+    (see `get_file`).
+
+    Args:
+        funcs: The item processing function of each marketplace.
+        chunk: A list of (index, path, marketplaces) tuples.
+
+    Returns:
+        A list of (index, marketplace, processing result) tuples.
+    """
+    return [(index, marketplace, funcs[marketplace](path))
+            for index, path, marketplaces in chunk for marketplace in marketplaces]
+
+
+def get_stage_items(stage: IDSetStage, stage_results: List) -> List:
+    """
+    Returns the id_set items (in the stage section) from the processing results of a stage.
+    """
+    items: List = []
+    for result in stage_results:
+        if stage.name == 'Packs':
+            continue
+        if stage.name == 'TestPlaybooks':
+            if result[0]:
+                items.append(result[0])
+        else:
+            items.extend(result[0] if isinstance(result, tuple) else result)
+    return items
+
+
+class IDSetStagesScheduler:
+    """
+    Runs the id_set stages on a single worker pool, for one or more marketplaces.
+
+    The items of all the stages which are ready (i.e. all of their dependencies are finished) are submitted at once,
+    larger items first, so the workers do not wait for the slowest item of each stage before moving to the next one.
+    Each item is sent to the workers once, and processed there for all the marketplaces whose id_set contains its stage.
+    """
+
+    def __init__(self, pool, processes: int, stages_by_marketplace: Dict[str, List[IDSetStage]], pack_to_create,
+                 print_logs: bool, id_set_manifests: Dict[str, IDSetManifest], progress_bar=None):
+        self.pool = pool
+        self.processes = processes
+        self.pack_to_create = pack_to_create
+        self.print_logs = print_logs
+        self.id_set_manifests = id_set_manifests
+        self.progress_bar = progress_bar
+
+        self.stages: List[IDSetStage] = []
+        self.stage_marketplaces: Dict[str, List[str]] = {}
+        for marketplace, marketplace_stages in stages_by_marketplace.items():
+            for stage in marketplace_stages:
+                if stage.name not in self.stage_marketplaces:
+                    self.stages.append(stage)
+                self.stage_marketplaces.setdefault(stage.name, []).append(marketplace)
+
+        self.results: Dict[str, Dict[str, List]] = {}
+        self.stage_items: Dict[str, Dict[str, List]] = {}
+        self.packs: Dict[str, Dict[str, Dict]] = {marketplace: {} for marketplace in stages_by_marketplace}
+        self._pending_chunks: Dict[str, int] = {}
+        self._stage_paths: Dict[str, List[str]] = {}
+        self._stage_funcs: Dict[str, Dict[str, Callable]] = {}
+        self._item_hashes: Dict[str, Dict[str, Dict[int, str]]] = {}
+        self._finished_chunks: queue.Queue = queue.Queue()
+
+    def run(self) -> Dict[str, Dict[str, List]]:
+        """
+        Returns:
+            The processing results of each stage by marketplace, in the order of the stage paths.
+        """
+        not_submitted = list(self.stages)
+        while not_submitted or self._pending_chunks:
+            ready_stages = [stage for stage in not_submitted if self.is_ready(stage)]
+            if ready_stages:
+                not_submitted = [stage for stage in not_submitted if stage not in ready_stages]
+                self.submit(ready_stages)
+                continue
+            if not self._pending_chunks:
+                raise ValueError(f'Could not resolve the dependencies of the stages: '
+                                 f'{[stage.name for stage in not_submitted]}')
+
+            stage, chunk_results = self._finished_chunks.get()
+            if isinstance(chunk_results, BaseException):
+                raise chunk_results
+            for index, marketplace, result in chunk_results:
+                self.add_result(stage, marketplace, index, result)
+            self._pending_chunks[stage.name] -= 1
+            if not self._pending_chunks[stage.name]:
+                self.finish(stage)
+
+        return self.results
+
+    def is_ready(self, stage: IDSetStage) -> bool:
+        dependencies = set(stage.dependencies.values())
+        if stage.name != 'Packs':
+            # all the items get their marketplaces from the packs
+            dependencies.add('Packs')
+        return all(dependency in self.stage_items or dependency not in self.stage_marketplaces
+                   for dependency in dependencies)
+
+    def get_dependencies(self, stage: IDSetStage, marketplace: str) -> Dict[str, List]:
+        return {kwarg: self.stage_items.get(dependency, {}).get(marketplace, [])
+                for kwarg, dependency in stage.dependencies.items()}
+
+    def get_stage_func(self, stage: IDSetStage, marketplace: str) -> Callable:
+        kwargs = dict(stage.func_kwargs, marketplace=marketplace, print_logs=self.print_logs)
+        if stage.name != 'Packs':
+            kwargs['packs'] = self.packs[marketplace]
+        kwargs.update(self.get_dependencies(stage, marketplace))
+        return partial(stage.process_func, **kwargs)
+
+    def submit(self, stages: List[IDSetStage]):
+        chunks: List[Tuple[IDSetStage, Dict[str, Callable], List[Tuple[int, str, List[str]]]]] = []
+        for stage in stages:
+            print_color(f"\nStarting iteration over {stage.name}", LOG_COLORS.GREEN)
+            # the paths are sorted so the order of the items with the same id does not depend on the file system
+            paths = sorted(stage.get_paths(self.pack_to_create))
+            self._stage_paths[stage.name] = paths
+            self._stage_funcs[stage.name] = {}
+            self._item_hashes[stage.name] = {}
+            self.results[stage.name] = {}
+            item_marketplaces: Dict[int, List[str]] = {}
+            for marketplace in self.stage_marketplaces[stage.name]:
+                func = self.get_stage_func(stage, marketplace)
+                cached_results, item_hashes = self.id_set_manifests[marketplace].get_cached_results(
+                    func, paths, self.get_dependencies(stage, marketplace) or None)
+                self._stage_funcs[stage.name][marketplace] = func
+                self._item_hashes[stage.name][marketplace] = item_hashes
+                self.results[stage.name][marketplace] = [None] * len(paths)
+                for index, result in cached_results.items():
+                    self.results[stage.name][marketplace][index] = result
+                for index in item_hashes:
+                    item_marketplaces.setdefault(index, []).append(marketplace)
+
+            to_process = sorted(item_marketplaces, key=lambda index: get_path_size(paths[index]), reverse=True)
+            chunk_size = max(1, len(to_process) // (self.processes * 4))
+            stage_chunks = [[(index, paths[index], item_marketplaces[index]) for index in to_process[i:i + chunk_size]]
+                            for i in range(0, len(to_process), chunk_size)]
+            self._pending_chunks[stage.name] = len(stage_chunks)
+            chunks.extend((stage, self._stage_funcs[stage.name], chunk) for chunk in stage_chunks)
+            if not stage_chunks:
+                self.finish(stage)
+
+        # larger chunks first, so they don't end up being the tail of the run
+        chunks.sort(key=lambda chunk: sum(get_path_size(path) * len(marketplaces)
+                                          for _, path, marketplaces in chunk[2]), reverse=True)
+        for stage, funcs, chunk in chunks:
+            self.pool.apply_async(process_id_set_chunk, (funcs, chunk),
+                                  callback=partial(self._on_chunk_finished, stage),
+                                  error_callback=partial(self._on_chunk_finished, stage))
+
+    def _on_chunk_finished(self, stage: IDSetStage, chunk_results):
+        self._finished_chunks.put((stage, chunk_results))
+
+    def add_result(self, stage: IDSetStage, marketplace: str, index: int, result):
+        self.results[stage.name][marketplace][index] = result
+        self.id_set_manifests[marketplace].add_result(self._stage_funcs[stage.name][marketplace],
+                                                      self._stage_paths[stage.name][index],
+                                                      self._item_hashes[stage.name][marketplace][index], result)
+
+    def finish(self, stage: IDSetStage):
+        del self._pending_chunks[stage.name]
+        self.stage_items[stage.name] = {}
+        for marketplace, marketplace_results in self.results[stage.name].items():
+            if stage.name == 'Packs':
+                # a copy, as the packs are sent to the workers while their content items are added
+                for pack_data in marketplace_results:
+                    self.packs[marketplace].update(copy.deepcopy(pack_data))
+            self.stage_items[stage.name][marketplace] = get_stage_items(stage, marketplace_results)
+        if self.progress_bar:
+            self.progress_bar.update(1)
+
+
+def add_stage_results(stage: IDSetStage, stage_results: List, id_set_lists: Dict[str, List],
+                      packs_dict: Dict[str, Dict], excluded_items_by_pack: Dict[str, set],
+                      excluded_items_by_type: Dict[str, set]):
+    """
+    Adds the processing results of a stage to the id_set sections, to the packs content items
+    and to the excluded items dicts.
+    """
+    for result in stage_results:
+        if stage.name == 'Packs':
+            packs_dict.update(result)
+            continue
+
+        if stage.name == 'TestPlaybooks':
+            playbook, script = result
+            if playbook:
+                id_set_lists['TestPlaybooks'].append(playbook)
+            if script:
+                id_set_lists['scripts'].append(script)
+            continue
+
+        arr, excluded_items_from_iteration = result if isinstance(result, tuple) else (result, {})
+        if stage.content_items_key:
+            for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
+                if data.get('pack'):
+                    packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault(stage.content_items_key,
+                                                                                           []).append(_id)
+        id_set_lists[stage.section].extend(arr)
+        update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type, excluded_items_from_iteration)
+
+
 def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, pack_to_create=None,  # noqa : C901
                      objects_to_create: list = None, print_logs: bool = True, fail_on_duplicates: bool = False,
-                     marketplace: str = ''):
+                     marketplace: str = '', manifest_path: Optional[str] = None):
     """Re create the id-set
 
     Args:
@@ -2033,6 +2540,8 @@ def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, pack_to_c
         print_logs: Whether to print logs or not
         fail_on_duplicates: If value is True an error will be raised if duplicates are found
         marketplace: The marketplace the id set is created for.
+        manifest_path: The path of the id-set manifest. When passed, only items that were changed since the manifest
+            was saved are parsed, and the manifest is updated. Pass None to parse all the items.
 
     Returns: id-set object
     """
@@ -2042,12 +2551,6 @@ def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, pack_to_c
         else:
             id_set_path = DEFAULT_ID_SET_PATH
 
-    if not objects_to_create:
-        if marketplace == MarketplaceVersions.MarketplaceV2.value:
-            objects_to_create = CONTENT_MP_V2_ENTITIES
-        else:
-            objects_to_create = CONTENT_ENTITIES
-
     if id_set_path and os.path.exists(id_set_path):
         try:
             refresh_interval = int(os.getenv('DEMISTO_SDK_ID_SET_REFRESH_INTERVAL', -1))
@@ -2085,636 +2588,122 @@ def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, pack_to_c
                         LOG_COLORS.GREEN)
         print("")  # add an empty line for clarity
 
+    return create_id_sets([marketplace], pack_to_create, objects_to_create, print_logs, fail_on_duplicates,
+                          manifest_path)[marketplace]
+
+
+def create_id_sets(marketplaces: List[str], pack_to_create=None, objects_to_create: list = None,
+                   print_logs: bool = True, fail_on_duplicates: bool = False,
+                   manifest_path: Optional[str] = None) -> Dict[str, Tuple[OrderedDict, Dict, Dict]]:
+    """Creates the id-sets of several marketplaces in a single pass over the content items.
+
+    Args:
+        marketplaces: The marketplaces to create id sets for.
+        pack_to_create: The input path. the default is the content repo.
+        objects_to_create: The content items the id sets will contain. Defaults are set
+            depending on the mp type.
+        print_logs: Whether to print logs or not
+        fail_on_duplicates: If value is True an error will be raised if duplicates are found
+        manifest_path: The path of the id-set manifest. When creating several id sets, the marketplace is added
+            to the manifest file name, e.g. id_set_manifest_xsoar.json.
+
+    Returns: The id-set, the excluded items by pack and the excluded items by type, of each marketplace.
+    """
     start_time = time.time()
-    scripts_list = []
-    playbooks_list = []
-    integration_list = []
-    testplaybooks_list = []
-
-    classifiers_list = []
-    dashboards_list = []
-    incident_fields_list = []
-    incident_type_list = []
-    indicator_fields_list = []
-    indicator_types_list = []
-    layouts_list = []
-    reports_list = []
-    widgets_list = []
-    mappers_list = []
-    generic_types_list = []
-    generic_fields_list = []
-    generic_modules_list = []
-    generic_definitions_list = []
-    lists_list = []
-    jobs_list = []
-    parsing_rules_list = []
-    modeling_rules_list = []
-    correlation_rules_list = []
-    xsiam_dashboards_list = []
-    xsiam_reports_list = []
-    triggers_list = []
-    wizards_list = []
-    packs_dict: Dict[str, Dict] = {}
-    excluded_items_by_pack: Dict[str, set] = {}
-    excluded_items_by_type: Dict[str, set] = {}
 
-    pool = Pool(processes=int(cpu_count()))
+    stages_by_marketplace: Dict[str, List[IDSetStage]] = {}
+    id_set_manifests: Dict[str, IDSetManifest] = {}
+    for marketplace in marketplaces:
+        marketplace_objects = objects_to_create or (
+            CONTENT_MP_V2_ENTITIES if marketplace == MarketplaceVersions.MarketplaceV2.value else CONTENT_ENTITIES)
+        stages_by_marketplace[marketplace] = [stage for stage in ID_SET_STAGES
+                                              if stage.object_type in marketplace_objects]
+        marketplace_manifest_path = manifest_path
+        if manifest_path and len(marketplaces) > 1:
+            manifest_root, manifest_ext = os.path.splitext(manifest_path)
+            marketplace_manifest_path = f'{manifest_root}_{marketplace or "all"}{manifest_ext}'
+        id_set_manifests[marketplace] = IDSetManifest(marketplace_manifest_path, marketplace)
+
+    processes = int(cpu_count())
+    number_of_stages = len({stage.name for stages in stages_by_marketplace.values() for stage in stages})
 
     print_color("Starting the creation of the id_set", LOG_COLORS.GREEN)
 
-    with click.progressbar(length=len(objects_to_create), label="Creating id-set") as progress_bar:
-
-        if 'Packs' in objects_to_create:
-            print_color("\nStarting iteration over Packs", LOG_COLORS.GREEN)
-            for pack_data in pool.map(partial(get_pack_metadata_data,
-                                              print_logs=print_logs,
-                                              marketplace=marketplace,
-                                              ),
-                                      get_pack_metadata_paths(pack_to_create)):
-                packs_dict.update(pack_data)
-
-        progress_bar.update(1)
-
-        if 'Integrations' in objects_to_create:
-            print_color("\nStarting iteration over Integrations", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_integration,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       ),
-                                                               get_integrations_paths(pack_to_create)):
-
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('integrations',
-                                                                                               []).append(_id)
-                integration_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'Playbooks' in objects_to_create:
-            print_color("\nStarting iteration over Playbooks", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(FileType.PLAYBOOK,),
-                                                                       data_extraction_func=get_playbook_data,
-                                                                       ),
-                                                               get_playbooks_paths(pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('playbooks', []).append(
-                            _id)
-                playbooks_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'Scripts' in objects_to_create:
-            print_color("\nStarting iteration over Scripts", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_script,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       ),
-                                                               get_general_paths(SCRIPTS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('scripts', []).append(
-                            _id)
-                scripts_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'TestPlaybooks' in objects_to_create:
-            print_color("\nStarting iteration over TestPlaybooks", LOG_COLORS.GREEN)
-            for pair in pool.map(partial(process_test_playbook_path,
-                                         packs=packs_dict,
-                                         marketplace=marketplace,
-                                         print_logs=print_logs,
-                                         ),
-                                 get_general_paths(TEST_PLAYBOOKS_DIR, pack_to_create)):
-                if pair[0]:
-                    testplaybooks_list.append(pair[0])
-                if pair[1]:
-                    scripts_list.append(pair[1])
-
-        progress_bar.update(1)
-
-        if 'Classifiers' in objects_to_create:
-            print_color("\nStarting iteration over Classifiers", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(
-                                                                           FileType.CLASSIFIER,
-                                                                           FileType.OLD_CLASSIFIER),
-                                                                       data_extraction_func=get_classifier_data,
-                                                                       ),
-                                                               get_general_paths(CLASSIFIERS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('classifiers',
-                                                                                               []).append(_id)
-                classifiers_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'Dashboards' in objects_to_create:
-            print_color("\nStarting iteration over Dashboards", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(FileType.DASHBOARD,),
-                                                                       data_extraction_func=get_dashboard_data,
-                                                                       ),
-                                                               get_general_paths(DASHBOARDS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('dashboards', []).append(
-                            _id)
-                dashboards_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'IncidentTypes' in objects_to_create:
-            print_color("\nStarting iteration over Incident Types", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(FileType.INCIDENT_TYPE,),
-                                                                       data_extraction_func=get_incident_type_data,
-                                                                       ),
-                                                               get_general_paths(INCIDENT_TYPES_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('incidentTypes',
-                                                                                               []).append(_id)
-                incident_type_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        # Has to be called after 'IncidentTypes' is called
-        if 'IncidentFields' in objects_to_create:
-            print_color("\nStarting iteration over Incident Fields", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_incident_fields,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       incident_types=incident_type_list,
-                                                                       ),
-                                                               get_general_paths(INCIDENT_FIELDS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('incidentFields',
-                                                                                               []).append(_id)
-                incident_fields_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'IndicatorFields' in objects_to_create:
-            print_color("\nStarting iteration over Indicator Fields", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(FileType.INDICATOR_FIELD,),
-                                                                       data_extraction_func=get_general_data,
-                                                                       ),
-                                                               get_general_paths(INDICATOR_FIELDS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('indicatorFields',
-                                                                                               []).append(_id)
-                indicator_fields_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        # Has to be called after 'Integrations' is called
-        if 'IndicatorTypes' in objects_to_create:
-            print_color("\nStarting iteration over Indicator Types", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_indicator_types,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       all_integrations=integration_list,
-                                                                       ),
-                                                               get_general_paths(INDICATOR_TYPES_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('indicatorTypes',
-                                                                                               []).append(_id)
-                indicator_types_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'Layouts' in objects_to_create:
-            print_color("\nStarting iteration over Layouts", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(FileType.LAYOUT,),
-                                                                       data_extraction_func=get_layout_data,
-                                                                       ),
-                                                               get_general_paths(LAYOUTS_DIR, pack_to_create)):
-                layouts_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-            for arr, excluded_items_from_iteration in pool.map(partial(process_layoutscontainers,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       ),
-                                                               get_general_paths(LAYOUTS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('layouts', []).append(
-                            _id)
-                layouts_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'Reports' in objects_to_create:
-            print_color("\nStarting iteration over Reports", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(FileType.REPORT,),
-                                                                       data_extraction_func=get_report_data,
-                                                                       ),
-                                                               get_general_paths(REPORTS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('reports', []).append(
-                            _id)
-                reports_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'Widgets' in objects_to_create:
-            print_color("\nStarting iteration over Widgets", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(FileType.WIDGET,),
-                                                                       data_extraction_func=get_widget_data,
-                                                                       ),
-                                                               get_general_paths(WIDGETS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('widgets', []).append(
-                            _id)
-                widgets_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'Mappers' in objects_to_create:
-            print_color("\nStarting iteration over Mappers", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(FileType.MAPPER,),
-                                                                       data_extraction_func=get_mapper_data,
-                                                                       ),
-                                                               get_general_paths(MAPPERS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('mappers', []).append(
-                            _id)
-                mappers_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'Lists' in objects_to_create:
-            print_color("\nStarting iteration over Lists", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(FileType.LISTS,),
-                                                                       data_extraction_func=get_list_data,
-                                                                       ),
-                                                               get_general_paths(LISTS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('lists', []).append(_id)
-                lists_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'GenericDefinitions' in objects_to_create:
-            print_color("\nStarting iteration over Generic Definitions", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(
-                                                                           FileType.GENERIC_DEFINITION,),
-                                                                       data_extraction_func=get_general_data,
-                                                                       ),
-                                                               get_general_paths(GENERIC_DEFINITIONS_DIR,
-                                                                                 pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('genericDefinitions',
-                                                                                               []).append(_id)
-                generic_definitions_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'GenericModules' in objects_to_create:
-            print_color("\nStarting iteration over Generic Modules", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(FileType.GENERIC_MODULE,),
-                                                                       data_extraction_func=get_generic_module_data,
-                                                                       ),
-                                                               get_general_paths(GENERIC_MODULES_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('genericModules',
-                                                                                               []).append(_id)
-                generic_modules_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'GenericTypes' in objects_to_create:
-            print_color("\nStarting iteration over Generic Types", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_generic_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       ),
-                                                               get_generic_entities_paths(GENERIC_TYPES_DIR,
-                                                                                          pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('genericTypes',
-                                                                                               []).append(_id)
-                generic_types_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        # Has to be called after 'GenericTypes' is called
-        if 'GenericFields' in objects_to_create:
-            print_color("\nStarting iteration over Generic Fields", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_generic_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       generic_types_list=generic_types_list,
-                                                                       ),
-                                                               get_generic_entities_paths(GENERIC_FIELDS_DIR,
-                                                                                          pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('genericFields',
-                                                                                               []).append(_id)
-                generic_fields_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'Jobs' in objects_to_create:
-            print_color("\nStarting iteration over Jobs", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_jobs,
-                                        packs=packs_dict,
-                                        marketplace=marketplace,
-                                        print_logs=print_logs,
-                                        ),
-                                get_general_paths(JOBS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('jobs', []).append(_id)
-                jobs_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if 'ParsingRules' in objects_to_create:
-            print_color("\nStarting iteration over Parsing Rules", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(
-                                                                           FileType.PARSING_RULE,),
-                                                                       data_extraction_func=get_parsing_rule_data,
-                                                                       ),
-                                                               get_general_paths(PARSING_RULES_DIR,
-                                                                                 pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('parsingRules',
-                                                                                               []).append(_id)
-                parsing_rules_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'ModelingRules' in objects_to_create:
-            print_color("\nStarting iteration over Modeling Rules", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(
-                                                                           FileType.MODELING_RULE,),
-                                                                       data_extraction_func=get_modeling_rule_data,
-                                                                       ),
-                                                               get_general_paths(MODELING_RULES_DIR,
-                                                                                 pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('modelingRules',
-                                                                                               []).append(_id)
-                modeling_rules_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'CorrelationRules' in objects_to_create:
-            print_color("\nStarting iteration over Correlation Rules", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(
-                                                                           FileType.CORRELATION_RULE,),
-                                                                       data_extraction_func=get_correlation_rule_data,
-                                                                       ),
-                                                               get_general_paths(CORRELATION_RULES_DIR,
-                                                                                 pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('correlationRules',
-                                                                                               []).append(_id)
-                correlation_rules_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'XSIAMDashboards' in objects_to_create:
-            print_color("\nStarting iteration over XSIAMDashboards", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(
-                                                                           FileType.XSIAM_DASHBOARD,),
-                                                                       data_extraction_func=get_xsiam_dashboard_data,
-                                                                       ),
-                                                               get_general_paths(XSIAM_DASHBOARDS_DIR,
-                                                                                 pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('xsiamdashboards',
-                                                                                               []).append(_id)
-                xsiam_dashboards_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'XSIAMReports' in objects_to_create:
-            print_color("\nStarting iteration over XSIAMReports", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(
-                                                                           FileType.XSIAM_REPORT,),
-                                                                       data_extraction_func=get_xsiam_report_data,
-                                                                       ),
-                                                               get_general_paths(XSIAM_REPORTS_DIR,
-                                                                                 pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('xsiamreports',
-                                                                                               []).append(_id)
-                xsiam_reports_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'Triggers' in objects_to_create:
-            print_color("\nStarting iteration over Triggers", LOG_COLORS.GREEN)
-            for arr, excluded_items_from_iteration in pool.map(partial(process_general_items,
-                                                                       packs=packs_dict,
-                                                                       marketplace=marketplace,
-                                                                       print_logs=print_logs,
-                                                                       expected_file_types=(
-                                                                           FileType.TRIGGER,),
-                                                                       data_extraction_func=get_trigger_data,
-                                                                       ),
-                                                               get_general_paths(TRIGGER_DIR,
-                                                                                 pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('triggers',
-                                                                                               []).append(_id)
-                triggers_list.extend(arr)
-                update_excluded_items_dict(excluded_items_by_pack, excluded_items_by_type,
-                                           excluded_items_from_iteration)
-
-        progress_bar.update(1)
-
-        if 'Wizards' in objects_to_create:
-            print_color("\nStarting iteration over Wizards", LOG_COLORS.GREEN)
-            for arr in pool.map(partial(process_wizards,
-                                        packs=packs_dict,
-                                        marketplace=marketplace,
-                                        print_logs=print_logs,
-                                        ),
-                                get_general_paths(WIZARDS_DIR, pack_to_create)):
-                for _id, data in (arr[0].items() if arr and isinstance(arr, list) else {}):
-                    if data.get('pack'):
-                        packs_dict[data.get('pack')].setdefault('ContentItems', {}).setdefault('wizards', []).append(_id)
-                wizards_list.extend(arr)
-
-        progress_bar.update(1)
+    with Pool(processes=processes) as pool, \
+            click.progressbar(length=number_of_stages, label="Creating id-set") as progress_bar:
+        stages_results = IDSetStagesScheduler(pool, processes, stages_by_marketplace, pack_to_create, print_logs,
+                                              id_set_manifests, progress_bar).run()
+
+    for id_set_manifest in id_set_manifests.values():
+        id_set_manifest.save()
+
+    id_sets = {}
+    for marketplace, stages in stages_by_marketplace.items():
+        id_sets[marketplace] = build_id_set(
+            stages, {stage.name: stages_results[stage.name].pop(marketplace) for stage in stages}, marketplace)
+
+    exec_time = time.time() - start_time
+    print_color("Finished the creation of the id_set. Total time: {} seconds".format(exec_time), LOG_COLORS.GREEN)
+    print_color(get_peak_memory_usage_message(), LOG_COLORS.GREEN)
+
+    for marketplace, (new_ids_dict, _, _) in id_sets.items():
+        duplicates = find_duplicates(new_ids_dict, print_logs, marketplace)
+        if any(duplicates) and fail_on_duplicates:
+            raise Exception(f'The following ids were found duplicates\n{json.dumps(duplicates, indent=4)}\n')
+
+    return id_sets
+
+
+def build_id_set(stages: List[IDSetStage], stages_results: Dict[str, List],
+                 marketplace: str) -> Tuple[OrderedDict, Dict, Dict]:
+    """
+    Builds the id-set of a marketplace from the processing results of its stages.
+
+    Returns: The id-set, the excluded items by pack and the excluded items by type.
+    """
+    packs_dict: Dict[str, Dict] = {}
+    excluded_items_by_pack: Dict[str, set] = {}
+    excluded_items_by_type: Dict[str, set] = {}
+    id_set_lists: Dict[str, List] = {section: [] for section in ID_SET_ENTITIES}
+
+    # the results are added in the order of the stages, regardless of the order they were finished in
+    for stage in stages:
+        add_stage_results(stage, stages_results[stage.name], id_set_lists, packs_dict, excluded_items_by_pack,
+                          excluded_items_by_type)
 
     new_ids_dict = OrderedDict()
     # we sort each time the whole set in case someone manually changed something
     # it shouldn't take too much time
-    new_ids_dict['scripts'] = sort(scripts_list)
-    new_ids_dict['playbooks'] = sort(playbooks_list)
-    new_ids_dict['integrations'] = sort(integration_list)
-    new_ids_dict['TestPlaybooks'] = sort(testplaybooks_list)
-    new_ids_dict['Classifiers'] = sort(classifiers_list)
-    new_ids_dict['IncidentFields'] = sort(incident_fields_list)
-    new_ids_dict['IncidentTypes'] = sort(incident_type_list)
-    new_ids_dict['IndicatorFields'] = sort(indicator_fields_list)
-    new_ids_dict['IndicatorTypes'] = sort(indicator_types_list)
-    new_ids_dict['Layouts'] = sort(layouts_list)
-    new_ids_dict['Lists'] = sort(lists_list)
-    new_ids_dict['Jobs'] = sort(jobs_list)
-    new_ids_dict['Mappers'] = sort(mappers_list)
-    new_ids_dict['ParsingRules'] = sort(parsing_rules_list)
-    new_ids_dict['ModelingRules'] = sort(modeling_rules_list)
-    new_ids_dict['CorrelationRules'] = sort(correlation_rules_list)
-    new_ids_dict['XSIAMDashboards'] = sort(xsiam_dashboards_list)
-    new_ids_dict['XSIAMReports'] = sort(xsiam_reports_list)
-    new_ids_dict['Triggers'] = sort(triggers_list)
-    new_ids_dict['Wizards'] = sort(wizards_list)
+    new_ids_dict['scripts'] = sort(id_set_lists['scripts'])
+    new_ids_dict['playbooks'] = sort(id_set_lists['playbooks'])
+    new_ids_dict['integrations'] = sort(id_set_lists['integrations'])
+    new_ids_dict['TestPlaybooks'] = sort(id_set_lists['TestPlaybooks'])
+    new_ids_dict['Classifiers'] = sort(id_set_lists['Classifiers'])
+    new_ids_dict['IncidentFields'] = sort(id_set_lists['IncidentFields'])
+    new_ids_dict['IncidentTypes'] = sort(id_set_lists['IncidentTypes'])
+    new_ids_dict['IndicatorFields'] = sort(id_set_lists['IndicatorFields'])
+    new_ids_dict['IndicatorTypes'] = sort(id_set_lists['IndicatorTypes'])
+    new_ids_dict['Layouts'] = sort(id_set_lists['Layouts'])
+    new_ids_dict['Lists'] = sort(id_set_lists['Lists'])
+    new_ids_dict['Jobs'] = sort(id_set_lists['Jobs'])
+    new_ids_dict['Mappers'] = sort(id_set_lists['Mappers'])
+    new_ids_dict['ParsingRules'] = sort(id_set_lists['ParsingRules'])
+    new_ids_dict['ModelingRules'] = sort(id_set_lists['ModelingRules'])
+    new_ids_dict['CorrelationRules'] = sort(id_set_lists['CorrelationRules'])
+    new_ids_dict['XSIAMDashboards'] = sort(id_set_lists['XSIAMDashboards'])
+    new_ids_dict['XSIAMReports'] = sort(id_set_lists['XSIAMReports'])
+    new_ids_dict['Triggers'] = sort(id_set_lists['Triggers'])
+    new_ids_dict['Wizards'] = sort(id_set_lists['Wizards'])
     new_ids_dict['Packs'] = packs_dict
 
     if marketplace != MarketplaceVersions.MarketplaceV2.value:
-        new_ids_dict['GenericTypes'] = sort(generic_types_list)
-        new_ids_dict['GenericFields'] = sort(generic_fields_list)
-        new_ids_dict['GenericModules'] = sort(generic_modules_list)
-        new_ids_dict['GenericDefinitions'] = sort(generic_definitions_list)
-        new_ids_dict['Reports'] = sort(reports_list)
-        new_ids_dict['Widgets'] = sort(widgets_list)
-        new_ids_dict['Dashboards'] = sort(dashboards_list)
+        new_ids_dict['GenericTypes'] = sort(id_set_lists['GenericTypes'])
+        new_ids_dict['GenericFields'] = sort(id_set_lists['GenericFields'])
+        new_ids_dict['GenericModules'] = sort(id_set_lists['GenericModules'])
+        new_ids_dict['GenericDefinitions'] = sort(id_set_lists['GenericDefinitions'])
+        new_ids_dict['Reports'] = sort(id_set_lists['Reports'])
+        new_ids_dict['Widgets'] = sort(id_set_lists['Widgets'])
+        new_ids_dict['Dashboards'] = sort(id_set_lists['Dashboards'])
     else:
         # a workaround for find-dependencies check (PackDependencies._collect_pack_items)
         new_ids_dict['GenericTypes'] = []
@@ -2725,13 +2714,6 @@ def re_create_id_set(id_set_path: Optional[str] = DEFAULT_ID_SET_PATH, pack_to_c
         new_ids_dict['Widgets'] = []
         new_ids_dict['Dashboards'] = []
 
-    exec_time = time.time() - start_time
-    print_color("Finished the creation of the id_set. Total time: {} seconds".format(exec_time), LOG_COLORS.GREEN)
-
-    duplicates = find_duplicates(new_ids_dict, print_logs, marketplace)
-    if any(duplicates) and fail_on_duplicates:
-        raise Exception(f'The following ids were found duplicates\n{json.dumps(duplicates, indent=4)}\n')
-
     return new_ids_dict, excluded_items_by_pack, excluded_items_by_type
 
 
@@ -2744,11 +2726,10 @@ def find_duplicates(id_set, print_logs, marketplace):
         if print_logs:
             print_color("Checking diff for {}".format(object_type), LOG_COLORS.GREEN)
         objects = id_set.get(object_type)
-        ids = {list(specific_item.keys())[0] for specific_item in objects}
 
         dup_list = []
-        for id_to_check in ids:
-            if has_duplicate(objects, id_to_check, object_type, print_logs, is_create_new=True):
+        for id_to_check, duplicates in group_by_id(objects).items():
+            if has_overlapping_duplicates(duplicates, id_to_check, object_type, print_logs, is_create_new=True):
                 dup_list.append(id_to_check)
         lists_to_return.append(dup_list)
 
@@ -2756,17 +2737,35 @@ def find_duplicates(id_set, print_logs, marketplace):
         print_color("Checking diff for Incident and Indicator Fields", LOG_COLORS.GREEN)
 
     fields = id_set['IncidentFields'] + id_set['IndicatorFields']
-    field_ids = {list(field.keys())[0] for field in fields}
 
     field_list = []
-    for field_to_check in field_ids:
-        if has_duplicate(fields, field_to_check, 'Indicator and Incident Fields', print_logs, is_create_new=True):
+    for field_to_check, duplicates in group_by_id(fields).items():
+        if has_overlapping_duplicates(duplicates, field_to_check, 'Indicator and Incident Fields', print_logs,
+                                      is_create_new=True):
             field_list.append(field_to_check)
     lists_to_return.append(field_list)
 
     return lists_to_return
 
 
+def group_by_id(id_set_subset_list: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Groups the items of an id_set section by their ids, in a single pass over the section.
+
+    Args:
+        id_set_subset_list: The id_set section items, each one is a dict of {id: data}.
+
+    Returns:
+        A dict of id -> the items with this id, in the order they appear in the section.
+    """
+    items_by_id: Dict[str, List[Dict]] = {}
+    for item in id_set_subset_list:
+        for item_id, item_data in item.items():
+            if item_data:
+                items_by_id.setdefault(item_id, []).append(item)
+    return items_by_id
+
+
 def has_duplicate(id_set_subset_list, id_to_check, object_type, print_logs=True, external_object=None,
                   is_create_new=False):
     """
@@ -2783,12 +2782,30 @@ def has_duplicate(id_set_subset_list, id_to_check, object_type, print_logs=True,
     if external_object and len(duplicates) == 0:
         return False
 
-    if not external_object and len(duplicates) == 1:
-        return False
-
     if external_object:
         duplicates.append(external_object)
 
+    return has_overlapping_duplicates(duplicates, id_to_check, object_type, print_logs, is_create_new)
+
+
+def has_overlapping_duplicates(duplicates, id_to_check, object_type, print_logs=True, is_create_new=False):
+    """
+    Checks whether items with the same id (id_to_check) are duplicates, i.e. they belong to the same marketplace
+    and their versions overlap.
+
+    Args:
+        duplicates: The items with the id `id_to_check`.
+        id_to_check: The id of the items.
+        object_type: The id_set section of the items.
+        print_logs: Whether to print warnings on items with the same id but different names.
+        is_create_new: Whether searching for duplicate while creating a new id-set.
+
+    Returns:
+        True if the items are duplicates, False otherwise.
+    """
+    if len(duplicates) < 2:
+        return False
+
     for dup1, dup2 in itertools.combinations(duplicates, 2):
         dict1 = list(dup1.values())[0]
         dict2 = list(dup2.values())[0]
@@ -2858,6 +2875,13 @@ def sort(data):
     return data
 
 
+def to_sorted_list(values: Iterable) -> list:
+    """
+    Converts a set of values to a sorted list, so the id_set does not change between runs.
+    """
+    return sorted(values, key=str)
+
+
 def update_excluded_items_dict(excluded_items_by_pack: dict, excluded_items_by_type: dict,
                                excluded_items_to_add: dict):
     """
@@ -1,6 +1,6 @@
 import os
 from collections import OrderedDict
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from genericpath import exists
 
@@ -9,8 +9,12 @@ from demisto_sdk.commands.common.constants import (DEFAULT_ID_SET_PATH,
                                                    MP_V2_ID_SET_PATH,
                                                    MarketplaceVersions)
 from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.id_set_db import (get_id_set_db_path,
+                                                   write_id_set_db)
 from demisto_sdk.commands.common.tools import open_id_set_file
-from demisto_sdk.commands.common.update_id_set import re_create_id_set
+from demisto_sdk.commands.common.update_id_set import (create_id_sets,
+                                                       re_create_id_set,
+                                                       write_id_set_sections)
 
 json = JSON_Handler()
 
@@ -18,7 +22,8 @@ json = JSON_Handler()
 class IDSetCreator:
 
     def __init__(self, output: Optional[str] = '', input: Optional[str] = None, print_logs: bool = True,
-                 fail_duplicates: bool = False, marketplace: str = ''):
+                 fail_duplicates: bool = False, marketplace: str = '', manifest_path: Optional[str] = None,
+                 write_db: bool = False):
         """IDSetCreator
 
         Args:
@@ -27,6 +32,9 @@ class IDSetCreator:
             print_logs (bool, optional): Print log output. Defaults to True.
             fail_duplicates(bool, optional): Flag which marks whether create_id_set fails when duplicates
              are found or not
+            manifest_path (str, optional): The id_set manifest path. When set, only items that were changed since
+             the last run are parsed.
+            write_db (bool, optional): Whether to write an indexed id_set database next to the output JSON file.
         """
         self.output = output
         self.input = input
@@ -34,6 +42,8 @@ class IDSetCreator:
         self.fail_duplicates = fail_duplicates
         self.id_set = OrderedDict()  # type: ignore
         self.marketplace = marketplace.lower()
+        self.manifest_path = manifest_path
+        self.write_db = write_db
 
     def create_id_set(self):
         self.id_set, excluded_items_by_pack, excluded_items_by_type = re_create_id_set(
@@ -41,13 +51,53 @@ class IDSetCreator:
             pack_to_create=self.input,
             print_logs=self.print_logs,
             fail_on_duplicates=self.fail_duplicates,
-            marketplace=self.marketplace
+            marketplace=self.marketplace,
+            manifest_path=self.manifest_path,
         )
 
         self.add_command_to_implementing_integrations_mapping()
         self.save_id_set()
         return self.id_set, excluded_items_by_pack, excluded_items_by_type
 
+    @classmethod
+    def create_marketplaces_id_sets(cls, marketplaces: List[str], outputs: Optional[List[str]] = None,
+                                    input: Optional[str] = None, print_logs: bool = True,
+                                    fail_duplicates: bool = False, manifest_path: Optional[str] = None,
+                                    write_db: bool = False) -> Dict[str, Tuple['IDSetCreator', Dict, Dict]]:
+        """Creates the id sets of several marketplaces, parsing the content items once for all of them.
+
+        Args:
+            marketplaces (list): The marketplaces to create id sets for.
+            outputs (list, optional): The output path of each marketplace id set. Defaults to the default path of
+             each marketplace.
+            The rest of the arguments are the same as the IDSetCreator arguments.
+
+        Returns:
+            dict: The id set creator, the excluded items by pack and the excluded items by type, of each marketplace.
+        """
+        outputs = outputs or [''] * len(marketplaces)
+        if len(outputs) != len(marketplaces):
+            raise ValueError('The number of the output paths must match the number of the marketplaces.')
+
+        id_sets = create_id_sets(
+            marketplaces=[marketplace.lower() for marketplace in marketplaces],
+            pack_to_create=input,
+            print_logs=print_logs,
+            fail_on_duplicates=fail_duplicates,
+            manifest_path=manifest_path,
+        )
+
+        id_set_creators = {}
+        for marketplace, output in zip(marketplaces, outputs):
+            id_set_creator = cls(output=output, input=input, print_logs=print_logs, fail_duplicates=fail_duplicates,
+                                 marketplace=marketplace, manifest_path=manifest_path, write_db=write_db)
+            id_set_creator.id_set, excluded_items_by_pack, excluded_items_by_type = id_sets[id_set_creator.marketplace]
+            id_set_creator.add_command_to_implementing_integrations_mapping()
+            id_set_creator.save_id_set()
+            id_set_creators[id_set_creator.marketplace] = (id_set_creator, excluded_items_by_pack,
+                                                           excluded_items_by_type)
+        return id_set_creators
+
     def add_command_to_implementing_integrations_mapping(self):
         """
         Modifies playbook set in id_set dictionary once it was created.
@@ -84,7 +134,13 @@ class IDSetCreator:
                     command_name_to_implemented_integration_map[command] = [integration_name]
         return command_name_to_implemented_integration_map
 
-    def save_id_set(self):
+    def save_id_set(self, release: bool = False):
+        """Writes the id set to the output file, section by section, so only a single section is serialized at a time.
+
+        Args:
+            release (bool, optional): Whether to remove each section from the in memory id set once it is written.
+             Used for the last save of the id set, when it is no longer needed.
+        """
         if self.output == "":
             self.output = MP_V2_ID_SET_PATH if self.marketplace == MarketplaceVersions.MarketplaceV2.value \
                 else DEFAULT_ID_SET_PATH
@@ -92,21 +148,28 @@ class IDSetCreator:
             if not exists(self.output):
                 intermediate_dirs = os.path.dirname(os.path.abspath(self.output))
                 os.makedirs(intermediate_dirs, exist_ok=True)
+            if self.write_db:
+                write_id_set_db(self.id_set, get_id_set_db_path(self.output))
             with open(self.output, 'w+') as id_set_file:
-                json.dump(self.id_set, id_set_file, indent=4)
+                write_id_set_sections(id_set_file, self._iter_sections(release))
+
+    def _iter_sections(self, release: bool):
+        for section_name in list(self.id_set):
+            yield section_name, self.id_set.pop(section_name) if release else self.id_set[section_name]
 
 
-def get_id_set(id_set_path: str) -> dict:
+def get_id_set(id_set_path: str, lazy: bool = False) -> dict:
     """
     Parses the content of id_set_path and returns its content.
     Args:
         id_set_path: The path of the id_set file
+        lazy: Whether to load the sections of an id_set database only when they are accessed
 
     Returns:
         The parsed content of id_set
     """
     if id_set_path:
-        id_set = open_id_set_file(id_set_path)
+        id_set = open_id_set_file(id_set_path, lazy=lazy)
     else:
         id_set, _, _ = IDSetCreator(print_logs=False).create_id_set()
     return id_set
@@ -3,6 +3,7 @@ import shutil
 from collections import OrderedDict
 from tempfile import mkdtemp
 
+from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.handlers import JSON_Handler
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.update_id_set import ID_SET_ENTITIES
@@ -204,6 +205,50 @@ def test_create_id_set_flow(repo, mocker):
         assert len(entity_content_in_id_set) == factor * number_of_packs_to_create
 
 
+def test_create_id_set_with_manifest(repo, mocker):
+    """
+    Given
+    - a content repo and an id set manifest path
+
+    When
+    - creating the id set twice, then changing a single integration and creating the id set again
+
+    Then
+    - ensure the second run takes all the items from the manifest and creates the same id set
+    - ensure the third run parses the changed integration again and the id set contains its new data
+    """
+    from demisto_sdk.commands.common.id_set_manifest import IDSetManifest
+
+    mocker.patch.dict(os.environ, {'DEMISTO_SDK_ID_SET_REFRESH_INTERVAL': '-1'})
+    save_spy = mocker.spy(IDSetManifest, 'save')
+    repo.setup_content_repo(2)
+    manifest_path = os.path.join(repo.path, 'id_set_manifest.json')
+
+    with ChangeCWD(repo.path):
+        IDSetCreator(repo.id_set.path, print_logs=False, manifest_path=manifest_path).create_id_set()
+        first_id_set = repo.id_set.read_json_as_dict()
+        first_run_manifest = save_spy.call_args[0][0]
+        assert first_run_manifest.hits == 0
+        assert first_run_manifest.misses > 0
+
+        IDSetCreator(repo.id_set.path, print_logs=False, manifest_path=manifest_path).create_id_set()
+        second_run_manifest = save_spy.call_args[0][0]
+        assert second_run_manifest.misses == 0
+        assert second_run_manifest.hits == first_run_manifest.misses
+        assert IsEqualFunctions.is_dicts_equal(repo.id_set.read_json_as_dict(), first_id_set)
+
+        integration = repo.packs[0].integrations[0]
+        integration.yml.update({'display': 'Changed Display Name'})
+        IDSetCreator(repo.id_set.path, print_logs=False, manifest_path=manifest_path).create_id_set()
+        third_run_manifest = save_spy.call_args[0][0]
+        assert 0 < third_run_manifest.misses < first_run_manifest.misses
+
+    integration_id = integration.yml.read_dict()['commonfields']['id']
+    integrations = {list(item.keys())[0]: list(item.values())[0]
+                    for item in repo.id_set.read_json_as_dict()['integrations']}
+    assert integrations[integration_id]['display_name'] == 'Changed Display Name'
+
+
 def setup_id_set():
     integration1 = {
         'Integration1': OrderedDict([('name', 'Integration1'), ('commands', ['test-command_1', 'test-command'])])}
@@ -428,3 +473,87 @@ class TestAddCommandToImplementingIntegrationsMapping:
 
         playbook = id_set_creator.id_set['playbooks'][0]['Playbook']
         assert playbook['command_to_integration']['send-notification'] == 'Slack'
+
+
+def test_create_id_set_with_db(repo):
+    """
+    Given
+    - a content repo
+
+    When
+    - creating the id set with the write_db flag
+
+    Then
+    - ensure the id set database is written next to the id set JSON file
+    - ensure the database content equals the id set JSON content
+    """
+    from demisto_sdk.commands.common.id_set_db import IDSetDB
+
+    repo.setup_content_repo(1)
+
+    with ChangeCWD(repo.path):
+        IDSetCreator(repo.id_set.path, print_logs=False, write_db=True).create_id_set()
+
+    db_path = os.path.splitext(repo.id_set.path)[0] + '.db'
+    with IDSetDB(db_path) as id_set_db:
+        assert IsEqualFunctions.is_dicts_equal(id_set_db.to_dict(), repo.id_set.read_json_as_dict())
+
+
+def test_create_marketplaces_id_sets(repo, mocker):
+    """
+    Given
+    - a content repo with an xsoar pack and a marketplacev2 pack
+
+    When
+    - creating the id sets of both marketplaces in a single pass
+
+    Then
+    - ensure each id set equals the id set created for its marketplace alone
+    - ensure each id set contains only the pack of its marketplace
+    """
+    mocker.patch.dict(os.environ, {'DEMISTO_SDK_ID_SET_REFRESH_INTERVAL': '-1'})
+    marketplaces = [MarketplaceVersions.XSOAR.value, MarketplaceVersions.MarketplaceV2.value]
+    for pack_name, marketplace in (('xsoar_pack', marketplaces[0]), ('mpv2_pack', marketplaces[1])):
+        pack = repo.setup_one_pack(pack_name, [marketplace])
+        pack.pack_metadata.update({'marketplaces': [marketplace]})
+    outputs = [os.path.join(repo.path, f'id_set_{marketplace}.json') for marketplace in marketplaces]
+
+    with ChangeCWD(repo.path):
+        id_set_creators = IDSetCreator.create_marketplaces_id_sets(marketplaces, outputs, print_logs=False)
+        for marketplace, output in zip(marketplaces, outputs):
+            id_set, excluded_items_by_pack, _ = IDSetCreator(output=None, print_logs=False,
+                                                             marketplace=marketplace).create_id_set()
+            id_set_creator, marketplace_excluded_items_by_pack, _ = id_set_creators[marketplace]
+            assert IsEqualFunctions.is_dicts_equal(id_set_creator.id_set, id_set)
+            assert marketplace_excluded_items_by_pack == excluded_items_by_pack
+            with open(output) as id_set_file:
+                assert IsEqualFunctions.is_dicts_equal(json.load(id_set_file), json.loads(json.dumps(id_set)))
+
+    assert list(id_set_creators[MarketplaceVersions.XSOAR.value][0].id_set['Packs']) == ['xsoar_pack']
+    assert list(id_set_creators[MarketplaceVersions.MarketplaceV2.value][0].id_set['Packs']) == ['mpv2_pack']
+
+
+def test_save_id_set_release(repo):
+    """
+    Given
+    - an id set created from a content repo
+
+    When
+    - saving the id set section by section and releasing the sections once they are written
+
+    Then
+    - ensure the id set file is the same as dumping the whole id set at once
+    - ensure all the sections were removed from the in memory id set
+    """
+    repo.setup_content_repo(2)
+
+    with ChangeCWD(repo.path):
+        id_set_creator = IDSetCreator(repo.id_set.path, print_logs=False)
+        id_set, _, _ = id_set_creator.create_id_set()
+    expected_id_set_text = json.dumps(id_set, indent=4)
+
+    id_set_creator.save_id_set(release=True)
+
+    with open(repo.id_set.path) as id_set_file:
+        assert id_set_file.read() == expected_id_set_text
+    assert not id_set_creator.id_set
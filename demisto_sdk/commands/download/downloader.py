@@ -879,7 +879,7 @@ class Downloader:
         :return: None
         """
 
-        pack_obj_data, _ = get_dict_from_file(file_path_to_read)
+        pack_obj_data, _ = get_dict_from_file(file_path_to_read, keep_format=True)
         fields: list = DELETED_YML_FIELDS_BY_DEMISTO if file_ending == 'yml' else DELETED_JSON_FIELDS_BY_DEMISTO
         # Creates a nested-complex dict of all fields to be deleted by Demisto.
         # We need the dict to be nested, to easily merge it later to the file data.
@@ -0,0 +1,205 @@
+import hashlib
+import os
+from typing import Dict, Optional, Set, Tuple
+
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.tools import (LOG_COLORS,
+                                               get_demisto_sdk_version,
+                                               print_color, print_warning)
+from demisto_sdk.commands.find_dependencies.id_set_index import IDSetIndex
+
+json = JSON_Handler()
+
+DEPENDENCIES_CACHE_VERSION = 1
+
+# the id_set sections the pack items are collected from, see PackDependencies._collect_pack_items
+PACK_ITEMS_SECTIONS = ('scripts', 'playbooks', 'Layouts', 'IncidentFields', 'IndicatorFields', 'IndicatorTypes',
+                       'integrations', 'IncidentTypes', 'Classifiers', 'Mappers', 'Widgets', 'Dashboards', 'Reports',
+                       'GenericTypes', 'GenericFields', 'GenericModules', 'GenericDefinitions', 'Lists', 'Jobs',
+                       'Wizards')
+
+
+def get_item_hash(item_details: dict) -> str:
+    return hashlib.sha1(json.dumps(item_details, sort_keys=True).encode()).hexdigest()
+
+
+def encode_dependencies(dependencies: Set[Tuple[str, bool]], dependencies_items: Dict) -> Dict:
+    """
+    Converts the result of `PackDependencies._find_pack_dependencies` into a JSON serializable object.
+    """
+    return {
+        'dependencies': sorted([pack, is_mandatory] for pack, is_mandatory in dependencies),
+        'items': [
+            [list(item), {pack: [list(pack_item) for pack_item in pack_items]
+                          for pack, pack_items in items_by_pack.items()}]
+            for item, items_by_pack in dependencies_items.items()
+        ],
+    }
+
+
+def decode_dependencies(encoded: Dict) -> Tuple[Set[Tuple[str, bool]], Dict]:
+    """
+    Reverts `encode_dependencies`.
+    """
+    dependencies = {(pack, is_mandatory) for pack, is_mandatory in encoded['dependencies']}
+    dependencies_items = {
+        tuple(item): {pack: [tuple(pack_item) for pack_item in pack_items]
+                      for pack, pack_items in items_by_pack.items()}
+        for item, items_by_pack in encoded['items']
+    }
+    return dependencies, dependencies_items
+
+
+class PackDependenciesCache:
+    """
+    A persisted mapping of: pack -> the first level dependencies of the pack, and the keys of the id_set lookups
+    made while calculating them (see `id_set_index.record_lookups`).
+    Along with the hashes of the id_set items of every pack and the keys these items are found by.
+
+    Used to build the all packs dependency graph incrementally - the dependencies of a pack are calculated again
+    only if the items of the pack were changed, or if an item changed in another pack is found by one of the keys
+    the pack looked up, e.g. the script the pack depends on was changed, or a new integration implements
+    a command the pack uses.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, marketplace: str = '',
+                 exclude_ignored_dependencies: bool = True):
+        """
+        Args:
+            cache_path: The path of the cache file. Pass None to disable the cache.
+            marketplace: The marketplace the dependencies are calculated for.
+            exclude_ignored_dependencies: Whether the unsupported dependencies are excluded from the calculation.
+        """
+        self.cache_path = cache_path
+        self.marketplace = marketplace
+        self.exclude_ignored_dependencies = exclude_ignored_dependencies
+        self._packs_items: Dict[str, Dict] = {}
+        self._dependencies: Dict[str, Dict] = {}
+        self._new_packs_items: Dict[str, Dict] = {}
+        self._new_dependencies: Dict[str, Dict] = {}
+        self._changed_packs: Set[str] = set()
+        self._changed_keys: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.cache_path)
+
+    def load(self):
+        if not self.enabled or not os.path.isfile(self.cache_path):  # type: ignore[arg-type]
+            return
+
+        try:
+            with open(self.cache_path, 'r') as cache_file:  # type: ignore[arg-type]
+                cache = json.load(cache_file)
+        except ValueError:
+            print_warning(f'Could not parse the dependencies cache {self.cache_path}, ignoring it.')
+            return
+
+        if cache.get('version') != DEPENDENCIES_CACHE_VERSION or \
+                cache.get('sdk_version') != get_demisto_sdk_version() or \
+                cache.get('marketplace') != self.marketplace or \
+                cache.get('exclude_ignored_dependencies') != self.exclude_ignored_dependencies:
+            print_color(f'The dependencies cache {self.cache_path} was created by a different demisto-sdk version or '
+                        f'with different arguments, ignoring it.', LOG_COLORS.YELLOW)
+            return
+
+        self._packs_items = cache.get('packs_items', {})
+        self._dependencies = cache.get('dependencies', {})
+
+    def save(self):
+        """
+        Saves the dependencies of the packs calculated or taken from the cache in the current run.
+        """
+        cache_path = self.cache_path
+        if not cache_path:
+            return
+
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+        with open(cache_path, 'w') as cache_file:
+            json.dump({
+                'version': DEPENDENCIES_CACHE_VERSION,
+                'sdk_version': get_demisto_sdk_version(),
+                'marketplace': self.marketplace,
+                'exclude_ignored_dependencies': self.exclude_ignored_dependencies,
+                'packs_items': self._new_packs_items,
+                'dependencies': self._new_dependencies,
+            }, cache_file)
+
+        print_color(f'Saved the dependencies cache to {self.cache_path}. The dependencies of {self.hits} packs were '
+                    f'taken from the cache, the dependencies of {self.misses} packs were calculated.', LOG_COLORS.GREEN)
+
+    def update_items(self, id_set: dict, id_set_index: Optional[IDSetIndex] = None):
+        """
+        Hashes the items of every pack in the id_set, and finds the packs whose items were changed since the cache
+        was saved, and the keys of the changed items (before and after the change).
+
+        Args:
+            id_set: The id_set the dependencies are calculated from.
+            id_set_index: The indexes of the id_set sections, built from the id_set when not given.
+        """
+        if not self.enabled:
+            return
+
+        id_set_index = id_set_index or IDSetIndex(id_set)
+        packs_item_keys: Dict[str, Set[str]] = {}
+        for section_name in PACK_ITEMS_SECTIONS:
+            if section_name not in id_set:
+                continue
+            for record in id_set_index.section(section_name).records:
+                if not record.pack:
+                    continue
+                pack_items = self._new_packs_items.setdefault(record.pack, {'item_hashes': {}, 'keys': []})
+                # a pack may have several items with the same id, e.g. for different server versions
+                pack_items['item_hashes'].setdefault(f'{section_name}:{record.item_id}', []).append(
+                    get_item_hash(record.details))
+                packs_item_keys.setdefault(record.pack, set()).update(record.lookup_keys())
+
+        for pack, item_keys in packs_item_keys.items():
+            for item_hashes in self._new_packs_items[pack]['item_hashes'].values():
+                item_hashes.sort()
+            self._new_packs_items[pack]['keys'] = sorted(item_keys)
+
+        for pack in set(self._packs_items) | set(self._new_packs_items):
+            old_pack_items = self._packs_items.get(pack, {})
+            new_pack_items = self._new_packs_items.get(pack, {})
+            if old_pack_items.get('item_hashes') != new_pack_items.get('item_hashes'):
+                self._changed_packs.add(pack)
+                self._changed_keys.update(old_pack_items.get('keys', []))
+                self._changed_keys.update(new_pack_items.get('keys', []))
+
+    def get(self, pack: str) -> Optional[Tuple[Set[Tuple[str, bool]], Dict]]:
+        """
+        Gets the cached dependencies of the pack, if the pack and the items it depends on were not changed.
+
+        Returns:
+            The dependencies and the dependencies items, as returned by `PackDependencies._find_pack_dependencies`,
+            or None if the dependencies should be calculated.
+        """
+        if not self.enabled:
+            return None
+
+        cached_dependencies = self._dependencies.get(pack)
+        if not cached_dependencies or pack in self._changed_packs or \
+                self._changed_keys.intersection(cached_dependencies['lookups']):
+            return None
+
+        self._new_dependencies[pack] = cached_dependencies
+        self.hits += 1
+        return decode_dependencies(cached_dependencies['result'])
+
+    def add(self, pack: str, dependencies: Set[Tuple[str, bool]], dependencies_items: Dict, lookups: Set[str]):
+        """
+        Adds the calculated dependencies of a pack to the cache.
+        """
+        if not self.enabled:
+            return
+
+        # encoding copies the result, later changes to the dependency graph don't affect the cache
+        self._new_dependencies[pack] = {
+            'result': encode_dependencies(dependencies, dependencies_items),
+            'lookups': sorted(lookups),
+        }
+        self.misses += 1
@@ -0,0 +1,90 @@
+from typing import Dict, FrozenSet, List, Set
+
+import networkx as nx
+
+
+def get_transitive_dependencies(dependency_graph: nx.DiGraph) -> Dict[str, FrozenSet[str]]:
+    """
+    Calculates the packs every pack of the graph depends on, directly or through other packs.
+
+    The strongly connected components of the graph (packs depending on each other in a cycle) are condensed to
+    single nodes, so the condensed graph is acyclic. The dependencies of every component are then collected
+    in one pass over the components in reverse topological order - the dependencies of a component are the
+    members and the dependencies of the components it points to, which are already calculated.
+    The packs of a component share the same frozenset.
+
+    Args:
+        dependency_graph: A graph of packs, with an edge from every pack to each pack it depends on.
+
+    Returns:
+        A mapping of: pack -> the packs it depends on in all levels. A pack depends on itself only if it is
+        part of a dependencies cycle.
+    """
+    condensed_graph = nx.condensation(dependency_graph)
+    components_dependencies: Dict[int, FrozenSet[str]] = {}
+    for component in reversed(list(nx.topological_sort(condensed_graph))):
+        dependencies: Set[str] = set()
+        for dependency_component in condensed_graph.successors(component):
+            dependencies.update(condensed_graph.nodes[dependency_component]['members'])
+            dependencies.update(components_dependencies[dependency_component])
+
+        members = condensed_graph.nodes[component]['members']
+        if len(members) > 1 or any(dependency_graph.has_edge(pack, pack) for pack in members):
+            dependencies.update(members)
+        components_dependencies[component] = frozenset(dependencies)
+
+    return {pack: components_dependencies[component]
+            for pack, component in condensed_graph.graph['mapping'].items()}
+
+
+class PackDependenciesClosure:
+    """
+    The first level and all levels dependencies of every pack in the all packs dependency graph, calculated once
+    for all the packs instead of traversing the graph from each pack (see `get_transitive_dependencies`).
+
+    A dependency is mandatory for a pack if the pack is in the `mandatory_for_packs` of the dependency node.
+    The mandatory dependencies in all levels are the packs reachable from a pack by mandatory dependencies only,
+    i.e. the packs that must be installed along with the pack.
+    """
+
+    def __init__(self, dependency_graph: nx.DiGraph):
+        """
+        Args:
+            dependency_graph: The graph built by `PackDependencies.build_all_dependencies_graph`.
+        """
+        self._first_level: Dict[str, Dict[str, bool]] = {}
+        for pack in dependency_graph:
+            self._first_level[pack] = {
+                dependency: pack in dependency_graph.nodes[dependency].get('mandatory_for_packs', ())
+                for dependency in dependency_graph.successors(pack)
+            }
+
+        mandatory_graph = nx.DiGraph()
+        mandatory_graph.add_nodes_from(dependency_graph)
+        mandatory_graph.add_edges_from((pack, dependency) for pack, dependencies in self._first_level.items()
+                                       for dependency, is_mandatory in dependencies.items() if is_mandatory)
+
+        self._all_levels = get_transitive_dependencies(dependency_graph)
+        self._mandatory_all_levels = get_transitive_dependencies(mandatory_graph)
+
+    def get_first_level_dependencies(self, pack: str) -> Dict[str, bool]:
+        """
+        Returns:
+            A mapping of: dependency -> whether the dependency is mandatory, for the packs the pack depends on
+            directly, in the order of the graph edges.
+        """
+        return self._first_level[pack]
+
+    def get_all_level_dependencies(self, pack: str) -> List[str]:
+        """
+        Returns:
+            The sorted packs the pack depends on, directly or through other packs.
+        """
+        return sorted(self._all_levels[pack])
+
+    def get_mandatory_all_level_dependencies(self, pack: str) -> List[str]:
+        """
+        Returns:
+            The sorted packs the pack depends on mandatorily, directly or through other mandatory dependencies.
+        """
+        return sorted(self._mandatory_all_levels[pack])
@@ -0,0 +1,121 @@
+import os
+from typing import Dict, List, Optional, Set, Tuple
+
+import networkx as nx
+
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.tools import (LOG_COLORS,
+                                               get_demisto_sdk_version,
+                                               print_color, print_warning)
+
+json = JSON_Handler()
+
+DEPENDENCY_GRAPH_FILE_VERSION = 1
+
+
+def encode_dependency_graph(dependency_graph: nx.DiGraph) -> Dict:
+    """
+    Encodes the all packs dependency graph compactly, referring to the packs by their positions in the graph nodes.
+
+    The graph is kept as its edges, the first level dependencies of every pack (`depending_on_packs`), and the
+    items causing each mandatory edge (`depending_on_items_mandatorily`). The other node attributes are derived
+    from these when the graph is decoded.
+
+    Returns:
+        {
+            'packs': [pack, ...],
+            'edges': [[pack, dependency, is mandatory], ...],
+            'edge_items': [[pack, dependency, [item type, item id], [[dependency item type, item id], ...]], ...],
+        }
+    """
+    packs = list(dependency_graph)
+    pack_positions = {pack: position for position, pack in enumerate(packs)}
+    edges: List[List] = []
+    edge_items: List[List] = []
+    for pack, pack_graph_node in dependency_graph.nodes(data=True):
+        for dependency, is_mandatory in sorted(pack_graph_node.get('depending_on_packs', [])):
+            edges.append([pack_positions[pack], pack_positions[dependency], int(is_mandatory)])
+        for item, items_by_pack in pack_graph_node.get('depending_on_items_mandatorily', {}).items():
+            for dependency, dependency_items in items_by_pack.items():
+                edge_items.append([pack_positions[pack], pack_positions[dependency], list(item),
+                                   [list(dependency_item) for dependency_item in dependency_items]])
+    return {'packs': packs, 'edges': edges, 'edge_items': edge_items}
+
+
+def decode_dependency_graph(encoded: Dict) -> Tuple[List[str], Dict[str, Tuple[Set[Tuple[str, bool]], Dict]]]:
+    """
+    Reverts `encode_dependency_graph`.
+
+    Returns:
+        The packs, in the order of the graph nodes, and a mapping of: pack -> the first level dependencies of the pack
+        and the items causing them, as returned by `PackDependencies._find_pack_dependencies`.
+    """
+    packs = encoded['packs']
+    packs_dependencies: Dict[str, Tuple[Set[Tuple[str, bool]], Dict]] = {}
+    for pack, dependency, is_mandatory in encoded['edges']:
+        packs_dependencies.setdefault(packs[pack], (set(), {}))[0].add((packs[dependency], bool(is_mandatory)))
+    for pack, dependency, item, dependency_items in encoded['edge_items']:
+        dependencies_items = packs_dependencies.setdefault(packs[pack], (set(), {}))[1]
+        dependencies_items.setdefault(tuple(item), {})[packs[dependency]] = [
+            tuple(dependency_item) for dependency_item in dependency_items]
+    return packs, packs_dependencies
+
+
+def save_dependency_graph(graph_path: str, dependency_graph: nx.DiGraph, pack_ids: List[str], id_set_hash: str,
+                          marketplace: str, exclude_ignored_dependencies: bool):
+    """
+    Saves the all packs dependency graph, keyed by the hash of the id_set it was built from and the arguments
+    it was built with.
+
+    Args:
+        graph_path: The path of the graph file.
+        dependency_graph: The graph built by `PackDependencies.build_all_dependencies_graph`.
+        pack_ids: The packs the graph was built for.
+        id_set_hash: The hash of the id_set file the graph was built from.
+        marketplace: The marketplace the dependencies were calculated for.
+        exclude_ignored_dependencies: Whether the unsupported dependencies were excluded from the calculation.
+    """
+    graph_dir = os.path.dirname(os.path.abspath(graph_path))
+    os.makedirs(graph_dir, exist_ok=True)
+    with open(graph_path, 'w') as graph_file:
+        json.dump({
+            'version': DEPENDENCY_GRAPH_FILE_VERSION,
+            'sdk_version': get_demisto_sdk_version(),
+            'id_set_hash': id_set_hash,
+            'marketplace': marketplace,
+            'exclude_ignored_dependencies': exclude_ignored_dependencies,
+            'pack_ids': sorted(pack_ids),
+            'graph': encode_dependency_graph(dependency_graph),
+        }, graph_file)
+
+
+def load_dependency_graph(graph_path: str, pack_ids: List[str], id_set_hash: str, marketplace: str,
+                          exclude_ignored_dependencies: bool) -> Optional[Tuple[List[str], Dict]]:
+    """
+    Loads the dependency graph saved by `save_dependency_graph`.
+
+    Returns:
+        The decoded graph (see `decode_dependency_graph`), or None if there is no graph file or the graph was built
+        from a different id_set, for different packs, with different arguments or by a different demisto-sdk version.
+    """
+    if not os.path.isfile(graph_path):
+        return None
+
+    try:
+        with open(graph_path, 'r') as graph_file:
+            saved_graph = json.load(graph_file)
+    except ValueError:
+        print_warning(f'Could not parse the dependency graph file {graph_path}, ignoring it.')
+        return None
+
+    if saved_graph.get('version') != DEPENDENCY_GRAPH_FILE_VERSION or \
+            saved_graph.get('sdk_version') != get_demisto_sdk_version() or \
+            saved_graph.get('id_set_hash') != id_set_hash or \
+            saved_graph.get('marketplace') != marketplace or \
+            saved_graph.get('exclude_ignored_dependencies') != exclude_ignored_dependencies or \
+            saved_graph.get('pack_ids') != sorted(pack_ids):
+        print_color(f'The dependency graph file {graph_path} was built from a different id set or with different '
+                    f'arguments, ignoring it.', LOG_COLORS.YELLOW)
+        return None
+
+    return decode_dependency_graph(saved_graph['graph'])
@@ -0,0 +1,84 @@
+import os
+from typing import Dict, List, Optional
+
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.tools import (LOG_COLORS,
+                                               get_demisto_sdk_version,
+                                               print_color, print_warning)
+
+json = JSON_Handler()
+
+DEPENDENT_ON_INDEX_VERSION = 1
+
+
+def get_dependent_on_index_path(output_path: str) -> str:
+    """
+    The path of the dependent on index saved alongside the all packs dependencies output file,
+    e.g. `all_packs_dependencies_dependent_on_index.json` for `all_packs_dependencies.json`.
+    """
+    return f'{os.path.splitext(output_path)[0]}_dependent_on_index.json'
+
+
+def save_dependent_on_index(index_path: str, dependent_on_index: Dict[str, Dict], id_set_hash: str,
+                            marketplace: str, packs: List[str]):
+    """
+    Saves the reverse edges index of the all packs dependency graph, along with the id_set hash and the arguments
+    it was calculated with.
+
+    Args:
+        index_path: The path of the index file, see get_dependent_on_index_path.
+        dependent_on_index: A mapping of: pack -> the packs dependent on it mandatorily, as returned by
+         `calculate_single_pack_depends_on`.
+        id_set_hash: The hash of the id_set file the dependency graph was built from.
+        marketplace: The marketplace the dependencies were calculated for.
+        packs: The packs the dependency graph was built for.
+    """
+    with open(index_path, 'w') as index_file:
+        json.dump({
+            'version': DEPENDENT_ON_INDEX_VERSION,
+            'sdk_version': get_demisto_sdk_version(),
+            'id_set_hash': id_set_hash,
+            'marketplace': marketplace,
+            'packs': sorted(packs),
+            'dependent_on': dependent_on_index,
+        }, index_file)
+
+
+def load_dependent_on_index(index_path: str, id_set_hash: str, marketplace: str,
+                            packs: List[str]) -> Optional[Dict[str, Dict]]:
+    """
+    Loads the dependent on index saved by `save_dependent_on_index`.
+
+    Returns:
+        The dependent on index, or None if there is no index or it was calculated from a different id_set,
+        for a different marketplace or packs, or by a different demisto-sdk version.
+    """
+    if not os.path.isfile(index_path):
+        return None
+
+    try:
+        with open(index_path, 'r') as index_file:
+            index = json.load(index_file)
+    except ValueError:
+        print_warning(f'Could not parse the dependent on index {index_path}, ignoring it.')
+        return None
+
+    if index.get('version') != DEPENDENT_ON_INDEX_VERSION or \
+            index.get('sdk_version') != get_demisto_sdk_version() or \
+            index.get('id_set_hash') != id_set_hash or \
+            index.get('marketplace') != marketplace or \
+            index.get('packs') != sorted(packs):
+        print_color(f'The dependent on index {index_path} was calculated from a different id set or with different '
+                    f'arguments, ignoring it.', LOG_COLORS.YELLOW)
+        return None
+
+    dependent_on_index = index.get('dependent_on', {})
+    for dependent_packs in dependent_on_index.values():
+        for dependency_data in dependent_packs.values():
+            if 'dependent_items' in dependency_data:
+                # JSON has no tuples, convert the items back to (item type, item id)
+                dependency_data['dependent_items'] = [
+                    (tuple(item), [tuple(dependent_item) for dependent_item in dependent_items])
+                    for item, dependent_items in dependency_data['dependent_items']
+                ]
+    return dependent_on_index
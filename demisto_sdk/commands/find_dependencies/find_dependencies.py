@@ -1,10 +1,11 @@
 import glob
+import math
 import os
 import sys
 from copy import deepcopy
 from pathlib import Path
 from pprint import pformat
-from typing import Any, Iterable, Optional, Set, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import click
 import networkx as nx
@@ -13,17 +14,31 @@ from requests import RequestException
 
 from demisto_sdk.commands.common import constants
 from demisto_sdk.commands.common.constants import (
-    DEFAULT_CONTENT_ITEM_TO_VERSION, GENERIC_COMMANDS_NAMES,
-    IGNORED_PACKS_IN_DEPENDENCY_CALC, PACKS_DIR)
+    ALL_PACKS_DEPENDENCIES_DEFAULT_PATH, DEFAULT_CONTENT_ITEM_TO_VERSION,
+    GENERIC_COMMANDS_NAMES, IGNORED_PACKS_IN_DEPENDENCY_CALC, PACKS_DIR)
 from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.id_set_db import close_id_set
 from demisto_sdk.commands.common.tools import (
-    ProcessPoolHandler, get_content_id_set, get_content_path, get_pack_name,
-    is_external_repository, item_type_to_content_items_header, print_error,
-    print_success, print_warning, wait_futures_complete)
+    ProcessPoolHandler, get_content_id_set, get_content_path,
+    get_file_or_dir_hash, get_pack_name, is_external_repository,
+    item_type_to_content_items_header, print_error, print_success,
+    print_warning, wait_futures_complete)
 from demisto_sdk.commands.common.update_id_set import (
     merge_id_sets, update_excluded_items_dict)
 from demisto_sdk.commands.create_id_set.create_id_set import (IDSetCreator,
                                                               get_id_set)
+from demisto_sdk.commands.find_dependencies.dependencies_cache import \
+    PackDependenciesCache
+from demisto_sdk.commands.find_dependencies.dependencies_closure import \
+    PackDependenciesClosure
+from demisto_sdk.commands.find_dependencies.dependency_graph_file import (
+    load_dependency_graph, save_dependency_graph)
+from demisto_sdk.commands.find_dependencies.dependent_on_index import (
+    get_dependent_on_index_path, load_dependent_on_index,
+    save_dependent_on_index)
+from demisto_sdk.commands.find_dependencies.id_set_index import (
+    IDSetIndex, IDSetItemRecord, IDSetSectionIndex, as_section_index,
+    record_lookups)
 
 json = JSON_Handler()
 
@@ -32,6 +47,12 @@ MINIMUM_DEPENDENCY_VERSION = Version('6.0.0')
 COMMON_TYPES_PACK = 'CommonTypes'
 CORE_ALERT_FIELDS_PACK = 'CoreAlertFields'
 PACKS_FULL_PATH = os.path.join(get_content_path(), PACKS_DIR)  # full path to Packs folder in content repo
+CHUNKS_PER_WORKER = 4
+
+# the dependency graph of a worker process, set by init_dependency_graph_worker
+_worker_dependency_graph: Optional[nx.DiGraph] = None
+# the dependencies closure of a worker process, set by init_dependencies_closure_worker
+_worker_dependencies_closure: Optional[PackDependenciesClosure] = None
 
 
 def parse_for_pack_metadata(dependency_graph: nx.DiGraph, graph_root: str, verbose: bool = False,
@@ -191,18 +212,19 @@ class PackDependencies:
     """
 
     @staticmethod
-    def _search_for_pack_items(pack_id: str, items_list: list) -> list:
+    def _search_for_pack_items(pack_id: str, items_list: Union[list, IDSetSectionIndex]) -> list:
         """
         Filtering of content items that belong to specific pack.
 
         Args:
             pack_id (str): pack id.
-            items_list (list): specific section of id set.
+            items_list (list or IDSetSectionIndex): specific section of id set, or its index.
 
         Returns:
             list: collection of content pack items.
         """
-        return list(filter(lambda s: next(iter(s.values())).get('pack') == pack_id, items_list))
+        section_index = as_section_index(items_list)
+        return [section_index.items_list[position] for position in section_index.find_by_pack(pack_id)]
 
     @staticmethod
     def _should_add_item_as_dependency(item_details: dict, base_condition: bool, exclude_ignored_dependencies: bool, marketplace: str) -> bool:
@@ -236,9 +258,34 @@ class PackDependencies:
 
         return base_condition and is_version_match and is_relevant_pack and is_marketplace_match
 
+    @staticmethod
+    def _should_add_record_as_dependency(record: IDSetItemRecord, exclude_ignored_dependencies: bool,
+                                         marketplace: str) -> bool:
+        """
+        Same as `_should_add_item_as_dependency` for an item which matches the base condition, using the version,
+        pack and marketplaces of the item that were normalized when the id set section was indexed.
+
+        Args:
+            record: the item record from the id set section index.
+            exclude_ignored_dependencies: Determines whether to include unsupported dependencies or not.
+            marketplace: The dependency calculation desired marketplace.
+
+        Returns:
+            bool
+        """
+        if record.to_version is None:
+            # not a valid version, fails the same way as the item details check
+            return PackDependencies._should_add_item_as_dependency(record.details, True, exclude_ignored_dependencies,
+                                                                   marketplace)
+
+        return bool(record.to_version >= MINIMUM_DEPENDENCY_VERSION and
+                    record.pack and
+                    (not exclude_ignored_dependencies or record.pack not in constants.IGNORED_DEPENDENCY_CALCULATION) and
+                    (not marketplace or record.is_in_marketplace(marketplace)))
+
     @staticmethod
     def _search_packs_by_items_names(items_names: Union[str, list],
-                                     items_list: list,
+                                     items_list: Union[list, IDSetSectionIndex],
                                      exclude_ignored_dependencies: bool = True,
                                      item_type: str = '',
                                      marketplace: str = '',
@@ -249,7 +296,7 @@ class PackDependencies:
 
         Args:
             items_names (str or list): items names to search.
-            items_list (list): specific section of id set.
+            items_list (list or IDSetSectionIndex): specific section of id set, or its index.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             item_type (str): the type of content item given.
             marketplace: The dependency calculation desired marketplace.
@@ -260,29 +307,53 @@ class PackDependencies:
                 dict: found {pack, (item_type, item_id)} ids
 
         """
-        packs_and_items_dict: dict = {}
-        if not isinstance(items_names, list):
-            items_names = [items_names]
+        return PackDependencies._search_packs_by_items_names_batch(
+            [items_names], items_list, exclude_ignored_dependencies, item_type, marketplace)[0]
 
-        pack_names = set()
-        for item in items_list:
-            item_id = list(item.keys())[0]
-            item_details = list(item.values())[0]
+    @staticmethod
+    def _search_packs_by_items_names_batch(items_names_groups: list,
+                                           items_list: Union[list, IDSetSectionIndex],
+                                           exclude_ignored_dependencies: bool = True,
+                                           item_type: str = '',
+                                           marketplace: str = '',
+                                           ) -> List[Tuple[Any, Any]]:
+        """
+        Same as `_search_packs_by_items_names` for several groups of items names of the same id set section.
+        The names are resolved against the section index in bulk, and every found item is filtered only once.
 
-            if PackDependencies._should_add_item_as_dependency(item_details,
-                                                               item_details.get('name', '') in items_names,
-                                                               exclude_ignored_dependencies,
-                                                               marketplace,
-                                                               ):
-                pack_name = item_details.get('pack')
-                pack_names.add(pack_name)
-                packs_and_items_dict.setdefault(pack_name, []).append((item_type, item_id))
+        Args:
+            items_names_groups (list): groups of items names to search, each one is a name or a list of names.
+            items_list (list or IDSetSectionIndex): specific section of id set, or its index.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            item_type (str): the type of content item given.
+            marketplace: The dependency calculation desired marketplace.
 
-        return pack_names, packs_and_items_dict
+        Returns:
+            list: the result of `_search_packs_by_items_names` for every group, in the order of the groups.
+        """
+        section_index = as_section_index(items_list)
+        should_add_positions: Dict[int, bool] = {}
+        results = []
+        for positions in section_index.find_by_names_batch(
+                items_names if isinstance(items_names, list) else [items_names] for items_names in items_names_groups):
+            packs_and_items_dict: dict = {}
+            pack_names = set()
+            for position in positions:
+                record = section_index.records[position]
+                if position not in should_add_positions:
+                    should_add_positions[position] = PackDependencies._should_add_record_as_dependency(
+                        record, exclude_ignored_dependencies, marketplace)
+
+                if should_add_positions[position]:
+                    pack_names.add(record.pack)
+                    packs_and_items_dict.setdefault(record.pack, []).append((item_type, record.item_id))
+            results.append((pack_names, packs_and_items_dict))
+
+        return results
 
     @staticmethod
     def _search_packs_by_items_names_or_ids(items_names: Union[str, list],
-                                            items_list: list,
+                                            items_list: Union[list, IDSetSectionIndex],
                                             exclude_ignored_dependencies: bool = True,
                                             incident_or_indicator: Optional[str] = 'Both',
                                             item_type: str = '',
@@ -293,7 +364,7 @@ class PackDependencies:
 
         Args:
             items_names (str or list): items names to search.
-            items_list (list): specific section of id set.
+            items_list (list or IDSetSectionIndex): specific section of id set, or its index.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             incident_or_indicator (str):
                 'Indicator' to search packs with indicator fields,
@@ -307,13 +378,38 @@ class PackDependencies:
             set: found pack ids
             dict: found {pack, (item_type, item_id)} ids
         """
-        packs_and_items_dict: dict = {}
-        pack_names = set()
-        if not isinstance(items_names, list):
-            items_names = [items_names]
-        item_possible_ids = []
+        return PackDependencies._search_packs_by_items_names_or_ids_batch(
+            [items_names], items_list, exclude_ignored_dependencies, incident_or_indicator, item_type, marketplace)[0]
+
+    @staticmethod
+    def _search_packs_by_items_names_or_ids_batch(items_names_groups: list,
+                                                  items_list: Union[list, IDSetSectionIndex],
+                                                  exclude_ignored_dependencies: bool = True,
+                                                  incident_or_indicator: Optional[str] = 'Both',
+                                                  item_type: str = '',
+                                                  marketplace: str = '',
+                                                  ) -> List[Tuple[Any, Any]]:
+        """
+        Same as `_search_packs_by_items_names_or_ids` for several groups of items names of the same id set section.
+        Every distinct name is resolved against the section index once, and every found item is filtered only once.
+
+        Args:
+            items_names_groups (list): groups of items names to search, each one is a name or a list of names.
+            items_list (list or IDSetSectionIndex): specific section of id set, or its index.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            incident_or_indicator (str): see `_search_packs_by_items_names_or_ids`.
+            item_type (str): the type of content item given.
+            marketplace: The dependency calculation desired marketplace.
+
+        Returns:
+            list: the result of `_search_packs_by_items_names_or_ids` for every group, in the order of the groups.
+        """
+        section_index = as_section_index(items_list)
+        names_positions: Dict[Any, List[int]] = {}
+        should_add_positions: Dict[int, bool] = {}
 
-        for item_name in items_names:
+        def find_item_positions(item_name: Any) -> List[int]:
+            item_possible_ids: list = []
             if incident_or_indicator == 'Incident':
                 item_possible_ids = [item_name, f'incident_{item_name}', f'{item_name}-mapper']
             elif incident_or_indicator == 'Indicator':
@@ -324,31 +420,47 @@ class PackDependencies:
                 item_possible_ids = [item_name, f'incident_{item_name}', f'indicator_{item_name}',
                                      f'{item_name}-mapper']
 
-            for item_from_id_set in items_list:
-                item_id = list(item_from_id_set.keys())[0]
-                item_details = list(item_from_id_set.values())[0]
-                id_set_item_aliases = set(item_details.get('aliases', []))
+            matching_positions = set(section_index.find_by_ids(item_possible_ids))
+            matching_positions.update(section_index.find_by_names([item_name], missing_name=None))
+            if item_type == 'incidentfield':
+                matching_positions.update(section_index.find_by_aliases(item_possible_ids))
+            return sorted(matching_positions)
+
+        results = []
+        for items_names in items_names_groups:
+            packs_and_items_dict: dict = {}
+            pack_names = set()
+            if not isinstance(items_names, list):
+                items_names = [items_names]
+
+            for item_name in items_names:
+                try:
+                    item_positions = names_positions.get(item_name)
+                except TypeError:  # an unhashable name is matched only by its id variations, not memoized
+                    item_positions = find_item_positions(item_name)
+                else:
+                    if item_positions is None:
+                        item_positions = names_positions[item_name] = find_item_positions(item_name)
 
-                is_item_id_match = item_id in item_possible_ids or item_name == item_details.get('name')
-                if item_type == 'incidentfield':
-                    is_item_id_match = is_item_id_match or set(item_possible_ids).intersection(id_set_item_aliases)
+                for position in item_positions:
+                    record = section_index.records[position]
+                    if position not in should_add_positions:
+                        should_add_positions[position] = PackDependencies._should_add_record_as_dependency(
+                            record, exclude_ignored_dependencies, marketplace)
 
-                if PackDependencies._should_add_item_as_dependency(item_details,
-                                                                   is_item_id_match,
-                                                                   exclude_ignored_dependencies,
-                                                                   marketplace,
-                                                                   ):
-                    pack_name = item_details.get('pack')
-                    pack_names.add(pack_name)
-                    packs_and_items_dict.setdefault(pack_name, []).extend([(item_type, item_id)])
+                    if should_add_positions[position]:
+                        pack_names.add(record.pack)
+                        packs_and_items_dict.setdefault(record.pack, []).extend([(item_type, record.item_id)])
+            results.append((pack_names, packs_and_items_dict))
 
-        return pack_names, packs_and_items_dict
+        return results
 
     @staticmethod
     def _search_packs_by_integration_command(command: str,
                                              id_set: dict,
                                              exclude_ignored_dependencies: bool = True,
                                              marketplace: str = '',
+                                             id_set_index: Optional[IDSetIndex] = None,
                                              ) -> Tuple[Any, Any]:
         """
         Filters packs by implementing integration commands.
@@ -356,6 +468,7 @@ class PackDependencies:
         Args:
             command (str): integration command.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace (str): The dependency calculation desired marketplace.
 
@@ -364,24 +477,68 @@ class PackDependencies:
             set: found pack ids
             dict: found {pack, (item_type, item_id)} ids
         """
-        packs_and_items_dict: dict = {}
-        pack_names: set = set()
-        for item in id_set['integrations']:
-            item_id = list(item.keys())[0]
-            item_details = list(item.values())[0]
-
-            if PackDependencies._should_add_item_as_dependency(item_details,
-                                                               command in item_details.get('commands', []),
-                                                               exclude_ignored_dependencies,
-                                                               marketplace,
-                                                               ):
-                pack_name = item_details.get('pack')
-                pack_names.add(pack_name)
-                packs_and_items_dict.setdefault(pack_name, []).extend([('integration', item_id)])
-
-        if not exclude_ignored_dependencies:
-            return set(pack_names), packs_and_items_dict
-        return {p for p in pack_names if p not in constants.IGNORED_DEPENDENCY_CALCULATION}, packs_and_items_dict
+        id_set_index = id_set_index or IDSetIndex(id_set)
+        return PackDependencies._search_packs_by_integration_commands_batch(
+            [command], id_set, exclude_ignored_dependencies, marketplace, id_set_index)[0]
+
+    @staticmethod
+    def _search_packs_by_integration_commands_batch(commands: list,
+                                                    id_set: dict,
+                                                    exclude_ignored_dependencies: bool = True,
+                                                    marketplace: str = '',
+                                                    id_set_index: Optional[IDSetIndex] = None,
+                                                    ) -> List[Tuple[Any, Any]]:
+        """
+        Same as `_search_packs_by_integration_command` for several commands, filtering every found integration
+        only once.
+
+        Args:
+            commands (list): integration commands.
+            id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            marketplace (str): The dependency calculation desired marketplace.
+
+        Returns:
+            list: the result of `_search_packs_by_integration_command` for every command, in the order of the commands.
+        """
+        id_set_index = id_set_index or IDSetIndex(id_set)
+        section_index = id_set_index.section('integrations')
+        should_add_positions: Dict[int, bool] = {}
+        results = []
+        for command in commands:
+            packs_and_items_dict: dict = {}
+            pack_names: set = set()
+            for position in section_index.find_by_command(command):
+                record = section_index.records[position]
+                if position not in should_add_positions:
+                    should_add_positions[position] = PackDependencies._should_add_record_as_dependency(
+                        record, exclude_ignored_dependencies, marketplace)
+
+                if should_add_positions[position]:
+                    pack_names.add(record.pack)
+                    packs_and_items_dict.setdefault(record.pack, []).extend([('integration', record.item_id)])
+
+            if exclude_ignored_dependencies:
+                pack_names = {p for p in pack_names if p not in constants.IGNORED_DEPENDENCY_CALCULATION}
+            results.append((pack_names, packs_and_items_dict))
+
+        return results
+
+    @staticmethod
+    def _copy_search_result(search_result: Tuple[Any, Any]) -> Tuple[Any, Any]:
+        """
+        Copies a result of the search methods, for a result of a batch search which is used by several items,
+        as the found packs and items are updated by the dependencies collection.
+
+        Args:
+            search_result (tuple): found pack ids and dict of found {pack, (item_type, item_id)} ids.
+
+        Returns:
+            tuple: a copy of the search result.
+        """
+        pack_names, packs_and_items_dict = search_result
+        return set(pack_names), dict(packs_and_items_dict)
 
     @staticmethod
     def _detect_generic_commands_dependencies(pack_ids: set) -> list:
@@ -457,6 +614,7 @@ class PackDependencies:
                                       exclude_ignored_dependencies: bool = True,
                                       get_dependent_items: bool = False,
                                       marketplace: str = '',
+                                      id_set_index: Optional[IDSetIndex] = None,
                                       ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects script pack dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -465,6 +623,7 @@ class PackDependencies:
         Args:
             pack_scripts (list): pack scripts collection.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -473,16 +632,16 @@ class PackDependencies:
             set: dependencies data that includes pack id and whether is mandatory or not.
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = {}
         pack_dependencies_data = []
         if verbose:
             click.secho('### Scripts', fg='white')
 
+        scripts_dependencies_commands = []
         for script_mapping in pack_scripts:
-            script_id = list(script_mapping.keys())[0]
             script = next(iter(script_mapping.values()))
-            script_dependencies = set()
 
             # 'depends on' list can have both scripts and integration commands
             depends_on = script.get('depends_on', [])
@@ -490,13 +649,28 @@ class PackDependencies:
             script_executions = script.get('script_executions', [])
 
             all_dependencies_commands = list(set(depends_on + command_to_integration + script_executions))
-            dependencies_commands = list(filter(lambda cmd: cmd not in GENERIC_COMMANDS_NAMES,
-                                                all_dependencies_commands))  # filter out generic commands
+            scripts_dependencies_commands.append(
+                list(filter(lambda cmd: cmd not in GENERIC_COMMANDS_NAMES,
+                            all_dependencies_commands)))  # filter out generic commands
+
+        # resolve the commands of all the scripts at once, by scripts first and then by integrations
+        all_commands = list(dict.fromkeys(command for commands in scripts_dependencies_commands for command in commands))
+        found_by_scripts = dict(zip(all_commands, PackDependencies._search_packs_by_items_names_batch(
+            all_commands, id_set_index.section('scripts'), exclude_ignored_dependencies, 'script', marketplace=marketplace)))
+        commands_without_scripts = [command for command in all_commands if not found_by_scripts[command][0]]
+        found_by_integrations = dict(zip(commands_without_scripts,
+                                         PackDependencies._search_packs_by_integration_commands_batch(
+                                             commands_without_scripts, id_set, exclude_ignored_dependencies,
+                                             marketplace=marketplace, id_set_index=id_set_index)))
+
+        for script_mapping, dependencies_commands in zip(pack_scripts, scripts_dependencies_commands):
+            script_id = list(script_mapping.keys())[0]
+            script = next(iter(script_mapping.values()))
+            script_dependencies = set()
 
             for command in dependencies_commands:
                 # try to search dependency by scripts first
-                pack_names, packs_and_items_dict = PackDependencies._search_packs_by_items_names(
-                    command, id_set['scripts'], exclude_ignored_dependencies, 'script', marketplace=marketplace)
+                pack_names, packs_and_items_dict = PackDependencies._copy_search_result(found_by_scripts[command])
 
                 if pack_names:  # found script dependency implementing pack name
                     pack_dependencies_data = PackDependencies._label_as_mandatory(pack_names)
@@ -504,8 +678,8 @@ class PackDependencies:
 
                 else:
                     # try to search dependency by integration
-                    pack_names, packs_and_items_dict = PackDependencies._search_packs_by_integration_command(
-                        command, id_set, exclude_ignored_dependencies, marketplace=marketplace)
+                    pack_names, packs_and_items_dict = PackDependencies._copy_search_result(
+                        found_by_integrations[command])
 
                     if pack_names:  # found integration dependency implementing pack name
                         pack_dependencies_data = PackDependencies._detect_generic_commands_dependencies(pack_names)
@@ -527,7 +701,7 @@ class PackDependencies:
     @staticmethod
     def _differentiate_playbook_implementing_objects(implementing_objects: list,
                                                      skippable_tasks: set,
-                                                     id_set_section: list,
+                                                     id_set_section: Union[list, IDSetSectionIndex],
                                                      exclude_ignored_dependencies: bool = True,
                                                      item_type: str = '',
                                                      ) -> Tuple[Any, Any]:
@@ -537,7 +711,8 @@ class PackDependencies:
         Args:
             implementing_objects (list): playbook object collection.
             skippable_tasks (set): playbook skippable tasks.
-            id_set_section (list): id set section corresponds to implementing_objects (scripts or playbooks).
+            id_set_section (list or IDSetSectionIndex): id set section corresponds to implementing_objects (scripts or
+                playbooks), or its index.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             item_type (str): the type of content item given.
             marketplace: The dependency calculation desired marketplace.
@@ -552,14 +727,13 @@ class PackDependencies:
         mandatory_scripts = set(implementing_objects) - skippable_tasks
         optional_scripts = set(implementing_objects) - mandatory_scripts
 
-        optional_script_packs, _ = PackDependencies._search_packs_by_items_names(
-            list(optional_scripts), id_set_section, exclude_ignored_dependencies, item_type)
+        (optional_script_packs, _), (mandatory_script_packs, mandatory_packs_and_items_dict) = PackDependencies. \
+            _search_packs_by_items_names_batch([list(optional_scripts), list(mandatory_scripts)], id_set_section,
+                                               exclude_ignored_dependencies, item_type)
         if optional_script_packs:  # found packs of optional objects
             pack_dependencies_data = PackDependencies._label_as_optional(optional_script_packs)
             dependencies.update(pack_dependencies_data)
 
-        mandatory_script_packs, mandatory_packs_and_items_dict = PackDependencies._search_packs_by_items_names(
-            list(mandatory_scripts), id_set_section, exclude_ignored_dependencies, item_type)
         if mandatory_script_packs:  # found packs of mandatory objects
             pack_dependencies_data = PackDependencies._label_as_mandatory(mandatory_script_packs)
             dependencies.update(pack_dependencies_data)
@@ -570,6 +744,7 @@ class PackDependencies:
     def _collect_playbooks_dependencies(pack_playbooks: list, id_set: dict, verbose: bool,
                                         exclude_ignored_dependencies: bool = True, get_dependent_items: bool = False,
                                         marketplace: str = '',
+                                        id_set_index: Optional[IDSetIndex] = None,
                                         ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects playbook pack dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -578,6 +753,7 @@ class PackDependencies:
         Args:
             pack_playbooks (list): collection of pack playbooks data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -587,12 +763,29 @@ class PackDependencies:
             if get_dependent_on: returns also mandatory dependency items dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
         packs_and_items_dict: dict = dict()
         if verbose:
             click.secho('### Playbooks', fg='white')
 
+        # resolve the implementing integrations and commands of all the playbooks at once
+        implementing_integrations = []
+        implementing_commands = []
+        for playbook in pack_playbooks:
+            for command, integration_name in next(iter(playbook.values())).get('command_to_integration', {}).items():
+                if integration_name:
+                    implementing_integrations.append(integration_name)
+                elif command not in GENERIC_COMMANDS_NAMES:
+                    implementing_commands.append(command)
+        implementing_integrations = list(dict.fromkeys(implementing_integrations))
+        implementing_commands = list(dict.fromkeys(implementing_commands))
+        found_by_integrations = dict(zip(implementing_integrations, PackDependencies._search_packs_by_items_names_batch(
+            implementing_integrations, id_set_index.section('integrations'), exclude_ignored_dependencies, 'integration')))
+        found_by_commands = dict(zip(implementing_commands, PackDependencies._search_packs_by_integration_commands_batch(
+            implementing_commands, id_set, exclude_ignored_dependencies, id_set_index=id_set_index)))
+
         for playbook in pack_playbooks:
             playbook_id = list(playbook.keys())[0]
             playbook_data = next(iter(playbook.values()))
@@ -606,11 +799,11 @@ class PackDependencies:
             for command, integration_name in implementing_commands_and_integrations.items():
                 packs_found_from_integration: set = set()
                 if integration_name:
-                    packs_found_from_integration, packs_and_items_dict = PackDependencies._search_packs_by_items_names(
-                        integration_name, id_set['integrations'], exclude_ignored_dependencies, 'integration')
+                    packs_found_from_integration, packs_and_items_dict = PackDependencies._copy_search_result(
+                        found_by_integrations[integration_name])
                 elif command not in GENERIC_COMMANDS_NAMES:  # do not collect deps on generic command in Pbs
-                    packs_found_from_integration, packs_and_items_dict = PackDependencies. \
-                        _search_packs_by_integration_command(command, id_set, exclude_ignored_dependencies)
+                    packs_found_from_integration, packs_and_items_dict = PackDependencies._copy_search_result(
+                        found_by_commands[command])
 
                 if packs_found_from_integration:
                     if command in skippable_tasks:
@@ -628,7 +821,7 @@ class PackDependencies:
 
             # searching for packs of implementing scripts
             dependencies, mandatory_packs_and_scripts_dict = PackDependencies. \
-                _differentiate_playbook_implementing_objects(implementing_scripts, skippable_tasks, id_set['scripts'],
+                _differentiate_playbook_implementing_objects(implementing_scripts, skippable_tasks, id_set_index.section('scripts'),
                                                              exclude_ignored_dependencies, 'script')
             playbook_dependencies.update(dependencies)
             if get_dependent_items:
@@ -638,7 +831,7 @@ class PackDependencies:
             # searching for packs of implementing playbooks
             dependencies, mandatory_packs_and_playbooks_dict = PackDependencies. \
                 _differentiate_playbook_implementing_objects(playbook_data.get('implementing_playbooks', []),
-                                                             skippable_tasks, id_set['playbooks'],
+                                                             skippable_tasks, id_set_index.section('playbooks'),
                                                              exclude_ignored_dependencies,
                                                              'playbook')
             playbook_dependencies.update(dependencies)
@@ -649,7 +842,7 @@ class PackDependencies:
             dependencies, mandatory_packs_and_lists_dict = PackDependencies._differentiate_playbook_implementing_objects(
                 playbook_data.get('lists', []),
                 skippable_tasks,
-                id_set['Lists'],
+                id_set_index.section('Lists'),
                 exclude_ignored_dependencies, 'list'
             )
             playbook_dependencies.update(dependencies)
@@ -661,7 +854,7 @@ class PackDependencies:
             # as customers do not have to use the OOTB inputs.
             incident_fields = playbook_data.get('incident_fields', [])
             packs_found_from_incident_fields, packs_and_incident_fields_dict = PackDependencies. \
-                _search_packs_by_items_names_or_ids(incident_fields, id_set['IncidentFields'],
+                _search_packs_by_items_names_or_ids(incident_fields, id_set_index.section('IncidentFields'),
                                                     exclude_ignored_dependencies, 'Both',
                                                     'incidentfield',
                                                     marketplace=marketplace)  # check if in builtin
@@ -677,7 +870,7 @@ class PackDependencies:
             # as customers do not have to use the OOTB inputs.
             indicator_fields = playbook_data.get('indicator_fields', [])
             packs_found_from_indicator_fields, packs_and_indicator_fields_dict = PackDependencies._search_packs_by_items_names_or_ids(
-                indicator_fields, id_set['IndicatorFields'], exclude_ignored_dependencies, 'Both', 'incidentfield',
+                indicator_fields, id_set_index.section('IndicatorFields'), exclude_ignored_dependencies, 'Both', 'incidentfield',
                 marketplace=marketplace)
             if packs_found_from_indicator_fields:
                 pack_dependencies_data = PackDependencies._update_optional_commontypes_pack_dependencies(
@@ -706,6 +899,7 @@ class PackDependencies:
                                       exclude_ignored_dependencies: bool = True,
                                       get_dependent_items: bool = False,
                                       marketplace: str = '',
+                                      id_set_index: Optional[IDSetIndex] = None,
                                       ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects layouts pack dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -714,6 +908,7 @@ class PackDependencies:
         Args:
             pack_layouts (list): collection of pack layouts data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -723,6 +918,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
         if verbose:
@@ -744,7 +940,7 @@ class PackDependencies:
             if layout_type in ["Incident", "Indicator"]:
                 related_types = layout_data.get('incident_and_indicator_types', [])
                 packs_found_from_incident_indicator_types, packs_and_incident_indicator_dict = PackDependencies._search_packs_by_items_names(
-                    related_types, id_set[f'{layout_type}Types'],
+                    related_types, id_set_index.section(f'{layout_type}Types'),
                     exclude_ignored_dependencies, 'layout')
 
                 if packs_found_from_incident_indicator_types:
@@ -756,7 +952,7 @@ class PackDependencies:
                                                   packs_and_incident_indicator_dict)
             related_fields = layout_data.get('incident_and_indicator_fields', [])
             packs_found_from_incident_indicator_fields, packs_and_incident_indicator_dict = PackDependencies. \
-                _search_packs_by_items_names_or_ids(related_fields, id_set[f'{layout_type}Fields'],
+                _search_packs_by_items_names_or_ids(related_fields, id_set_index.section(f'{layout_type}Fields'),
                                                     exclude_ignored_dependencies, layout_type,
                                                     f'{layout_type.lower()}_field',
                                                     marketplace=marketplace)
@@ -787,6 +983,7 @@ class PackDependencies:
                                                exclude_ignored_dependencies: bool = True,
                                                get_dependent_items: bool = False,
                                                marketplace: str = '',
+                                               id_set_index: Optional[IDSetIndex] = None,
                                                ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects incidents fields dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -795,6 +992,7 @@ class PackDependencies:
         Args:
             pack_incidents_fields (list): collection of pack incidents fields data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -804,6 +1002,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
         if verbose:
@@ -824,7 +1023,7 @@ class PackDependencies:
 
             related_scripts = incident_field_data.get('scripts', [])
             packs_found_from_scripts, packs_and_scripts_dict = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies, 'script', marketplace=marketplace)
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies, 'script', marketplace=marketplace)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -851,6 +1050,7 @@ class PackDependencies:
                                                exclude_ignored_dependencies: bool = True,
                                                get_dependent_items: bool = False,
                                                marketplace: str = '',
+                                               id_set_index: Optional[IDSetIndex] = None,
                                                ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects in indicators types dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -859,6 +1059,7 @@ class PackDependencies:
         Args:
             pack_indicators_types (list): collection of pack indicators types data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -868,6 +1069,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
         if verbose:
@@ -897,7 +1099,7 @@ class PackDependencies:
 
             related_scripts = indicator_type_data.get('scripts', [])
             packs_found_from_scripts, packs_and_scripts_dict = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies, 'script', marketplace=marketplace)
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies, 'script', marketplace=marketplace)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -925,6 +1127,7 @@ class PackDependencies:
     def _collect_integrations_dependencies(pack_integrations: list, id_set: dict, verbose: bool,
                                            exclude_ignored_dependencies: bool = True, get_dependent_items: bool = False,
                                            marketplace: str = '',
+                                           id_set_index: Optional[IDSetIndex] = None,
                                            ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects integrations dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -932,6 +1135,7 @@ class PackDependencies:
         Args:
             pack_integrations (list): collection of pack integrations data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -941,6 +1145,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
         if verbose:
@@ -953,7 +1158,7 @@ class PackDependencies:
 
             related_classifiers = integration_data.get('classifiers', [])
             packs_found_from_classifiers, packs_and_classifiers_dict = PackDependencies._search_packs_by_items_names_or_ids(
-                related_classifiers, id_set['Classifiers'], exclude_ignored_dependencies, 'Both', 'classifier',
+                related_classifiers, id_set_index.section('Classifiers'), exclude_ignored_dependencies, 'Both', 'classifier',
                 marketplace=marketplace)
 
             if packs_found_from_classifiers:
@@ -966,7 +1171,7 @@ class PackDependencies:
 
             related_mappers = integration_data.get('mappers', [])
             packs_found_from_mappers, packs_and_mappers_dict = PackDependencies._search_packs_by_items_names_or_ids(
-                related_mappers, id_set['Mappers'], exclude_ignored_dependencies, 'Both', 'mapper',
+                related_mappers, id_set_index.section('Mappers'), exclude_ignored_dependencies, 'Both', 'mapper',
                 marketplace=marketplace)
 
             if packs_found_from_mappers:
@@ -979,7 +1184,7 @@ class PackDependencies:
 
             related_incident_types = integration_data.get('incident_types', [])
             packs_found_from_incident_types, packs_and_incident_types_dict = PackDependencies._search_packs_by_items_names(
-                related_incident_types, id_set['IncidentTypes'], exclude_ignored_dependencies, 'incidenttype',
+                related_incident_types, id_set_index.section('IncidentTypes'), exclude_ignored_dependencies, 'incidenttype',
                 marketplace=marketplace)
 
             if packs_found_from_incident_types:
@@ -1014,6 +1219,7 @@ class PackDependencies:
                                               exclude_ignored_dependencies: bool = True,
                                               get_dependent_items: bool = False,
                                               marketplace: str = '',
+                                              id_set_index: Optional[IDSetIndex] = None,
                                               ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects in incidents types dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -1022,6 +1228,7 @@ class PackDependencies:
         Args:
             pack_incidents_types (list): collection of pack incidents types data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -1031,6 +1238,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
         if verbose:
@@ -1043,7 +1251,7 @@ class PackDependencies:
 
             related_playbooks = incident_type_data.get('playbooks', [])
             packs_found_from_playbooks, packs_and_playbooks_dict = PackDependencies._search_packs_by_items_names(
-                related_playbooks, id_set['playbooks'], exclude_ignored_dependencies, 'playbook', marketplace=marketplace)
+                related_playbooks, id_set_index.section('playbooks'), exclude_ignored_dependencies, 'playbook', marketplace=marketplace)
 
             if packs_found_from_playbooks:
                 pack_dependencies_data = PackDependencies. \
@@ -1056,7 +1264,7 @@ class PackDependencies:
 
             related_scripts = incident_type_data.get('scripts', [])
             packs_found_from_scripts, packs_and_scripts_dict = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies, 'script', marketplace=marketplace)
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies, 'script', marketplace=marketplace)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -1084,6 +1292,7 @@ class PackDependencies:
     def _collect_classifiers_dependencies(pack_classifiers: list, id_set: dict, verbose: bool,
                                           exclude_ignored_dependencies: bool = True, get_dependent_items: bool = False,
                                           marketplace: str = '',
+                                          id_set_index: Optional[IDSetIndex] = None,
                                           ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects in classifiers dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -1092,6 +1301,7 @@ class PackDependencies:
         Args:
             pack_classifiers (list): collection of pack classifiers data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -1101,6 +1311,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
         if verbose:
@@ -1117,7 +1328,7 @@ class PackDependencies:
                                                                                                    'indicator']:
                 packs_found_from_generic_types, packs_and_generic_types_dict = \
                     PackDependencies._search_packs_by_items_names_or_ids(
-                        related_types, id_set['GenericTypes'], exclude_ignored_dependencies, "Generic", 'generictype',
+                        related_types, id_set_index.section('GenericTypes'), exclude_ignored_dependencies, "Generic", 'generictype',
                         marketplace=marketplace)
 
                 if packs_found_from_generic_types:
@@ -1131,7 +1342,7 @@ class PackDependencies:
             else:
                 packs_found_from_incident_types, packs_and_incident_types_dict = \
                     PackDependencies._search_packs_by_items_names(
-                        related_types, id_set['IncidentTypes'], exclude_ignored_dependencies, 'incidenttype',
+                        related_types, id_set_index.section('IncidentTypes'), exclude_ignored_dependencies, 'incidenttype',
                         marketplace=marketplace)
 
                 # classifiers dependencies from incident types should be marked as optional unless CommonTypes pack,
@@ -1148,7 +1359,7 @@ class PackDependencies:
             # collect pack dependencies from transformers and filters
             related_scripts = classifier_data.get('filters', []) + classifier_data.get('transformers', [])
             packs_found_from_scripts, packs_and_scripts_dict = PackDependencies._search_packs_by_items_names_or_ids(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies, 'Both', 'script',
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies, 'Both', 'script',
                 marketplace=marketplace)
 
             if packs_found_from_scripts:
@@ -1174,6 +1385,7 @@ class PackDependencies:
     def _collect_mappers_dependencies(pack_mappers: list, id_set: dict, verbose: bool,
                                       exclude_ignored_dependencies: bool = True, get_dependent_items: bool = False,
                                       marketplace: str = '',
+                                      id_set_index: Optional[IDSetIndex] = None,
                                       ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects in mappers dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -1182,6 +1394,7 @@ class PackDependencies:
         Args:
             pack_mappers (list): collection of pack mappers data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -1191,6 +1404,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
 
@@ -1206,7 +1420,7 @@ class PackDependencies:
             if mapper_data.get('definitionId') and mapper_data.get('definitionId') not in ['incident', 'indicator']:
                 packs_found_from_generic_types, packs_and_generic_types_dict = \
                     PackDependencies._search_packs_by_items_names(
-                        related_types, id_set['GenericTypes'], exclude_ignored_dependencies, 'generictype',
+                        related_types, id_set_index.section('GenericTypes'), exclude_ignored_dependencies, 'generictype',
                         marketplace=marketplace)
 
                 if packs_found_from_generic_types:
@@ -1219,7 +1433,7 @@ class PackDependencies:
 
                 packs_found_from_generic_fields, packs_and_generic_fields_dict = \
                     PackDependencies._search_packs_by_items_names(
-                        related_types, id_set['GenericFields'], exclude_ignored_dependencies, 'genericfield',
+                        related_types, id_set_index.section('GenericFields'), exclude_ignored_dependencies, 'genericfield',
                         marketplace=marketplace)
 
                 if packs_found_from_generic_fields:
@@ -1232,7 +1446,7 @@ class PackDependencies:
             else:
                 packs_found_from_incident_types, packs_and_incident_types_dict = PackDependencies. \
                     _search_packs_by_items_names(
-                        related_types, id_set['IncidentTypes'], exclude_ignored_dependencies, 'incidenttype',
+                        related_types, id_set_index.section('IncidentTypes'), exclude_ignored_dependencies, 'incidenttype',
                         marketplace=marketplace)
 
                 # mappers dependencies from incident types should be marked as optional unless CommonTypes Pack,
@@ -1249,7 +1463,7 @@ class PackDependencies:
                 related_fields = mapper_data.get('incident_fields', [])
                 packs_found_from_incident_fields, packs_and_incident_fields_dict = PackDependencies. \
                     _search_packs_by_items_names_or_ids(
-                        related_fields, id_set['IncidentFields'], exclude_ignored_dependencies, 'Both', 'incidentfield',
+                        related_fields, id_set_index.section('IncidentFields'), exclude_ignored_dependencies, 'Both', 'incidentfield',
                         marketplace=marketplace)
 
                 # mappers dependencies from incident fields should be marked as optional unless CommonTypes pack,
@@ -1264,7 +1478,7 @@ class PackDependencies:
             # collect pack dependencies from transformers and filters
             related_scripts = mapper_data.get('filters', []) + mapper_data.get('transformers', [])
             packs_found_from_scripts, packs_and_scripts_dict = PackDependencies._search_packs_by_items_names_or_ids(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies, 'Both', 'script', marketplace=marketplace)
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies, 'Both', 'script', marketplace=marketplace)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies._label_as_mandatory(packs_found_from_scripts)
@@ -1291,6 +1505,7 @@ class PackDependencies:
                                      header: str = "Widgets",
                                      get_dependent_items: bool = False,
                                      marketplace: str = '',
+                                     id_set_index: Optional[IDSetIndex] = None,
                                      ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects widget dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -1299,6 +1514,7 @@ class PackDependencies:
         Args:
             pack_widgets (list): collection of pack widget data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -1308,6 +1524,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
 
@@ -1321,7 +1538,7 @@ class PackDependencies:
 
             related_scripts = widget_data.get('scripts', [])
             packs_found_from_scripts, packs_and_scripts_dict = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies, 'script', marketplace=marketplace)
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies, 'script', marketplace=marketplace)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -1348,6 +1565,7 @@ class PackDependencies:
                                             exclude_ignored_dependencies: bool = True,
                                             get_dependent_items: bool = False,
                                             marketplace: str = '',
+                                            id_set_index: Optional[IDSetIndex] = None,
                                             ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects generic types dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -1356,6 +1574,7 @@ class PackDependencies:
         Args:
             pack_generic_types (list): collection of pack generics types data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -1365,6 +1584,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
 
@@ -1378,7 +1598,7 @@ class PackDependencies:
 
             related_scripts = generic_type_data.get('scripts', [])
             packs_found_from_scripts, packs_and_scripts_dict = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies, 'script', marketplace=marketplace)
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies, 'script', marketplace=marketplace)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -1390,7 +1610,7 @@ class PackDependencies:
                                               packs_and_scripts_dict)
             related_definitions = generic_type_data.get('definitionId')
             packs_found_from_definitions, packs_and_definitions_dict = PackDependencies._search_packs_by_items_names_or_ids(
-                related_definitions, id_set['GenericDefinitions'], exclude_ignored_dependencies, 'Both',
+                related_definitions, id_set_index.section('GenericDefinitions'), exclude_ignored_dependencies, 'Both',
                 'generic_definition', marketplace=marketplace)
 
             if packs_found_from_definitions:
@@ -1404,7 +1624,7 @@ class PackDependencies:
 
             related_layout = generic_type_data.get('layout')
             packs_found_from_layout, packs_and_layouts_dict = PackDependencies._search_packs_by_items_names_or_ids(
-                related_layout, id_set['Layouts'], exclude_ignored_dependencies, 'Both', 'layout', marketplace=marketplace)
+                related_layout, id_set_index.section('Layouts'), exclude_ignored_dependencies, 'Both', 'layout', marketplace=marketplace)
 
             if packs_found_from_definitions:
                 pack_dependencies_data = PackDependencies. \
@@ -1433,6 +1653,7 @@ class PackDependencies:
                                              exclude_ignored_dependencies: bool = True,
                                              get_dependent_items: bool = False,
                                              marketplace: str = '',
+                                             id_set_index: Optional[IDSetIndex] = None,
                                              ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects in generic fields dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -1441,6 +1662,7 @@ class PackDependencies:
         Args:
             pack_generic_fields (list): collection of pack incidents fields data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -1450,6 +1672,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
 
@@ -1463,7 +1686,7 @@ class PackDependencies:
 
             related_scripts = generic_field_data.get('scripts', [])
             packs_found_from_scripts, packs_and_scripts_dict = PackDependencies._search_packs_by_items_names(
-                related_scripts, id_set['scripts'], exclude_ignored_dependencies, 'script', marketplace=marketplace)
+                related_scripts, id_set_index.section('scripts'), exclude_ignored_dependencies, 'script', marketplace=marketplace)
 
             if packs_found_from_scripts:
                 pack_dependencies_data = PackDependencies. \
@@ -1476,7 +1699,7 @@ class PackDependencies:
             related_definitions = generic_field_data.get('definitionId')
             packs_found_from_definitions, packs_and_definitions_dict = PackDependencies. \
                 _search_packs_by_items_names_or_ids(
-                    related_definitions, id_set['GenericDefinitions'], exclude_ignored_dependencies,
+                    related_definitions, id_set_index.section('GenericDefinitions'), exclude_ignored_dependencies,
                     'Both', 'generic_definition', marketplace=marketplace)
 
             if packs_found_from_definitions:
@@ -1489,7 +1712,7 @@ class PackDependencies:
                                               packs_and_definitions_dict)
             related_types = generic_field_data.get('generic_types')
             packs_found_from_types, packs_and_types_dict = PackDependencies._search_packs_by_items_names_or_ids(
-                related_types, id_set['GenericTypes'], exclude_ignored_dependencies, 'Both', 'generic_type',
+                related_types, id_set_index.section('GenericTypes'), exclude_ignored_dependencies, 'Both', 'generic_type',
                 marketplace=marketplace)
 
             if packs_found_from_types:
@@ -1519,6 +1742,7 @@ class PackDependencies:
                                               exclude_ignored_dependencies: bool = True,
                                               get_dependent_items: bool = False,
                                               marketplace: str = '',
+                                              id_set_index: Optional[IDSetIndex] = None,
                                               ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects generic types dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -1527,6 +1751,7 @@ class PackDependencies:
         Args:
             pack_generic_types (list): collection of pack generics types data.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -1536,6 +1761,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         dependencies_packs: set = set()
         items_dependencies: dict = dict()
 
@@ -1550,7 +1776,7 @@ class PackDependencies:
             related_definitions = generic_module_data.get('definitionIds')
             packs_found_from_definitions, packs_and_definitions_dict = PackDependencies. \
                 _search_packs_by_items_names_or_ids(
-                    related_definitions, id_set['GenericDefinitions'], exclude_ignored_dependencies,
+                    related_definitions, id_set_index.section('GenericDefinitions'), exclude_ignored_dependencies,
                     'Both', 'generic_definition', marketplace=marketplace)
 
             if packs_found_from_definitions:
@@ -1566,7 +1792,7 @@ class PackDependencies:
                 related_dashboards = related_views.get(view, {}).get('dashboards', [])
                 packs_found_from_dashboards, packs_and_dashboards_dict = PackDependencies. \
                     _search_packs_by_items_names_or_ids(
-                        related_dashboards, id_set['Dashboards'], exclude_ignored_dependencies, 'dashboard',
+                        related_dashboards, id_set_index.section('Dashboards'), exclude_ignored_dependencies, 'dashboard',
                         marketplace=marketplace)
 
                 if packs_found_from_dashboards:
@@ -1598,6 +1824,7 @@ class PackDependencies:
                                    exclude_ignored_dependencies: bool = True,
                                    get_dependent_items: bool = False,
                                    marketplace: str = '',
+                                   id_set_index: Optional[IDSetIndex] = None,
                                    ) -> Union[Tuple[Any, Any], Set[Any]]:
         """
         Collects integrations dependencies. If get_dependent_on flag is on, collect the items causing the dependencies
@@ -1606,6 +1833,7 @@ class PackDependencies:
         Args:
             pack_jobs: collection of pack job data.
             id_set: id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose: Whether to log the dependencies to the console.
             exclude_ignored_dependencies: Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -1615,6 +1843,7 @@ class PackDependencies:
             if get_dependent_on: returns also dict: found {pack, (item_type, item_id)} ids
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         all_job_dependencies: set = set()
         items_dependencies: dict = dict()
 
@@ -1628,7 +1857,7 @@ class PackDependencies:
 
             # Playbook dependency
             packs_found_from_playbooks, packs_and_playbooks_dict = PackDependencies._search_packs_by_items_names_or_ids(
-                job_data.get('playbookId', ''), id_set['playbooks'], exclude_ignored_dependencies, 'Both', 'playbook',
+                job_data.get('playbookId', ''), id_set_index.section('playbooks'), exclude_ignored_dependencies, 'Both', 'playbook',
                 marketplace=marketplace)
             pack_dependencies_data = PackDependencies._label_as_mandatory(packs_found_from_playbooks)
             job_dependencies.update(pack_dependencies_data)
@@ -1638,7 +1867,7 @@ class PackDependencies:
                                           packs_and_playbooks_dict)
             # Specified feeds dependencies
             packs_found_from_feeds, packs_and_feeds_dict = PackDependencies._search_packs_by_items_names_or_ids(
-                job_data.get('selectedFeeds', []), id_set['integrations'], exclude_ignored_dependencies, 'Both',
+                job_data.get('selectedFeeds', []), id_set_index.section('integrations'), exclude_ignored_dependencies, 'Both',
                 'integration', marketplace=marketplace)
             pack_dependencies_data = PackDependencies._label_as_mandatory(packs_found_from_feeds)
             job_dependencies.update(pack_dependencies_data)
@@ -1659,17 +1888,19 @@ class PackDependencies:
         return all_job_dependencies
 
     @staticmethod
-    def _collect_pack_items(pack_id: str, id_set: dict) -> dict:
+    def _collect_pack_items(pack_id: str, id_set: dict, id_set_index: Optional[IDSetIndex] = None) -> dict:
         """
         Collects script and playbook content items inside specific pack.
 
         Args:
             pack_id (str): pack id, currently pack folder name is in use.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
 
         Returns:
             list, list: pack scripts and playbooks data.
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         pack_items = dict()
 
         for pack_key, id_set_key in (('scripts', 'scripts'),
@@ -1699,7 +1930,7 @@ class PackDependencies:
                                "of the Demisto SDK. Please delete content/Tests/id_set.json and "
                                "run demisto-sdk find-dependencies again."))
                 )
-            pack_items[pack_key] = PackDependencies._search_for_pack_items(pack_id, id_set[id_set_key])
+            pack_items[pack_key] = PackDependencies._search_for_pack_items(pack_id, id_set_index.section(id_set_key))
 
         if not sum(pack_items.values(), []):
             click.secho(f"Couldn't find any items for pack '{pack_id}'. Please make sure:\n"
@@ -1712,13 +1943,14 @@ class PackDependencies:
     @staticmethod
     def _find_pack_dependencies(pack_id: str, id_set: dict, verbose: bool,
                                 exclude_ignored_dependencies: bool = True,
-                                marketplace: str = ''):
+                                marketplace: str = '', id_set_index: Optional[IDSetIndex] = None):
         """
         Searches for the packs and mandatory items the given pack is depending on.
 
         Args:
             pack_id (str): pack id, currently pack folder name is in use.
             id_set (dict): id set json.
+            id_set_index (IDSetIndex): the indexes of the id set sections, built from the id set when not given.
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
@@ -1729,9 +1961,10 @@ class PackDependencies:
             dict: found {pack, (item_type, item_id)} ids of mandatory dependent items.
 
         """
+        id_set_index = id_set_index or IDSetIndex(id_set)
         if verbose:
             click.secho(f'\n# Pack ID: {pack_id}', fg='white')
-        pack_items = PackDependencies._collect_pack_items(pack_id, id_set)
+        pack_items = PackDependencies._collect_pack_items(pack_id, id_set, id_set_index)
 
         scripts_dependencies, scripts_items_dependencies = PackDependencies._collect_scripts_dependencies(
             pack_items['scripts'],
@@ -1740,6 +1973,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
 
         playbooks_dependencies, playbooks_items_dependencies = PackDependencies._collect_playbooks_dependencies(
@@ -1749,6 +1983,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
 
         layouts_dependencies, layouts_items_dependencies = PackDependencies._collect_layouts_dependencies(
@@ -1758,6 +1993,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         incidents_fields_dependencies, incidents_fields_items_dependencies = PackDependencies._collect_incidents_fields_dependencies(
             pack_items['incidents_fields'],
@@ -1766,6 +2002,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         indicators_types_dependencies, indicators_types_items_dependencies = PackDependencies._collect_indicators_types_dependencies(
             pack_items['indicators_types'],
@@ -1774,6 +2011,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
 
         integrations_dependencies, integrations_items_dependencies = PackDependencies._collect_integrations_dependencies(
@@ -1783,6 +2021,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         incidents_types_dependencies, incidents_types_items_dependencies = PackDependencies._collect_incidents_types_dependencies(
             pack_items['incidents_types'],
@@ -1791,6 +2030,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         classifiers_dependencies, classifiers_items_dependencies = PackDependencies._collect_classifiers_dependencies(
             pack_items['classifiers'],
@@ -1799,6 +2039,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         mappers_dependencies, mappers_items_dependencies = PackDependencies._collect_mappers_dependencies(
             pack_items['mappers'],
@@ -1807,6 +2048,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         widget_dependencies, widgets_items_dependencies = PackDependencies._collect_widget_dependencies(
             pack_items['widgets'],
@@ -1815,6 +2057,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         dashboards_dependencies, dashboards_items_dependencies = PackDependencies._collect_widget_dependencies(
             pack_items['dashboards'],
@@ -1824,6 +2067,7 @@ class PackDependencies:
             header='Dashboards',
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         reports_dependencies, reports_items_dependencies = PackDependencies._collect_widget_dependencies(
             pack_items['reports'],
@@ -1833,6 +2077,7 @@ class PackDependencies:
             header='Reports',
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         generic_types_dependencies, generic_types_items_dependencies = PackDependencies._collect_generic_types_dependencies(
             pack_items['generic_types'],
@@ -1841,6 +2086,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         generic_fields_dependencies, generic_fields_items_dependencies = PackDependencies._collect_generic_fields_dependencies(
             pack_items['generic_fields'],
@@ -1849,6 +2095,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         generic_modules_dependencies, generic_modules_items_dependencies = PackDependencies._collect_generic_modules_dependencies(
             pack_items['generic_modules'],
@@ -1857,6 +2104,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
         jobs_dependencies, jobs_items_dependencies = PackDependencies._collect_jobs_dependencies(
             pack_items['jobs'],
@@ -1865,6 +2113,7 @@ class PackDependencies:
             exclude_ignored_dependencies,
             get_dependent_items=True,
             marketplace=marketplace,
+            id_set_index=id_set_index,
         )
 
         pack_dependencies = (
@@ -1887,12 +2136,68 @@ class PackDependencies:
 
         return pack_dependencies, items_depenencies
 
+    @staticmethod
+    def add_pack_dependencies_to_graph(dependency_graph: nx.DiGraph, pack: str, dependencies: Set[Tuple[str, bool]],
+                                       dependencies_items: dict, verbose: bool = False):
+        """
+        Adds the first level dependencies of a pack to the dependency graph, see build_all_dependencies_graph.
+
+        Args:
+            dependency_graph: The dependency graph, with a node for the pack.
+            pack: The pack id.
+            dependencies: The packs the pack depends on, and whether each dependency is mandatory.
+            dependencies_items: The items of the pack causing the mandatory dependencies, in the structure of
+             `depending_on_items_mandatorily`.
+            verbose: Whether to log the dependencies to the console.
+        """
+        for dependency_name, is_mandatory in dependencies:
+            if dependency_name == pack:
+                continue
+            if verbose:
+                print(f'Collecting info about {pack} and {dependency_name} dependencies')
+            if dependency_name not in dependency_graph:
+                dependency_graph.add_node(dependency_name, mandatory_for_packs=[],
+                                          depending_on_items_mandatorily={},
+                                          mandatory_for_items={}, depending_on_packs=[])
+            dependency_graph.add_edge(pack, dependency_name)
+            if is_mandatory:
+                if verbose:
+                    print(f'Found {dependency_name} pack is mandatory for {pack}')
+                dependency_graph.nodes()[dependency_name]['mandatory_for_packs'].append(pack)
+
+        for dependent_item, items_depending_on_item in dependencies_items.items():
+            for pack_of_item_dependent_on, items_dependent_on in items_depending_on_item.items():
+                if pack_of_item_dependent_on == pack:
+                    continue
+                if pack_of_item_dependent_on not in dependency_graph:
+                    dependency_graph.add_node(pack_of_item_dependent_on, mandatory_for_packs=[],
+                                              depending_on_items_mandatorily={}, mandatory_for_items={},
+                                              depending_on_packs=[])
+                for item_dependent_on in items_dependent_on:
+                    if verbose:
+                        print(f'Adding the dependency between the items {dependent_item} and {item_dependent_on} '
+                              f'to the dependency graph')
+                    if dependency_graph.nodes()[pack_of_item_dependent_on]['mandatory_for_items'].get(
+                            item_dependent_on, {}).get(pack):
+                        dependency_graph.nodes()[pack_of_item_dependent_on]['mandatory_for_items'][
+                            item_dependent_on].setdefault(
+                            pack, []).append(dependent_item)
+                    else:
+                        dependency_graph.nodes()[pack_of_item_dependent_on]['mandatory_for_items'].setdefault(
+                            item_dependent_on, {}).update({pack: [dependent_item]})
+
+        if verbose:
+            print(f'\nPack {pack} and its dependencies were successfully added to the dependencies graph.')
+        dependency_graph.nodes()[pack]['depending_on_packs'] = list(dependencies)
+        dependency_graph.nodes()[pack]['depending_on_items_mandatorily'] = dependencies_items
+
     @staticmethod
     def build_all_dependencies_graph(pack_ids: list,
                                      id_set: dict,
                                      verbose: bool = False,
                                      exclude_ignored_dependencies: bool = True,
                                      marketplace: str = '',
+                                     cache_path: Optional[str] = None,
                                      ) -> nx.DiGraph:
         """
         Builds all level of dependencies and returns dependency graph for all packs.
@@ -1927,12 +2232,18 @@ class PackDependencies:
             verbose (bool): Whether to log the dependencies to the console.
             exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
             marketplace: The dependency calculation desired marketplace.
+            cache_path: The path of the dependencies cache. When given, only the dependencies of packs which were
+             changed, or depend on items which were changed, since the cache was saved are calculated.
 
         Returns:
             DiGraph: all dependencies of given packs.
         """
         if verbose:
             print('Building the dependencies graph...')
+        # the id set sections are indexed once, for the dependencies of all the packs
+        id_set_index = IDSetIndex(id_set)
+        dependencies_cache = PackDependenciesCache(cache_path, marketplace, exclude_ignored_dependencies)
+        dependencies_cache.update_items(id_set, id_set_index)
         dependency_graph = nx.DiGraph()
         for pack in pack_ids:
             dependency_graph.add_node(pack, mandatory_for_packs=[], depending_on_items_mandatorily={},
@@ -1941,50 +2252,55 @@ class PackDependencies:
             if verbose:
                 print(f'Adding {pack} pack dependencies to the graph...')
             # ITEMS *THIS PACK* IS DEPENDENT *ON*:
-            dependencies, dependencies_items = PackDependencies._find_pack_dependencies(
-                pack, id_set, verbose=verbose, exclude_ignored_dependencies=exclude_ignored_dependencies,
-                marketplace=marketplace)
-            for dependency_name, is_mandatory in dependencies:
-                if dependency_name == pack:
-                    continue
+            cached_dependencies = dependencies_cache.get(pack)
+            if cached_dependencies:
                 if verbose:
-                    print(f'Collecting info about {pack} and {dependency_name} dependencies')
-                if dependency_name not in dependency_graph:
-                    dependency_graph.add_node(dependency_name, mandatory_for_packs=[],
-                                              depending_on_items_mandatorily={},
-                                              mandatory_for_items={}, depending_on_packs=[])
-                dependency_graph.add_edge(pack, dependency_name)
-                if is_mandatory:
-                    if verbose:
-                        print(f'Found {dependency_name} pack is mandatory for {pack}')
-                    dependency_graph.nodes()[dependency_name]['mandatory_for_packs'].append(pack)
-
-            for dependent_item, items_depending_on_item in dependencies_items.items():
-                for pack_of_item_dependent_on, items_dependent_on in items_depending_on_item.items():
-                    if pack_of_item_dependent_on == pack:
-                        continue
-                    if pack_of_item_dependent_on not in dependency_graph:
-                        dependency_graph.add_node(pack_of_item_dependent_on, mandatory_for_packs=[],
-                                                  depending_on_items_mandatorily={}, mandatory_for_items={},
-                                                  depending_on_packs=[])
-                    for item_dependent_on in items_dependent_on:
-                        if verbose:
-                            print(f'Adding the dependency between the items {dependent_item} and {item_dependent_on} '
-                                  f'to the dependency graph')
-                        if dependency_graph.nodes()[pack_of_item_dependent_on]['mandatory_for_items'].get(
-                                item_dependent_on, {}).get(pack):
-                            dependency_graph.nodes()[pack_of_item_dependent_on]['mandatory_for_items'][
-                                item_dependent_on].setdefault(
-                                pack, []).append(dependent_item)
-                        else:
-                            dependency_graph.nodes()[pack_of_item_dependent_on]['mandatory_for_items'].setdefault(
-                                item_dependent_on, {}).update({pack: [dependent_item]})
+                    print(f'Taking {pack} pack dependencies from the cache')
+                dependencies, dependencies_items = cached_dependencies
+            else:
+                with record_lookups() as lookups:
+                    dependencies, dependencies_items = PackDependencies._find_pack_dependencies(
+                        pack, id_set, verbose=verbose, exclude_ignored_dependencies=exclude_ignored_dependencies,
+                        marketplace=marketplace, id_set_index=id_set_index)
+                dependencies_cache.add(pack, dependencies, dependencies_items, lookups)
+            PackDependencies.add_pack_dependencies_to_graph(dependency_graph, pack, dependencies, dependencies_items,
+                                                            verbose)
+
+        dependencies_cache.save()
+        return dependency_graph
 
-            if verbose:
-                print(f'\nPack {pack} and its dependencies were successfully added to the dependencies graph.')
-            dependency_graph.nodes()[pack]['depending_on_packs'] = list(dependencies)
-            dependency_graph.nodes()[pack]['depending_on_items_mandatorily'] = dependencies_items
+    @staticmethod
+    def load_all_dependencies_graph(graph_path: str, pack_ids: list, id_set_hash: str,
+                                    exclude_ignored_dependencies: bool = True,
+                                    marketplace: str = '') -> Optional[nx.DiGraph]:
+        """
+        Loads the dependency graph saved by get_all_packs_dependency_graph, and rebuilds the attributes of its nodes
+        the same way build_all_dependencies_graph does.
+
+        Args:
+            graph_path: The path of the dependency graph file.
+            pack_ids: pack ids, currently pack folder names is in use.
+            id_set_hash: The hash of the id_set file the graph should be built from.
+            exclude_ignored_dependencies (bool): Determines whether to include unsupported dependencies or not.
+            marketplace: The dependency calculation desired marketplace.
+
+        Returns:
+            DiGraph: all dependencies of given packs, or None if the graph file does not match the arguments.
+        """
+        saved_graph = load_dependency_graph(graph_path, pack_ids, id_set_hash, marketplace,
+                                            exclude_ignored_dependencies)
+        if saved_graph is None:
+            return None
 
+        graph_packs, packs_dependencies = saved_graph
+        dependency_graph = nx.DiGraph()
+        for pack in list(pack_ids) + graph_packs:
+            if pack not in dependency_graph:
+                dependency_graph.add_node(pack, mandatory_for_packs=[], depending_on_items_mandatorily={},
+                                          mandatory_for_items={}, depending_on_packs=[])
+        for pack in pack_ids:
+            dependencies, dependencies_items = packs_dependencies.get(pack, (set(), {}))
+            PackDependencies.add_pack_dependencies_to_graph(dependency_graph, pack, dependencies, dependencies_items)
         return dependency_graph
 
     @staticmethod
@@ -2025,6 +2341,7 @@ class PackDependencies:
         graph = nx.DiGraph()
         graph.add_node(pack_id)  # add pack id as root of the direct graph
         found_new_dependencies = True
+        id_set_index = IDSetIndex(id_set)
 
         while found_new_dependencies:
             current_number_of_nodes = graph.number_of_nodes()
@@ -2033,7 +2350,7 @@ class PackDependencies:
             for leaf in leaf_nodes:
                 leaf_dependencies, dependencies_items = PackDependencies._find_pack_dependencies(
                     leaf, id_set, verbose=verbose, exclude_ignored_dependencies=exclude_ignored_dependencies,
-                    marketplace=marketplace)
+                    marketplace=marketplace, id_set_index=id_set_index)
 
                 if leaf_dependencies:
                     for dependency_name, is_mandatory in leaf_dependencies:
@@ -2094,6 +2411,10 @@ class PackDependencies:
             get_dependent_on: bool = False,
             dependency: str = '',
             output_path: str = None,
+            cache_path: Optional[str] = None,
+            workers: Optional[int] = None,
+            dependent_on_index_path: Optional[str] = None,
+            graph_path: Optional[str] = None,
     ) -> None:
         """
 
@@ -2107,6 +2428,15 @@ class PackDependencies:
             get_dependent_on: Whether to get the packs dependent on the given packs.
             output_path: The destination path for the packs dependencies json file.
             dependency: The pack to search the dependency for.
+            cache_path: The path of the dependencies cache, used when calculating all packs dependencies.
+            workers: The number of worker processes used when calculating all packs dependencies or the packs
+             dependent on the given packs, defaults to the number of CPUs.
+            dependent_on_index_path: The path of the dependent on index saved when calculating all packs
+             dependencies, used when getting the packs dependent on the given packs. Defaults to the index
+             saved alongside the default all packs dependencies output file.
+            graph_path: The path of the dependency graph file, used when calculating all packs dependencies or the
+             packs dependent on the given packs. The graph is loaded from the file when it was built from the same
+             id set file, and is saved to it otherwise.
 
         """
 
@@ -2114,8 +2444,12 @@ class PackDependencies:
                                                            get_dependent_on)
 
         if get_dependent_on:
+            dependent_on_index_path = dependent_on_index_path or \
+                get_dependent_on_index_path(ALL_PACKS_DEPENDENCIES_DEFAULT_PATH)
             dependent_packs, _ = get_packs_dependent_on_given_packs(input_paths, id_set_path,  # type: ignore[arg-type]
-                                                                    output_path, verbose)
+                                                                    output_path, verbose, workers=workers,
+                                                                    dependent_on_index_path=dependent_on_index_path,
+                                                                    graph_path=graph_path)
             print_success("Found the following dependent packs:")
             dependent_packs = json.dumps(dependent_packs, indent=4)
             click.echo(click.style(dependent_packs, bold=True))
@@ -2135,7 +2469,8 @@ class PackDependencies:
                 print_warning(f"Could not find dependencies between the two packs: {input_pack_name} and {dependency}")
 
         elif all_packs_dependencies:
-            calculate_all_packs_dependencies(id_set_path, output_path, verbose)  # type: ignore[arg-type]
+            calculate_all_packs_dependencies(id_set_path, output_path, verbose,  # type: ignore[arg-type]
+                                             cache_path=cache_path, workers=workers, graph_path=graph_path)
             print_success(f"The packs dependencies json was successfully saved to {output_path}")
 
         else:
@@ -2179,31 +2514,35 @@ class PackDependencies:
         """
 
         if id_set_path and os.path.isfile(id_set_path):
-            with open(id_set_path, 'r') as id_set_file:
-                id_set = json.load(id_set_file)
+            id_set = get_id_set(id_set_path, lazy=True)
         else:
             if skip_id_set_creation:
                 return {}
 
             id_set, _, _ = IDSetCreator(print_logs=False).create_id_set()
 
-        if is_external_repository():
-            print_warning('Running in a private repository, will download the id set from official content')
-            id_set = get_merged_official_and_local_id_set(id_set, silent_mode=silent_mode)
-
-        dependency_graph = PackDependencies.build_dependency_graph_single_pack(
-            pack_id=pack_name,
-            id_set=id_set,
-            verbose=verbose,
-            exclude_ignored_dependencies=exclude_ignored_dependencies
-        )
-        first_level_dependencies, _ = parse_for_pack_metadata(
-            dependency_graph,
-            pack_name,
-            verbose,
-            complete_data=complete_data,
-            id_set_data=id_set,
-        )
+        try:
+            if is_external_repository():
+                print_warning('Running in a private repository, will download the id set from official content')
+                local_id_set = id_set
+                id_set = get_merged_official_and_local_id_set(local_id_set, silent_mode=silent_mode)
+                close_id_set(local_id_set)
+
+            dependency_graph = PackDependencies.build_dependency_graph_single_pack(
+                pack_id=pack_name,
+                id_set=id_set,
+                verbose=verbose,
+                exclude_ignored_dependencies=exclude_ignored_dependencies
+            )
+            first_level_dependencies, _ = parse_for_pack_metadata(
+                dependency_graph,
+                pack_name,
+                verbose,
+                complete_data=complete_data,
+                id_set_data=id_set,
+            )
+        finally:
+            close_id_set(id_set)
         if use_pack_metadata:
             first_level_dependencies = PackDependencies.update_dependencies_from_pack_metadata(pack_name,
                                                                                                first_level_dependencies)
@@ -2294,20 +2633,18 @@ def calculate_single_pack_depends_on(pack: str, dependency_graph: nx.DiGraph, ve
     return first_level_dependencies, pack
 
 
-def calculate_single_pack_dependencies(pack: str, dependency_graph: object, verbose: bool = False) -> \
-        Tuple[dict, list, str]:
+def calculate_single_pack_dependencies(pack: str,
+                                       dependency_graph: Union[nx.DiGraph, PackDependenciesClosure],
+                                       verbose: bool = False) -> Tuple[dict, list, str]:
     """
     Calculates pack dependencies given a pack and a dependencies graph.
-    First is extract the dependencies subgraph of the given graph only using DFS algorithm with the pack as source.
-
-    Then, for all the dependencies of that pack it Replaces the 'mandatory_for_packs' key with a boolean key 'mandatory'
-    which indicates whether this dependency is mandatory for this pack or not.
-
-    Then using that subgraph we get the first-level dependencies and all-levels dependencies.
+    The first level and all levels dependencies are taken from the dependencies closure of the graph,
+    see PackDependenciesClosure. When calculating the dependencies of many packs, pass the closure
+    so it is calculated once for all of them.
 
     Args:
         pack: The pack for which we need to calculate the dependencies
-        dependency_graph: The full dependencies graph
+        dependency_graph: The full dependencies graph, or its dependencies closure
         verbose: Whether to output a detailed response.
 
     Returns:
@@ -2319,19 +2656,23 @@ def calculate_single_pack_dependencies(pack: str, dependency_graph: object, verb
         print(f"Calculating {pack} pack dependencies.")
 
     try:
-        subgraph = PackDependencies.get_dependencies_subgraph_by_dfs(dependency_graph, pack)
+        if isinstance(dependency_graph, PackDependenciesClosure):
+            dependencies_closure = dependency_graph
+        else:
+            dependencies_closure = PackDependenciesClosure(dependency_graph)
 
-        for dependency_pack, additional_data in subgraph.nodes(data=True):
+        first_level_dependencies = {}
+        for dependency_pack, is_mandatory in dependencies_closure.get_first_level_dependencies(pack).items():
             if verbose:
                 print(f'Iterating dependency {dependency_pack} for pack {pack}')
-            additional_data['mandatory'] = pack in additional_data['mandatory_for_packs']
-            del additional_data['mandatory_for_packs']
-            del additional_data['mandatory_for_items']
-            del additional_data['depending_on_packs']
-            del additional_data['depending_on_items_mandatorily']
-            # This could be added as a value to the output, see issue 45798
-
-        first_level_dependencies, all_level_dependencies = parse_for_pack_metadata(subgraph, pack)
+            first_level_dependencies[dependency_pack] = {
+                'mandatory': is_mandatory,
+                'display_name': find_pack_display_name(dependency_pack),
+            }
+
+        all_level_dependencies = dependencies_closure.get_all_level_dependencies(pack)
+        if verbose:
+            click.secho(f'All level dependencies are: {all_level_dependencies}', fg='white')
     except Exception:
         print_error(f"Failed calculating {pack} pack dependencies")
         raise
@@ -2339,23 +2680,88 @@ def calculate_single_pack_dependencies(pack: str, dependency_graph: object, verb
     return first_level_dependencies, all_level_dependencies, pack
 
 
-def get_all_packs_dependency_graph(id_set: dict, packs: list) -> Iterable:
+def init_dependency_graph_worker(dependency_graph: nx.DiGraph) -> None:
+    """
+    Keeps the dependency graph in the worker process, so it is passed to each worker once
+    instead of being pickled for every pack.
+    """
+    global _worker_dependency_graph
+    _worker_dependency_graph = dependency_graph
+
+
+def init_dependencies_closure_worker(dependencies_closure: PackDependenciesClosure) -> None:
+    """
+    Keeps the dependencies closure in the worker process, so it is passed to each worker once.
+    """
+    global _worker_dependencies_closure
+    _worker_dependencies_closure = dependencies_closure
+
+
+def calculate_packs_dependencies_chunk(packs: List[str], verbose: bool = False) -> List[Tuple[dict, list, str]]:
+    """
+    Calculates the dependencies of several packs in a worker process, see calculate_single_pack_dependencies.
+    """
+    return [calculate_single_pack_dependencies(pack, _worker_dependencies_closure, verbose)  # type: ignore[arg-type]
+            for pack in packs]
+
+
+def calculate_packs_depends_on_chunk(packs: List[str], verbose: bool = False) -> List[Tuple[dict, str]]:
+    """
+    Calculates the packs dependent on several packs in a worker process, see calculate_single_pack_depends_on.
+    The worker dependency graph is the reversed dependency graph.
+    """
+    return [calculate_single_pack_depends_on(pack, _worker_dependency_graph, verbose) for pack in packs]
+
+
+def split_to_chunks(packs: List[str], workers: int) -> List[List[str]]:
+    """
+    Splits the packs to chunks, a few chunks for each worker so the work is balanced between the workers.
+    """
+    chunk_size = max(1, math.ceil(len(packs) / (workers * CHUNKS_PER_WORKER)))
+    return [packs[index:index + chunk_size] for index in range(0, len(packs), chunk_size)]
+
+
+def get_all_packs_dependency_graph(id_set: Optional[dict], packs: list, cache_path: Optional[str] = None,
+                                   id_set_path: str = '', graph_path: Optional[str] = None,
+                                   marketplace: str = '', verbose: bool = False) -> nx.DiGraph:
     """
     Gets a graph with dependencies for all packs
     Args:
-        id_set: The content of id_set file
+        id_set: The content of id_set file, or None to read it from id_set_path when the graph is built
         packs: The packs that should be part of the dependencies calculation
+        cache_path: The path of the dependencies cache, see PackDependenciesCache
+        id_set_path: The path of the id_set file
+        graph_path: The path of the dependency graph file. When given, and the id_set is read from id_set_path,
+         the graph is loaded from the file if it was built from the same id_set file, and is saved to it otherwise
+        marketplace: The dependency calculation desired marketplace
+        verbose: Whether to print the log to the console
 
     Returns:
         A graph with all packs dependencies
     """
     print("Calculating all packs dependencies.")
-    # try:
-    dependency_graph = PackDependencies.build_all_dependencies_graph(packs, id_set=id_set, verbose=False)
+    id_set_hash = get_file_or_dir_hash(id_set_path) if graph_path and id_set is None and id_set_path else ''
+    if graph_path and id_set_hash:
+        loaded_graph = PackDependencies.load_all_dependencies_graph(graph_path, packs, id_set_hash,
+                                                                    marketplace=marketplace)
+        if loaded_graph is not None:
+            print(f'Loaded the dependency graph from {graph_path}')
+            return loaded_graph
+
+    opened_id_set = None
+    if id_set is None:
+        id_set = opened_id_set = get_id_set(id_set_path, lazy=True)
+    try:
+        dependency_graph = PackDependencies.build_all_dependencies_graph(packs, id_set=id_set, verbose=verbose,
+                                                                         marketplace=marketplace,
+                                                                         cache_path=cache_path)
+    finally:
+        close_id_set(opened_id_set)
+    if graph_path and id_set_hash:
+        save_dependency_graph(graph_path, dependency_graph, packs, id_set_hash, marketplace,
+                              exclude_ignored_dependencies=True)
+        print(f'Saved the dependency graph to {graph_path}')
     return dependency_graph
-    # except Exception as e:
-    #     print_error(f"Failed calculating dependencies graph: {e}")
-    #     exit(2)
 
 
 def select_packs_for_calculation() -> list:
@@ -2373,7 +2779,9 @@ def select_packs_for_calculation() -> list:
     return packs
 
 
-def calculate_all_packs_dependencies(id_set_path: str, output_path: str, verbose: bool = False) -> dict:
+def calculate_all_packs_dependencies(id_set_path: str, output_path: str, verbose: bool = False,
+                                     cache_path: Optional[str] = None, workers: Optional[int] = None,
+                                     graph_path: Optional[str] = None) -> dict:
     """
     Calculates all packs dependencies in parallel.
     First - the method generates the full dependency graph. Then - using a process pool we extract the
@@ -2382,6 +2790,13 @@ def calculate_all_packs_dependencies(id_set_path: str, output_path: str, verbose
         id_set_path: The id_set content.
         output_path: The path for the outputs json.
         verbose: Whether to print the log to the console.
+        cache_path: The path of the dependencies cache. When given, only the first level dependencies of packs
+         which were changed, or depend on items which were changed, since the previous run are calculated.
+        workers: The number of worker processes, defaults to the number of CPUs.
+        graph_path: The path of the dependency graph file, see get_all_packs_dependency_graph.
+
+    The packs dependent on each pack are saved to an index alongside the output file (see
+    get_dependent_on_index_path), so `--get-dependent-on` can look them up instead of building the graph again.
     """
 
     def add_pack_metadata_results(results: Tuple) -> None:
@@ -2405,24 +2820,45 @@ def calculate_all_packs_dependencies(id_set_path: str, output_path: str, verbose
             print_error('Failed to collect pack dependencies results')
             raise
 
+    def add_packs_chunk_results(chunk_results: List[Tuple]) -> None:
+        """
+        The callback of the future of a packs chunk, adds the results of every pack of the chunk.
+        """
+        for results in chunk_results:
+            add_pack_metadata_results(results)
+
     pack_dependencies_result: dict = {}
-    id_set = get_id_set(id_set_path)
     packs = select_packs_for_calculation()
 
     # Generating one graph with dependencies for all packs
-    dependency_graph = get_all_packs_dependency_graph(id_set, packs)
-
-    with ProcessPoolHandler() as pool:
+    dependency_graph = get_all_packs_dependency_graph(None, packs, cache_path, id_set_path=id_set_path,
+                                                      graph_path=graph_path)
+    # the dependencies of all the packs in all levels, calculated in one pass over the graph
+    dependencies_closure = PackDependenciesClosure(dependency_graph)
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolHandler(max_workers=workers, initializer=init_dependencies_closure_worker,
+                            initargs=(dependencies_closure,)) as pool:
         futures = []
-        for pack in dependency_graph:
-            futures.append(pool.schedule(calculate_single_pack_dependencies, args=(pack, dependency_graph, verbose)))
-        wait_futures_complete(futures=futures, done_fn=add_pack_metadata_results)
+        for packs_chunk in split_to_chunks(list(dependency_graph), workers):
+            futures.append(pool.schedule(calculate_packs_dependencies_chunk, args=(packs_chunk, verbose)))
+        wait_futures_complete(futures=futures, done_fn=add_packs_chunk_results)
         print(f"Number of created pack dependencies entries: {len(pack_dependencies_result.keys())}")
         # finished iteration over pack folders
         print_success("Finished dependencies calculation")
 
         with open(output_path, 'w') as pack_dependencies_file:
             json.dump(pack_dependencies_result, pack_dependencies_file, indent=4)
+
+    id_set_hash = get_file_or_dir_hash(id_set_path) if id_set_path else ''
+    if id_set_hash:
+        # the reverse edges of the graph, for looking up the packs dependent on a pack with --get-dependent-on
+        dependent_on_index_path = get_dependent_on_index_path(output_path)
+        save_dependent_on_index(dependent_on_index_path,
+                                {pack: calculate_single_pack_depends_on(pack, dependency_graph)[0]
+                                 for pack in dependency_graph},
+                                id_set_hash, marketplace='', packs=packs)
+        print(f'Saved the dependent on index to {dependent_on_index_path}')
     return pack_dependencies_result
 
 
@@ -2432,7 +2868,9 @@ def get_packs_dependent_on_given_packs(packs: list,
                                        verbose: bool = False,
                                        id_set: dict = None,
                                        marketplace: str = '',
-
+                                       workers: Optional[int] = None,
+                                       dependent_on_index_path: Optional[str] = None,
+                                       graph_path: Optional[str] = None,
                                        ) -> Tuple:
     """
 
@@ -2444,6 +2882,11 @@ def get_packs_dependent_on_given_packs(packs: list,
         verbose: Whether to print the log to the console.
         id_set: id_set to calculate the dependencies
         marketplace: The dependency calculation desired marketplace.
+        workers: The number of worker processes, defaults to the number of CPUs.
+        dependent_on_index_path: The path of the index saved by calculate_all_packs_dependencies. When the index
+         was calculated from the same id_set file, the dependent packs are looked up in the index instead of
+         building the dependency graph.
+        graph_path: The path of the dependency graph file, see get_all_packs_dependency_graph.
 
     Returns:
         1. A dict with the given packs as keys, and the dependent packs with details about the dependency
@@ -2465,27 +2908,46 @@ def get_packs_dependent_on_given_packs(packs: list,
             print_error('Failed to collect the packs dependent on given packs')
             raise
 
+    def collect_packs_chunk_dependent_packs(chunk_results: List[Tuple]) -> None:
+        """
+        The callback of the future of a packs chunk, collects the dependent packs of every pack of the chunk.
+        """
+        for results in chunk_results:
+            collect_dependent_packs(results)
+
     dependent_on_results: dict = {}
     dependent_packs_list: list = []
-    if not id_set:
-        id_set = get_id_set(id_set_path)
     all_packs = select_packs_for_calculation()
-    dependency_graph = PackDependencies.build_all_dependencies_graph(all_packs, id_set=id_set, verbose=verbose, marketplace=marketplace)
-    reverse_dependency_graph = nx.DiGraph.reverse(dependency_graph)
-
-    pack_names = [get_pack_name(pack_path) for pack_path in packs]
-    with ProcessPoolHandler() as pool:
-        futures = []
-        for pack in pack_names:
-            futures.append(
-                pool.schedule(calculate_single_pack_depends_on, args=(str(pack), reverse_dependency_graph, verbose)))
-        wait_futures_complete(futures=futures, done_fn=collect_dependent_packs)
-        # finished iteration over pack folders
-        print_success("Finished calculating the dependencies on the given packs.")
-
-        if output_path:
-            with open(output_path, 'w') as pack_dependencies_file:
-                json.dump(dependent_on_results, pack_dependencies_file, indent=4)
+    pack_names = [str(get_pack_name(pack_path)) for pack_path in packs]
+
+    dependent_on_index = None
+    if dependent_on_index_path and not id_set and id_set_path and os.path.isfile(id_set_path):
+        dependent_on_index = load_dependent_on_index(dependent_on_index_path, get_file_or_dir_hash(id_set_path),
+                                                     marketplace, all_packs)
+
+    if dependent_on_index is not None and all(pack_name in dependent_on_index for pack_name in pack_names):
+        print(f'Taking the packs dependent on the given packs from the index {dependent_on_index_path}')
+        for pack_name in pack_names:
+            collect_dependent_packs((dependent_on_index[pack_name], pack_name))
+    else:
+        dependency_graph = get_all_packs_dependency_graph(id_set or None, all_packs, id_set_path=id_set_path,
+                                                          graph_path=graph_path, marketplace=marketplace,
+                                                          verbose=verbose)
+        reverse_dependency_graph = nx.DiGraph.reverse(dependency_graph)
+
+        workers = min(workers or os.cpu_count() or 1, len(pack_names)) or 1
+        with ProcessPoolHandler(max_workers=workers, initializer=init_dependency_graph_worker,
+                                initargs=(reverse_dependency_graph,)) as pool:
+            futures = []
+            for packs_chunk in split_to_chunks(pack_names, workers):
+                futures.append(pool.schedule(calculate_packs_depends_on_chunk, args=(packs_chunk, verbose)))
+            wait_futures_complete(futures=futures, done_fn=collect_packs_chunk_dependent_packs)
+    # finished iteration over pack folders
+    print_success("Finished calculating the dependencies on the given packs.")
+
+    if output_path:
+        with open(output_path, 'w') as pack_dependencies_file:
+            json.dump(dependent_on_results, pack_dependencies_file, indent=4)
     return dependent_on_results, set(dependent_packs_list)
 
 
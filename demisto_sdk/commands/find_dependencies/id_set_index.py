@@ -0,0 +1,230 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
+
+from packaging.version import InvalidVersion, Version
+
+from demisto_sdk.commands.common.constants import (
+    DEFAULT_CONTENT_ITEM_TO_VERSION, MarketplaceVersions)
+
+MARKETPLACE_BITS = {marketplace.value: 1 << bit for bit, marketplace in enumerate(MarketplaceVersions)}
+
+_MISSING = object()
+
+# the lookup keys of the current `record_lookups` block
+_recorded_lookups: Optional[Set[str]] = None
+
+
+def get_lookup_key(kind: str, value: Any) -> str:
+    """
+    A serializable key of a lookup in the id_set indexes, e.g. `command:ip` for looking up the `ip` command.
+    """
+    return f'{kind}:{"" if value is _MISSING else value}'
+
+
+@contextmanager
+def record_lookups() -> Iterator[Set[str]]:
+    """
+    Records the keys of the lookups in the id_set indexes made inside the block, see `get_lookup_key`.
+    An item can change the result of the block only if one of its keys (see `IDSetItemRecord.lookup_keys`)
+    was looked up.
+    """
+    global _recorded_lookups
+    outer_lookups = _recorded_lookups
+    _recorded_lookups = set()
+    try:
+        yield _recorded_lookups
+    finally:
+        if outer_lookups is not None:
+            outer_lookups.update(_recorded_lookups)
+        _recorded_lookups = outer_lookups
+
+
+@lru_cache(maxsize=None)
+def parse_item_version(version: str) -> Optional[Version]:
+    try:
+        return Version(version)
+    except (InvalidVersion, TypeError):
+        return None
+
+
+def get_marketplaces_mask(marketplaces: Iterable[str]) -> int:
+    mask = 0
+    for marketplace in marketplaces:
+        mask |= MARKETPLACE_BITS.get(marketplace, 0)
+    return mask
+
+
+@dataclass(frozen=True)
+class IDSetItemRecord:
+    """
+    An id_set item, with the fields the dependencies calculation filters the items by normalized once.
+
+    Attributes:
+        item_id: The item id.
+        details: The item data from the id_set.
+        to_version: The parsed `toversion` of the item, None if it is not a valid version.
+        pack: The id of the pack of the item.
+        marketplaces_mask: The bits of the item marketplaces, see MARKETPLACE_BITS.
+    """
+    item_id: str
+    details: dict
+    to_version: Optional[Version]
+    pack: Optional[str]
+    marketplaces_mask: int
+
+    @classmethod
+    def from_item(cls, item_id: str, item_details: dict) -> 'IDSetItemRecord':
+        return cls(
+            item_id=item_id,
+            details=item_details,
+            to_version=parse_item_version(item_details.get('toversion', DEFAULT_CONTENT_ITEM_TO_VERSION)),
+            pack=item_details.get('pack'),
+            marketplaces_mask=get_marketplaces_mask(item_details.get('marketplaces', [])),
+        )
+
+    def lookup_keys(self) -> Set[str]:
+        """
+        The keys the item is found by, in the format of `get_lookup_key`.
+        """
+        keys = {get_lookup_key('id', self.item_id), get_lookup_key('name', self.details.get('name', _MISSING)),
+                get_lookup_key('pack', self.pack)}
+        keys.update(get_lookup_key('alias', alias) for alias in self.details.get('aliases', []))
+        keys.update(get_lookup_key('command', command) for command in self.details.get('commands', []))
+        return keys
+
+    def is_in_marketplace(self, marketplace: str) -> bool:
+        marketplace_bit = MARKETPLACE_BITS.get(marketplace)
+        if marketplace_bit is None:
+            return marketplace in self.details.get('marketplaces', [])
+        return bool(self.marketplaces_mask & marketplace_bit)
+
+
+class IDSetSectionIndex:
+    """
+    Inverted indexes of an id_set section, mapping the ids, names, aliases, integration commands and packs
+    of the section items to the positions of the items in the section.
+    The records of the items are kept in `records`, by the position of the items.
+
+    The lookups return the positions in ascending order, so iterating over the found items keeps the order
+    of the section, the same as a linear scan over the section would.
+    """
+
+    def __init__(self, items_list: list):
+        self.items_list = items_list
+        self.size = len(items_list)
+        self.records: List[IDSetItemRecord] = []
+        self._by_id: Dict[Any, List[int]] = {}
+        self._by_name: Dict[Any, List[int]] = {}
+        self._by_alias: Dict[Any, List[int]] = {}
+        self._by_command: Dict[Any, List[int]] = {}
+        self._by_pack: Dict[Any, List[int]] = {}
+
+        for position, item in enumerate(items_list):
+            if not item:
+                self.records.append(IDSetItemRecord.from_item('', {}))
+                continue
+            item_id, item_details = next(iter(item.items()))
+            self.records.append(IDSetItemRecord.from_item(item_id, item_details))
+            self._by_id.setdefault(item_id, []).append(position)
+            self._by_name.setdefault(item_details.get('name', _MISSING), []).append(position)
+            self._by_pack.setdefault(item_details.get('pack'), []).append(position)
+            for alias in set(item_details.get('aliases', [])):
+                self._by_alias.setdefault(alias, []).append(position)
+            for command in set(item_details.get('commands', [])):
+                self._by_command.setdefault(command, []).append(position)
+
+    @staticmethod
+    def _lookup(kind: str, index: Dict[Any, List[int]], keys: Iterable) -> List[int]:
+        positions: Set[int] = set()
+        for key in keys:
+            try:
+                positions.update(index.get(key, ()))
+            except TypeError:  # an unhashable key can not match any item
+                continue
+            if _recorded_lookups is not None:
+                _recorded_lookups.add(get_lookup_key(kind, key))
+        return sorted(positions)
+
+    def find_by_ids(self, ids: Iterable) -> List[int]:
+        return self._lookup('id', self._by_id, ids)
+
+    def find_by_names(self, names: Iterable, missing_name: Any = '') -> List[int]:
+        """
+        Finds the items with the given names.
+        Items without a name are found when `missing_name` is one of the given names.
+        """
+        names = list(names)
+        if any(name is missing_name or name == missing_name for name in names):
+            names.append(_MISSING)
+        return self._lookup('name', self._by_name, names)
+
+    def find_by_names_batch(self, names_groups: Iterable[Iterable], missing_name: Any = '') -> List[List[int]]:
+        """
+        Finds the items of several groups of names at once, the same as calling `find_by_names` for every group.
+        A name referenced by several groups is looked up only once.
+
+        Returns:
+            The positions of the items found for every group, in the order of the groups.
+        """
+        names_positions: Dict[Any, List[int]] = {}
+        groups_positions = []
+        for names in names_groups:
+            positions: Set[int] = set()
+            for name in names:
+                try:
+                    name_positions = names_positions.get(name)
+                except TypeError:  # an unhashable name can not match any item
+                    continue
+                if name_positions is None:
+                    name_positions = self.find_by_names([name], missing_name=missing_name)
+                    names_positions[name] = name_positions
+                positions.update(name_positions)
+            groups_positions.append(sorted(positions))
+        return groups_positions
+
+    def find_by_aliases(self, aliases: Iterable) -> List[int]:
+        return self._lookup('alias', self._by_alias, aliases)
+
+    def find_by_command(self, command: str) -> List[int]:
+        return self._lookup('command', self._by_command, [command])
+
+    def find_by_pack(self, pack_id: str) -> List[int]:
+        return self._lookup('pack', self._by_pack, [pack_id])
+
+
+class IDSetIndex:
+    """
+    The indexes of the sections of an id_set, see IDSetSectionIndex. Built once per id_set, and passed to the
+    dependencies calculation of all the packs. The index of a section is built on the first lookup in the section.
+
+    The indexes are not updated when the id_set is changed, a changed id_set should be indexed again.
+    """
+
+    def __init__(self, id_set: dict):
+        self.id_set = id_set
+        self._section_indexes: Dict[str, IDSetSectionIndex] = {}
+
+    def section(self, section_name: str) -> IDSetSectionIndex:
+        """
+        Gets the index of an id_set section.
+
+        Args:
+            section_name: The name of the section, e.g. `scripts`.
+
+        Returns:
+            The section index.
+        """
+        section_index = self._section_indexes.get(section_name)
+        if section_index is None:
+            section_index = self._section_indexes[section_name] = IDSetSectionIndex(self.id_set[section_name])
+        return section_index
+
+
+def as_section_index(section: Union[list, IDSetSectionIndex]) -> IDSetSectionIndex:
+    """
+    The index of an id_set section given as an index (see IDSetIndex.section), or a new index of a section given as
+    a list of items.
+    """
+    return section if isinstance(section, IDSetSectionIndex) else IDSetSectionIndex(section)
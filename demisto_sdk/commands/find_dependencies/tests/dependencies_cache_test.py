@@ -0,0 +1,149 @@
+import copy
+import os
+
+from demisto_sdk.commands.find_dependencies.dependencies_cache import (
+    PACK_ITEMS_SECTIONS, PackDependenciesCache, decode_dependencies,
+    encode_dependencies)
+from demisto_sdk.commands.find_dependencies.find_dependencies import \
+    PackDependencies
+
+PACKS = ['PackA', 'PackB', 'PackC', 'PackD']
+
+
+def create_id_set() -> dict:
+    """
+    PackA script uses the `b-command` command of PackB integration, PackC script executes PackA script,
+    PackD does not depend on any pack.
+    """
+    id_set: dict = {section: [] for section in PACK_ITEMS_SECTIONS}
+    id_set['scripts'] = [
+        {'ScriptA': {'name': 'ScriptA', 'pack': 'PackA', 'depends_on': ['b-command'], 'marketplaces': ['xsoar']}},
+        {'ScriptC': {'name': 'ScriptC', 'pack': 'PackC', 'script_executions': ['ScriptA'], 'marketplaces': ['xsoar']}},
+        {'ScriptD': {'name': 'ScriptD', 'pack': 'PackD', 'marketplaces': ['xsoar']}},
+    ]
+    id_set['integrations'] = [
+        {'IntegrationB': {'name': 'IntegrationB', 'pack': 'PackB', 'commands': ['b-command'],
+                          'marketplaces': ['xsoar']}},
+    ]
+    return id_set
+
+
+def get_graph_data(dependency_graph):
+    return {pack: (sorted(data['depending_on_packs']), data['depending_on_items_mandatorily'])
+            for pack, data in dependency_graph.nodes(data=True)}
+
+
+def build_graph(id_set: dict, cache_path: str):
+    return PackDependencies.build_all_dependencies_graph(PACKS, copy.deepcopy(id_set), cache_path=cache_path)
+
+
+def test_encode_decode_dependencies():
+    """
+    Given
+    - the dependencies of a pack, with the items causing them
+
+    When
+    - encoding the dependencies to JSON and decoding them back
+
+    Then
+    - ensure the decoded dependencies equal the original ones
+    """
+    dependencies = {('PackB', True), ('PackC', False)}
+    dependencies_items = {('script', 'ScriptA'): {'PackB': [('integration', 'IntegrationB')]}}
+
+    assert decode_dependencies(encode_dependencies(dependencies, dependencies_items)) == \
+        (dependencies, dependencies_items)
+
+
+class TestPackDependenciesCache:
+    def test_unchanged_id_set(self, tmpdir):
+        """
+        Given
+        - a dependencies cache saved by building the dependency graph of all packs
+
+        When
+        - building the dependency graph again from the same id set
+
+        Then
+        - ensure the dependencies of all the packs are taken from the cache
+        - ensure the dependency graph equals the graph built without the cache
+        """
+        cache_path = os.path.join(tmpdir, 'cache.json')
+        id_set = create_id_set()
+        build_graph(id_set, cache_path)
+
+        dependency_graph = build_graph(id_set, cache_path)
+
+        cache = PackDependenciesCache(cache_path)
+        cache.update_items(id_set)
+        assert all(cache.get(pack) for pack in PACKS)
+        assert get_graph_data(dependency_graph) == get_graph_data(build_graph(id_set, None))
+
+    def test_changed_dependency_target(self, tmpdir):
+        """
+        Given
+        - a dependencies cache saved by building the dependency graph of all packs
+
+        When
+        - the integration implementing the command PackA uses is moved to a new pack
+
+        Then
+        - ensure only the dependencies of the changed pack, and of the pack using the changed integration,
+          are calculated
+        - ensure the dependency graph equals the graph built without the cache
+        """
+        cache_path = os.path.join(tmpdir, 'cache.json')
+        id_set = create_id_set()
+        build_graph(id_set, cache_path)
+        id_set['integrations'][0]['IntegrationB']['pack'] = 'PackD'
+
+        cache = PackDependenciesCache(cache_path)
+        cache.update_items(id_set)
+        assert [pack for pack in PACKS if cache.get(pack) is None] == ['PackA', 'PackB', 'PackD']
+
+        dependency_graph = build_graph(id_set, cache_path)
+        assert get_graph_data(dependency_graph) == get_graph_data(build_graph(id_set, None))
+        assert ('PackD', True) in dependency_graph.nodes['PackA']['depending_on_packs']
+
+    def test_new_item_found_by_lookup(self, tmpdir):
+        """
+        Given
+        - a dependencies cache saved by building the dependency graph of all packs
+
+        When
+        - a new pack adds an integration implementing the command PackA uses
+
+        Then
+        - ensure the dependencies of PackA are calculated again, and include the new pack as an optional dependency
+        """
+        cache_path = os.path.join(tmpdir, 'cache.json')
+        id_set = create_id_set()
+        build_graph(id_set, cache_path)
+        id_set['integrations'].append(
+            {'IntegrationE': {'name': 'IntegrationE', 'pack': 'PackE', 'commands': ['b-command'],
+                              'marketplaces': ['xsoar']}})
+
+        dependency_graph = build_graph(id_set, cache_path)
+
+        assert get_graph_data(dependency_graph) == get_graph_data(build_graph(id_set, None))
+        assert ('PackE', False) in dependency_graph.nodes['PackA']['depending_on_packs']
+
+    def test_cache_of_other_marketplace(self, tmpdir):
+        """
+        Given
+        - a dependencies cache saved for the xsoar marketplace
+
+        When
+        - loading the cache for the marketplacev2 marketplace
+
+        Then
+        - ensure the cache is ignored
+        """
+        cache_path = os.path.join(tmpdir, 'cache.json')
+        id_set = create_id_set()
+        PackDependencies.build_all_dependencies_graph(PACKS, id_set, marketplace='xsoar', cache_path=cache_path)
+
+        cache = PackDependenciesCache(cache_path, marketplace='marketplacev2')
+        cache.update_items(id_set)
+
+        assert all(cache.get(pack) is None for pack in PACKS)
@@ -0,0 +1,91 @@
+import networkx as nx
+import pytest
+
+from demisto_sdk.commands.find_dependencies.dependencies_closure import (
+    PackDependenciesClosure, get_transitive_dependencies)
+from demisto_sdk.commands.find_dependencies.find_dependencies import \
+    PackDependencies
+
+
+def create_dependency_graph(dependencies: dict) -> nx.DiGraph:
+    """
+    Creates a dependency graph from a mapping of: pack -> [(dependency, is mandatory)].
+    """
+    graph = nx.DiGraph()
+    for pack in dependencies:
+        graph.add_node(pack, mandatory_for_packs=[])
+    for pack, pack_dependencies in dependencies.items():
+        for dependency, is_mandatory in pack_dependencies:
+            graph.add_edge(pack, dependency)
+            if is_mandatory:
+                graph.nodes[dependency]['mandatory_for_packs'].append(pack)
+    return graph
+
+
+# pack1 -> pack2 -> pack3 -> pack4 -> pack2 (a cycle), pack1 -> pack5, pack6 has no dependencies
+DEPENDENCIES = {
+    'pack1': [('pack2', True), ('pack5', False)],
+    'pack2': [('pack3', True)],
+    'pack3': [('pack4', False)],
+    'pack4': [('pack2', True)],
+    'pack5': [],
+    'pack6': [],
+}
+
+
+@pytest.mark.parametrize('pack', list(DEPENDENCIES))
+def test_get_transitive_dependencies(pack):
+    """
+    Given
+    - a dependency graph with a dependencies cycle
+
+    When
+    - calculating the transitive dependencies of all the packs
+
+    Then
+    - ensure the dependencies of every pack are the packs reachable by a DFS from the pack
+    """
+    graph = create_dependency_graph(DEPENDENCIES)
+
+    transitive_dependencies = get_transitive_dependencies(graph)
+
+    dfs_subgraph = PackDependencies.get_dependencies_subgraph_by_dfs(graph, pack)
+    assert transitive_dependencies[pack] == {node for node in dfs_subgraph if dfs_subgraph.in_degree(node) > 0}
+
+
+class TestPackDependenciesClosure:
+    def test_first_level_dependencies(self):
+        """
+        Given
+        - a dependency graph with mandatory and optional dependencies
+
+        When
+        - getting the first level dependencies of a pack from the closure
+
+        Then
+        - ensure only the direct dependencies are returned, with whether each one is mandatory
+        """
+        closure = PackDependenciesClosure(create_dependency_graph(DEPENDENCIES))
+
+        assert closure.get_first_level_dependencies('pack1') == {'pack2': True, 'pack5': False}
+        assert closure.get_first_level_dependencies('pack6') == {}
+
+    def test_all_level_dependencies(self):
+        """
+        Given
+        - a dependency graph with a dependencies cycle, where one of the cycle edges is optional
+
+        When
+        - getting the all levels dependencies and mandatory dependencies of the packs from the closure
+
+        Then
+        - ensure the packs of the cycle depend on themselves
+        - ensure the mandatory dependencies stop at the optional edge, so pack2 is not in a mandatory cycle
+        """
+        closure = PackDependenciesClosure(create_dependency_graph(DEPENDENCIES))
+
+        assert closure.get_all_level_dependencies('pack1') == ['pack2', 'pack3', 'pack4', 'pack5']
+        assert closure.get_all_level_dependencies('pack3') == ['pack2', 'pack3', 'pack4']
+        assert closure.get_mandatory_all_level_dependencies('pack1') == ['pack2', 'pack3']
+        assert closure.get_mandatory_all_level_dependencies('pack4') == ['pack2', 'pack3']
+        assert closure.get_all_level_dependencies('pack6') == []
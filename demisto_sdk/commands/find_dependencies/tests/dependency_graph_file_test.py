@@ -0,0 +1,119 @@
+import copy
+
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.id_set_db import IDSetDB, write_id_set_db
+from demisto_sdk.commands.find_dependencies.dependencies_cache import \
+    PACK_ITEMS_SECTIONS
+from demisto_sdk.commands.find_dependencies.dependency_graph_file import (
+    load_dependency_graph, save_dependency_graph)
+from demisto_sdk.commands.find_dependencies.find_dependencies import (
+    PackDependencies, get_all_packs_dependency_graph)
+
+json = JSON_Handler()
+
+PACKS = ['PackA', 'PackB', 'PackC', 'PackD']
+
+
+def create_id_set() -> dict:
+    """
+    PackA script uses the `b-command` command of PackB integration and executes PackC script, PackC script
+    executes PackA script, PackD does not depend on any pack.
+    """
+    id_set: dict = {section: [] for section in PACK_ITEMS_SECTIONS}
+    id_set['scripts'] = [
+        {'ScriptA': {'name': 'ScriptA', 'pack': 'PackA', 'depends_on': ['b-command'], 'script_executions': ['ScriptC'],
+                     'marketplaces': ['xsoar']}},
+        {'ScriptC': {'name': 'ScriptC', 'pack': 'PackC', 'script_executions': ['ScriptA'], 'marketplaces': ['xsoar']}},
+        {'ScriptD': {'name': 'ScriptD', 'pack': 'PackD', 'marketplaces': ['xsoar']}},
+    ]
+    id_set['integrations'] = [
+        {'IntegrationB': {'name': 'IntegrationB', 'pack': 'PackB', 'commands': ['b-command'],
+                          'marketplaces': ['xsoar']}},
+    ]
+    return id_set
+
+
+def get_graph_data(dependency_graph):
+    return [(pack, sorted(data['depending_on_packs']), data['depending_on_items_mandatorily'],
+             data['mandatory_for_packs'], data['mandatory_for_items'])
+            for pack, data in dependency_graph.nodes(data=True)], sorted(dependency_graph.edges)
+
+
+def test_save_load_dependency_graph(tmpdir):
+    """
+    Given
+    - the dependency graph of all packs, with a dependencies cycle
+
+    When
+    - saving the graph to a file and loading it back
+
+    Then
+    - ensure the loaded graph, including the attributes of its nodes, equals the original graph
+    - ensure the graph is not loaded for another id set hash or other packs
+    """
+    graph_path = str(tmpdir.join('graph.json'))
+    dependency_graph = PackDependencies.build_all_dependencies_graph(PACKS, copy.deepcopy(create_id_set()))
+
+    save_dependency_graph(graph_path, dependency_graph, PACKS, 'hash', '', exclude_ignored_dependencies=True)
+
+    loaded_graph = PackDependencies.load_all_dependencies_graph(graph_path, PACKS, 'hash')
+    assert get_graph_data(loaded_graph) == get_graph_data(dependency_graph)
+    assert load_dependency_graph(graph_path, PACKS, 'other hash', '', True) is None
+    assert load_dependency_graph(graph_path, PACKS[:2], 'hash', '', True) is None
+
+
+def test_get_all_packs_dependency_graph_from_file(tmpdir, mocker):
+    """
+    Given
+    - an id set file
+
+    When
+    - getting the all packs dependency graph with a graph file, twice, and again after the id set file is changed
+
+    Then
+    - ensure the graph is built and saved in the first call, and loaded from the file in the second call
+    - ensure the graph is built again once the id set file is changed
+    """
+    id_set_path = tmpdir.join('id_set.json')
+    id_set_path.write(json.dumps(create_id_set()))
+    graph_path = str(tmpdir.join('graph.json'))
+    build_graph = mocker.spy(PackDependencies, 'build_all_dependencies_graph')
+
+    dependency_graph = get_all_packs_dependency_graph(None, PACKS, id_set_path=str(id_set_path), graph_path=graph_path)
+    loaded_graph = get_all_packs_dependency_graph(None, PACKS, id_set_path=str(id_set_path), graph_path=graph_path)
+
+    assert build_graph.call_count == 1
+    assert get_graph_data(loaded_graph) == get_graph_data(dependency_graph)
+
+    id_set_path.write(json.dumps({section: [] for section in PACK_ITEMS_SECTIONS}))
+    get_all_packs_dependency_graph(None, PACKS, id_set_path=str(id_set_path), graph_path=graph_path)
+    assert build_graph.call_count == 2
+
+
+def test_get_all_packs_dependency_graph_from_id_set_db(tmpdir, mocker):
+    """
+    Given
+    - an id set database, with a section the dependencies are not calculated from
+
+    When
+    - getting the all packs dependency graph from the database
+
+    Then
+    - ensure the graph equals the graph of the id set
+    - ensure the graph is built from the database itself, without loading the unused section
+    - ensure the database is closed once the graph is built
+    """
+    id_set = create_id_set()
+    id_set_path = str(tmpdir.join('id_set.db'))
+    write_id_set_db({**id_set, 'Documentation': [{'Doc': {'name': 'Doc', 'pack': 'PackA'}}]}, id_set_path)
+    build_graph = mocker.spy(PackDependencies, 'build_all_dependencies_graph')
+
+    dependency_graph = get_all_packs_dependency_graph(None, PACKS, id_set_path=id_set_path)
+
+    assert get_graph_data(dependency_graph) == get_graph_data(
+        PackDependencies.build_all_dependencies_graph(PACKS, copy.deepcopy(id_set)))
+    id_set_db = build_graph.call_args_list[0].kwargs['id_set']
+    assert isinstance(id_set_db, IDSetDB)
+    assert 'scripts' in id_set_db._sections
+    assert 'Documentation' not in id_set_db._sections
+    assert id_set_db._connection is None
@@ -7,11 +7,19 @@ import pytest
 import demisto_sdk.commands.create_id_set.create_id_set as cis
 from demisto_sdk.commands.common.constants import (
     FILETYPE_TO_DEFAULT_FROMVERSION, FileType, MarketplaceVersions)
+from demisto_sdk.commands.common.tools import get_file_or_dir_hash
+from demisto_sdk.commands.find_dependencies.dependencies_closure import \
+    PackDependenciesClosure
+from demisto_sdk.commands.find_dependencies.dependent_on_index import \
+    save_dependent_on_index
 from demisto_sdk.commands.find_dependencies.find_dependencies import (
-    PackDependencies, calculate_single_pack_dependencies,
+    PackDependencies, calculate_packs_dependencies_chunk,
+    calculate_single_pack_dependencies, calculate_single_pack_depends_on,
     find_dependencies_between_two_packs, get_packs_dependent_on_given_packs,
+    init_dependencies_closure_worker,
     remove_items_from_content_entities_sections,
-    remove_items_from_packs_section)
+    remove_items_from_packs_section, split_to_chunks)
+from demisto_sdk.commands.find_dependencies.id_set_index import IDSetItemRecord
 from TestSuite.test_tools import ChangeCWD
 from TestSuite.utils import IsEqualFunctions
 
@@ -529,6 +537,33 @@ class TestIdSetFilters:
 
         assert found_filtered_result == expected_result
 
+    @pytest.mark.parametrize('item_details', [
+        {'pack': 'Pack1', 'marketplaces': ['xsoar']},
+        {'pack': 'Pack1', 'marketplaces': ['xsoar', 'marketplacev2'], 'toversion': '6.0.0'},
+        {'pack': 'Pack1', 'marketplaces': ['marketplacev2'], 'toversion': '5.5.0'},
+        {'pack': 'Base', 'marketplaces': ['xsoar']},
+        {'marketplaces': ['xsoar']},
+        {'pack': 'Pack1'},
+    ])
+    @pytest.mark.parametrize('marketplace', ['', 'xsoar', 'marketplacev2', 'unknown'])
+    @pytest.mark.parametrize('exclude_ignored_dependencies', [True, False])
+    def test_should_add_record_as_dependency(self, item_details, marketplace, exclude_ignored_dependencies):
+        """
+        Given
+        - an id set item with a version, pack and marketplaces
+
+        When
+        - checking whether the item should be added as a dependency by its normalized record
+
+        Then
+        - ensure the result is the same as checking the item details
+        """
+        record = IDSetItemRecord.from_item('item_id', item_details)
+
+        assert PackDependencies._should_add_record_as_dependency(
+            record, exclude_ignored_dependencies, marketplace) == PackDependencies._should_add_item_as_dependency(
+            item_details, True, exclude_ignored_dependencies, marketplace)
+
 
 class TestDependsOnScriptAndIntegration:
     @pytest.mark.parametrize("dependency_script,expected_result",
@@ -2735,6 +2770,32 @@ def test_search_packs_by_items_names_or_ids(item_names, section_name, expected_r
     assert packs_and_items_dict == expected_result[1]
 
 
+def test_search_packs_batch(module_repo):
+    """
+    Given
+        - Groups of items names, some of them sharing names, and integration commands.
+    When
+        - Searching the packs of all the groups at once.
+    Then
+        - Ensure the result of every group is the same as searching the group by itself.
+    """
+    id_set = module_repo.id_set.read_json_as_dict()
+    names_groups = [['E-mail Address', 'emailaddress'], 'emailaddress', [], ['type', 'E-mail Address']]
+    commands = ['sla-set', 'ip', 'no-such-command', 'ip']
+
+    assert PackDependencies._search_packs_by_items_names_or_ids_batch(
+        names_groups, id_set['IncidentFields'], True, 'Both', 'incidentfield') == [
+        PackDependencies._search_packs_by_items_names_or_ids(names, id_set['IncidentFields'], True, 'Both',
+                                                             'incidentfield')
+        for names in names_groups]
+    assert PackDependencies._search_packs_by_items_names_batch(
+        [['Set', 'GetFieldsByIncidentType'], 'Set', []], id_set['scripts'], True, 'script') == [
+        PackDependencies._search_packs_by_items_names(names, id_set['scripts'], True, 'script')
+        for names in [['Set', 'GetFieldsByIncidentType'], 'Set', []]]
+    assert PackDependencies._search_packs_by_integration_commands_batch(commands, id_set, False) == [
+        PackDependencies._search_packs_by_integration_command(command, id_set, False) for command in commands]
+
+
 def test_find_dependencies_using_pack_metadata(mocker):
     """
         Given
@@ -3128,6 +3189,47 @@ class TestCalculateSinglePackDependencies:
                 assert not self.first_level_dependencies[node]['mandatory']
 
 
+@pytest.mark.parametrize('number_of_packs, workers, expected_chunk_sizes', [
+    (10, 1, [3, 3, 3, 1]),
+    (10, 4, [1] * 10),
+    (2, 8, [1, 1]),
+    (0, 2, []),
+])
+def test_split_to_chunks(number_of_packs, workers, expected_chunk_sizes):
+    """
+    Given
+        - packs to calculate the dependencies of, and a number of workers
+    When
+        - Splitting the packs to chunks for the workers
+    Then
+        - Ensure there are a few chunks for each worker, and all the packs are in the chunks by their order
+    """
+    packs = [f'pack{index}' for index in range(number_of_packs)]
+
+    chunks = split_to_chunks(packs, workers)
+
+    assert [len(chunk) for chunk in chunks] == expected_chunk_sizes
+    assert sum(chunks, []) == packs
+
+
+def test_calculate_packs_dependencies_chunk(mocker):
+    """
+    Given
+        - A worker initialized with the dependencies closure of a full dependency graph
+    When
+        - Calculating the dependencies of a chunk of packs in the worker
+    Then
+        - Ensure the results are the same as calculating the dependencies of each pack with the graph
+    """
+    mocker.patch('demisto_sdk.commands.find_dependencies.find_dependencies.find_pack_display_name',
+                 side_effect=find_pack_display_name_mock)
+    graph = get_mock_dependency_graph()
+    init_dependencies_closure_worker(PackDependenciesClosure(graph))
+
+    assert calculate_packs_dependencies_chunk(['pack1', 'pack2']) == [
+        calculate_single_pack_dependencies('pack1', graph), calculate_single_pack_dependencies('pack2', graph)]
+
+
 def get_mock_dependency_graph():
     graph = nx.DiGraph()
 
@@ -3170,6 +3272,48 @@ class TestGetDependentOnGivenPack:
         assert dependent_packs_dict['pack3']['packsDependentOnThisPackMandatorily']['pack2']['dependent_items'] == [
             (('type_item_3', 'item3'), ('type_item_b', 'item_b'))]
 
+    def test_get_dependent_on_given_pack_from_index(self, mocker, tmpdir):
+        """
+        Given
+            - A dependent on index saved from the dependency graph built from an id set file
+        When
+            - Getting the packs dependent on a pack with the index, before and after the id set file is changed
+        Then
+            - Ensure the result is looked up in the index without building the dependency graph, and equals
+              the result calculated from the graph
+            - Ensure the index is ignored once the id set file is changed
+        """
+        graph = nx.DiGraph()
+        graph.add_node('pack1', mandatory_for_packs=[], mandatory_for_items={})
+        graph.add_node('pack2', mandatory_for_packs=[], mandatory_for_items={})
+        graph.add_node('pack3', mandatory_for_packs=['pack1', 'pack2'], mandatory_for_items={
+            ('script', 'script3'): {'pack1': [('playbook', 'playbook1')], 'pack2': [('script', 'script2')]}})
+        graph.add_edge('pack1', 'pack3')
+        graph.add_edge('pack2', 'pack3')
+        id_set_path = tmpdir.join('id_set.json')
+        id_set_path.write('{}')
+        index_path = str(tmpdir.join('all_packs_dependencies_dependent_on_index.json'))
+        mocker.patch('demisto_sdk.commands.find_dependencies.find_dependencies.get_id_set', return_value={})
+        mocker.patch('demisto_sdk.commands.find_dependencies.find_dependencies.select_packs_for_calculation',
+                     return_value=['pack1', 'pack2', 'pack3'])
+        mocker.patch('demisto_sdk.commands.find_dependencies.find_dependencies.get_pack_name', return_value='pack3')
+        build_graph = mocker.patch('demisto_sdk.commands.find_dependencies.find_dependencies.PackDependencies.'
+                                   'build_all_dependencies_graph', return_value=graph)
+        expected_result = get_packs_dependent_on_given_packs(['Packs/pack3'], str(id_set_path))
+        save_dependent_on_index(index_path, {pack: calculate_single_pack_depends_on(pack, graph)[0] for pack in graph},
+                                get_file_or_dir_hash(str(id_set_path)), marketplace='',
+                                packs=['pack1', 'pack2', 'pack3'])
+        build_graph.reset_mock()
+
+        assert get_packs_dependent_on_given_packs(['Packs/pack3'], str(id_set_path),
+                                                  dependent_on_index_path=index_path) == expected_result
+        assert not build_graph.called
+
+        id_set_path.write('{"scripts": []}')
+        assert get_packs_dependent_on_given_packs(['Packs/pack3'], str(id_set_path),
+                                                  dependent_on_index_path=index_path) == expected_result
+        assert build_graph.called
+
     def test_find_dependencies_between_two_packs(self, mocker):
         """
         Given
@@ -0,0 +1,116 @@
+from demisto_sdk.commands.find_dependencies.id_set_index import (
+    IDSetIndex, IDSetSectionIndex, record_lookups)
+
+SECTION = [
+    {'Field1': {'name': 'Field One', 'pack': 'Pack1', 'aliases': ['field_alias']}},
+    {'Integration1': {'name': 'Integration One', 'pack': 'Pack2', 'commands': ['cmd-1', 'cmd-2']}},
+    {'Field1': {'name': 'Field One', 'pack': 'Pack3'}},
+    {'NoName': {'pack': 'Pack1', 'commands': ['cmd-2']}},
+]
+
+
+class TestIDSetSectionIndex:
+    def test_lookups(self):
+        """
+        Given
+        - an id set section with items of the same id, name and command in several packs
+
+        When
+        - looking up the items by their ids, names, aliases, commands and packs
+
+        Then
+        - ensure the positions of all the matching items are returned, in the order of the section
+        """
+        section_index = IDSetSectionIndex(SECTION)
+
+        assert section_index.find_by_ids(['Field1', 'Missing']) == [0, 2]
+        assert section_index.find_by_names(['Integration One', 'Field One']) == [0, 1, 2]
+        assert section_index.find_by_aliases(['field_alias']) == [0]
+        assert section_index.find_by_command('cmd-2') == [1, 3]
+        assert section_index.find_by_pack('Pack1') == [0, 3]
+        assert section_index.records[3].item_id == 'NoName'
+        assert section_index.records[3].details == {'pack': 'Pack1', 'commands': ['cmd-2']}
+
+    def test_find_items_without_a_name(self):
+        """
+        Given
+        - an id set section with an item without a name
+
+        When
+        - looking up the items by names
+
+        Then
+        - ensure the item without a name is found only when looking for the missing name value
+        - ensure unhashable names do not match any item
+        """
+        section_index = IDSetSectionIndex(SECTION)
+
+        assert section_index.find_by_names(['']) == [3]
+        assert section_index.find_by_names([None]) == []
+        assert section_index.find_by_names([None], missing_name=None) == [3]
+        assert section_index.find_by_names([['Field One']]) == []
+
+    def test_find_by_names_batch(self):
+        """
+        Given
+        - groups of names, sharing some of the names
+
+        When
+        - looking up the items of all the groups at once
+
+        Then
+        - ensure the positions found for every group are the same as looking up the group by itself
+        """
+        section_index = IDSetSectionIndex(SECTION)
+        names_groups = [['Field One', 'Integration One'], ['Field One'], [''], [], [['Field One'], 'Missing']]
+
+        assert section_index.find_by_names_batch(names_groups) == [
+            section_index.find_by_names(names) for names in names_groups]
+
+
+def test_id_set_index_sections():
+    """
+    Given
+    - an id set
+
+    When
+    - getting a section index from an IDSetIndex of the id set, before and after changing an item of the section
+      in place
+
+    Then
+    - ensure the section index is built once and reused by the same IDSetIndex
+    - ensure an IDSetIndex of the changed id set finds the items by their new values
+    """
+    id_set = {'section': list(SECTION)}
+    id_set_index = IDSetIndex(id_set)
+    section_index = id_set_index.section('section')
+    assert id_set_index.section('section') is section_index
+    assert section_index.find_by_pack('Pack1') == [0, 3]
+
+    id_set['section'][0] = {'Field1': {'name': 'Field One', 'pack': 'Pack4'}}
+
+    assert IDSetIndex(id_set).section('section').find_by_pack('Pack4') == [0]
+    assert IDSetIndex(id_set).section('section').find_by_pack('Pack1') == [3]
+
+
+def test_record_lookups():
+    """
+    Given
+    - an indexed id set section
+
+    When
+    - looking up items inside a record_lookups block
+
+    Then
+    - ensure the keys of the lookups are recorded, and match the keys of the found items
+    - ensure lookups outside the block are not recorded
+    """
+    section_index = IDSetSectionIndex(SECTION)
+
+    with record_lookups() as lookups:
+        section_index.find_by_command('cmd-1')
+        section_index.find_by_names([''])
+    section_index.find_by_ids(['Field1'])
+
+    assert lookups == {'command:cmd-1', 'name:'}
+    assert lookups <= section_index.records[1].lookup_keys() | section_index.records[3].lookup_keys()
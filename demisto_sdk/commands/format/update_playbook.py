@@ -132,7 +132,7 @@ class BasePlaybookYMLFormat(BaseUpdateYML):
         updated_tasks = []
         # if the changed file is a playbook get it's data
         if find_type(file_path) in [FileType.PLAYBOOK, FileType.TEST_PLAYBOOK]:
-            playbook_data = get_yaml(file_path)
+            playbook_data = get_yaml(file_path, keep_format=True)
             # go through all the tasks
             for task_id, task_data in playbook_data.get('tasks').items():
                 # if a task is of playbook type
@@ -102,7 +102,7 @@ def generate_integration_context(
     if not output_path:
         output_path = input_path
     try:
-        yml_data = get_yaml(input_path)
+        yml_data = get_yaml(input_path, keep_format=True)
 
         # Parse examples file
         example_dict = generate_example_dict(examples, insecure)
@@ -226,7 +226,7 @@ def generate_ai_descriptions(
 
     try:
         similar_paths: Dict[str, str] = {}
-        yml_data = get_yaml(input_path)
+        yml_data = get_yaml(input_path, keep_format=True)
 
         # Fix sometimes the yml doesn't contain the full structure
         #  (json-to-outputs)
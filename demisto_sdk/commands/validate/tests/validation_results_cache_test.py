@@ -0,0 +1,185 @@
+import os
+
+from demisto_sdk.commands.common.errors import FOUND_FILES_AND_ERRORS
+from demisto_sdk.commands.validate.validate_manager import ValidateManager
+from demisto_sdk.commands.validate.validation_results_cache import (
+    ValidationResultsCache, get_file_inputs_hash)
+from TestSuite.test_tools import ChangeCWD
+
+
+def create_invalid_job(repo):
+    pack = repo.create_pack('CachedPack')
+    return pack, pack.create_job(is_feed=False, name='job_name', selected_feeds=['feed_name'])
+
+
+class TestValidationResultsCache:
+    def test_replay_cached_results(self, repo, tmpdir, mocker, capsys):
+        """
+        Given
+        - An invalid job, validated with a validation results cache.
+
+        When
+        - Validating the job again with the same cache.
+
+        Then
+        - Ensure the job validations are not run again.
+        - Ensure the cached result and errors are reported again.
+        """
+        _, job = create_invalid_job(repo)
+        cache_dir = str(tmpdir / 'cache')
+
+        with ChangeCWD(repo.path):
+            validate_manager = ValidateManager(check_is_unskipped=False, skip_conf_json=True,
+                                               validation_cache_path=cache_dir)
+            assert not validate_manager.run_validations_on_file(job.path, [])
+            assert "cannot have non-empty selectedFeeds" in capsys.readouterr().out
+
+            FOUND_FILES_AND_ERRORS.clear()
+            validate_manager = ValidateManager(check_is_unskipped=False, skip_conf_json=True,
+                                               validation_cache_path=cache_dir)
+            run_file_validations = mocker.patch.object(validate_manager, 'run_file_validations')
+            assert not validate_manager.run_validations_on_file(job.path, [])
+
+        assert not run_file_validations.called
+        assert "cannot have non-empty selectedFeeds" in capsys.readouterr().out
+        assert any(error.startswith(job.path) for error in FOUND_FILES_AND_ERRORS)
+
+    def test_cache_invalidated_by_pack_ignore(self, repo, tmpdir, mocker):
+        """
+        Given
+        - A job validated with a validation results cache.
+
+        When
+        - Changing the .pack-ignore of the job pack, and validating the job again with the same cache.
+
+        Then
+        - Ensure the job validations are run again.
+        """
+        pack, job = create_invalid_job(repo)
+        cache_dir = str(tmpdir / 'cache')
+
+        with ChangeCWD(repo.path):
+            ValidateManager(check_is_unskipped=False, skip_conf_json=True,
+                            validation_cache_path=cache_dir).run_validations_on_file(job.path, [])
+            pack.pack_ignore.write_list(['[file:job-job_name.json]', 'ignore=JB101'])
+
+            validate_manager = ValidateManager(check_is_unskipped=False, skip_conf_json=True,
+                                               validation_cache_path=cache_dir)
+            run_file_validations = mocker.patch.object(validate_manager, 'run_file_validations', return_value=True)
+            assert validate_manager.run_validations_on_file(job.path, [])
+
+        assert run_file_validations.called
+
+    def test_added_file_not_replayed_from_other_runs(self, repo, tmpdir, mocker):
+        """
+        Given
+        - A job validated with a validation results cache, when the job was not an added file.
+
+        When
+        - Validating the job again with the same cache as an added file, and when validating all the packs.
+
+        Then
+        - Ensure the job validations are run again in both cases, so the checks of added files are not skipped.
+        """
+        _, job = create_invalid_job(repo)
+        cache_dir = str(tmpdir / 'cache')
+
+        with ChangeCWD(repo.path):
+            ValidateManager(check_is_unskipped=False, skip_conf_json=True, file_path=job.path,
+                            validation_cache_path=cache_dir).run_validations_on_file(job.path, [])
+
+            validate_manager = ValidateManager(check_is_unskipped=False, skip_conf_json=True, file_path=job.path,
+                                               validation_cache_path=cache_dir)
+            run_file_validations = mocker.patch.object(validate_manager, 'run_file_validations', return_value=True)
+            assert validate_manager.run_validations_on_file(job.path, [], added_files={job.path})
+            assert run_file_validations.call_count == 1
+
+            validate_manager = ValidateManager(check_is_unskipped=False, skip_conf_json=True, validate_all=True,
+                                               validation_cache_path=cache_dir)
+            run_file_validations = mocker.patch.object(validate_manager, 'run_file_validations', return_value=True)
+            assert validate_manager.run_validations_on_file(job.path, [])
+            assert run_file_validations.call_count == 1
+
+    def test_release_notes_not_cached(self, repo, tmpdir, mocker):
+        """
+        Given
+        - Release notes of a pack.
+
+        When
+        - Validating the release notes twice with a validation results cache.
+
+        Then
+        - Ensure the release notes are validated both times, as they are validated against the other changed files.
+        """
+        pack = repo.create_pack('CachedPack')
+        release_notes = pack.create_release_notes('1_0_1', '#### Scripts\n##### Script\n- Fixed an issue.')
+        cache_dir = str(tmpdir / 'cache')
+
+        with ChangeCWD(repo.path):
+            validate_manager = ValidateManager(check_is_unskipped=False, skip_conf_json=True,
+                                               validation_cache_path=cache_dir)
+            run_file_validations = mocker.patch.object(validate_manager, 'run_file_validations', return_value=True)
+            assert validate_manager.run_validations_on_file(release_notes.path, [])
+            assert validate_manager.run_validations_on_file(release_notes.path, [])
+
+        assert run_file_validations.call_count == 2
+        assert not os.listdir(cache_dir)
+
+
+def test_file_key_depends_on_file_inputs(tmpdir):
+    """
+    Given
+    - A validation results cache.
+
+    When
+    - Getting the key of the same file, as an added file and as an existing file.
+
+    Then
+    - Ensure the keys are different.
+    """
+    file_path = tmpdir / 'file.yml'
+    file_path.write('id: file')
+    results_cache = ValidationResultsCache(str(tmpdir / 'cache'), {})
+
+    assert results_cache.get_file_key(str(file_path), {'is_added_file': True}) != \
+        results_cache.get_file_key(str(file_path), {'is_added_file': False})
+
+
+def test_get_file_inputs_hash_of_package(repo):
+    """
+    Given
+    - An integration package.
+
+    When
+    - Changing the code of the integration.
+
+    Then
+    - Ensure the inputs hash of the integration yml is changed.
+    """
+    integration = repo.create_pack('CachedPack').create_integration('CachedIntegration')
+    yml_path = integration.yml.path
+
+    with ChangeCWD(repo.path):
+        inputs_hash = get_file_inputs_hash(os.path.relpath(yml_path, repo.path))
+        integration.code.write('print("changed")')
+
+        assert get_file_inputs_hash(os.path.relpath(yml_path, repo.path)) != inputs_hash
+
+
+def test_file_key_depends_on_run_inputs(tmpdir):
+    """
+    Given
+    - Validation results caches of runs with different enabled validations.
+
+    When
+    - Getting the key of the same file.
+
+    Then
+    - Ensure the keys are different, so results of one configuration are not used by the other.
+    """
+    file_path = tmpdir / 'file.yml'
+    file_path.write('id: file')
+    cache_dir = str(tmpdir / 'cache')
+
+    assert ValidationResultsCache(cache_dir, {'specific_validations': None}).get_file_key(str(file_path)) != \
+        ValidationResultsCache(cache_dir, {'specific_validations': ['BA101']}).get_file_key(str(file_path))
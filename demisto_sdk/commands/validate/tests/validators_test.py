@@ -1,4 +1,6 @@
+import multiprocessing
 import os
+import pickle
 import sys
 from io import StringIO
 from pathlib import Path
@@ -13,11 +15,11 @@ from demisto_sdk.commands.common import tools
 from demisto_sdk.commands.common.constants import (
     CONF_PATH, FILETYPE_TO_DEFAULT_FROMVERSION, PACKS_PACK_META_FILE_NAME,
     TEST_PLAYBOOK, FileType)
-from demisto_sdk.commands.common.errors import Errors
+from demisto_sdk.commands.common.errors import FOUND_FILES_AND_ERRORS, Errors
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.handlers import JSON_Handler
-from demisto_sdk.commands.common.hook_validations.base_validator import \
-    BaseValidator
+from demisto_sdk.commands.common.hook_validations.base_validator import (
+    BaseValidator, flush_json_report)
 from demisto_sdk.commands.common.hook_validations.content_entity_validator import \
     ContentEntityValidator
 from demisto_sdk.commands.common.hook_validations.dashboard import \
@@ -39,6 +41,7 @@ from demisto_sdk.commands.common.hook_validations.pack_unique_files import \
     PackUniqueFilesValidator
 from demisto_sdk.commands.common.hook_validations.playbook import \
     PlaybookValidator
+from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
 from demisto_sdk.commands.common.hook_validations.release_notes import \
     ReleaseNotesValidator
 from demisto_sdk.commands.common.hook_validations.reputation import \
@@ -47,10 +50,12 @@ from demisto_sdk.commands.common.hook_validations.script import ScriptValidator
 from demisto_sdk.commands.common.hook_validations.structure import \
     StructureValidator
 from demisto_sdk.commands.common.hook_validations.widget import WidgetValidator
+from demisto_sdk.commands.common.id_set_db import IDSetDB, write_id_set_db
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.unify.integration_script_unifier import \
     IntegrationScriptUnifier
-from demisto_sdk.commands.validate.validate_manager import ValidateManager
+from demisto_sdk.commands.validate.validate_manager import (
+    FILE_TASK, PACK_UNIQUE_FILES_TASK, ValidateManager, init_validate_worker)
 from demisto_sdk.tests.constants_test import (
     CONF_JSON_MOCK_PATH, DASHBOARD_TARGET, DIR_LIST, IGNORED_PNG,
     INCIDENT_FIELD_TARGET, INCIDENT_TYPE_TARGET, INDICATOR_TYPE_TARGET,
@@ -1919,3 +1924,187 @@ def test_image_error(capsys):
     expected_string, expected_code = Errors.invalid_image_name_or_location()
     assert expected_string in stdout
     assert expected_code in stdout
+
+
+def test_get_validation_tasks(repo):
+    """
+    Given
+            A pack with an integration, a script and a job
+    When
+            Splitting the validation of the pack into tasks
+    Then
+            Ensure the unique files of the pack are validated by the first task of the pack
+            Ensure every content file is validated by a task of its own, and the other files are ignored
+    """
+    pack = repo.create_pack('PackWithTasks')
+    integration = pack.create_integration('integration')
+    script = pack.create_script('script')
+    job = pack.create_job(is_feed=False, name='job_name')
+
+    with ChangeCWD(repo.path):
+        validate_manager = ValidateManager(check_is_unskipped=False, skip_conf_json=True)
+        pack_path = os.path.join('Packs', 'PackWithTasks')
+        tasks = validate_manager.get_validation_tasks([pack_path])
+
+    assert tasks[0][:2] == (PACK_UNIQUE_FILES_TASK, pack_path)
+    validated_files = {os.path.basename(path) for task_type, path, _ in tasks[1:] if task_type == FILE_TASK}
+    assert {os.path.basename(integration.yml.path), os.path.basename(script.yml.path),
+            os.path.basename(job.path)} <= validated_files
+    assert os.path.basename(integration.code.path) not in validated_files
+    assert any(path.endswith(os.path.basename(integration.code.path)) for path in validate_manager.ignored_files)
+
+
+def test_validate_packs_with_workers(repo, mocker):
+    """
+    Given
+            Two packs, one of them with an invalid job
+    When
+            Validating the packs in worker processes, and in the main process
+    Then
+            Ensure the validation results, the found errors and the JSON report entries are the same
+    """
+    mocker.patch.object(ValidateManager, 'validate_pack_unique_files', return_value=True)
+    mocker.patch.object(ValidateManager, 'validate_readme', return_value=True)
+    repo.create_pack('ValidPack').create_job(is_feed=False, name='valid_job')
+    repo.create_pack('InvalidPack').create_job(is_feed=False, name='invalid_job', selected_feeds=['feed_name'])
+    packs = [os.path.join('Packs', 'InvalidPack'), os.path.join('Packs', 'ValidPack')]
+
+    results = []
+    with ChangeCWD(repo.path):
+        for multiprocessing in (True, False):
+            FOUND_FILES_AND_ERRORS.clear()
+            json_file_path = os.path.join(repo.path, f'validate_outputs_{multiprocessing}.json')
+            validate_manager = ValidateManager(check_is_unskipped=False, skip_conf_json=True, validate_all=True,
+                                               multiprocessing=multiprocessing, workers=2,
+                                               json_file_path=json_file_path)
+            is_valid = validate_manager.validate_packs(packs, set(), 1, len(packs))
+            flush_json_report()
+            with open(json_file_path) as json_file:
+                results.append((is_valid, sorted(set(FOUND_FILES_AND_ERRORS)), json.load(json_file)))
+
+    assert results[0] == results[1]
+    assert not results[0][0]
+    assert any('invalid_job' in error for error in results[0][1])
+    assert any(entry['name'] == 'invalid_job' for entry in results[0][2])
+
+
+def test_validated_file_parsed_once(repo, mocker):
+    """
+    Given
+            An integration
+    When
+            Validating the integration
+    Then
+            Ensure the integration yml is parsed once, and its parsed document is reused by the other validators
+    """
+    mocker.patch.object(ImageValidator, 'is_valid', return_value=True)
+    integration = repo.create_pack('ParsedPack').create_integration('ParsedIntegration')
+    integration.create_default_integration()
+
+    with ChangeCWD(repo.path):
+        validate_manager = ValidateManager(file_path=integration.yml.rel_path, check_is_unskipped=False,
+                                           skip_conf_json=True, skip_pack_rn_validation=True)
+        validate_manager.skip_docker_checks = True
+        validate_manager.run_validation()
+
+    assert tools.parsed_documents_store.parse_counts[str(Path(integration.yml.path).resolve())] == 1
+    assert tools.parsed_documents_store.hits
+
+
+def test_validate_time_measurements(repo, mocker, tmpdir):
+    """
+    Given
+            An integration, and a time measurements directory
+    When
+            Validating the integration
+    Then
+            Ensure the time of the validations of the integration, its file type and its pack are reported
+    """
+    mocker.patch.object(ImageValidator, 'is_valid', return_value=True)
+    integration = repo.create_pack('MeasuredPack').create_integration('MeasuredIntegration')
+    integration.create_default_integration()
+    time_measurements_dir = tmpdir / 'time_measurements'
+
+    with ChangeCWD(repo.path):
+        validate_manager = ValidateManager(file_path=integration.yml.rel_path, check_is_unskipped=False,
+                                           skip_conf_json=True, skip_pack_rn_validation=True,
+                                           time_measurements_dir=str(time_measurements_dir))
+        validate_manager.skip_docker_checks = True
+        validate_manager.run_validation()
+
+    with open(time_measurements_dir / 'validate_time_measurements.json') as report_file:
+        report = json.load(report_file)
+    validations = {validation['name']: validation for validation in report['validations']}
+    assert validations['StructureValidator.is_valid_scheme']['call_count'] == 1
+    assert validations['IntegrationValidator.is_valid_file']['call_count'] == 1
+    assert [file_type['name'] for file_type in report['file_types']] == ['integration']
+    assert [pack['name'] for pack in report['validated_packs']] == ['MeasuredPack']
+    assert (time_measurements_dir / 'validate_validations_time_measurements.csv').exists()
+
+
+def test_init_validate_worker_mdx_server_ports(mocker):
+    """
+    Given
+            The ports of the mdx servers started by the main validate process, and the readme parse results it
+            prefetched
+    When
+            Initializing two validate worker processes which did not inherit them, e.g. spawned workers
+    Then
+            Ensure the workers verify readme files with the servers and the prefetched results of the main process
+            Ensure each worker uses another server
+    """
+    mocker.patch.object(ReadMeValidator, '_MDX_SERVER_PORTS', [])
+    mocker.patch.object(ReadMeValidator, '_MDX_SERVER_INDEX', 0)
+    mocker.patch.object(ReadMeValidator, '_MDX_RESULTS', {})
+    validate_manager = ValidateManager(skip_conf_json=True)
+    workers_counter = multiprocessing.Value('i', 0)
+
+    init_validate_worker(validate_manager, [6161, 6162], {'content_hash': ''}, workers_counter)
+    first_worker_url = ReadMeValidator.get_mdx_server_url()
+    init_validate_worker(validate_manager, [6161, 6162], {'content_hash': ''}, workers_counter)
+
+    assert ReadMeValidator.get_mdx_server_ports() == [6161, 6162]
+    assert ReadMeValidator.get_mdx_results() == {'content_hash': ''}
+    assert {first_worker_url, ReadMeValidator.get_mdx_server_url()} == {'http://localhost:6161',
+                                                                        'http://localhost:6162'}
+
+
+def test_get_id_set_file_from_id_set_db(tmp_path):
+    """
+    Given
+            An id_set database
+    When
+            Initializing validate with the database as the id_set path, and passing its id_set to a worker process
+    Then
+            Ensure the id_set sections are loaded from the database only when they are accessed
+            Ensure the id_set passed to the worker reads the same sections
+    """
+    id_set = {'scripts': [{'script1': {'name': 'Script One', 'pack': 'Pack1'}}], 'integrations': [], 'Packs': {}}
+    id_set_path = str(tmp_path / 'id_set.db')
+    write_id_set_db(id_set, id_set_path)
+
+    validate_manager = ValidateManager(skip_conf_json=True, id_set_path=id_set_path)
+
+    assert isinstance(validate_manager.id_set_file, IDSetDB)
+    assert not validate_manager.id_set_file._sections
+    assert validate_manager.id_set_file.get('scripts', []) == id_set['scripts']
+    assert list(validate_manager.id_set_file._sections) == ['scripts']
+    assert dict(pickle.loads(pickle.dumps(validate_manager.id_set_file))) == id_set
+
+
+def test_run_validation_closes_id_set_db(tmp_path, mocker):
+    """
+    Given
+            Validate initialized with an id_set database
+    When
+            Running the validation
+    Then
+            Ensure the connection to the id_set database is closed once the validation is done
+    """
+    id_set_path = str(tmp_path / 'id_set.db')
+    write_id_set_db({'scripts': []}, id_set_path)
+    validate_manager = ValidateManager(skip_conf_json=True, id_set_path=id_set_path, file_path='file.yml')
+    mocker.patch.object(validate_manager, 'run_validation_on_specific_files', return_value=True)
+
+    assert validate_manager.run_validation() == 0
+    assert validate_manager.id_set_file._connection is None
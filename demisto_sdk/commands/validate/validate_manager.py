@@ -1,8 +1,13 @@
+import multiprocessing
 import os
-from concurrent.futures._base import Future, as_completed
+import time
+from concurrent.futures._base import Future
 from configparser import ConfigParser, MissingSectionHeaderError
+from contextlib import contextmanager
+from itertools import chain
+from multiprocessing.sharedctypes import Synchronized
 from pathlib import Path
-from typing import Callable, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import click
 import pebble
@@ -10,7 +15,7 @@ from colorama import Fore
 from git import InvalidGitRepositoryError
 from packaging import version
 
-from demisto_sdk.commands.common import tools
+from demisto_sdk.commands.common import timers, tools
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (
     API_MODULES_PACK, AUTHOR_IMAGE_FILE_NAME, CONTENT_ENTITIES_DIRS,
@@ -29,7 +34,8 @@ from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.hook_validations.author_image import \
     AuthorImageValidator
 from demisto_sdk.commands.common.hook_validations.base_validator import (
-    BaseValidator, error_codes)
+    BaseValidator, add_json_report_entries, error_codes, flush_json_report,
+    pop_json_report_entries, record_reported_errors, replay_reported_errors)
 from demisto_sdk.commands.common.hook_validations.classifier import \
     ClassifierValidator
 from demisto_sdk.commands.common.hook_validations.conf_json import \
@@ -40,6 +46,8 @@ from demisto_sdk.commands.common.hook_validations.dashboard import \
     DashboardValidator
 from demisto_sdk.commands.common.hook_validations.description import \
     DescriptionValidator
+from demisto_sdk.commands.common.hook_validations.docker import (
+    DockerImagesCache, DockerImageValidator)
 from demisto_sdk.commands.common.hook_validations.generic_definition import \
     GenericDefinitionValidator
 from demisto_sdk.commands.common.hook_validations.generic_field import \
@@ -96,13 +104,100 @@ from demisto_sdk.commands.common.hook_validations.xsiam_report import \
     XSIAMReportValidator
 from demisto_sdk.commands.common.hook_validations.xsoar_config_json import \
     XSOARConfigJsonValidator
+from demisto_sdk.commands.common.id_set_db import close_id_set
+from demisto_sdk.commands.common.timers import (MeasureType,
+                                                add_time_measurement,
+                                                add_time_measurements,
+                                                enable_time_measurements,
+                                                measure_time,
+                                                pop_time_measurements,
+                                                report_measured_time)
 from demisto_sdk.commands.common.tools import (
     _get_file_id, find_type, get_api_module_ids,
     get_api_module_integrations_set, get_content_path, get_file,
-    get_pack_ignore_file_path, get_pack_name, get_pack_names_from_files,
-    get_relative_path_from_packs_dir, get_yaml, open_id_set_file,
-    run_command_os)
+    get_file_or_dir_hash, get_pack_ignore_file_path, get_pack_name,
+    get_pack_names_from_files, get_relative_path_from_packs_dir, get_yaml,
+    open_id_set_file, parsed_documents_store, run_command_os)
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
+from demisto_sdk.commands.validate.validation_results_cache import \
+    ValidationResultsCache
+
+PACK_UNIQUE_FILES_TASK = 'pack_unique_files'
+FILE_TASK = 'file'
+
+# the directory of the docker images lookups in the validation cache directory
+DOCKER_IMAGES_CACHE_DIR_NAME = 'docker_images'
+
+# the validate manager of the current worker process, see init_validate_worker
+_worker_validate_manager: Optional['ValidateManager'] = None
+
+# the time measurements reported by validate, and the number of the longest of each to print
+VALIDATE_MEASURE_TYPES = (MeasureType.VALIDATIONS, MeasureType.FILE_TYPES, MeasureType.VALIDATED_PACKS)
+TIME_MEASUREMENTS_SUMMARY_SIZE = 20
+
+
+def init_validate_worker(validate_manager: 'ValidateManager', mdx_server_ports: List[int],
+                         mdx_results: Dict[str, str], workers_counter: Synchronized):
+    """
+    Keeps the validate manager in the worker process, so it is passed once to every worker instead of with every task.
+    The worker uses the mdx servers of the main process, and the readme parse results it prefetched, which are passed
+    explicitly since spawned workers do not inherit them. Every worker takes the next index from the workers counter,
+    and parses its readme files with the server of that index, so the workers are spread evenly between the servers.
+    """
+    global _worker_validate_manager
+    _worker_validate_manager = validate_manager
+    with workers_counter.get_lock():
+        worker_index = workers_counter.value
+        workers_counter.value += 1
+    ReadMeValidator.set_mdx_server_ports(mdx_server_ports, server_index=worker_index)
+    ReadMeValidator.add_mdx_results(mdx_results)
+    # drop the JSON report entries and time measurements the worker inherited from the main process
+    pop_json_report_entries()
+    enable_time_measurements(bool(validate_manager.time_measurements_dir))
+    pop_time_measurements()
+
+
+def run_validate_worker_task(task: Tuple[str, str, dict]) -> Tuple[bool, list, list, dict, dict]:
+    """
+    Runs a validation task in a worker process, see ValidateManager.get_validation_tasks.
+
+    Returns:
+        Whether the validated files are valid, the errors and ignored errors found by the task, the JSON report
+        entries of the errors (see `pop_json_report_entries`) and the time measurements of the task
+        (see `pop_time_measurements`).
+    """
+    # the lists are returned to the main process with the result of every task
+    FOUND_FILES_AND_ERRORS.clear()
+    FOUND_FILES_AND_IGNORED_ERRORS.clear()
+    is_valid = _worker_validate_manager.run_validation_task(*task)  # type: ignore[union-attr]
+    return is_valid, list(FOUND_FILES_AND_ERRORS), list(FOUND_FILES_AND_IGNORED_ERRORS), pop_json_report_entries(), \
+        pop_time_measurements()
+
+
+@contextmanager
+def measure_file_validations_time(file_path: str) -> Iterator[None]:
+    """
+    Measures the time of validating a file, by the type and by the pack of the file.
+    """
+    if not timers.time_measurements_enabled:
+        yield
+        return
+    tic = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_time = time.perf_counter() - tic
+        file_type = find_type(file_path)
+        add_time_measurement(MeasureType.FILE_TYPES, file_type.value if file_type else 'unknown', elapsed_time)
+        add_time_measurement(MeasureType.VALIDATED_PACKS, get_pack_name(file_path) or 'unknown', elapsed_time)
+
+
+def get_validation_task_size(task: Tuple[str, str, dict]) -> int:
+    """
+    The size of the file validated by a task, used to schedule the largest files first.
+    """
+    task_type, path, _ = task
+    return os.path.getsize(path) if task_type == FILE_TASK else 0
 
 
 class ValidateManager:
@@ -113,6 +208,7 @@ class ValidateManager:
             silence_init_prints=False, no_docker_checks=False, skip_dependencies=False, id_set_path=None, staged=False,
             create_id_set=False, json_file_path=None, skip_schema_check=False, debug_git=False, include_untracked=False,
             pykwalify_logs=False, check_is_unskipped=True, quiet_bc=False, multiprocessing=True, specific_validations=None,
+            validation_cache_path=None, workers=None, time_measurements_dir=None,
     ):
         # General configuration
         self.skip_docker_checks = False
@@ -137,6 +233,7 @@ class ValidateManager:
         self.check_is_unskipped = check_is_unskipped
         self.conf_json_data = {}
         self.run_with_multiprocessing = multiprocessing
+        self.workers = workers or os.cpu_count() or 1
         self.is_possible_validate_readme = self.is_node_exist()
 
         if json_file_path:
@@ -218,6 +315,53 @@ class ValidateManager:
             self.conf_json_validator = ConfJsonValidator(specific_validations=self.specific_validations)
             self.conf_json_data = self.conf_json_validator.conf_data
 
+        self.validation_cache_path = validation_cache_path
+        self.validation_results_cache = ValidationResultsCache(
+            validation_cache_path, self.get_validation_cache_run_inputs()) if validation_cache_path else None
+
+        self.time_measurements_dir = time_measurements_dir
+
+    def get_validation_cache_run_inputs(self) -> dict:
+        """
+        The configuration of the run which the validation results of the files depend on, see ValidationResultsCache.
+        """
+        return {
+            'specific_validations': self.specific_validations,
+            'id_set_hash': get_file_or_dir_hash(self.id_set_path) if self.id_set_file else '',
+            'validate_id_set': bool(self.id_set_validations),
+            'conf_json_hash': '' if self.skip_conf_json else get_file_or_dir_hash(ConfJsonValidator.CONF_PATH),
+            'check_is_unskipped': self.check_is_unskipped,
+            'is_backward_check': self.is_backward_check,
+            'prev_ver': self.prev_ver,
+            'skip_docker_checks': self.skip_docker_checks,
+            'skip_schema_check': self.skip_schema_check,
+            'skip_pack_rn_validation': self.skip_pack_rn_validation,
+            'is_external_repo': self.is_external_repo,
+            'is_possible_validate_readme': self.is_possible_validate_readme,
+            'print_ignored_errors': self.print_ignored_errors,
+            'json_output': bool(self.json_file_path),
+            'quiet_bc': self.quiet_bc,
+            'validation_mode': self.get_validation_mode(),
+        }
+
+    def get_validation_mode(self) -> str:
+        """
+        The mode validate runs in - on all the packs, on the changed files by git, or on the given files.
+        """
+        if self.validate_all:
+            return 'all'
+        # validate runs using git when no files are given, see run_validation
+        if self.use_git or not self.file_path:
+            return 'git'
+        return 'files'
+
+    def get_validation_cache_key(self, file_path: str, added_files: Optional[Set] = None) -> str:
+        """
+        The key of the cached validation results of a file, see ValidationResultsCache.get_file_key.
+        """
+        return self.validation_results_cache.get_file_key(  # type: ignore[union-attr]
+            file_path, {'is_added_file': file_path in added_files if added_files else False})
+
     def is_node_exist(self) -> bool:
         """ Check if node interpreter exists.
         Returns:
@@ -254,19 +398,47 @@ class ValidateManager:
     def run_validation(self):
         """Initiates validation in accordance with mode (i,g,a)
         """
-        if self.validate_all:
-            is_valid = self.run_validation_on_all_packs()
-        elif self.use_git:
-            is_valid = self.run_validation_using_git()
-        elif self.file_path:
-            is_valid = self.run_validation_on_specific_files()
-        else:
-            # default validate to -g --post-commit
-            self.use_git = True
-            self.is_circle = True
-            is_valid = self.run_validation_using_git()
+        # every file is parsed once per run, and its parsed document is shared by all the validators of the run
+        parsed_documents_store.clear()
+        if self.time_measurements_dir:
+            pop_time_measurements()
+            enable_time_measurements()
+        if self.validation_cache_path:
+            # keep the docker images lookups with the cached validation results, for the other processes and runs
+            DockerImageValidator.images_cache = DockerImagesCache(
+                os.path.join(self.validation_cache_path, DOCKER_IMAGES_CACHE_DIR_NAME))
+        try:
+            if self.validate_all:
+                is_valid = self.run_validation_on_all_packs()
+            elif self.use_git:
+                is_valid = self.run_validation_using_git()
+            elif self.file_path:
+                is_valid = self.run_validation_on_specific_files()
+            else:
+                # default validate to -g --post-commit
+                self.use_git = True
+                self.is_circle = True
+                is_valid = self.run_validation_using_git()
+        finally:
+            # write the JSON report once, with the errors of all the validated files
+            flush_json_report()
+            DockerImageValidator.images_cache = None
+            close_id_set(self.id_set_file)
+            if self.time_measurements_dir:
+                enable_time_measurements(False)
+                self.report_time_measurements()
         return self.print_final_report(is_valid)
 
+    def report_time_measurements(self):
+        """
+        Writes the time measurements of the validations, validated file types and validated packs of the run to
+        the time measurements directory, and prints the ones which took the longest.
+        """
+        summary = report_measured_time('validate', self.time_measurements_dir,
+                                       measure_types=VALIDATE_MEASURE_TYPES, top=TIME_MEASUREMENTS_SUMMARY_SIZE)
+        click.echo(summary)
+        click.secho(f'The time measurements were written to {self.time_measurements_dir}', fg='bright_cyan')
+
     @staticmethod
     def detect_file_level(file_path: str) -> PathLevel:
         """
@@ -302,6 +474,10 @@ class ValidateManager:
         """
         files_validation_result = set()
 
+        if not self.skip_docker_checks:
+            DockerImageValidator.prefetch_docker_images(
+                file_path for path in self.file_path.split(',') for file_path in self.get_files_to_validate_in_path(path))
+
         for path in self.file_path.split(','):
             error_ignore_list = self.get_error_ignore_list(get_pack_name(path))
             file_level = self.detect_file_level(path)
@@ -334,16 +510,17 @@ class ValidateManager:
 
     def wait_futures_complete(self, futures_list: List[Future], done_fn: Callable):
         """Wait for all futures to complete, Raise exception if occurred.
+        The results are handled in the order of the futures, so they are aggregated the same way on every run.
         Args:
             futures_list: futures to wait for.
             done_fn: Function to run on result.
         Raises:
             Exception: Raise caught exception for further cleanups.
         """
-        for future in as_completed(futures_list):
+        for future in futures_list:
             try:
                 result = future.result()
-                done_fn(result[0], result[1])
+                done_fn(*result)
             except Exception as e:
                 click.secho(f'An error occurred while tried to collect result, Error: {e}', fg="bright_red")
                 raise
@@ -368,7 +545,9 @@ class ValidateManager:
 
         ReadMeValidator.add_node_env_vars()
         if self.is_possible_validate_readme:
-            with ReadMeValidator.start_mdx_server(handle_error=self.handle_error):
+            # a server for every worker process, so the workers do not wait for each other to parse their readme files
+            mdx_servers = self.workers if self.run_with_multiprocessing else 1
+            with ReadMeValidator.start_mdx_server(handle_error=self.handle_error, servers=mdx_servers):
                 return self.validate_packs(all_packs, all_packs_valid, count, num_of_packs)
         else:
             return self.validate_packs(all_packs, all_packs_valid, count, num_of_packs)
@@ -377,13 +556,25 @@ class ValidateManager:
                        count: int, num_of_packs: int) -> bool:
 
         if self.run_with_multiprocessing:
-            with pebble.ProcessPool(max_workers=4) as executor:
-                futures = []
-                for pack_path in all_packs:
-                    futures.append(executor.schedule(self.run_validations_on_pack, args=(pack_path,)))
-                self.wait_futures_complete(futures_list=futures,
-                                           done_fn=lambda x, y: (all_packs_valid.add(x),  # type: ignore
-                                                                 FOUND_FILES_AND_ERRORS.extend(y)))  # type: ignore
+            def add_task_results(is_valid: bool, errors: list, ignored_errors: list, json_report_entries: dict,
+                                 measurements: dict):
+                all_packs_valid.add(is_valid)
+                FOUND_FILES_AND_ERRORS.extend(errors)
+                FOUND_FILES_AND_IGNORED_ERRORS.extend(ignored_errors)
+                add_json_report_entries(json_report_entries)
+                add_time_measurements(measurements)
+
+            tasks = self.get_validation_tasks(all_packs)
+            ReadMeValidator.prefetch_mdx_results(self.get_readme_files_to_parse(tasks))
+            futures: List[Optional[Future]] = [None] * len(tasks)
+            workers_counter = multiprocessing.Value('i', 0)
+            with pebble.ProcessPool(max_workers=self.workers, initializer=init_validate_worker,
+                                    initargs=(self, ReadMeValidator.get_mdx_server_ports(),
+                                              ReadMeValidator.get_mdx_results(), workers_counter)) as executor:
+                # schedule the largest files first, so the run does not end waiting for a single large file
+                for task_index in sorted(range(len(tasks)), key=lambda index: -get_validation_task_size(tasks[index])):
+                    futures[task_index] = executor.schedule(run_validate_worker_task, args=(tasks[task_index],))
+                self.wait_futures_complete(futures_list=futures, done_fn=add_task_results)  # type: ignore[arg-type]
         else:
             for pack_path in all_packs:
                 self.completion_percentage = format((count / num_of_packs) * 100, ".2f")  # type: ignore
@@ -391,44 +582,82 @@ class ValidateManager:
                 count += 1
         return all(all_packs_valid)
 
-    def run_validations_on_pack(self, pack_path):
-        """Runs validation on all files in given pack. (i,g,a)
+    def get_validation_tasks(self, all_packs: list) -> List[Tuple[str, str, dict]]:
+        """Splits the validation of the packs into tasks of a single file, or of the unique files of a pack,
+        see run_validation_task.
 
         Args:
-            pack_path: the path to the pack.
+            all_packs: the paths of the packs.
 
         Returns:
-            bool. true if all files in pack are valid, false otherwise.
+            list. (task type, path, pack ignored errors) tuples, in the order the packs are validated in.
         """
-        pack_entities_validation_results = set()
-        pack_error_ignore_list = self.get_error_ignore_list(os.path.basename(pack_path))
+        tasks = []
+        for pack_path in all_packs:
+            pack_error_ignore_list = self.get_error_ignore_list(os.path.basename(pack_path))
+            tasks.append((PACK_UNIQUE_FILES_TASK, pack_path, pack_error_ignore_list))
+            tasks.extend((FILE_TASK, file_path, pack_error_ignore_list)
+                         for file_path in self.get_pack_files_to_validate(pack_path))
+        return tasks
+
+    def get_readme_files_to_parse(self, tasks: List[Tuple[str, str, dict]]) -> List[str]:
+        """The readme files validated by the tasks, without those whose validation results are cached.
+        """
+        readme_files = [path for task_type, path, _ in tasks if task_type == FILE_TASK and path.endswith('README.md')]
+        if self.validation_results_cache:
+            results_cache = self.validation_results_cache
+            readme_files = [path for path in readme_files
+                            if results_cache.load(self.get_validation_cache_key(path)) is None]
+        return readme_files
 
-        pack_entities_validation_results.add(self.validate_pack_unique_files(pack_path, pack_error_ignore_list))
+    def run_validation_task(self, task_type: str, path: str, pack_error_ignore_list: dict) -> bool:
+        """Runs a task of get_validation_tasks.
 
+        Returns:
+            bool. true if the validated files are valid, false otherwise.
+        """
+        if task_type == PACK_UNIQUE_FILES_TASK:
+            return self.validate_pack_unique_files(path, pack_error_ignore_list)
+        return self.run_validations_on_file(path, pack_error_ignore_list)
+
+    def get_files_to_validate_in_path(self, path: str) -> List[str]:
+        """Gets the files to validate in a path given to run_validation_on_specific_files.
+        """
+        file_level = self.detect_file_level(path)
+        if file_level == PathLevel.FILE:
+            return [path]
+        if file_level == PathLevel.CONTENT_ENTITY_DIR:
+            return self.get_content_entities_files_to_validate(path)
+        if file_level == PathLevel.CONTENT_GENERIC_ENTITY_DIR:
+            return self.get_generic_entities_files_to_validate(path)
+        if file_level == PathLevel.PACK:
+            return self.get_pack_files_to_validate(path)
+        return self.get_package_files_to_validate(path)
+
+    def get_pack_files_to_validate(self, pack_path: str) -> List[str]:
+        """Gets the files of the content entities of a pack, the files that are not validated are added to the
+        ignored files.
+        """
+        files = []
         for content_dir in os.listdir(pack_path):
             content_entity_path = os.path.join(pack_path, content_dir)
             if content_dir in CONTENT_ENTITIES_DIRS:
-                pack_entities_validation_results.add(self.run_validation_on_content_entities(content_entity_path,
-                                                                                             pack_error_ignore_list))
+                files.extend(self.get_content_entities_files_to_validate(content_entity_path))
             else:
                 self.ignored_files.add(content_entity_path)
+        return files
 
-        return all(pack_entities_validation_results), FOUND_FILES_AND_ERRORS
-
-    def run_validation_on_content_entities(self, content_entity_dir_path, pack_error_ignore_list):
-        """Gets non-pack folder and runs validation within it (Scripts, Integrations...)
-
-        Returns:
-            bool. true if all files in directory are valid, false otherwise.
+    def get_content_entities_files_to_validate(self, content_entity_dir_path: str) -> List[str]:
+        """Gets the files to validate in a content entity directory (Scripts, Integrations...), the files that are
+        not validated are added to the ignored files.
         """
-        content_entities_validation_results = set()
+        files = []
         if content_entity_dir_path.endswith(GENERIC_FIELDS_DIR) or content_entity_dir_path.endswith(GENERIC_TYPES_DIR):
             for dir_name in os.listdir(content_entity_dir_path):
                 dir_path = os.path.join(content_entity_dir_path, dir_name)
                 if not os.path.isfile(dir_path):
                     # should be only directories (not files) in generic types/fields directory
-                    content_entities_validation_results.add(
-                        self.run_validation_on_generic_entities(dir_path, pack_error_ignore_list))
+                    files.extend(self.get_generic_entities_files_to_validate(dir_path))
                 else:
                     self.ignored_files.add(dir_path)
         else:
@@ -436,29 +665,74 @@ class ValidateManager:
                 file_path = os.path.join(content_entity_dir_path, file_name)
                 if os.path.isfile(file_path):
                     if file_path.endswith('.json') or file_path.endswith('.yml') or file_path.endswith('.md'):
-                        content_entities_validation_results.add(self.run_validations_on_file(file_path,
-                                                                                             pack_error_ignore_list))
+                        files.append(file_path)
                     else:
                         self.ignored_files.add(file_path)
 
                 else:
-                    content_entities_validation_results.add(self.run_validation_on_package(file_path,
-                                                                                           pack_error_ignore_list))
+                    files.extend(self.get_package_files_to_validate(file_path))
 
-        return all(content_entities_validation_results)
-
-    def run_validation_on_package(self, package_path, pack_error_ignore_list):
-        package_entities_validation_results = set()
+        return files
 
+    def get_package_files_to_validate(self, package_path: str) -> List[str]:
+        """Gets the files to validate in a package, the other files are added to the ignored files.
+        """
+        files = []
         for file_name in os.listdir(package_path):
             file_path = os.path.join(package_path, file_name)
             if file_path.endswith('.yml') or file_path.endswith('.md'):
-                package_entities_validation_results.add(self.run_validations_on_file(file_path, pack_error_ignore_list))
+                files.append(file_path)
 
             else:
                 self.ignored_files.add(file_path)
 
-        return all(package_entities_validation_results)
+        return files
+
+    def get_generic_entities_files_to_validate(self, dir_path: str) -> List[str]:
+        """Gets the files to validate in a generic content entity directory (i.e a sub-directory of GenericTypes or
+        GenericFields), the other files are added to the ignored files.
+        """
+        files = []
+        for file_name in os.listdir(dir_path):
+            file_path = os.path.join(dir_path, file_name)
+            if file_path.endswith('.json'):  # generic types/fields are jsons
+                files.append(file_path)
+            else:
+                self.ignored_files.add(file_path)
+
+        return files
+
+    def run_validations_on_pack(self, pack_path):
+        """Runs validation on all files in given pack. (i,g,a)
+
+        Args:
+            pack_path: the path to the pack.
+
+        Returns:
+            bool. true if all files in pack are valid, false otherwise.
+        """
+        pack_entities_validation_results = set()
+        pack_error_ignore_list = self.get_error_ignore_list(os.path.basename(pack_path))
+
+        pack_entities_validation_results.add(self.validate_pack_unique_files(pack_path, pack_error_ignore_list))
+
+        for file_path in self.get_pack_files_to_validate(pack_path):
+            pack_entities_validation_results.add(self.run_validations_on_file(file_path, pack_error_ignore_list))
+
+        return all(pack_entities_validation_results), FOUND_FILES_AND_ERRORS
+
+    def run_validation_on_content_entities(self, content_entity_dir_path, pack_error_ignore_list):
+        """Gets non-pack folder and runs validation within it (Scripts, Integrations...)
+
+        Returns:
+            bool. true if all files in directory are valid, false otherwise.
+        """
+        return all({self.run_validations_on_file(file_path, pack_error_ignore_list)
+                    for file_path in self.get_content_entities_files_to_validate(content_entity_dir_path)})
+
+    def run_validation_on_package(self, package_path, pack_error_ignore_list):
+        return all({self.run_validations_on_file(file_path, pack_error_ignore_list)
+                    for file_path in self.get_package_files_to_validate(package_path)})
 
     def run_validation_on_generic_entities(self, dir_path, pack_error_ignore_list):
         """
@@ -468,16 +742,8 @@ class ValidateManager:
         Returns:
             bool. true if all files in directory are valid, false otherwise.
         """
-        package_entities_validation_results = set()
-
-        for file_name in os.listdir(dir_path):
-            file_path = os.path.join(dir_path, file_name)
-            if file_path.endswith('.json'):  # generic types/fields are jsons
-                package_entities_validation_results.add(self.run_validations_on_file(file_path, pack_error_ignore_list))
-            else:
-                self.ignored_files.add(file_path)
-
-        return all(package_entities_validation_results)
+        return all({self.run_validations_on_file(file_path, pack_error_ignore_list)
+                    for file_path in self.get_generic_entities_files_to_validate(dir_path)})
 
     @error_codes('BA114')
     def is_valid_pack_name(self, file_path, old_file_path):
@@ -511,9 +777,41 @@ class ValidateManager:
 
         return True
 
-    # flake8: noqa: C901
     def run_validations_on_file(self, file_path, pack_error_ignore_list, is_modified=False,
                                 old_file_path=None, modified_files=None, added_files=None):
+        """Runs the validations of a single file, or replays the cached results of the file if it was validated
+        with the same content and configuration before. See run_file_validations.
+
+        Returns:
+            bool. true if file is valid, false otherwise.
+        """
+        with measure_file_validations_time(file_path):
+            # modified and renamed files are validated against their previous versions, and release notes against the
+            # other changed files of their pack, so their results are not cached
+            if not self.validation_results_cache or is_modified or old_file_path or \
+                    find_type(file_path) == FileType.RELEASE_NOTES:
+                return self.run_file_validations(file_path, pack_error_ignore_list, is_modified, old_file_path,
+                                                 modified_files, added_files)
+
+            cache_key = self.get_validation_cache_key(file_path, added_files)
+            cached_results = self.validation_results_cache.load(cache_key)
+            if cached_results is not None:
+                if cached_results['is_ignored']:
+                    self.ignored_files.add(file_path)
+                elif not self.check_only_schema:
+                    click.echo(f'\nValidating {file_path} - using the cached validation results')
+                replay_reported_errors(cached_results['reported_errors'], self.json_file_path)
+                return cached_results['is_valid']
+
+            with record_reported_errors() as reported_errors:
+                is_valid = self.run_file_validations(file_path, pack_error_ignore_list, is_modified, old_file_path,
+                                                     modified_files, added_files)
+            self.validation_results_cache.save(cache_key, is_valid, file_path in self.ignored_files, reported_errors)
+            return is_valid
+
+    # flake8: noqa: C901
+    def run_file_validations(self, file_path, pack_error_ignore_list, is_modified=False,
+                             old_file_path=None, modified_files=None, added_files=None):
         """Choose a validator to run for a single file. (i)
 
         Args:
@@ -849,6 +1147,11 @@ class ValidateManager:
 
         validation_results = {valid_git_setup, valid_types}
 
+        if not self.skip_docker_checks:
+            DockerImageValidator.prefetch_docker_images(
+                file_path[1] if isinstance(file_path, tuple) else file_path
+                for file_path in chain(modified_files, added_files))
+
         validation_results.add(self.validate_modified_files(modified_files))
         validation_results.add(self.validate_added_files(added_files, modified_files))
         validation_results.add(self.validate_changed_packs_unique_files(modified_files, added_files, old_format_files,
@@ -1240,31 +1543,32 @@ class ValidateManager:
         files_valid = True
         author_valid = True
 
-        click.echo(f'\nValidating {pack_path} unique pack files')
-        pack_unique_files_validator = PackUniqueFilesValidator(pack=os.path.basename(pack_path),
-                                                               pack_path=pack_path,
-                                                               ignored_errors=pack_error_ignore_list,
-                                                               print_as_warnings=self.print_ignored_errors,
-                                                               should_version_raise=should_version_raise,
-                                                               validate_dependencies=not self.skip_dependencies,
-                                                               id_set_path=self.id_set_path,
-                                                               private_repo=self.is_external_repo,
-                                                               skip_id_set_creation=self.skip_id_set_creation,
-                                                               prev_ver=self.prev_ver,
-                                                               json_file_path=self.json_file_path,
-                                                               specific_validations=self.specific_validations)
-        pack_errors = pack_unique_files_validator.are_valid_files(self.id_set_validations)
-        if pack_errors:
-            click.secho(pack_errors, fg="bright_red")
-            files_valid = False
-
-        # check author image
-        author_image_path = os.path.join(pack_path, AUTHOR_IMAGE_FILE_NAME)
-        if os.path.exists(author_image_path):
-            click.echo("Validating pack author image")
-            author_valid = self.validate_author_image(author_image_path, pack_error_ignore_list)
-
-        return files_valid and author_valid
+        with measure_time(MeasureType.VALIDATED_PACKS, os.path.basename(pack_path)):
+            click.echo(f'\nValidating {pack_path} unique pack files')
+            pack_unique_files_validator = PackUniqueFilesValidator(pack=os.path.basename(pack_path),
+                                                                   pack_path=pack_path,
+                                                                   ignored_errors=pack_error_ignore_list,
+                                                                   print_as_warnings=self.print_ignored_errors,
+                                                                   should_version_raise=should_version_raise,
+                                                                   validate_dependencies=not self.skip_dependencies,
+                                                                   id_set_path=self.id_set_path,
+                                                                   private_repo=self.is_external_repo,
+                                                                   skip_id_set_creation=self.skip_id_set_creation,
+                                                                   prev_ver=self.prev_ver,
+                                                                   json_file_path=self.json_file_path,
+                                                                   specific_validations=self.specific_validations)
+            pack_errors = pack_unique_files_validator.are_valid_files(self.id_set_validations)
+            if pack_errors:
+                click.secho(pack_errors, fg="bright_red")
+                files_valid = False
+
+            # check author image
+            author_image_path = os.path.join(pack_path, AUTHOR_IMAGE_FILE_NAME)
+            if os.path.exists(author_image_path):
+                click.echo("Validating pack author image")
+                author_valid = self.validate_author_image(author_image_path, pack_error_ignore_list)
+
+            return files_valid and author_valid
 
     def validate_job(self, structure_validator, pack_error_ignore_list):
         job_validator = JobValidator(structure_validator,
@@ -1907,7 +2211,7 @@ class ValidateManager:
                 id_set, _, _ = IDSetCreator(print_logs=False).create_id_set()
 
         else:
-            id_set = open_id_set_file(id_set_path)
+            id_set = open_id_set_file(id_set_path, lazy=True)
 
         if not id_set and not self.no_configuration_prints:
             error_message, error_code = Errors.no_id_set_file()
@@ -0,0 +1,138 @@
+import glob
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from demisto_sdk.commands.common.constants import (CONTENT_ENTITIES_DIRS,
+                                                   PACKS_PACK_IGNORE_FILE_NAME,
+                                                   PACKS_PACK_META_FILE_NAME)
+from demisto_sdk.commands.common.handlers import JSON_Handler
+from demisto_sdk.commands.common.tools import (get_demisto_sdk_version,
+                                               get_file_or_dir_hash,
+                                               get_pack_dir, print_warning)
+
+json = JSON_Handler()
+
+VALIDATION_RESULTS_CACHE_VERSION = 1
+
+SCHEMAS_DIR = Path(__file__).parent.parent / 'common' / 'schemas'
+
+
+def get_file_inputs_hash(file_path: str) -> str:
+    """
+    Calculates a hash of the content the validations of a file depend on, besides the file itself:
+        * The other files of the package of the file, e.g. the code, image and description of an integration.
+        * The files next to the file which are named after it, e.g. the README of a playbook.
+        * The .pack-ignore and pack_metadata.json of the pack of the file.
+
+    Args:
+        file_path: The path of the validated file.
+
+    Returns:
+        The sha256 hex digest of the content.
+    """
+    content_hash = hashlib.sha256()
+    file_dir = os.path.dirname(file_path)
+    pack_dir_parts = get_pack_dir(file_path)
+    pack_dir = os.path.join(*pack_dir_parts) if pack_dir_parts else ''
+
+    if pack_dir and os.path.basename(file_dir) not in CONTENT_ENTITIES_DIRS and \
+            os.path.normpath(file_dir) != os.path.normpath(pack_dir):
+        # the file is in a package
+        content_hash.update(get_file_or_dir_hash(file_dir).encode())
+    else:
+        file_stem = os.path.splitext(os.path.basename(file_path))[0]
+        for related_file in sorted(Path(file_dir or '.').glob(f'{glob.escape(file_stem)}*')):
+            content_hash.update(related_file.name.encode())
+            content_hash.update(get_file_or_dir_hash(related_file).encode())
+
+    if pack_dir:
+        for pack_file in (PACKS_PACK_IGNORE_FILE_NAME, PACKS_PACK_META_FILE_NAME):
+            content_hash.update(get_file_or_dir_hash(os.path.join(pack_dir, pack_file)).encode())
+
+    return content_hash.hexdigest()
+
+
+class ValidationResultsCache:
+    """
+    A persisted mapping of: the content and configuration a file was validated with -> whether the file was valid,
+    and the outputs of the errors and warnings reported while validating it (see
+    `base_validator.record_reported_errors`).
+
+    The results of a file are kept in a file of their own in the cache directory, named by the key of the file,
+    so validate worker processes can save results concurrently. A changed file, related file, .pack-ignore, schema,
+    id_set or validate configuration changes the key of the file, so the results saved before are not used again.
+    Results which depend on the other files of the run, e.g. of release notes, must not be cached.
+    """
+
+    def __init__(self, cache_dir: str, run_inputs: Dict):
+        """
+        Args:
+            cache_dir: The directory of the cache.
+            run_inputs: The configuration of the validate run which affects the validation results, e.g. the enabled
+             validations and the id_set hash. Must be JSON serializable.
+        """
+        self.cache_dir = cache_dir
+        self.run_hash = hashlib.sha256(json.dumps({
+            'version': VALIDATION_RESULTS_CACHE_VERSION,
+            'sdk_version': get_demisto_sdk_version(),
+            'schemas_hash': get_file_or_dir_hash(SCHEMAS_DIR),
+            **run_inputs,
+        }, sort_keys=True).encode()).hexdigest()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get_file_key(self, file_path: str, file_inputs: Optional[Dict] = None) -> str:
+        """
+        The key of the validation results of a file, see `get_file_inputs_hash`.
+
+        Args:
+            file_path: The path of the validated file.
+            file_inputs: The inputs of the run which affect the validation results of this file only, e.g. whether
+             the file is added. Must be JSON serializable.
+        """
+        key_hash = hashlib.sha256(self.run_hash.encode())
+        key_hash.update(os.path.normpath(file_path).encode())
+        key_hash.update(json.dumps(file_inputs or {}, sort_keys=True).encode())
+        key_hash.update(get_file_or_dir_hash(file_path).encode())
+        key_hash.update(get_file_inputs_hash(file_path).encode())
+        return key_hash.hexdigest()
+
+    def get_results_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def load(self, key: str) -> Optional[Dict]:
+        """
+        Loads the validation results saved for a key.
+
+        Returns:
+            {'is_valid': bool, 'is_ignored': bool, 'reported_errors': [...]}, or None if there are no saved results.
+        """
+        results_path = self.get_results_path(key)
+        if not os.path.isfile(results_path):
+            return None
+
+        try:
+            with open(results_path, 'r') as results_file:
+                return json.load(results_file)
+        except ValueError:
+            print_warning(f'Could not parse the cached validation results {results_path}, ignoring them.')
+            return None
+
+    def save(self, key: str, is_valid: bool, is_ignored: bool, reported_errors: List[dict]):
+        """
+        Saves the validation results of a key.
+
+        Args:
+            key: The key of the validated file, see `get_file_key`.
+            is_valid: Whether the file is valid.
+            is_ignored: Whether the file was ignored by the validation.
+            reported_errors: The outputs of the errors and warnings reported while validating the file.
+        """
+        results_path = self.get_results_path(key)
+        # write to a temporary file and rename it, so a concurrent load never reads partial results
+        temp_results_path = f'{results_path}.{os.getpid()}.tmp'
+        with open(temp_results_path, 'w') as results_file:
+            json.dump({'is_valid': is_valid, 'is_ignored': is_ignored, 'reported_errors': reported_errors},
+                      results_file)
+        os.replace(temp_results_path, results_path)
@@ -0,0 +1,144 @@
+"""
+Benchmarks the playbook tasks graph used by the id_set playbook extractors.
+
+Compares the networkx based tasks graph (used up to demisto-sdk 1.6.9) with `PlaybookTasksGraph`, on the largest
+playbooks of a content repository, and verifies both find the same unreachable and skippable tasks.
+
+Usage:
+    python demisto_sdk/utils/benchmarks/playbook_tasks_graph_benchmark.py -i <content repo path> [-n 20] [-r 20]
+        [-s 100 500]
+"""
+import argparse
+import timeit
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import networkx
+from tabulate import tabulate
+
+from demisto_sdk.commands.common.tools import get_yaml
+from demisto_sdk.commands.common.update_id_set import PlaybookTasksGraph
+
+
+def build_networkx_tasks_graph(playbook_data: dict) -> networkx.DiGraph:
+    """
+    The networkx tasks graph, as built by `build_tasks_graph` up to demisto-sdk 1.6.9 (without the warnings).
+    """
+    initial_task = playbook_data.get('starttaskid', '')
+    tasks = playbook_data.get('tasks', {})
+
+    graph = networkx.DiGraph()
+    graph.add_node(initial_task, mandatory=True)
+
+    found_new_tasks = True
+    while found_new_tasks:
+        current_number_of_nodes = graph.number_of_nodes()
+        leaf_nodes = {node for node in graph.nodes() if graph.out_degree(node) == 0}
+
+        for leaf in leaf_nodes:
+            leaf_task = tasks.get(leaf)
+            leaf_mandatory = graph.nodes[leaf]['mandatory']
+            if not leaf_task:
+                continue
+
+            for task_id in sum((next_ids or [] for next_ids in (leaf_task.get('nexttasks') or {}).values()), []):
+                task = tasks.get(task_id)
+                if not task:
+                    continue
+                mandatory = leaf_mandatory and not task.get('skipunavailable', False)
+                if task_id not in graph.nodes():
+                    graph.add_node(task_id, mandatory=mandatory)
+                else:
+                    graph.nodes[task_id]['mandatory'] = graph.nodes[task_id]['mandatory'] or mandatory
+                graph.add_edge(leaf, task_id)
+
+        found_new_tasks = graph.number_of_nodes() > current_number_of_nodes
+
+    return graph
+
+
+def get_networkx_tasks_state(playbook_data: dict, graph: networkx.DiGraph) -> Dict[str, Optional[bool]]:
+    """
+    Returns task id -> whether the task is skippable, or None for unreachable tasks.
+    """
+    return {task_id: not graph.nodes[task_id]['mandatory'] if task_id in graph.nodes else None
+            for task_id in playbook_data.get('tasks', {})}
+
+
+def get_tasks_state(playbook_data: dict, graph: PlaybookTasksGraph) -> Dict[str, Optional[bool]]:
+    return {task_id: graph.is_skippable(task_id) if graph.is_reachable(task_id) else None
+            for task_id in playbook_data.get('tasks', {})}
+
+
+def create_synthetic_playbook(number_of_tasks: int) -> dict:
+    """
+    Creates a playbook of consecutive conditional tasks, each one leads to the next two tasks,
+    and every third task can be skipped.
+    """
+    tasks = {}
+    for index in range(number_of_tasks):
+        next_tasks = [str(next_index) for next_index in (index + 1, index + 2) if next_index < number_of_tasks]
+        tasks[str(index)] = {
+            'id': str(index),
+            'task': {'scriptName': f'Script{index}'},
+            'nexttasks': {'yes': next_tasks[:1], 'no': next_tasks[1:]} if next_tasks else {},
+            'skipunavailable': index % 3 == 1,
+        }
+    return {'id': f'Synthetic{number_of_tasks}', 'starttaskid': '0', 'tasks': tasks}
+
+
+def get_largest_playbooks(content_path: Path, number_of_playbooks: int) -> List[Path]:
+    playbooks = [path for path in content_path.glob('**/Playbooks/*.yml')]
+    playbooks.extend(content_path.glob('**/TestPlaybooks/*.yml'))
+    return sorted(playbooks, key=lambda path: path.stat().st_size, reverse=True)[:number_of_playbooks]
+
+
+def benchmark_playbook(playbook_data: dict, repeat: int) -> Tuple[float, float]:
+    """
+    Returns the time it takes to build the tasks graph and find the unreachable and skippable tasks,
+    with networkx and with PlaybookTasksGraph.
+    """
+    before = min(timeit.repeat(
+        lambda: get_networkx_tasks_state(playbook_data, build_networkx_tasks_graph(playbook_data)),
+        number=1, repeat=repeat))
+    after = min(timeit.repeat(
+        lambda: get_tasks_state(playbook_data, PlaybookTasksGraph(playbook_data)),
+        number=1, repeat=repeat))
+    return before, after
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the playbook tasks graph.')
+    parser.add_argument('-i', '--input', default='.', help='The content repository path.')
+    parser.add_argument('-n', '--number-of-playbooks', type=int, default=20,
+                        help='The number of the largest playbooks to benchmark.')
+    parser.add_argument('-r', '--repeat', type=int, default=20, help='The number of times to build each graph.')
+    parser.add_argument('-s', '--synthetic', type=int, nargs='*', default=[],
+                        help='Also benchmark synthetic playbooks with the given numbers of tasks.')
+    args = parser.parse_args()
+
+    playbooks = [(playbook_path.name, get_yaml(str(playbook_path)))
+                 for playbook_path in get_largest_playbooks(Path(args.input), args.number_of_playbooks)]
+    playbooks.extend((f'synthetic ({number_of_tasks} tasks)', create_synthetic_playbook(number_of_tasks))
+                     for number_of_tasks in args.synthetic)
+
+    rows = []
+    mismatches = []
+    for playbook_name, playbook_data in playbooks:
+        if not isinstance(playbook_data, dict) or not isinstance(playbook_data.get('tasks'), dict):
+            continue
+        if get_networkx_tasks_state(playbook_data, build_networkx_tasks_graph(playbook_data)) != \
+                get_tasks_state(playbook_data, PlaybookTasksGraph(playbook_data)):
+            mismatches.append(playbook_name)
+        before, after = benchmark_playbook(playbook_data, args.repeat)
+        rows.append([playbook_name, len(playbook_data['tasks']), f'{before * 1000:.3f}', f'{after * 1000:.3f}',
+                     f'{before / after:.1f}x' if after else '-'])
+
+    print(tabulate(rows, headers=['Playbook', 'Tasks', 'networkx (ms)', 'PlaybookTasksGraph (ms)', 'Speedup']))
+    if mismatches:
+        # the networkx graph did not update the tasks after an already expanded task became mandatory
+        print(f'\nThe graphs differ on the skippable tasks of: {", ".join(mismatches)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmarks the read-only yml loading of `get_file`.
+
+Loads the integration ymls of a content repository with the round-trip loader (`keep_format=True`, used by the
+commands which write the files back) and with the read-only safe loader (the default), and verifies both load the
+same data - the same keys in the same order and the same values of the same plain types.
+
+Usage:
+    python demisto_sdk/utils/benchmarks/yaml_loading_benchmark.py -i <content repo path> [-n 20] [-r 5]
+"""
+import argparse
+import datetime
+import timeit
+from pathlib import Path
+from typing import Any, List, Tuple
+
+from tabulate import tabulate
+
+from demisto_sdk.commands.common.tools import parse_file
+
+try:
+    import ruamel.yaml.clib  # noqa: F401
+    C_LOADER_INSTALLED = True
+except ImportError:
+    C_LOADER_INSTALLED = False
+
+
+def to_plain(data: Any) -> Any:
+    """
+    Converts loaded yml data to plain python types, keeping the order of the keys, so the data loaded by the two
+    loaders can be compared by its repr. The round-trip loader subclasses the plain types (e.g. CommentedMap,
+    DoubleQuotedScalarString, ScalarFloat and TimeStamp), the subclasses are compared as their plain types.
+    """
+    if isinstance(data, dict):
+        return [(to_plain(key), to_plain(value)) for key, value in data.items()]
+    if isinstance(data, list):
+        return [to_plain(value) for value in data]
+    if isinstance(data, (datetime.date, datetime.datetime)):
+        return 'timestamp', data.isoformat()
+    for plain_type in (bool, str, int, float):
+        if isinstance(data, plain_type):
+            return plain_type(data)
+    return data
+
+
+def get_integration_ymls(content_path: Path, number_of_files: int) -> List[Path]:
+    ymls = [path for path in content_path.glob('**/Integrations/**/*.yml') if not path.name.endswith('_unified.yml')]
+    ymls.sort(key=lambda path: path.stat().st_size, reverse=True)
+    return ymls[:number_of_files] if number_of_files else ymls
+
+
+def benchmark_file(yml_path: Path, repeat: int) -> Tuple[float, float, bool]:
+    """
+    Returns the time it takes to load the file with the round-trip loader and with the safe loader, and whether
+    both loaded the same data.
+    """
+    round_trip = min(timeit.repeat(lambda: parse_file(yml_path, 'yml', keep_format=True), number=1, repeat=repeat))
+    safe = min(timeit.repeat(lambda: parse_file(yml_path, 'yml'), number=1, repeat=repeat))
+    is_identical = repr(to_plain(parse_file(yml_path, 'yml', keep_format=True))) == \
+        repr(to_plain(parse_file(yml_path, 'yml')))
+    return round_trip, safe, is_identical
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the read-only yml loading.')
+    parser.add_argument('-i', '--input', default='.', help='The content repository path.')
+    parser.add_argument('-n', '--number-of-files', type=int, default=20,
+                        help='The number of the largest integration ymls to show, all of them are compared and '
+                             'counted in the total.')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='The number of times to load each file.')
+    args = parser.parse_args()
+
+    rows = []
+    mismatches = []
+    total_round_trip = total_safe = 0.0
+    ymls = get_integration_ymls(Path(args.input), 0)
+    for index, yml_path in enumerate(ymls):
+        try:
+            round_trip, safe, is_identical = benchmark_file(yml_path, args.repeat)
+        except ValueError as error:
+            # a yml which can not be loaded, validate reports it as a structure issue
+            print(f'Skipping {yml_path}: {error}')
+            continue
+        total_round_trip += round_trip
+        total_safe += safe
+        if not is_identical:
+            mismatches.append(str(yml_path))
+        if index < args.number_of_files:
+            rows.append([yml_path.name, f'{yml_path.stat().st_size // 1024}', f'{round_trip * 1000:.1f}',
+                         f'{safe * 1000:.1f}', f'{round_trip / safe:.1f}x' if safe else '-'])
+    rows.append([f'Total ({len(ymls)} files)', '', f'{total_round_trip * 1000:.1f}', f'{total_safe * 1000:.1f}',
+                 f'{total_round_trip / total_safe:.1f}x' if total_safe else '-'])
+
+    print(tabulate(rows, headers=['Integration', 'Size (KB)', 'Round-trip (ms)', 'Safe (ms)', 'Speedup']))
+    print(f'\nThe C loader of ruamel.yaml.clib is {"" if C_LOADER_INSTALLED else "not "}installed.')
+    if mismatches:
+        print(f'\nThe loaders loaded different data from: {", ".join(mismatches)}')
+    else:
+        print('\nBoth loaders loaded the same data from all the files.')
+
+
+if __name__ == '__main__':
+    main()